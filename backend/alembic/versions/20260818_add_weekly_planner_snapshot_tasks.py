@@ -0,0 +1,163 @@
+"""Store weekly planner snapshot tasks as indexed rows.
+
+Revision ID: 20260818_snapshot_tasks
+Revises: 20260817_full_note_titles
+"""
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+revision = "20260818_snapshot_tasks"
+down_revision = "20260817_full_note_titles"
+branch_labels = None
+depends_on = None
+
+
+_ITEMS = """
+    SELECT
+        snapshot.id AS snapshot_id,
+        (item.ordinality - 1)::integer AS position,
+        item.value AS item,
+        COALESCE(
+            NULLIF(item.value->>'match_key', ''),
+            CASE
+                WHEN NULLIF(item.value->>'task_id', '') IS NOT NULL THEN 'id:' || (item.value->>'task_id')
+                ELSE 'fallback:' || COALESCE(item.value->>'fallback_key', '')
+            END
+        ) AS match_key
+    FROM weekly_planner_snapshots AS snapshot
+    CROSS JOIN LATERAL jsonb_array_elements(
+        CASE WHEN jsonb_typeof(snapshot.payload->'task_items') = 'array'
+            THEN snapshot.payload->'task_items' ELSE '[]'::jsonb END
+    ) WITH ORDINALITY AS item(value, ordinality)
+"""
+
+_TASK_COLUMNS = """
+    id, snapshot_id, position, match_key, task_id, fallback_key, title, project_id, project_title,
+    source_type, status, daily_status, completed_at, is_completed, finish_period, priority, tags,
+    planned_due_date, user_id, user_name, day, slot
+"""
+
+_TASK_VALUES = """
+    gen_random_uuid(),
+    items.snapshot_id,
+    items.position,
+    items.match_key,
+    NULLIF(items.item->>'task_id', '')::uuid,
+    items.item->>'fallback_key',
+    COALESCE(NULLIF(items.item->>'title', ''), '(Untitled task)'),
+    NULLIF(items.item->>'project_id', '')::uuid,
+    items.item->>'project_title',
+    COALESCE(NULLIF(items.item->>'source_type', ''), 'project'),
+    items.item->>'status',
+    items.item->>'daily_status',
+    NULLIF(items.item->>'completed_at', '')::timestamptz,
+    COALESCE((items.item->>'is_completed')::boolean, false),
+    items.item->>'finish_period',
+    items.item->>'priority',
+    ARRAY(
+        SELECT jsonb_array_elements_text(
+            CASE WHEN jsonb_typeof(items.item->'tags') = 'array' THEN items.item->'tags' ELSE '[]'::jsonb END
+        )
+    ),
+    NULLIF(items.item->>'due_date', '')::timestamptz
+"""
+
+
+def _array(path: str) -> str:
+    return f"CASE WHEN jsonb_typeof({path}) = 'array' THEN {path} ELSE '[]'::jsonb END"
+
+
+def upgrade() -> None:
+    op.create_table(
+        "weekly_planner_snapshot_tasks",
+        sa.Column("id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("snapshot_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("position", sa.Integer(), nullable=False),
+        sa.Column("match_key", sa.Text(), nullable=False),
+        sa.Column("task_id", postgresql.UUID(as_uuid=True), nullable=True),
+        sa.Column("fallback_key", sa.Text(), nullable=True),
+        sa.Column("title", sa.Text(), nullable=False),
+        sa.Column("project_id", postgresql.UUID(as_uuid=True), nullable=True),
+        sa.Column("project_title", sa.Text(), nullable=True),
+        sa.Column("source_type", sa.String(length=20), nullable=False),
+        sa.Column("status", sa.String(length=32), nullable=True),
+        sa.Column("daily_status", sa.String(length=32), nullable=True),
+        sa.Column("completed_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("is_completed", sa.Boolean(), nullable=False, server_default=sa.false()),
+        sa.Column("finish_period", sa.String(length=20), nullable=True),
+        sa.Column("priority", sa.String(length=20), nullable=True),
+        sa.Column("tags", postgresql.ARRAY(sa.String()), nullable=False, server_default="{}"),
+        sa.Column("planned_due_date", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("user_id", postgresql.UUID(as_uuid=True), nullable=True),
+        sa.Column("user_name", sa.String(length=255), nullable=True),
+        sa.Column("day", sa.Date(), nullable=True),
+        sa.Column("slot", sa.String(length=10), nullable=True),
+        sa.ForeignKeyConstraint(["snapshot_id"], ["weekly_planner_snapshots.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        "ix_weekly_planner_snapshot_tasks_match",
+        "weekly_planner_snapshot_tasks",
+        ["snapshot_id", "match_key", "user_id", "day", "slot"],
+    )
+    op.create_index(
+        "ix_weekly_planner_snapshot_tasks_user_day",
+        "weekly_planner_snapshot_tasks",
+        ["snapshot_id", "user_id", "day", "slot"],
+    )
+    op.create_index("ix_weekly_planner_snapshot_tasks_task_id", "weekly_planner_snapshot_tasks", ["task_id"])
+
+    # Backfill from payload["task_items"]; the row layout matches
+    # app.services.weekly_snapshot_tasks.snapshot_task_rows. Snapshots without
+    # task items stay unexploded and keep using the payload fallback.
+    op.execute(
+        f"""
+        INSERT INTO weekly_planner_snapshot_tasks ({_TASK_COLUMNS})
+        SELECT {_TASK_VALUES},
+            NULLIF(occurrence.value->>'assignee_id', '')::uuid,
+            occurrence.value->>'assignee_name',
+            NULLIF(LEFT(occurrence.value->>'day', 10), '')::date,
+            occurrence.value->>'time_slot'
+        FROM ({_ITEMS}) AS items
+        CROSS JOIN LATERAL jsonb_array_elements({_array("items.item->'occurrences'")}) AS occurrence(value)
+        """
+    )
+    op.execute(
+        f"""
+        INSERT INTO weekly_planner_snapshot_tasks ({_TASK_COLUMNS})
+        SELECT {_TASK_VALUES},
+            NULLIF(assignee.value->>'assignee_id', '')::uuid,
+            COALESCE(NULLIF(assignee.value->>'assignee_name', ''), 'Unassigned'),
+            NULL,
+            NULL
+        FROM ({_ITEMS}) AS items
+        CROSS JOIN LATERAL jsonb_array_elements({_array("items.item->'assignees'")}) AS assignee(value)
+        WHERE NOT EXISTS (
+            SELECT 1
+            FROM jsonb_array_elements({_array("items.item->'occurrences'")}) AS occurrence(value)
+            WHERE COALESCE(
+                occurrence.value->>'assignee_id',
+                'name:' || LOWER(occurrence.value->>'assignee_name')
+            ) = COALESCE(
+                assignee.value->>'assignee_id',
+                'name:' || LOWER(COALESCE(NULLIF(assignee.value->>'assignee_name', ''), 'Unassigned'))
+            )
+        )
+        """
+    )
+    op.execute(
+        f"""
+        INSERT INTO weekly_planner_snapshot_tasks ({_TASK_COLUMNS})
+        SELECT {_TASK_VALUES}, NULL, NULL, NULL, NULL
+        FROM ({_ITEMS}) AS items
+        WHERE jsonb_array_length({_array("items.item->'occurrences'")}) = 0
+          AND jsonb_array_length({_array("items.item->'assignees'")}) = 0
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("weekly_planner_snapshot_tasks")
@@ -0,0 +1,53 @@
+"""Cache computed weekly snapshot comparisons.
+
+Revision ID: 20260818_snapshot_comparisons
+Revises: 20260818_snapshot_tasks
+"""
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+revision = "20260818_snapshot_comparisons"
+down_revision = "20260818_snapshot_tasks"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "weekly_snapshot_comparisons",
+        sa.Column("id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("baseline_snapshot_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("compare_snapshot_id", postgresql.UUID(as_uuid=True), nullable=True),
+        sa.Column("cache_key", sa.String(length=64), nullable=False),
+        sa.Column("result", postgresql.JSONB(astext_type=sa.Text()), nullable=False),
+        sa.Column("computed_at", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=True),
+        sa.ForeignKeyConstraint(["baseline_snapshot_id"], ["weekly_planner_snapshots.id"], ondelete="CASCADE"),
+        sa.ForeignKeyConstraint(["compare_snapshot_id"], ["weekly_planner_snapshots.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        "uq_weekly_snapshot_comparisons_pair",
+        "weekly_snapshot_comparisons",
+        ["baseline_snapshot_id", "compare_snapshot_id"],
+        unique=True,
+        postgresql_where=sa.text("compare_snapshot_id IS NOT NULL"),
+    )
+    op.create_index(
+        "uq_weekly_snapshot_comparisons_live",
+        "weekly_snapshot_comparisons",
+        ["baseline_snapshot_id"],
+        unique=True,
+        postgresql_where=sa.text("compare_snapshot_id IS NULL"),
+    )
+    op.create_index(
+        "ix_weekly_snapshot_comparisons_compare_snapshot_id",
+        "weekly_snapshot_comparisons",
+        ["compare_snapshot_id"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("weekly_snapshot_comparisons")
@@ -0,0 +1,41 @@
+"""Queue outgoing report emails.
+
+Revision ID: 20260819_outbound_emails
+Revises: 20260818_snapshot_comparisons
+"""
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+revision = "20260819_outbound_emails"
+down_revision = "20260818_snapshot_comparisons"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "outbound_emails",
+        sa.Column("id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("message_id", sa.String(length=255), nullable=False),
+        sa.Column("source", sa.String(length=64), nullable=True),
+        sa.Column("source_id", postgresql.UUID(as_uuid=True), nullable=True),
+        sa.Column("subject", sa.String(length=500), nullable=False),
+        sa.Column("recipients", postgresql.JSONB(astext_type=sa.Text()), nullable=False),
+        sa.Column("size_bytes", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("status", sa.String(length=20), nullable=False, server_default="QUEUED"),
+        sa.Column("attempt_count", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("last_error", sa.Text(), nullable=True),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=True),
+        sa.Column("sent_at", sa.DateTime(timezone=True), nullable=True),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index("ix_outbound_emails_message_id", "outbound_emails", ["message_id"])
+    op.create_index("ix_outbound_emails_status_created_at", "outbound_emails", ["status", "created_at"])
+    op.create_index("ix_outbound_emails_source", "outbound_emails", ["source", "source_id"])
+
+
+def downgrade() -> None:
+    op.drop_table("outbound_emails")
@@ -0,0 +1,191 @@
+"""Maintain a date-bucketed task calendar for planner range reads.
+
+Revision ID: 20260820_task_calendar_days
+Revises: 20260819_outbound_emails
+"""
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from app.config import settings
+
+
+revision = "20260820_task_calendar_days"
+down_revision = "20260819_outbound_emails"
+branch_labels = None
+depends_on = None
+
+
+# Mirrors app.services.task_calendar.task_calendar_slots: local days come from
+# APP_TIMEZONE, multi-day spans keep workdays only, and a task_daily_progress
+# slot overrides the task's finish period for that day.
+_REFRESH_FUNCTION = """
+CREATE OR REPLACE FUNCTION task_calendar_refresh(p_task_id uuid) RETURNS void
+LANGUAGE plpgsql AS $$
+BEGIN
+    DELETE FROM task_calendar_days WHERE task_id = p_task_id;
+    INSERT INTO task_calendar_days (
+        task_id, day_date, time_slot, department_id, project_id, assigned_to,
+        status, daily_status, is_active, excluded_user_ids, updated_at
+    )
+    SELECT
+        t.id,
+        day.day_date,
+        slot.time_slot,
+        t.department_id,
+        t.project_id,
+        t.assigned_to,
+        t.status,
+        progress.daily_status,
+        t.is_active,
+        ARRAY(
+            SELECT exclusion.user_id
+            FROM task_planner_exclusions AS exclusion
+            WHERE exclusion.task_id = t.id
+              AND exclusion.day_date = day.day_date
+              AND UPPER(COALESCE(exclusion.time_slot, 'ALL')) IN ('ALL', slot.time_slot)
+            UNION
+            SELECT exclusion.user_id
+            FROM project_planner_exclusions AS exclusion
+            WHERE exclusion.project_id = t.project_id
+              AND exclusion.day_date = day.day_date
+              AND UPPER(COALESCE(exclusion.time_slot, 'ALL')) IN ('ALL', slot.time_slot)
+        ),
+        now()
+    FROM tasks AS t
+    CROSS JOIN LATERAL (
+        SELECT
+            (t.due_date AT TIME ZONE '{timezone}')::date AS due_day,
+            (t.start_date AT TIME ZONE '{timezone}')::date AS start_day
+    ) AS local
+    CROSS JOIN LATERAL (
+        SELECT
+            COALESCE(local.due_day, local.start_day) AS last_day,
+            CASE
+                WHEN local.due_day IS NULL OR local.start_day IS NULL OR local.start_day > local.due_day
+                    THEN COALESCE(local.due_day, local.start_day)
+                ELSE GREATEST(local.start_day, local.due_day - {max_span_days})
+            END AS first_day
+    ) AS span
+    CROSS JOIN LATERAL (
+        SELECT generated::date AS day_date
+        FROM generate_series(span.first_day, span.last_day, interval '1 day') AS generated
+    ) AS day
+    LEFT JOIN task_daily_progress AS progress
+        ON progress.task_id = t.id AND progress.day_date = day.day_date
+    CROSS JOIN LATERAL (
+        SELECT CASE
+            WHEN progress.finish_period = 'ALL' THEN NULL
+            WHEN progress.finish_period IS NOT NULL THEN UPPER(progress.finish_period)
+            ELSE UPPER(t.finish_period)
+        END AS finish_period
+    ) AS effective
+    CROSS JOIN LATERAL unnest(
+        CASE effective.finish_period
+            WHEN 'AM' THEN ARRAY['AM']
+            WHEN 'PM' THEN ARRAY['PM']
+            ELSE ARRAY['AM', 'PM']
+        END
+    ) AS slot(time_slot)
+    WHERE t.id = p_task_id
+      AND span.last_day IS NOT NULL
+      AND (span.first_day = span.last_day OR EXTRACT(ISODOW FROM day.day_date) < 6);
+END;
+$$;
+"""
+
+_TRIGGER_FUNCTION = """
+CREATE OR REPLACE FUNCTION task_calendar_trigger() RETURNS trigger
+LANGUAGE plpgsql AS $$
+BEGIN
+    IF TG_TABLE_NAME = 'tasks' THEN
+        PERFORM task_calendar_refresh(NEW.id);
+    ELSIF TG_TABLE_NAME = 'project_planner_exclusions' THEN
+        IF TG_OP <> 'DELETE' THEN
+            PERFORM task_calendar_refresh(affected.task_id)
+            FROM (
+                SELECT DISTINCT task_id
+                FROM task_calendar_days
+                WHERE project_id = NEW.project_id AND day_date = NEW.day_date
+            ) AS affected;
+        END IF;
+        IF TG_OP <> 'INSERT' THEN
+            PERFORM task_calendar_refresh(affected.task_id)
+            FROM (
+                SELECT DISTINCT task_id
+                FROM task_calendar_days
+                WHERE project_id = OLD.project_id AND day_date = OLD.day_date
+            ) AS affected;
+        END IF;
+    ELSE
+        IF TG_OP <> 'DELETE' THEN
+            PERFORM task_calendar_refresh(NEW.task_id);
+        END IF;
+        IF TG_OP = 'DELETE' OR (TG_OP = 'UPDATE' AND OLD.task_id IS DISTINCT FROM NEW.task_id) THEN
+            PERFORM task_calendar_refresh(OLD.task_id);
+        END IF;
+    END IF;
+    RETURN NULL;
+END;
+$$;
+"""
+
+_TRIGGERS = {
+    "tasks": (
+        "AFTER INSERT OR UPDATE OF start_date, due_date, finish_period, department_id, "
+        "project_id, assigned_to, status, is_active"
+    ),
+    "task_planner_exclusions": "AFTER INSERT OR UPDATE OR DELETE",
+    "project_planner_exclusions": "AFTER INSERT OR UPDATE OR DELETE",
+    "task_daily_progress": "AFTER INSERT OR UPDATE OF day_date, daily_status, finish_period, task_id OR DELETE",
+}
+
+
+def upgrade() -> None:
+    op.create_table(
+        "task_calendar_days",
+        sa.Column("task_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("day_date", sa.Date(), nullable=False),
+        sa.Column("time_slot", sa.String(length=10), nullable=False),
+        sa.Column("department_id", postgresql.UUID(as_uuid=True), nullable=True),
+        sa.Column("project_id", postgresql.UUID(as_uuid=True), nullable=True),
+        sa.Column("assigned_to", postgresql.UUID(as_uuid=True), nullable=True),
+        sa.Column("status", sa.String(length=50), nullable=True),
+        sa.Column("daily_status", sa.String(length=50), nullable=True),
+        sa.Column("is_active", sa.Boolean(), nullable=False, server_default=sa.true()),
+        sa.Column(
+            "excluded_user_ids",
+            postgresql.ARRAY(postgresql.UUID(as_uuid=True)),
+            nullable=False,
+            server_default="{}",
+        ),
+        sa.Column("updated_at", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=True),
+        sa.ForeignKeyConstraint(["task_id"], ["tasks.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("task_id", "day_date", "time_slot"),
+    )
+    op.create_index("ix_task_calendar_days_day_department", "task_calendar_days", ["day_date", "department_id"])
+    op.create_index("ix_task_calendar_days_day_project", "task_calendar_days", ["day_date", "project_id"])
+    op.create_index("ix_task_calendar_days_day_assigned_to", "task_calendar_days", ["day_date", "assigned_to"])
+
+    op.execute(
+        _REFRESH_FUNCTION.format(
+            timezone=settings.APP_TIMEZONE.replace("'", "''"),
+            max_span_days=366,
+        )
+    )
+    op.execute(_TRIGGER_FUNCTION)
+    for table, events in _TRIGGERS.items():
+        op.execute(
+            f"CREATE TRIGGER {table}_task_calendar {events} ON {table} "
+            "FOR EACH ROW EXECUTE FUNCTION task_calendar_trigger()"
+        )
+    op.execute("SELECT task_calendar_refresh(id) FROM tasks WHERE due_date IS NOT NULL OR start_date IS NOT NULL")
+
+
+def downgrade() -> None:
+    for table in _TRIGGERS:
+        op.execute(f"DROP TRIGGER IF EXISTS {table}_task_calendar ON {table}")
+    op.execute("DROP FUNCTION IF EXISTS task_calendar_trigger()")
+    op.execute("DROP FUNCTION IF EXISTS task_calendar_refresh(uuid)")
+    op.drop_table("task_calendar_days")
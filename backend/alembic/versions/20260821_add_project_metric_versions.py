@@ -0,0 +1,107 @@
+"""Version project control metrics so cached values are invalidated on change.
+
+Revision ID: 20260821_project_metric_versions
+Revises: 20260820_task_calendar_days
+"""
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+revision = "20260821_project_metric_versions"
+down_revision = "20260820_task_calendar_days"
+branch_labels = None
+depends_on = None
+
+
+_BUMP_FUNCTION = """
+CREATE OR REPLACE FUNCTION project_metric_version_bump(p_project_id uuid) RETURNS void
+LANGUAGE sql AS $$
+    INSERT INTO project_metric_versions (project_id, version, updated_at)
+    VALUES (p_project_id, 1, now())
+    ON CONFLICT (project_id) DO UPDATE
+        SET version = project_metric_versions.version + 1, updated_at = now();
+$$;
+"""
+
+# Mirrors the inputs of app.services.project_display_title
+# .compute_project_control_week_metrics: CONTROL tasks and their product
+# counts, the totals of the origin tasks they reference in internal_notes,
+# and task_daily_progress values.
+_TRIGGER_FUNCTION = """
+CREATE OR REPLACE FUNCTION project_metric_version_trigger() RETURNS trigger
+LANGUAGE plpgsql AS $$
+BEGIN
+    IF TG_TABLE_NAME = 'tasks' THEN
+        IF TG_OP <> 'DELETE' AND NEW.project_id IS NOT NULL THEN
+            PERFORM project_metric_version_bump(NEW.project_id);
+        END IF;
+        IF TG_OP <> 'INSERT' AND OLD.project_id IS NOT NULL
+            AND (TG_OP = 'DELETE' OR OLD.project_id IS DISTINCT FROM NEW.project_id) THEN
+            PERFORM project_metric_version_bump(OLD.project_id);
+        END IF;
+        IF TG_OP = 'UPDATE' AND (
+            OLD.daily_products IS DISTINCT FROM NEW.daily_products
+            OR OLD.internal_notes IS DISTINCT FROM NEW.internal_notes
+        ) THEN
+            PERFORM project_metric_version_bump(control.project_id)
+            FROM (
+                SELECT DISTINCT project_id
+                FROM tasks
+                WHERE phase = 'CONTROL'
+                  AND project_id IS NOT NULL
+                  AND project_id IS DISTINCT FROM NEW.project_id
+                  AND internal_notes ILIKE '%' || NEW.id::text || '%'
+            ) AS control;
+        END IF;
+    ELSE
+        IF TG_OP <> 'DELETE' THEN
+            PERFORM project_metric_version_bump(t.project_id)
+            FROM tasks AS t
+            WHERE t.id = NEW.task_id AND t.project_id IS NOT NULL;
+        END IF;
+        IF TG_OP = 'DELETE' OR (TG_OP = 'UPDATE' AND OLD.task_id IS DISTINCT FROM NEW.task_id) THEN
+            PERFORM project_metric_version_bump(t.project_id)
+            FROM tasks AS t
+            WHERE t.id = OLD.task_id AND t.project_id IS NOT NULL;
+        END IF;
+    END IF;
+    RETURN NULL;
+END;
+$$;
+"""
+
+_TRIGGERS = {
+    "tasks": (
+        "AFTER INSERT OR UPDATE OF project_id, phase, is_active, daily_products, internal_notes OR DELETE"
+    ),
+    "task_daily_progress": (
+        "AFTER INSERT OR UPDATE OF task_id, day_date, completed_value, completed_delta OR DELETE"
+    ),
+}
+
+
+def upgrade() -> None:
+    op.create_table(
+        "project_metric_versions",
+        sa.Column("project_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("version", sa.BigInteger(), nullable=False, server_default="0"),
+        sa.Column("updated_at", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=True),
+        sa.PrimaryKeyConstraint("project_id"),
+    )
+    op.execute(_BUMP_FUNCTION)
+    op.execute(_TRIGGER_FUNCTION)
+    for table, events in _TRIGGERS.items():
+        op.execute(
+            f"CREATE TRIGGER {table}_project_metric_version {events} ON {table} "
+            "FOR EACH ROW EXECUTE FUNCTION project_metric_version_trigger()"
+        )
+
+
+def downgrade() -> None:
+    for table in _TRIGGERS:
+        op.execute(f"DROP TRIGGER IF EXISTS {table}_project_metric_version ON {table}")
+    op.execute("DROP FUNCTION IF EXISTS project_metric_version_trigger()")
+    op.execute("DROP FUNCTION IF EXISTS project_metric_version_bump(uuid)")
+    op.drop_table("project_metric_versions")
@@ -0,0 +1,31 @@
+"""add daily report task indexes
+
+Revision ID: 20260822_daily_report_task_indexes
+Revises: 20260821_project_metric_versions
+Create Date: 2026-08-22
+
+"""
+
+from __future__ import annotations
+
+from alembic import op
+
+
+revision = "20260822_daily_report_task_indexes"
+down_revision = "20260821_project_metric_versions"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Daily report / export candidates: a user's active regular tasks by due
+    # date. Co-assignees go through ix_task_assignees_user_task.
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS ix_tasks_daily_report_assignee_due "
+        "ON tasks (assigned_to, is_active, due_date) "
+        "WHERE system_template_origin_id IS NULL AND due_date IS NOT NULL"
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS ix_tasks_daily_report_assignee_due")
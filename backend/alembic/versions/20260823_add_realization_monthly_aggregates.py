@@ -0,0 +1,100 @@
+"""Store monthly Realization Pulse rollups per person and department.
+
+Revision ID: 20260823_rlz_monthly_aggregates
+Revises: 20260822_daily_report_task_indexes
+
+Months without rows are computed from their weekly results when read, and
+the first weekly refresh of such a month stores all of its weeks.
+scripts/rebuild_realization_monthly_aggregates.py rebuilds every month.
+"""
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+revision = "20260823_rlz_monthly_aggregates"
+down_revision = "20260822_daily_report_task_indexes"
+branch_labels = None
+depends_on = None
+
+
+_PERSON_COUNTERS = (
+    "plus_count",
+    "plus_plus_count",
+    "diamond_count",
+    "question_count",
+    "ok_count",
+    "unresolved_pink_days",
+    "verified_positive_extras",
+    "unresolved_negative_evidence",
+    "verified_negative_evidence",
+)
+
+
+def upgrade() -> None:
+    op.create_table(
+        "realization_monthly_person_aggregates",
+        sa.Column("id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("department_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("month_start", sa.Date(), nullable=False),
+        sa.Column("user_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column(
+            "weekly_history",
+            postgresql.JSONB(astext_type=sa.Text()),
+            server_default=sa.text("'[]'::jsonb"),
+            nullable=False,
+        ),
+        *(sa.Column(name, sa.Integer(), server_default="0", nullable=False) for name in _PERSON_COUNTERS),
+        sa.Column(
+            "trend",
+            postgresql.JSONB(astext_type=sa.Text()),
+            server_default=sa.text("'[]'::jsonb"),
+            nullable=False,
+        ),
+        sa.Column("current_pulse", sa.String(length=20), nullable=True),
+        sa.Column("updated_at", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
+        sa.ForeignKeyConstraint(["department_id"], ["departments.id"], ondelete="CASCADE"),
+        sa.ForeignKeyConstraint(["user_id"], ["users.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint(
+            "department_id", "month_start", "user_id", name="uq_realization_monthly_person_aggregate"
+        ),
+    )
+    op.create_index(
+        "ix_realization_monthly_person_aggregates_user_id",
+        "realization_monthly_person_aggregates",
+        ["user_id"],
+    )
+    op.create_table(
+        "realization_monthly_department_aggregates",
+        sa.Column("id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("department_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("month_start", sa.Date(), nullable=False),
+        sa.Column("people_count", sa.Integer(), server_default="0", nullable=False),
+        sa.Column(
+            "pulse_counts",
+            postgresql.JSONB(astext_type=sa.Text()),
+            server_default=sa.text("'{}'::jsonb"),
+            nullable=False,
+        ),
+        sa.Column(
+            "source_weekly_period_ids",
+            postgresql.JSONB(astext_type=sa.Text()),
+            server_default=sa.text("'[]'::jsonb"),
+            nullable=False,
+        ),
+        sa.Column("updated_at", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
+        sa.ForeignKeyConstraint(["department_id"], ["departments.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("department_id", "month_start", name="uq_realization_monthly_department_aggregate"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("realization_monthly_department_aggregates")
+    op.drop_index(
+        "ix_realization_monthly_person_aggregates_user_id",
+        table_name="realization_monthly_person_aggregates",
+    )
+    op.drop_table("realization_monthly_person_aggregates")
@@ -0,0 +1,34 @@
+"""add checklist item import key
+
+Revision ID: 20260824_checklist_item_import_key
+Revises: 20260823_rlz_monthly_aggregates
+Create Date: 2026-08-24
+
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+
+
+revision = "20260824_checklist_item_import_key"
+down_revision = "20260823_rlz_monthly_aggregates"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column("checklist_items", sa.Column("import_key", sa.String(length=64), nullable=True))
+    # Excel template imports upsert against this; items created in the UI
+    # keep a NULL key and stay outside the constraint.
+    op.execute(
+        "CREATE UNIQUE INDEX IF NOT EXISTS uq_checklist_items_checklist_import_key "
+        "ON checklist_items (checklist_id, import_key) "
+        "WHERE import_key IS NOT NULL"
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS uq_checklist_items_checklist_import_key")
+    op.drop_column("checklist_items", "import_key")
@@ -0,0 +1,34 @@
+"""add updated_at to system task templates and weekly plans
+
+Revision ID: 20260825_planner_source_updated_at
+Revises: 20260824_checklist_item_import_key
+Create Date: 2026-08-25
+
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+
+
+revision = "20260825_planner_source_updated_at"
+down_revision = "20260824_checklist_item_import_key"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # The live weekly comparison fingerprints the rows the planner reads by
+    # (id, updated_at); edits to these tables must move it too.
+    for table in ("system_task_templates", "weekly_plans"):
+        op.add_column(
+            table,
+            sa.Column("updated_at", sa.DateTime(timezone=True), nullable=False, server_default=sa.text("now()")),
+        )
+        op.execute(f"UPDATE {table} SET updated_at = created_at WHERE created_at IS NOT NULL")
+
+
+def downgrade() -> None:
+    op.drop_column("weekly_plans", "updated_at")
+    op.drop_column("system_task_templates", "updated_at")
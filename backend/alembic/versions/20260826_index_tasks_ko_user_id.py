@@ -0,0 +1,39 @@
+"""index the KO owner parsed from task internal notes
+
+Revision ID: 20260826_tasks_ko_user_id_index
+Revises: 20260825_planner_source_updated_at
+Create Date: 2026-08-26
+
+"""
+
+from __future__ import annotations
+
+from alembic import op
+
+
+revision = "20260826_tasks_ko_user_id_index"
+down_revision = "20260825_planner_source_updated_at"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Daily report candidates look up a user's KO tasks by this expression
+    # (daily_report_data.ko_user_id_expr); an ILIKE on internal_notes could
+    # not use any index.
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS ix_tasks_ko_user_id "
+        "ON tasks (lower(substring(internal_notes, '(?i)ko_user_id[:=]\\s*([a-f0-9-]+)')))"
+    )
+    # No candidate query filters on assigned_to together with the partial
+    # predicate, so this index was never used.
+    op.execute("DROP INDEX IF EXISTS ix_tasks_daily_report_assignee_due")
+
+
+def downgrade() -> None:
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS ix_tasks_daily_report_assignee_due "
+        "ON tasks (assigned_to, is_active, due_date) "
+        "WHERE system_template_origin_id IS NULL AND due_date IS NOT NULL"
+    )
+    op.execute("DROP INDEX IF EXISTS ix_tasks_ko_user_id")
@@ -0,0 +1,130 @@
+"""index CONTROL tasks by origin task and bump metrics on origin insert/delete
+
+Revision ID: 20260827_control_origin_task_index
+Revises: 20260826_tasks_ko_user_id_index
+Create Date: 2026-08-27
+
+"""
+
+from __future__ import annotations
+
+from alembic import op
+
+
+revision = "20260827_control_origin_task_index"
+down_revision = "20260826_tasks_ko_user_id_index"
+branch_labels = None
+depends_on = None
+
+
+# Same match as project_display_title.ORIGIN_TASK_ID_RE; the trigger below
+# must use this exact expression for the index to apply.
+_ORIGIN_TASK_ID_EXPR = "lower(substring(internal_notes, '(?i)origin_task_id[:=]\\s*([a-f0-9-]+)'))"
+
+_OWN_PROJECT_BUMPS = """
+        IF TG_OP <> 'DELETE' AND NEW.project_id IS NOT NULL THEN
+            PERFORM project_metric_version_bump(NEW.project_id);
+        END IF;
+        IF TG_OP <> 'INSERT' AND OLD.project_id IS NOT NULL
+            AND (TG_OP = 'DELETE' OR OLD.project_id IS DISTINCT FROM NEW.project_id) THEN
+            PERFORM project_metric_version_bump(OLD.project_id);
+        END IF;
+"""
+
+_PROGRESS_BUMPS = """
+    ELSE
+        IF TG_OP <> 'DELETE' THEN
+            PERFORM project_metric_version_bump(t.project_id)
+            FROM tasks AS t
+            WHERE t.id = NEW.task_id AND t.project_id IS NOT NULL;
+        END IF;
+        IF TG_OP = 'DELETE' OR (TG_OP = 'UPDATE' AND OLD.task_id IS DISTINCT FROM NEW.task_id) THEN
+            PERFORM project_metric_version_bump(t.project_id)
+            FROM tasks AS t
+            WHERE t.id = OLD.task_id AND t.project_id IS NOT NULL;
+        END IF;
+    END IF;
+    RETURN NULL;
+END;
+$$;
+"""
+
+# CONTROL tasks take their total from the origin task they name, so adding,
+# removing or editing an origin task changes their projects' metrics too.
+_TRIGGER_FUNCTION = (
+    """
+CREATE OR REPLACE FUNCTION project_metric_version_trigger() RETURNS trigger
+LANGUAGE plpgsql AS $$
+DECLARE
+    origin_id uuid;
+    origin_project_id uuid;
+BEGIN
+    IF TG_TABLE_NAME = 'tasks' THEN
+"""
+    + _OWN_PROJECT_BUMPS
+    + f"""
+        IF TG_OP <> 'UPDATE'
+            OR OLD.daily_products IS DISTINCT FROM NEW.daily_products
+            OR OLD.internal_notes IS DISTINCT FROM NEW.internal_notes THEN
+            IF TG_OP = 'DELETE' THEN
+                origin_id := OLD.id;
+                origin_project_id := OLD.project_id;
+            ELSE
+                origin_id := NEW.id;
+                origin_project_id := NEW.project_id;
+            END IF;
+            PERFORM project_metric_version_bump(control.project_id)
+            FROM (
+                SELECT DISTINCT project_id
+                FROM tasks
+                WHERE phase = 'CONTROL'
+                  AND {_ORIGIN_TASK_ID_EXPR} = origin_id::text
+                  AND project_id IS NOT NULL
+                  AND project_id IS DISTINCT FROM origin_project_id
+            ) AS control;
+        END IF;
+"""
+    + _PROGRESS_BUMPS
+)
+
+_PREVIOUS_TRIGGER_FUNCTION = (
+    """
+CREATE OR REPLACE FUNCTION project_metric_version_trigger() RETURNS trigger
+LANGUAGE plpgsql AS $$
+BEGIN
+    IF TG_TABLE_NAME = 'tasks' THEN
+"""
+    + _OWN_PROJECT_BUMPS
+    + """
+        IF TG_OP = 'UPDATE' AND (
+            OLD.daily_products IS DISTINCT FROM NEW.daily_products
+            OR OLD.internal_notes IS DISTINCT FROM NEW.internal_notes
+        ) THEN
+            PERFORM project_metric_version_bump(control.project_id)
+            FROM (
+                SELECT DISTINCT project_id
+                FROM tasks
+                WHERE phase = 'CONTROL'
+                  AND project_id IS NOT NULL
+                  AND project_id IS DISTINCT FROM NEW.project_id
+                  AND internal_notes ILIKE '%' || NEW.id::text || '%'
+            ) AS control;
+        END IF;
+"""
+    + _PROGRESS_BUMPS
+)
+
+
+def upgrade() -> None:
+    # The trigger used to find dependent CONTROL tasks with an ILIKE on
+    # internal_notes, a full scan of tasks for every origin edit.
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS ix_tasks_control_origin_task_id "
+        f"ON tasks ({_ORIGIN_TASK_ID_EXPR}) WHERE phase = 'CONTROL'"
+    )
+    op.execute(_TRIGGER_FUNCTION)
+
+
+def downgrade() -> None:
+    op.execute(_PREVIOUS_TRIGGER_FUNCTION)
+    op.execute("DROP INDEX IF EXISTS ix_tasks_control_origin_task_id")
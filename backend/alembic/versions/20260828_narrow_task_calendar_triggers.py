@@ -0,0 +1,256 @@
+"""rebuild task calendar days only when a task's planner days can change
+
+Revision ID: 20260828_task_calendar_date_triggers
+Revises: 20260827_control_origin_task_index
+Create Date: 2026-08-28
+
+"""
+
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+from app.config import settings
+
+
+revision = "20260828_task_calendar_date_triggers"
+down_revision = "20260827_control_origin_task_index"
+branch_labels = None
+depends_on = None
+
+
+# Mirrors app.services.task_calendar.task_calendar_slots. {columns} and
+# {values} are the copied task fields; {timezone} is the zone expression.
+_REFRESH_TEMPLATE = """
+CREATE OR REPLACE FUNCTION task_calendar_refresh({signature}) RETURNS void
+LANGUAGE plpgsql AS $$
+BEGIN
+    DELETE FROM task_calendar_days WHERE task_id = p_task_id;
+    INSERT INTO task_calendar_days (
+        task_id, day_date, time_slot, department_id, project_id, assigned_to,{columns}
+        excluded_user_ids, updated_at
+    )
+    SELECT
+        t.id,
+        day.day_date,
+        slot.time_slot,
+        t.department_id,
+        t.project_id,
+        t.assigned_to,{values}
+        ARRAY(
+            SELECT exclusion.user_id
+            FROM task_planner_exclusions AS exclusion
+            WHERE exclusion.task_id = t.id
+              AND exclusion.day_date = day.day_date
+              AND UPPER(COALESCE(exclusion.time_slot, 'ALL')) IN ('ALL', slot.time_slot)
+            UNION
+            SELECT exclusion.user_id
+            FROM project_planner_exclusions AS exclusion
+            WHERE exclusion.project_id = t.project_id
+              AND exclusion.day_date = day.day_date
+              AND UPPER(COALESCE(exclusion.time_slot, 'ALL')) IN ('ALL', slot.time_slot)
+        ),
+        now()
+    FROM tasks AS t
+    CROSS JOIN LATERAL (
+        SELECT
+            (t.due_date AT TIME ZONE {timezone})::date AS due_day,
+            (t.start_date AT TIME ZONE {timezone})::date AS start_day
+    ) AS local
+    CROSS JOIN LATERAL (
+        SELECT
+            COALESCE(local.due_day, local.start_day) AS last_day,
+            CASE
+                WHEN local.due_day IS NULL OR local.start_day IS NULL OR local.start_day > local.due_day
+                    THEN COALESCE(local.due_day, local.start_day)
+                ELSE GREATEST(local.start_day, local.due_day - 366)
+            END AS first_day
+    ) AS span
+    CROSS JOIN LATERAL (
+        SELECT generated::date AS day_date
+        FROM generate_series(span.first_day, span.last_day, interval '1 day') AS generated
+    ) AS day
+    LEFT JOIN task_daily_progress AS progress
+        ON progress.task_id = t.id AND progress.day_date = day.day_date
+    CROSS JOIN LATERAL (
+        SELECT CASE
+            WHEN progress.finish_period = 'ALL' THEN NULL
+            WHEN progress.finish_period IS NOT NULL THEN UPPER(progress.finish_period)
+            ELSE UPPER(t.finish_period)
+        END AS finish_period
+    ) AS effective
+    CROSS JOIN LATERAL unnest(
+        CASE effective.finish_period
+            WHEN 'AM' THEN ARRAY['AM']
+            WHEN 'PM' THEN ARRAY['PM']
+            ELSE ARRAY['AM', 'PM']
+        END
+    ) AS slot(time_slot)
+    WHERE t.id = p_task_id
+      AND span.last_day IS NOT NULL
+      AND (span.first_day = span.last_day OR EXTRACT(ISODOW FROM day.day_date) < 6);
+END;
+$$;
+"""
+
+# The planner zone is the trigger argument; rows hold local days, so a new
+# APP_TIMEZONE needs a migration that recreates these triggers with it and
+# refreshes every task.
+_TRIGGER_FUNCTION = """
+CREATE OR REPLACE FUNCTION task_calendar_trigger() RETURNS trigger
+LANGUAGE plpgsql AS $$
+BEGIN
+    IF TG_TABLE_NAME = 'tasks' THEN
+        IF TG_OP = 'INSERT' THEN
+            PERFORM task_calendar_refresh(NEW.id, TG_ARGV[0]);
+        ELSIF OLD.start_date IS DISTINCT FROM NEW.start_date
+            OR OLD.due_date IS DISTINCT FROM NEW.due_date
+            OR OLD.finish_period IS DISTINCT FROM NEW.finish_period
+            OR OLD.project_id IS DISTINCT FROM NEW.project_id THEN
+            PERFORM task_calendar_refresh(NEW.id, TG_ARGV[0]);
+        ELSIF OLD.department_id IS DISTINCT FROM NEW.department_id
+            OR OLD.assigned_to IS DISTINCT FROM NEW.assigned_to THEN
+            -- Same days, new owner: no need to rebuild them.
+            UPDATE task_calendar_days
+            SET department_id = NEW.department_id, assigned_to = NEW.assigned_to, updated_at = now()
+            WHERE task_id = NEW.id;
+        END IF;
+    ELSIF TG_TABLE_NAME = 'project_planner_exclusions' THEN
+        IF TG_OP <> 'DELETE' THEN
+            PERFORM task_calendar_refresh(affected.task_id, TG_ARGV[0])
+            FROM (
+                SELECT DISTINCT task_id
+                FROM task_calendar_days
+                WHERE project_id = NEW.project_id AND day_date = NEW.day_date
+            ) AS affected;
+        END IF;
+        IF TG_OP <> 'INSERT' THEN
+            PERFORM task_calendar_refresh(affected.task_id, TG_ARGV[0])
+            FROM (
+                SELECT DISTINCT task_id
+                FROM task_calendar_days
+                WHERE project_id = OLD.project_id AND day_date = OLD.day_date
+            ) AS affected;
+        END IF;
+    ELSE
+        IF TG_OP <> 'DELETE' THEN
+            PERFORM task_calendar_refresh(NEW.task_id, TG_ARGV[0]);
+        END IF;
+        IF TG_OP = 'DELETE' OR (TG_OP = 'UPDATE' AND OLD.task_id IS DISTINCT FROM NEW.task_id) THEN
+            PERFORM task_calendar_refresh(OLD.task_id, TG_ARGV[0]);
+        END IF;
+    END IF;
+    RETURN NULL;
+END;
+$$;
+"""
+
+# Status, activity and daily status do not move a task between days; the
+# copies of them were never read, so they are dropped rather than kept fresh.
+_TRIGGERS = {
+    "tasks": "AFTER INSERT OR UPDATE OF start_date, due_date, finish_period, project_id, department_id, assigned_to",
+    "task_planner_exclusions": "AFTER INSERT OR UPDATE OR DELETE",
+    "project_planner_exclusions": "AFTER INSERT OR UPDATE OR DELETE",
+    "task_daily_progress": "AFTER INSERT OR UPDATE OF day_date, finish_period, task_id OR DELETE",
+}
+
+_PREVIOUS_TRIGGER_FUNCTION = """
+CREATE OR REPLACE FUNCTION task_calendar_trigger() RETURNS trigger
+LANGUAGE plpgsql AS $$
+BEGIN
+    IF TG_TABLE_NAME = 'tasks' THEN
+        PERFORM task_calendar_refresh(NEW.id);
+    ELSIF TG_TABLE_NAME = 'project_planner_exclusions' THEN
+        IF TG_OP <> 'DELETE' THEN
+            PERFORM task_calendar_refresh(affected.task_id)
+            FROM (
+                SELECT DISTINCT task_id
+                FROM task_calendar_days
+                WHERE project_id = NEW.project_id AND day_date = NEW.day_date
+            ) AS affected;
+        END IF;
+        IF TG_OP <> 'INSERT' THEN
+            PERFORM task_calendar_refresh(affected.task_id)
+            FROM (
+                SELECT DISTINCT task_id
+                FROM task_calendar_days
+                WHERE project_id = OLD.project_id AND day_date = OLD.day_date
+            ) AS affected;
+        END IF;
+    ELSE
+        IF TG_OP <> 'DELETE' THEN
+            PERFORM task_calendar_refresh(NEW.task_id);
+        END IF;
+        IF TG_OP = 'DELETE' OR (TG_OP = 'UPDATE' AND OLD.task_id IS DISTINCT FROM NEW.task_id) THEN
+            PERFORM task_calendar_refresh(OLD.task_id);
+        END IF;
+    END IF;
+    RETURN NULL;
+END;
+$$;
+"""
+
+_PREVIOUS_TRIGGERS = {
+    "tasks": (
+        "AFTER INSERT OR UPDATE OF start_date, due_date, finish_period, department_id, "
+        "project_id, assigned_to, status, is_active"
+    ),
+    "task_planner_exclusions": "AFTER INSERT OR UPDATE OR DELETE",
+    "project_planner_exclusions": "AFTER INSERT OR UPDATE OR DELETE",
+    "task_daily_progress": "AFTER INSERT OR UPDATE OF day_date, daily_status, finish_period, task_id OR DELETE",
+}
+
+
+def _quoted_timezone() -> str:
+    return "'" + settings.APP_TIMEZONE.replace("'", "''") + "'"
+
+
+def _drop_triggers() -> None:
+    for table in _TRIGGERS:
+        op.execute(f"DROP TRIGGER IF EXISTS {table}_task_calendar ON {table}")
+
+
+def upgrade() -> None:
+    _drop_triggers()
+    op.execute("DROP FUNCTION IF EXISTS task_calendar_refresh(uuid)")
+    op.drop_column("task_calendar_days", "status")
+    op.drop_column("task_calendar_days", "daily_status")
+    op.drop_column("task_calendar_days", "is_active")
+    op.execute(
+        _REFRESH_TEMPLATE.format(
+            signature="p_task_id uuid, p_timezone text", columns="", values="", timezone="p_timezone"
+        )
+    )
+    op.execute(_TRIGGER_FUNCTION)
+    for table, events in _TRIGGERS.items():
+        op.execute(
+            f"CREATE TRIGGER {table}_task_calendar {events} ON {table} "
+            f"FOR EACH ROW EXECUTE FUNCTION task_calendar_trigger({_quoted_timezone()})"
+        )
+
+
+def downgrade() -> None:
+    _drop_triggers()
+    op.execute("DROP FUNCTION IF EXISTS task_calendar_refresh(uuid, text)")
+    op.add_column("task_calendar_days", sa.Column("status", sa.String(length=50), nullable=True))
+    op.add_column("task_calendar_days", sa.Column("daily_status", sa.String(length=50), nullable=True))
+    op.add_column(
+        "task_calendar_days",
+        sa.Column("is_active", sa.Boolean(), nullable=False, server_default=sa.true()),
+    )
+    op.execute(
+        _REFRESH_TEMPLATE.format(
+            signature="p_task_id uuid",
+            columns="\n        status, daily_status, is_active,",
+            values="\n        t.status,\n        progress.daily_status,\n        t.is_active,",
+            timezone=_quoted_timezone(),
+        )
+    )
+    op.execute(_PREVIOUS_TRIGGER_FUNCTION)
+    for table, events in _PREVIOUS_TRIGGERS.items():
+        op.execute(
+            f"CREATE TRIGGER {table}_task_calendar {events} ON {table} "
+            "FOR EACH ROW EXECUTE FUNCTION task_calendar_trigger()"
+        )
+    op.execute("SELECT task_calendar_refresh(id) FROM tasks WHERE due_date IS NOT NULL OR start_date IS NOT NULL")
@@ -0,0 +1,143 @@
+"""bump project metric versions only for CONTROL tasks and their origin tasks
+
+Revision ID: 20260829_control_metric_bumps
+Revises: 20260828_task_calendar_date_triggers
+Create Date: 2026-08-29
+
+"""
+
+from __future__ import annotations
+
+from alembic import op
+
+
+revision = "20260829_control_metric_bumps"
+down_revision = "20260828_task_calendar_date_triggers"
+branch_labels = None
+depends_on = None
+
+
+# Same expression as ix_tasks_control_origin_task_id (20260827).
+_ORIGIN_TASK_ID_EXPR = "lower(substring(internal_notes, '(?i)origin_task_id[:=]\\s*([a-f0-9-]+)'))"
+
+# compute_project_control_week_metrics reads active CONTROL tasks, the totals
+# of the origin tasks they name and the daily progress of those CONTROL tasks.
+# Any other task write leaves the metrics alone, so it must not queue on the
+# project's version row. Projects are bumped in id order so two transactions
+# touching the same projects lock them in the same order.
+_TRIGGER_FUNCTION = f"""
+CREATE OR REPLACE FUNCTION project_metric_version_trigger() RETURNS trigger
+LANGUAGE plpgsql AS $$
+DECLARE
+    changed_id uuid;
+    origin_changed boolean;
+BEGIN
+    IF TG_TABLE_NAME = 'tasks' THEN
+        IF TG_OP = 'UPDATE' THEN
+            IF OLD.project_id IS NOT DISTINCT FROM NEW.project_id
+                AND OLD.phase IS NOT DISTINCT FROM NEW.phase
+                AND OLD.is_active IS NOT DISTINCT FROM NEW.is_active
+                AND OLD.daily_products IS NOT DISTINCT FROM NEW.daily_products
+                AND OLD.internal_notes IS NOT DISTINCT FROM NEW.internal_notes THEN
+                RETURN NULL;
+            END IF;
+            changed_id := NEW.id;
+            origin_changed := OLD.daily_products IS DISTINCT FROM NEW.daily_products
+                OR OLD.internal_notes IS DISTINCT FROM NEW.internal_notes;
+        ELSIF TG_OP = 'INSERT' THEN
+            changed_id := NEW.id;
+            origin_changed := true;
+        ELSE
+            changed_id := OLD.id;
+            origin_changed := true;
+        END IF;
+        PERFORM project_metric_version_bump(affected.project_id)
+        FROM (
+            SELECT NEW.project_id AS project_id WHERE NEW.phase = 'CONTROL'
+            UNION
+            SELECT OLD.project_id WHERE OLD.phase = 'CONTROL'
+            UNION
+            SELECT project_id
+            FROM tasks
+            WHERE origin_changed
+              AND phase = 'CONTROL'
+              AND {_ORIGIN_TASK_ID_EXPR} = changed_id::text
+        ) AS affected
+        WHERE affected.project_id IS NOT NULL
+        ORDER BY affected.project_id;
+    ELSE
+        PERFORM project_metric_version_bump(t.project_id)
+        FROM tasks AS t
+        WHERE t.id IN (NEW.task_id, OLD.task_id)
+          AND t.phase = 'CONTROL'
+          AND t.project_id IS NOT NULL
+        GROUP BY t.project_id
+        ORDER BY t.project_id;
+    END IF;
+    RETURN NULL;
+END;
+$$;
+"""
+
+# 20260827_control_origin_task_index
+_PREVIOUS_TRIGGER_FUNCTION = f"""
+CREATE OR REPLACE FUNCTION project_metric_version_trigger() RETURNS trigger
+LANGUAGE plpgsql AS $$
+DECLARE
+    origin_id uuid;
+    origin_project_id uuid;
+BEGIN
+    IF TG_TABLE_NAME = 'tasks' THEN
+        IF TG_OP <> 'DELETE' AND NEW.project_id IS NOT NULL THEN
+            PERFORM project_metric_version_bump(NEW.project_id);
+        END IF;
+        IF TG_OP <> 'INSERT' AND OLD.project_id IS NOT NULL
+            AND (TG_OP = 'DELETE' OR OLD.project_id IS DISTINCT FROM NEW.project_id) THEN
+            PERFORM project_metric_version_bump(OLD.project_id);
+        END IF;
+
+        IF TG_OP <> 'UPDATE'
+            OR OLD.daily_products IS DISTINCT FROM NEW.daily_products
+            OR OLD.internal_notes IS DISTINCT FROM NEW.internal_notes THEN
+            IF TG_OP = 'DELETE' THEN
+                origin_id := OLD.id;
+                origin_project_id := OLD.project_id;
+            ELSE
+                origin_id := NEW.id;
+                origin_project_id := NEW.project_id;
+            END IF;
+            PERFORM project_metric_version_bump(control.project_id)
+            FROM (
+                SELECT DISTINCT project_id
+                FROM tasks
+                WHERE phase = 'CONTROL'
+                  AND {_ORIGIN_TASK_ID_EXPR} = origin_id::text
+                  AND project_id IS NOT NULL
+                  AND project_id IS DISTINCT FROM origin_project_id
+            ) AS control;
+        END IF;
+
+    ELSE
+        IF TG_OP <> 'DELETE' THEN
+            PERFORM project_metric_version_bump(t.project_id)
+            FROM tasks AS t
+            WHERE t.id = NEW.task_id AND t.project_id IS NOT NULL;
+        END IF;
+        IF TG_OP = 'DELETE' OR (TG_OP = 'UPDATE' AND OLD.task_id IS DISTINCT FROM NEW.task_id) THEN
+            PERFORM project_metric_version_bump(t.project_id)
+            FROM tasks AS t
+            WHERE t.id = OLD.task_id AND t.project_id IS NOT NULL;
+        END IF;
+    END IF;
+    RETURN NULL;
+END;
+$$;
+"""
+
+
+def upgrade() -> None:
+    op.execute(_TRIGGER_FUNCTION)
+
+
+def downgrade() -> None:
+    op.execute(_PREVIOUS_TRIGGER_FUNCTION)
@@ -0,0 +1,88 @@
+"""drop the trigger-maintained task calendar
+
+Revision ID: 20260830_drop_task_calendar_days
+Revises: 20260829_control_metric_bumps
+Create Date: 2026-08-30
+
+"""
+
+from __future__ import annotations
+
+import importlib.util
+from pathlib import Path
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+revision = "20260830_drop_task_calendar_days"
+down_revision = "20260829_control_metric_bumps"
+branch_labels = None
+depends_on = None
+
+
+# Only the monthly planner read task_calendar_days, while its triggers
+# rewrote up to two years of rows on every task date change. The weekly
+# planners, the common view and the 1H reports derive their days with rules
+# (progress days, completion days, department exceptions) the table does not
+# hold, so they could not use it.
+_TABLES = ("tasks", "task_planner_exclusions", "project_planner_exclusions", "task_daily_progress")
+
+
+def _calendar_revision():
+    # The 20260828 SQL is reused so a downgrade restores exactly that state.
+    path = Path(__file__).with_name("20260828_narrow_task_calendar_triggers.py")
+    spec = importlib.util.spec_from_file_location("task_calendar_date_triggers", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def upgrade() -> None:
+    for table in _TABLES:
+        op.execute(f"DROP TRIGGER IF EXISTS {table}_task_calendar ON {table}")
+    op.execute("DROP FUNCTION IF EXISTS task_calendar_trigger()")
+    op.execute("DROP FUNCTION IF EXISTS task_calendar_refresh(uuid, text)")
+    op.drop_table("task_calendar_days")
+
+
+def downgrade() -> None:
+    calendar = _calendar_revision()
+    op.create_table(
+        "task_calendar_days",
+        sa.Column("task_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("day_date", sa.Date(), nullable=False),
+        sa.Column("time_slot", sa.String(length=10), nullable=False),
+        sa.Column("department_id", postgresql.UUID(as_uuid=True), nullable=True),
+        sa.Column("project_id", postgresql.UUID(as_uuid=True), nullable=True),
+        sa.Column("assigned_to", postgresql.UUID(as_uuid=True), nullable=True),
+        sa.Column(
+            "excluded_user_ids",
+            postgresql.ARRAY(postgresql.UUID(as_uuid=True)),
+            nullable=False,
+            server_default="{}",
+        ),
+        sa.Column("updated_at", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=True),
+        sa.ForeignKeyConstraint(["task_id"], ["tasks.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("task_id", "day_date", "time_slot"),
+    )
+    op.create_index("ix_task_calendar_days_day_department", "task_calendar_days", ["day_date", "department_id"])
+    op.create_index("ix_task_calendar_days_day_project", "task_calendar_days", ["day_date", "project_id"])
+    op.create_index("ix_task_calendar_days_day_assigned_to", "task_calendar_days", ["day_date", "assigned_to"])
+    op.execute(
+        calendar._REFRESH_TEMPLATE.format(
+            signature="p_task_id uuid, p_timezone text", columns="", values="", timezone="p_timezone"
+        )
+    )
+    op.execute(calendar._TRIGGER_FUNCTION)
+    timezone = calendar._quoted_timezone()
+    for table, events in calendar._TRIGGERS.items():
+        op.execute(
+            f"CREATE TRIGGER {table}_task_calendar {events} ON {table} "
+            f"FOR EACH ROW EXECUTE FUNCTION task_calendar_trigger({timezone})"
+        )
+    op.execute(
+        f"SELECT task_calendar_refresh(id, {timezone}) FROM tasks "
+        "WHERE due_date IS NOT NULL OR start_date IS NOT NULL"
+    )
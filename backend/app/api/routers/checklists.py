@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import uuid
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, File, Form, HTTPException, UploadFile, status
 from sqlalchemy import nulls_last, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
@@ -15,8 +15,15 @@ from app.models.checklist_item import ChecklistItem, ChecklistItemAssignee
 from app.models.enums import UserRole
 from app.models.project import Project
 from app.models.task import Task
-from app.schemas.checklist import ChecklistCreate, ChecklistOut, ChecklistUpdate, ChecklistWithItemsOut
+from app.schemas.checklist import (
+    ChecklistCreate,
+    ChecklistImportJobOut,
+    ChecklistOut,
+    ChecklistUpdate,
+    ChecklistWithItemsOut,
+)
 from app.schemas.checklist_item import ChecklistItemAssigneeOut, ChecklistItemOut
+from app.services.checklist_import import MAX_UPLOAD_BYTES, get_import_progress, start_checklist_import
 
 
 router = APIRouter()
@@ -276,3 +283,42 @@ async def delete_checklist(
     await db.delete(checklist)
     await db.commit()
     return {"ok": True}
+
+
+@router.post("/import", response_model=ChecklistImportJobOut, status_code=status.HTTP_202_ACCEPTED)
+async def import_checklist_template(
+    file: UploadFile = File(...),
+    title: str = Form(...),
+    group_key: str = Form(...),
+    sheet: str | None = Form(None),
+    note: str | None = Form(None),
+    position: int | None = Form(None),
+    user=Depends(get_current_user),
+) -> ChecklistImportJobOut:
+    ensure_manager_or_admin(user)
+    if not (file.filename or "").lower().endswith(".xlsx"):
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="An XLSX file is required")
+    content = await file.read(MAX_UPLOAD_BYTES + 1)
+    if len(content) > MAX_UPLOAD_BYTES:
+        raise HTTPException(status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE, detail="XLSX file is too large")
+    progress = await start_checklist_import(
+        content,
+        title=title,
+        group_key=group_key,
+        sheet_name=sheet or None,
+        note=note,
+        position=position,
+    )
+    return ChecklistImportJobOut(**progress.to_dict())
+
+
+@router.get("/import/{job_id}", response_model=ChecklistImportJobOut)
+async def get_checklist_import(
+    job_id: str,
+    user=Depends(get_current_user),
+) -> ChecklistImportJobOut:
+    ensure_manager_or_admin(user)
+    progress = await get_import_progress(job_id)
+    if progress is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Import job not found")
+    return ChecklistImportJobOut(**progress.to_dict())
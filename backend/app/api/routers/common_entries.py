@@ -28,7 +28,7 @@ from app.schemas.common_entry import (
     CommonEntryReject,
 )
 from app.services.audit import add_audit_log
-from app.services.notifications import add_notification, publish_notification
+from app.services.notifications import add_notification, publish_notifications
 
 
 router = APIRouter()
@@ -287,11 +287,7 @@ async def create_entry(
     await db.refresh(entry)
 
     # Publish notifications
-    for n in created_notifications:
-        try:
-            await publish_notification(user_id=n.user_id, notification=n)
-        except Exception:
-            pass
+    await publish_notifications(created_notifications)
 
     return _to_out(entry)
 
@@ -342,11 +338,7 @@ async def assign_entry(
     await db.commit()
     await db.refresh(entry)
 
-    for n in created_notifications:
-        try:
-            await publish_notification(user_id=n.user_id, notification=n)
-        except Exception:
-            pass
+    await publish_notifications(created_notifications)
 
     return _to_out(entry)
 
@@ -449,11 +441,7 @@ async def approve_entry(
     await db.commit()
     await db.refresh(entry)
 
-    for n in created_notifications:
-        try:
-            await publish_notification(user_id=n.user_id, notification=n)
-        except Exception:
-            pass
+    await publish_notifications(created_notifications)
 
     return _to_out(entry)
 
@@ -19,6 +19,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.access import ensure_department_access
 from app.api.deps import get_current_user
+from app.api.serialization import PreEncodedRoute, pre_encoded
 from app.config import settings
 from app.db import get_db
 from app.models.common_entry import CommonEntry
@@ -40,7 +41,7 @@ from app.services.one_h_slots import effective_slot_date
 from app.services.system_task_schedule import matches_template_date
 
 
-router = APIRouter()
+router = APIRouter(route_class=PreEncodedRoute)
 FEEDBACK_DAILY_MARKER = "[EVERYDAY]"
 
 
@@ -424,6 +425,7 @@ async def _compute_etag(
 
 
 @router.get("", response_model=CommonViewResponse)
+@pre_encoded
 async def get_common_view(
     request: Request,
     response: Response,
@@ -8,7 +8,6 @@ import uuid
 from datetime import date, datetime, time, timedelta, timezone
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
-from fastapi.encoders import jsonable_encoder
 from fastapi.responses import StreamingResponse
 from openpyxl import Workbook
 from openpyxl.cell.rich_text import CellRichText, TextBlock
@@ -27,7 +26,7 @@ from pydantic import BaseModel, Field
 
 from app.api.access import ensure_department_access, ensure_manager_or_admin, ensure_reports_access
 from app.api.deps import get_current_user
-from app.db import get_db
+from app.db import get_read_db
 from app.models.checklist import Checklist
 from app.models.checklist_item import ChecklistItem, ChecklistItemAssignee
 from app.models.common_entry import CommonEntry
@@ -52,16 +51,15 @@ from app.api.routers import planners as planners_router
 from app.api.routers.planners import weekly_table_planner
 from app.schemas.planner import WeeklyTableDepartment
 from app.schemas.weekly_planner_snapshot import WeeklySnapshotType
+from app.services.daily_report_data import load_daily_report_tasks
 from app.services.daily_report_logic import (
     DailyReportTyoMode,
     _as_utc_date,
-    completed_on_day,
     daily_report_tyo_label,
-    planned_range_for_daily_report,
-    task_matches_department_scope,
-    task_is_visible_to_user,
 )
 from app.services.ga_time_table import get_ga_time_table_rows
+from app.services.task_read_model import EXPORT_TASK_PROJECTION
+from app.services.weekly_snapshot_tasks import defer_snapshot_payload, load_snapshot_roster
 
 
 router = APIRouter()
@@ -913,8 +911,8 @@ async def _query_tasks(
     status_id: uuid.UUID | None,
     planned_from: date | None,
     planned_to: date | None,
-) -> list[Task]:
-    stmt = select(Task)
+) -> list:
+    stmt = EXPORT_TASK_PROJECTION.select()
 
     role_value = getattr(user.role, "value", None)
     is_admin = user.role == UserRole.ADMIN or (isinstance(role_value, str) and role_value.upper() == "ADMIN")
@@ -957,10 +955,10 @@ async def _query_tasks(
         if planned_to:
             stmt = stmt.where(planned_expr <= planned_to)
 
-    return (await db.execute(stmt.order_by(Task.created_at.desc()))).scalars().all()
+    return await EXPORT_TASK_PROJECTION.fetch(db, stmt.order_by(Task.created_at.desc()))
 
 
-async def _maps(db: AsyncSession, tasks: list[Task]) -> tuple[dict[uuid.UUID, str], dict[uuid.UUID, str]]:
+async def _maps(db: AsyncSession, tasks: list) -> tuple[dict[uuid.UUID, str], dict[uuid.UUID, str]]:
     status_ids = {getattr(t, "status_id", None) for t in tasks}
     status_ids.discard(None)
     user_ids = {getattr(t, "assigned_to_user_id", None) for t in tasks}
@@ -980,7 +978,7 @@ async def _maps(db: AsyncSession, tasks: list[Task]) -> tuple[dict[uuid.UUID, st
     return status_map, user_map
 
 
-def _task_rows(tasks: list[Task], status_map: dict[uuid.UUID, str], user_map: dict[uuid.UUID, str]) -> list[list[str]]:
+def _task_rows(tasks: list, status_map: dict[uuid.UUID, str], user_map: dict[uuid.UUID, str]) -> list[list[str]]:
     rows: list[list[str]] = []
     for t in tasks:
         planned_value = getattr(t, "planned_for", None)
@@ -1251,7 +1249,7 @@ async def export_tasks_csv(
     status_id: uuid.UUID | None = None,
     planned_from: date | None = None,
     planned_to: date | None = None,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     user=Depends(get_current_user),
 ):
     ensure_reports_access(user)
@@ -1290,7 +1288,7 @@ async def export_tasks_xlsx(
     planned_to: date | None = None,
     title: str | None = None,
     standard: bool = False,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     user=Depends(get_current_user),
 ):
     ensure_reports_access(user)
@@ -1487,7 +1485,7 @@ async def export_tasks_xlsx(
 @router.get("/ga-time.xlsx")
 async def export_ga_time_xlsx(
     week_start: date,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     user=Depends(get_current_user),
 ):
     ensure_manager_or_admin(user)
@@ -1673,7 +1671,7 @@ async def preview_project_tasks(
     planned_from: date | None = None,
     planned_to: date | None = None,
     limit: int | None = 200,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     user=Depends(get_current_user),
 ):
     ensure_reports_access(user)
@@ -1727,7 +1725,7 @@ async def export_fast_tasks_xlsx(
     fast_task_kinds: list[str] | None = Query(default=None),
     planned_from: date | None = None,
     planned_to: date | None = None,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     user=Depends(get_current_user),
 ):
     ensure_reports_access(user)
@@ -1974,7 +1972,7 @@ async def preview_fast_tasks(
     planned_from: date | None = None,
     planned_to: date | None = None,
     limit: int | None = 200,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     user=Depends(get_current_user),
 ):
     ensure_reports_access(user)
@@ -2360,7 +2358,7 @@ async def export_open_tasks_xlsx(
     filter: str = Query(default="all"),
     search: str | None = Query(default=None),
     this_week_start: date | None = Query(default=None),
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     user=Depends(get_current_user),
 ):
     ensure_reports_access(user)
@@ -2870,7 +2868,7 @@ async def export_common_view_xlsx(
 @router.get("/meeting-template.xlsx")
 async def export_meeting_template_xlsx(
     checklist_id: uuid.UUID,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     user=Depends(get_current_user),
 ):
     ensure_reports_access(user)
@@ -3049,7 +3047,7 @@ async def export_meeting_template_xlsx(
 
 @router.get("/meeting-templates.xlsx")
 async def export_meeting_templates_xlsx(
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     user=Depends(get_current_user),
 ):
     ensure_reports_access(user)
@@ -3203,7 +3201,7 @@ async def export_meeting_templates_xlsx(
 async def export_department_internal_meetings_xlsx(
     group_key: str = Query(..., min_length=1),
     title: str = "Internal Meetings",
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     user=Depends(get_current_user),
 ):
     ensure_reports_access(user)
@@ -3352,7 +3350,7 @@ async def export_tasks_pdf(
     status_id: uuid.UUID | None = None,
     planned_from: date | None = None,
     planned_to: date | None = None,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     user=Depends(get_current_user),
 ):
     ensure_reports_access(user)
@@ -3430,7 +3428,7 @@ async def export_checklist_xlsx(
     title: str | None = None,
     include_original: bool = True,
     exclude_path: list[str] | None = Query(None),
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     user=Depends(get_current_user),
 ):
     checklist = (
@@ -3703,110 +3701,21 @@ async def _daily_report_rows_for_user(
     day_start = datetime.combine(day, time.min, tzinfo=timezone.utc)
     day_end = day_start + timedelta(days=1)
 
-    task_stmt = (
-        select(Task)
-        .outerjoin(Project, Task.project_id == Project.id)
-        .where(Task.is_active.is_(True))
-        .where(Task.system_template_origin_id.is_(None))
-        .where(Task.due_date.is_not(None))
-        .outerjoin(TaskAssignee, TaskAssignee.task_id == Task.id)
-        .where(
-            or_(
-                Task.assigned_to == user_id,
-                TaskAssignee.user_id == user_id,
-                Task.internal_notes.ilike(f"%ko_user_id={user_id}%"),
-                Task.internal_notes.ilike(f"%ko_user_id:%{user_id}%"),
-                Task.internal_notes.ilike(f"%ko_user_id%{user_id}%"),
-            )
-        )
-        .distinct()
+    report_tasks = await load_daily_report_tasks(
+        db,
+        user_id=user_id,
+        day=day,
+        department_id=department_id,
+        dept_code=dept_code,
+        include_cross_department_assigned=include_cross_department_assigned,
+        all_open=all_open,
     )
-    if department_id is not None and not include_cross_department_assigned:
-        task_stmt = task_stmt.where(or_(Task.department_id == department_id, Project.department_id == department_id))
-
-    tasks = (await db.execute(task_stmt.order_by(Task.due_date, Task.created_at))).scalars().all()
-
-    task_ids = [t.id for t in tasks]
-    assignee_ids_by_task: dict[uuid.UUID, set[uuid.UUID]] = {tid: set() for tid in task_ids}
-    if task_ids:
-        rows = (
-            await db.execute(
-                select(TaskAssignee.task_id, TaskAssignee.user_id).where(TaskAssignee.task_id.in_(task_ids))
-            )
-        ).all()
-        for tid, uid in rows:
-            assignee_ids_by_task.setdefault(tid, set()).add(uid)
-
-    project_ids = {t.project_id for t in tasks if t.project_id is not None}
-    projects: list[Project] = []
-    if project_ids:
-        projects = (
-            await db.execute(select(Project).where(Project.id.in_(project_ids)))
-        ).scalars().all()
-    project_by_id = {p.id: p for p in projects}
-
-    tasks_today: list[Task] = []
-    tasks_overdue: list[Task] = []
-    planned_range_by_task_id: dict[uuid.UUID, tuple[date, date]] = {}
-    for task in tasks:
-        project = project_by_id.get(task.project_id) if task.project_id else None
-        if not task_matches_department_scope(
-            task,
-            project=project,
-            department_id=department_id,
-            include_cross_department_assigned=include_cross_department_assigned,
-        ):
-            continue
-        if not task_is_visible_to_user(
-            task,
-            user_id=user_id,
-            assignee_ids=assignee_ids_by_task.get(task.id),
-            project=project,
-            dept_code=dept_code,
-        ):
-            continue
-
-        planned_start, planned_end = planned_range_for_daily_report(task, dept_code)
-        if planned_start is None or planned_end is None:
-            continue
-
-        planned_range_by_task_id[task.id] = (planned_start, planned_end)
-
-        is_done = task.completed_at is not None or task.status == TaskStatusEnum.DONE
-        if all_open:
-            if not is_done:
-                tasks_today.append(task)
-            continue
-
-        if completed_on_day(task.completed_at, day):
-            tasks_today.append(task)
-            continue
-
-        is_project_task = task.project_id is not None
-        if is_project_task:
-            if planned_start <= day <= planned_end:
-                tasks_today.append(task)
-            elif planned_end < day and not is_done:
-                tasks_overdue.append(task)
-            continue
-
-        # Fast tasks: show once their range has started.
-        if planned_start <= day <= planned_end:
-            tasks_today.append(task)
-        elif planned_end < day and not is_done:
-            tasks_overdue.append(task)
-
-    daily_tasks = tasks_today + tasks_overdue
-    task_comment_map = await _user_comments_for_tasks(db, [t.id for t in daily_tasks], user_id)
-
-    project_ids = {t.project_id for t in daily_tasks if t.project_id is not None}
-    project_map: dict[uuid.UUID, str] = {}
-    if project_ids:
-        projects = (
-            await db.execute(select(Project).where(Project.id.in_(project_ids)))
-        ).scalars().all()
-        for project in projects:
-            project_map[project.id] = project.title or project.name or "-"
+    daily_tasks = report_tasks.tasks
+    planned_range_by_task_id = report_tasks.planned_range_by_task_id
+    task_comment_map = await _user_comments_for_tasks(db, report_tasks.task_ids, user_id)
+    project_map: dict[uuid.UUID, str] = {
+        project.id: project.title or project.name or "-" for project in report_tasks.project_by_id.values()
+    }
 
     done_like_statuses = ("DONE", "NOT_DONE", "SKIPPED")
     local_occurrence_date = cast(
@@ -4121,7 +4030,7 @@ async def export_daily_report_xlsx(
     all_users: bool = False,
     all_today: bool = False,
     all_open: bool = False,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     user=Depends(get_current_user),
 ):
     if department_id is not None:
@@ -4417,7 +4326,7 @@ async def export_daily_report_xlsx(
 @router.get("/system-task-templates.xlsx")
 async def export_system_task_templates_xlsx(
     mode: str = "all",
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     user=Depends(get_current_user),
 ):
     ensure_manager_or_admin(user)
@@ -4655,7 +4564,7 @@ async def export_system_tasks_xlsx(
     status_id: uuid.UUID | None = None,
     planned_from: date | None = None,
     planned_to: date | None = None,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     user=Depends(get_current_user),
 ):
     ensure_reports_access(user)
@@ -4995,7 +4904,7 @@ async def preview_system_tasks(
     planned_from: date | None = None,
     planned_to: date | None = None,
     limit: int | None = 200,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     user=Depends(get_current_user),
 ):
     ensure_reports_access(user)
@@ -5265,7 +5174,7 @@ async def preview_system_tasks(
 @router.get("/common.xlsx")
 async def export_common_xlsx(
     week_start: date,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     user=Depends(get_current_user),
 ):
     week_dates = [week_start + timedelta(days=i) for i in range(5)]
@@ -5678,7 +5587,7 @@ async def export_weekly_planner_xlsx(
     week_start: date | None = None,
     department_id: uuid.UUID | None = None,
     is_this_week: bool = False,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     user=Depends(get_current_user),
 ):
     if department_id is None:
@@ -5968,7 +5877,7 @@ async def export_weekly_planner_xlsx(
 @router.get("/weekly-snapshot.xlsx")
 async def export_weekly_snapshot_xlsx(
     snapshot_id: uuid.UUID = Query(..., description="Weekly planner snapshot id"),
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     user=Depends(get_current_user),
 ):
     snapshot = (
@@ -6270,11 +6179,28 @@ async def export_weekly_snapshot_xlsx(
     )
 
 
+async def _snapshot_assignee_columns(
+    db: AsyncSession,
+    *snapshots: WeeklyPlannerSnapshot | None,
+) -> list[tuple[uuid.UUID | None, str]]:
+    """Employee columns of the first snapshot that has any, sorted by name.
+
+    Read from the snapshot roster, so the planner payload is not loaded.
+    """
+    present = [snapshot for snapshot in snapshots if snapshot is not None]
+    rosters = await load_snapshot_roster(db, [snapshot.id for snapshot in present])
+    for snapshot in present:
+        columns = [(user_id, name.strip()) for user_id, name in rosters.get(snapshot.id, {}).items() if name.strip()]
+        if columns:
+            return sorted(columns, key=lambda item: item[1].lower())
+    return []
+
+
 @router.get("/weekly-plan-vs-final.xlsx")
 async def export_weekly_plan_vs_final_xlsx(
     department_id: uuid.UUID,
     week_start: date,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     user=Depends(get_current_user),
 ):
     ensure_department_access(user, department_id)
@@ -6296,6 +6222,7 @@ async def export_weekly_plan_vs_final_xlsx(
     planned_official_snapshot = (
         await db.execute(
             select(WeeklyPlannerSnapshot)
+            .options(*defer_snapshot_payload())
             .where(
                 WeeklyPlannerSnapshot.department_id == department_id,
                 WeeklyPlannerSnapshot.week_start_date == normalized_week_start,
@@ -6309,6 +6236,7 @@ async def export_weekly_plan_vs_final_xlsx(
     latest_final_snapshot = (
         await db.execute(
             select(WeeklyPlannerSnapshot)
+            .options(*defer_snapshot_payload())
             .where(
                 WeeklyPlannerSnapshot.department_id == department_id,
                 WeeklyPlannerSnapshot.week_start_date == normalized_week_start,
@@ -6319,37 +6247,8 @@ async def export_weekly_plan_vs_final_xlsx(
         )
     ).scalar_one_or_none()
 
-    def _assignee_columns_from_snapshot(snapshot: WeeklyPlannerSnapshot | None) -> list[tuple[uuid.UUID | None, str]]:
-        if snapshot is None:
-            return []
-        payload = snapshot.payload or {}
-        department_payload = payload.get("department")
-        if not department_payload:
-            return []
-        try:
-            dept = WeeklyTableDepartment.model_validate(department_payload)
-        except Exception:
-            return []
-
-        seen: set[str] = set()
-        columns: list[tuple[uuid.UUID | None, str]] = []
-        for day in dept.days:
-            for user_day in day.users:
-                name = (user_day.user_name or "").strip()
-                if not name:
-                    continue
-                user_id = getattr(user_day, "user_id", None)
-                key = str(user_id) if user_id is not None else f"name:{name.lower()}"
-                if key in seen:
-                    continue
-                seen.add(key)
-                columns.append((user_id, name))
-
-        columns.sort(key=lambda item: item[1].lower())
-        return columns
-
     # Prefer planned snapshot for column ordering (matches UI).
-    assignee_columns = _assignee_columns_from_snapshot(planned_official_snapshot) or _assignee_columns_from_snapshot(latest_final_snapshot)
+    assignee_columns = await _snapshot_assignee_columns(db, planned_official_snapshot, latest_final_snapshot)
 
     message: str | None = None
     groups: list[dict[str, object]] = []
@@ -6358,25 +6257,16 @@ async def export_weekly_plan_vs_final_xlsx(
     elif latest_final_snapshot is None:
         message = "No final snapshot found for this week. Save This Week (Final) first."
     else:
-        planned_tasks_by_key = planners_router._tasks_by_key_from_snapshot_payload(planned_official_snapshot.payload or {})
-        final_tasks_by_key = planners_router._tasks_by_key_from_snapshot_payload(latest_final_snapshot.payload or {})
-
-        as_of_date = week_end + timedelta(days=1)
-        buckets = planners_router._classify_weekly_plan_performance(
-            planned_tasks=planned_tasks_by_key,
-            actual_tasks=final_tasks_by_key,
-            week_end=week_end,
-            as_of_date=as_of_date,
+        buckets, _ = await planners_router._snapshot_comparison(
+            db, planned_official_snapshot, latest_final_snapshot, week_end=week_end
         )
 
-        completed = [planners_router._to_compare_task_out(task) for task in buckets.get("completed", [])]
-        in_progress = [planners_router._to_compare_task_out(task) for task in buckets.get("in_progress", [])]
-        pending = [planners_router._to_compare_task_out(task) for task in buckets.get("pending", [])]
-        late = [planners_router._to_compare_task_out(task) for task in buckets.get("late", [])]
-        additional = [planners_router._to_compare_task_out(task) for task in buckets.get("additional", [])]
-        removed_or_canceled = [
-            planners_router._to_compare_task_out(task) for task in buckets.get("removed_or_canceled", [])
-        ]
+        completed = buckets["completed"]
+        in_progress = buckets["in_progress"]
+        pending = buckets["pending"]
+        late = buckets["late"]
+        additional = buckets["additional"]
+        removed_or_canceled = buckets["removed_or_canceled"]
 
         grouped = planners_router._group_compare_tasks_by_assignee(
             completed=completed,
@@ -6589,7 +6479,7 @@ async def export_weekly_plan_vs_final_xlsx(
 async def export_ga_notes_xlsx(
     department_id: uuid.UUID | None = None,
     project_id: uuid.UUID | None = None,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     user=Depends(get_current_user),
 ):
     """Export GA/KA notes to Excel"""
@@ -6929,7 +6819,7 @@ async def export_ga_notes_xlsx(
 async def export_weekly_plan_vs_actual_xlsx(
     department_id: uuid.UUID,
     week_start: date,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     user=Depends(get_current_user),
 ):
     ensure_department_access(user, department_id)
@@ -6951,6 +6841,7 @@ async def export_weekly_plan_vs_actual_xlsx(
     planned_official_snapshot = (
         await db.execute(
             select(WeeklyPlannerSnapshot)
+            .options(*defer_snapshot_payload())
             .where(
                 WeeklyPlannerSnapshot.department_id == department_id,
                 WeeklyPlannerSnapshot.week_start_date == normalized_week_start,
@@ -6993,74 +6884,21 @@ async def export_weekly_plan_vs_actual_xlsx(
             headers={"Content-Disposition": f'attachment; filename=\"{filename}\"'},
         )
 
-    snapshot_tasks_by_key = planners_router._tasks_by_key_from_snapshot_payload(planned_official_snapshot.payload or {})
-
-    current_weekly_table = await weekly_table_planner(
-        week_start=normalized_week_start,
+    buckets, _, assignee_columns = await planners_router._live_comparison(
+        db,
+        user,
+        planned_official_snapshot,
         department_id=department_id,
-        is_this_week=False,
-        db=db,
-        user=user,
-    )
-    current_table_json = jsonable_encoder(current_weekly_table)
-    current_departments = current_table_json.get("departments") or []
-    current_department_payload = current_departments[0] if current_departments else None
-    current_task_ids = planners_router._task_ids_from_department_payload(current_department_payload)
-    current_task_priorities = await planners_router._load_task_priority_map(db, current_task_ids)
-    current_task_items = planners_router._flatten_weekly_department_tasks(
-        current_department_payload,
-        task_priority_map=current_task_priorities,
-    )
-    current_tasks_by_key = {
-        task["match_key"]: task
-        for task in current_task_items
-    }
-
-    def _assignee_columns_from_current_table(department_payload: dict | None) -> list[tuple[uuid.UUID | None, str]]:
-        if not department_payload:
-            return []
-        try:
-            dept = WeeklyTableDepartment.model_validate(department_payload)
-        except Exception:
-            return []
-
-        seen: set[str] = set()
-        columns: list[tuple[uuid.UUID | None, str]] = []
-        for day in dept.days:
-            for user_day in day.users:
-                name = (user_day.user_name or "").strip()
-                if not name:
-                    continue
-                user_id = getattr(user_day, "user_id", None)
-                key = str(user_id) if user_id is not None else f"name:{name.lower()}"
-                if key in seen:
-                    continue
-                seen.add(key)
-                columns.append((user_id, name))
-
-        columns.sort(key=lambda item: item[1].lower())
-        return columns
-
-    assignee_columns = _assignee_columns_from_current_table(current_department_payload)
-
-    today_local = planners_router._today_pristina_date()
-    as_of_date = min(today_local, week_end)
-
-    buckets = planners_router._classify_weekly_plan_performance(
-        planned_tasks=snapshot_tasks_by_key,
-        actual_tasks=current_tasks_by_key,
+        week_start=normalized_week_start,
         week_end=week_end,
-        as_of_date=as_of_date,
     )
 
-    completed = [planners_router._to_compare_task_out(task) for task in buckets.get("completed", [])]
-    in_progress = [planners_router._to_compare_task_out(task) for task in buckets.get("in_progress", [])]
-    pending = [planners_router._to_compare_task_out(task) for task in buckets.get("pending", [])]
-    late = [planners_router._to_compare_task_out(task) for task in buckets.get("late", [])]
-    additional = [planners_router._to_compare_task_out(task) for task in buckets.get("additional", [])]
-    removed_or_canceled = [
-        planners_router._to_compare_task_out(task) for task in buckets.get("removed_or_canceled", [])
-    ]
+    completed = buckets["completed"]
+    in_progress = buckets["in_progress"]
+    pending = buckets["pending"]
+    late = buckets["late"]
+    additional = buckets["additional"]
+    removed_or_canceled = buckets["removed_or_canceled"]
 
     grouped = planners_router._group_compare_tasks_by_assignee(
         completed=completed,
@@ -7266,20 +7104,28 @@ async def export_weekly_plan_vs_actual_xlsx(
 async def export_weekly_snapshot_compare_xlsx(
     baseline_snapshot_id: uuid.UUID = Query(..., description="Baseline snapshot ID"),
     compare_snapshot_id: uuid.UUID = Query(..., description="Comparison snapshot ID"),
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     user=Depends(get_current_user),
 ):
     if baseline_snapshot_id == compare_snapshot_id:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Choose two different snapshots.")
 
     baseline_snapshot = (
-        await db.execute(select(WeeklyPlannerSnapshot).where(WeeklyPlannerSnapshot.id == baseline_snapshot_id))
+        await db.execute(
+            select(WeeklyPlannerSnapshot)
+            .options(*defer_snapshot_payload())
+            .where(WeeklyPlannerSnapshot.id == baseline_snapshot_id)
+        )
     ).scalar_one_or_none()
     if baseline_snapshot is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Baseline snapshot not found")
 
     compare_snapshot = (
-        await db.execute(select(WeeklyPlannerSnapshot).where(WeeklyPlannerSnapshot.id == compare_snapshot_id))
+        await db.execute(
+            select(WeeklyPlannerSnapshot)
+            .options(*defer_snapshot_payload())
+            .where(WeeklyPlannerSnapshot.id == compare_snapshot_id)
+        )
     ).scalar_one_or_none()
     if compare_snapshot is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Comparison snapshot not found")
@@ -7307,56 +7153,18 @@ async def export_weekly_snapshot_compare_xlsx(
     ).strip()
     title_upper = title_label.upper() if title_label else "SNAPSHOT COMPARISON"
 
-    planned_tasks_by_key = planners_router._tasks_by_key_from_snapshot_payload(baseline_snapshot.payload or {})
-    actual_tasks_by_key = planners_router._tasks_by_key_from_snapshot_payload(compare_snapshot.payload or {})
+    assignee_columns = await _snapshot_assignee_columns(db, baseline_snapshot, compare_snapshot)
 
-    def _assignee_columns_from_snapshot(snapshot: WeeklyPlannerSnapshot | None) -> list[tuple[uuid.UUID | None, str]]:
-        if snapshot is None:
-            return []
-        payload = snapshot.payload or {}
-        department_payload = payload.get("department")
-        if not department_payload:
-            return []
-        try:
-            dept = WeeklyTableDepartment.model_validate(department_payload)
-        except Exception:
-            return []
-
-        seen: set[str] = set()
-        columns: list[tuple[uuid.UUID | None, str]] = []
-        for day in dept.days:
-            for user_day in day.users:
-                name = (user_day.user_name or "").strip()
-                if not name:
-                    continue
-                user_id = getattr(user_day, "user_id", None)
-                key = str(user_id) if user_id is not None else f"name:{name.lower()}"
-                if key in seen:
-                    continue
-                seen.add(key)
-                columns.append((user_id, name))
-
-        columns.sort(key=lambda item: item[1].lower())
-        return columns
-
-    assignee_columns = _assignee_columns_from_snapshot(baseline_snapshot) or _assignee_columns_from_snapshot(compare_snapshot)
-
-    as_of_date = week_end + timedelta(days=1)
-    buckets = planners_router._classify_weekly_plan_performance(
-        planned_tasks=planned_tasks_by_key,
-        actual_tasks=actual_tasks_by_key,
-        week_end=week_end,
-        as_of_date=as_of_date,
+    buckets, _ = await planners_router._snapshot_comparison(
+        db, baseline_snapshot, compare_snapshot, week_end=week_end
     )
 
-    completed = [planners_router._to_compare_task_out(task) for task in buckets.get("completed", [])]
-    in_progress = [planners_router._to_compare_task_out(task) for task in buckets.get("in_progress", [])]
-    pending = [planners_router._to_compare_task_out(task) for task in buckets.get("pending", [])]
-    late = [planners_router._to_compare_task_out(task) for task in buckets.get("late", [])]
-    additional = [planners_router._to_compare_task_out(task) for task in buckets.get("additional", [])]
-    removed_or_canceled = [
-        planners_router._to_compare_task_out(task) for task in buckets.get("removed_or_canceled", [])
-    ]
+    completed = buckets["completed"]
+    in_progress = buckets["in_progress"]
+    pending = buckets["pending"]
+    late = buckets["late"]
+    additional = buckets["additional"]
+    removed_or_canceled = buckets["removed_or_canceled"]
 
     grouped = planners_router._group_compare_tasks_by_assignee(
         completed=completed,
@@ -1,13 +1,16 @@
 from __future__ import annotations
 
+import asyncio
 import io
 import json
 import math
 import re
 import uuid
+from collections.abc import AsyncIterator
+from contextlib import AsyncExitStack
 from datetime import date, datetime, time, timedelta, timezone
 
-from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
 from fastapi.responses import StreamingResponse
 from openpyxl import Workbook
 from openpyxl.styles import Alignment, Font, PatternFill
@@ -35,15 +38,17 @@ from app.schemas.std_feedback_ticket import (
     StdTicketTaskOptionsOut,
     StdTicketUserOption,
 )
-from app.services.notifications import publish_notification
+from app.services.notifications import publish_notifications
 from app.services.std_feedback_task_creation import (
     create_ticket_task_bundle,
     is_std_project_title,
     mark_tickets_no_action,
 )
+from app.services.std_attachment_cache import etag_matches, get_std_attachment_cache, read_blob
 from app.services.std_feedback_tickets import (
     StdFeedbackClient,
     _std_token,
+    attachment_media_type,
     refresh_std_ticket_detail,
     sync_std_feedback_tickets,
     ticket_comments,
@@ -492,11 +497,7 @@ async def create_external_ticket_task(
     await db.commit()
     if not bundle.created:
         response.status_code = status.HTTP_200_OK
-    for notification in bundle.notifications:
-        try:
-            await publish_notification(user_id=notification.user_id, notification=notification)
-        except Exception:
-            pass
+    await publish_notifications(bundle.notifications)
     return StdTicketCreateTaskOut(
         note_id=bundle.note.id,
         task_ids=[task.id for task in bundle.tasks],
@@ -534,6 +535,7 @@ def _safe_filename(value: str) -> str:
 async def download_external_ticket_file(
     ticket_id: uuid.UUID,
     file_id: str,
+    request: Request,
     db: AsyncSession = Depends(get_db),
     _user: User = Depends(get_current_user),
 ) -> Response:
@@ -547,24 +549,48 @@ async def download_external_ticket_file(
     ).scalar_one_or_none()
     if ticket is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="External ticket not found")
-    if not _std_token():
-        raise HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail="STD integration is not configured")
 
     metadata = next(
         (item for item in ticket_files(ticket) if str(item.get("id")) == file_id),
         {},
     )
-    async with StdFeedbackClient() as client:
-        try:
-            upstream = await client.get_file(ticket.external_id, file_id)
-        except Exception as exc:
-            raise HTTPException(status_code=status.HTTP_502_BAD_GATEWAY, detail="STD attachment download failed") from exc
     filename = _safe_filename(
         str(metadata.get("original_filename") or metadata.get("filename") or metadata.get("name") or file_id)
     )
-    media_type = upstream.headers.get("content-type") or str(metadata.get("content_type") or "application/octet-stream")
-    return Response(
-        content=upstream.content,
-        media_type=media_type,
-        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
-    )
+    headers = {"Content-Disposition": f'attachment; filename="{filename}"'}
+
+    cache = get_std_attachment_cache()
+    cached = await asyncio.to_thread(cache.get, ticket.external_id, file_id)
+    if cached is not None:
+        # Browsers revalidate each download; an unchanged copy costs a 304.
+        cached_headers = {**headers, "ETag": cached.etag, "Cache-Control": "private, no-cache"}
+        if etag_matches(request.headers.get("if-none-match"), cached.etag):
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=cached_headers)
+        # Opened before answering, so a later eviction cannot pull the file
+        # from under the response; one evicted already is fetched again.
+        handle = await asyncio.to_thread(cache.open_blob, cached)
+        if handle is not None:
+            cached_headers["Content-Length"] = str(cached.size)
+            return StreamingResponse(read_blob(handle), media_type=cached.media_type, headers=cached_headers)
+
+    if not _std_token():
+        raise HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail="STD integration is not configured")
+    upstream_stack = AsyncExitStack()
+    try:
+        client = await upstream_stack.enter_async_context(StdFeedbackClient())
+        upstream = await upstream_stack.enter_async_context(client.stream_file(ticket.external_id, file_id))
+    except Exception as exc:
+        await upstream_stack.aclose()
+        raise HTTPException(status_code=status.HTTP_502_BAD_GATEWAY, detail="STD attachment download failed") from exc
+    media_type = attachment_media_type(upstream, metadata)
+
+    async def body() -> AsyncIterator[bytes]:
+        # Closed here rather than in a background task, which is skipped
+        # when the upstream stream fails halfway.
+        try:
+            async for chunk in cache.tee(ticket.external_id, file_id, upstream.aiter_bytes(), media_type=media_type):
+                yield chunk
+        finally:
+            await upstream_stack.aclose()
+
+    return StreamingResponse(body(), media_type=media_type, headers=headers)
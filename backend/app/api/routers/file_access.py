@@ -25,7 +25,7 @@ from app.schemas.file_access import (
     FileAccessRequestOut,
     FileAccessUserMappingOut,
 )
-from app.services.notifications import add_notification, publish_notification
+from app.services.notifications import add_notification, publish_notifications
 
 
 router = APIRouter()
@@ -250,8 +250,7 @@ async def create_request(
     ]
     await db.commit()
     await db.refresh(request)
-    for approver, notification in zip(approvers, notifications):
-        await publish_notification(user_id=approver.id, notification=notification)
+    await publish_notifications(notifications)
     return _request_to_out(request)
 
 
@@ -295,7 +294,7 @@ async def approve_request(
     await db.commit()
     await db.refresh(request)
     if requester:
-        await publish_notification(user_id=requester.id, notification=notification)
+        await publish_notifications([notification])
     return _request_to_out(request)
 
 
@@ -329,7 +328,7 @@ async def reject_request(
     await db.commit()
     await db.refresh(request)
     if requester:
-        await publish_notification(user_id=requester.id, notification=notification)
+        await publish_notifications([notification])
     return _request_to_out(request)
 
 
@@ -8,7 +8,7 @@ from datetime import datetime, timedelta, timezone
 from pathlib import Path
 
 from fastapi import APIRouter, Depends, File, Form, HTTPException, UploadFile, status
-from fastapi.responses import FileResponse, HTMLResponse
+from fastapi.responses import HTMLResponse
 from sqlalchemy import or_, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
@@ -18,6 +18,15 @@ from starlette.concurrency import run_in_threadpool
 from app.api.access import ensure_department_access
 from app.api.deps import get_current_user
 from app.db import get_db
+from app.integrations.storage import (
+    GA_NOTES_NAMESPACE,
+    StorageBackend,
+    StorageError,
+    StorageLimitExceeded,
+    download_response,
+    get_storage,
+    iter_upload_chunks,
+)
 from app.models.ga_note import GaNote
 from app.models.ga_note_attachment import GaNoteAttachment
 from app.models.enums import GaNotePriority, GaNoteStatus, GaNoteType, NotificationType, TaskStatus, UserRole
@@ -46,7 +55,7 @@ from app.services.ga_note_task_instances import (
 from app.services.notifications import (
     add_notification,
     notification_task_preview,
-    publish_notification,
+    publish_notifications,
 )
 from app.config import settings
 
@@ -105,11 +114,12 @@ def _note_out(note: GaNote) -> GaNoteOut:
     )
 
 
-def _ga_note_upload_base_dir() -> Path:
-    upload_base = Path(settings.GA_NOTES_UPLOAD_DIR)
-    if not upload_base.is_absolute():
-        upload_base = Path(__file__).resolve().parents[3] / upload_base
-    return upload_base
+def _ga_note_storage() -> StorageBackend:
+    return get_storage(GA_NOTES_NAMESPACE)
+
+
+def _attachment_key(note_id: uuid.UUID, stored_filename: str) -> str:
+    return f"{note_id}/{stored_filename}"
 
 
 def _preview_page(title: str, body: str) -> str:
@@ -235,38 +245,32 @@ async def _save_ga_note_attachments(
         )
 
     max_bytes = settings.GA_NOTES_MAX_FILE_MB * 1024 * 1024
-    upload_base = _ga_note_upload_base_dir()
-    note_dir = upload_base / str(note.id)
-    note_dir.mkdir(parents=True, exist_ok=True)
+    storage = _ga_note_storage()
 
     created: list[GaNoteAttachment] = []
-    stored_paths: list[Path] = []
+    stored_keys: list[str] = []
     try:
         for upload in files:
             attachment_id = uuid.uuid4()
             original_name = (upload.filename or "file").strip()
             extension = Path(original_name).suffix
             stored_name = f"{attachment_id}{extension}"
-            stored_path = note_dir / stored_name
-
-            size_bytes = 0
-            with stored_path.open("wb") as buffer:
-                while True:
-                    chunk = await upload.read(1024 * 1024)
-                    if not chunk:
-                        break
-                    size_bytes += len(chunk)
-                    if size_bytes > max_bytes:
-                        buffer.close()
-                        if stored_path.exists():
-                            stored_path.unlink()
-                        await upload.close()
-                        raise HTTPException(
-                            status_code=status.HTTP_400_BAD_REQUEST,
-                            detail=f"File too large. Max {settings.GA_NOTES_MAX_FILE_MB}MB.",
-                        )
-                    buffer.write(chunk)
-            stored_paths.append(stored_path)
+            stored_key = _attachment_key(note.id, stored_name)
+
+            try:
+                size_bytes = await storage.save_stream(
+                    stored_key,
+                    iter_upload_chunks(upload),
+                    content_type=upload.content_type,
+                    max_bytes=max_bytes,
+                )
+            except StorageLimitExceeded:
+                await upload.close()
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail=f"File too large. Max {settings.GA_NOTES_MAX_FILE_MB}MB.",
+                )
+            stored_keys.append(stored_key)
 
             attachment = GaNoteAttachment(
                 id=attachment_id,
@@ -283,9 +287,8 @@ async def _save_ga_note_attachments(
 
         await db.commit()
     except Exception:
-        for path in stored_paths:
-            if path.exists():
-                path.unlink()
+        for stored_key in stored_keys:
+            await storage.delete(stored_key)
         await db.rollback()
         raise
 
@@ -707,11 +710,7 @@ async def update_ga_note_task_bundle(
             )
 
     await db.commit()
-    for notification in created_notifications:
-        try:
-            await publish_notification(user_id=notification.user_id, notification=notification)
-        except Exception:
-            pass
+    await publish_notifications(created_notifications)
     await db.refresh(note)
     return GaNoteTaskBundleResponse(
         note=_note_out(note),
@@ -941,21 +940,23 @@ async def preview_ga_note_attachment(
 
     await _ensure_note_access(attachment.note, user, db)
 
-    stored_path = _ga_note_upload_base_dir() / str(attachment.note_id) / attachment.stored_filename
-    if not stored_path.exists():
+    storage = _ga_note_storage()
+    stored_key = _attachment_key(attachment.note_id, attachment.stored_filename)
+    if not await storage.exists(stored_key):
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="File not found on server")
 
     content_type = attachment.content_type or mimetypes.guess_type(attachment.original_filename)[0] or "application/octet-stream"
-    suffix = stored_path.suffix.lower()
+    suffix = Path(attachment.stored_filename).suffix.lower()
     if content_type.startswith(("image/", "audio/", "video/")) or content_type == "application/pdf" or suffix == ".pdf":
-        return FileResponse(stored_path, media_type=content_type)
+        return await download_response(storage, stored_key, filename=None, media_type=content_type, inline=True)
 
     try:
-        preview_html = await run_in_threadpool(
-            _build_attachment_preview,
-            stored_path,
-            attachment.original_filename,
-        )
+        async with storage.local_file(stored_key) as stored_path:
+            preview_html = await run_in_threadpool(
+                _build_attachment_preview,
+                stored_path,
+                attachment.original_filename,
+            )
     except Exception:
         preview_html = _preview_page(
             attachment.original_filename,
@@ -982,13 +983,14 @@ async def download_ga_note_attachment(
 
     await _ensure_note_access(attachment.note, user, db)
 
-    upload_base = _ga_note_upload_base_dir()
-    stored_path = upload_base / str(attachment.note_id) / attachment.stored_filename
-    if not stored_path.exists():
+    storage = _ga_note_storage()
+    stored_key = _attachment_key(attachment.note_id, attachment.stored_filename)
+    if not await storage.exists(stored_key):
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="File not found on server")
 
-    return FileResponse(
-        stored_path,
+    return await download_response(
+        storage,
+        stored_key,
         media_type=attachment.content_type or "application/octet-stream",
         filename=attachment.original_filename,
     )
@@ -1012,17 +1014,12 @@ async def delete_ga_note_attachment(
 
     await _ensure_note_access(attachment.note, user, db)
 
-    upload_base = _ga_note_upload_base_dir()
-    note_dir = upload_base / str(attachment.note_id)
-    stored_path = note_dir / attachment.stored_filename
+    stored_key = _attachment_key(attachment.note_id, attachment.stored_filename)
 
     await db.delete(attachment)
     await db.commit()
 
     try:
-        if stored_path.exists():
-            stored_path.unlink()
-        if note_dir.exists() and not any(note_dir.iterdir()):
-            note_dir.rmdir()
-    except OSError:
+        await _ga_note_storage().delete(stored_key)
+    except StorageError:
         pass
@@ -14,6 +14,15 @@ from app.api.access import ensure_department_access, ensure_task_editor
 from app.api.deps import get_current_user
 from app.config import settings
 from app.db import get_db
+from app.integrations.storage import (
+    PLAN_NOTES_NAMESPACE,
+    StorageBackend,
+    StorageError,
+    StorageLimitExceeded,
+    download_response,
+    get_storage,
+    iter_upload_chunks,
+)
 from app.models.enums import GaNoteStatus, GaNoteType, NotificationType, TaskStatus, UserRole
 from app.models.plan_note import PlanNote
 from app.models.plan_note_attachment import PlanNoteAttachment
@@ -41,7 +50,7 @@ from app.services.task_daily_progress import upsert_explicit_task_daily_status
 from app.services.notifications import (
     add_notification,
     notification_task_preview,
-    publish_notification,
+    publish_notifications,
 )
 
 router = APIRouter()
@@ -105,11 +114,12 @@ def _note_out(note: PlanNote) -> PlanNoteOut:
     )
 
 
-def _plan_note_upload_base_dir() -> Path:
-    upload_base = Path(settings.PLAN_NOTES_UPLOAD_DIR)
-    if not upload_base.is_absolute():
-        upload_base = Path(__file__).resolve().parents[3] / upload_base
-    return upload_base
+def _plan_note_storage() -> StorageBackend:
+    return get_storage(PLAN_NOTES_NAMESPACE)
+
+
+def _attachment_key(note_id: uuid.UUID, stored_filename: str) -> str:
+    return f"{note_id}/{stored_filename}"
 
 
 async def _ensure_note_access(note: PlanNote, user, db: AsyncSession) -> None:
@@ -141,38 +151,32 @@ async def _save_plan_note_attachments(
         )
 
     max_bytes = settings.GA_NOTES_MAX_FILE_MB * 1024 * 1024
-    upload_base = _plan_note_upload_base_dir()
-    note_dir = upload_base / str(note.id)
-    note_dir.mkdir(parents=True, exist_ok=True)
+    storage = _plan_note_storage()
 
     created: list[PlanNoteAttachment] = []
-    stored_paths: list[Path] = []
+    stored_keys: list[str] = []
     try:
         for upload in files:
             attachment_id = uuid.uuid4()
             original_name = (upload.filename or "file").strip()
             extension = Path(original_name).suffix
             stored_name = f"{attachment_id}{extension}"
-            stored_path = note_dir / stored_name
-
-            size_bytes = 0
-            with stored_path.open("wb") as buffer:
-                while True:
-                    chunk = await upload.read(1024 * 1024)
-                    if not chunk:
-                        break
-                    size_bytes += len(chunk)
-                    if size_bytes > max_bytes:
-                        buffer.close()
-                        if stored_path.exists():
-                            stored_path.unlink()
-                        await upload.close()
-                        raise HTTPException(
-                            status_code=status.HTTP_400_BAD_REQUEST,
-                            detail=f"File too large. Max {settings.GA_NOTES_MAX_FILE_MB}MB.",
-                        )
-                    buffer.write(chunk)
-            stored_paths.append(stored_path)
+            stored_key = _attachment_key(note.id, stored_name)
+
+            try:
+                size_bytes = await storage.save_stream(
+                    stored_key,
+                    iter_upload_chunks(upload),
+                    content_type=upload.content_type,
+                    max_bytes=max_bytes,
+                )
+            except StorageLimitExceeded:
+                await upload.close()
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail=f"File too large. Max {settings.GA_NOTES_MAX_FILE_MB}MB.",
+                )
+            stored_keys.append(stored_key)
 
             attachment = PlanNoteAttachment(
                 id=attachment_id,
@@ -189,9 +193,8 @@ async def _save_plan_note_attachments(
 
         await db.commit()
     except Exception:
-        for path in stored_paths:
-            if path.exists():
-                path.unlink()
+        for stored_key in stored_keys:
+            await storage.delete(stored_key)
         await db.rollback()
         raise
 
@@ -586,11 +589,7 @@ async def update_plan_note_task_bundle(
                 )
 
     await db.commit()
-    for notification in created_notifications:
-        try:
-            await publish_notification(user_id=notification.user_id, notification=notification)
-        except Exception:
-            pass
+    await publish_notifications(created_notifications)
     await db.refresh(note)
     return PlanNoteTaskBundleResponse(
         note=_note_out(note),
@@ -810,15 +809,14 @@ async def download_plan_note_attachment(
 
     await _ensure_note_access(attachment.note, user, db)
 
-    upload_base = _plan_note_upload_base_dir()
-    stored_path = upload_base / str(attachment.note_id) / attachment.stored_filename
-    if not stored_path.exists():
+    storage = _plan_note_storage()
+    stored_key = _attachment_key(attachment.note_id, attachment.stored_filename)
+    if not await storage.exists(stored_key):
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="File not found on server")
 
-    from fastapi.responses import FileResponse
-
-    return FileResponse(
-        stored_path,
+    return await download_response(
+        storage,
+        stored_key,
         media_type=attachment.content_type or "application/octet-stream",
         filename=attachment.original_filename,
     )
@@ -842,17 +840,12 @@ async def delete_plan_note_attachment(
 
     await _ensure_note_access(attachment.note, user, db)
 
-    upload_base = _plan_note_upload_base_dir()
-    note_dir = upload_base / str(attachment.note_id)
-    stored_path = note_dir / attachment.stored_filename
+    stored_key = _attachment_key(attachment.note_id, attachment.stored_filename)
 
     await db.delete(attachment)
     await db.commit()
 
     try:
-        if stored_path.exists():
-            stored_path.unlink()
-        if note_dir.exists() and not any(note_dir.iterdir()):
-            note_dir.rmdir()
-    except OSError:
+        await _plan_note_storage().delete(stored_key)
+    except StorageError:
         pass
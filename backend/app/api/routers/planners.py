@@ -3,6 +3,7 @@ from __future__ import annotations
 import logging
 import re
 import uuid
+from collections.abc import Iterator
 from datetime import date, datetime, timedelta, timezone
 
 try:
@@ -22,6 +23,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.access import ensure_department_access, ensure_manager_or_admin
 from app.api.deps import get_current_user
+from app.api.serialization import PreEncodedRoute, pre_encoded
 from app.config import settings
 from app.db import get_db
 from app.models.common_entry import CommonEntry
@@ -39,8 +41,30 @@ from app.models.weekly_plan import WeeklyPlan
 from app.models.weekly_planner_snapshot import WeeklyPlannerSnapshot
 from app.models.weekly_planner_legend_entry import WeeklyPlannerLegendEntry
 from app.models.department import Department
+from app.services.planner_occurrences import (
+    OCCURRENCE_FAST,
+    OCCURRENCE_PROJECT,
+    OCCURRENCE_SYSTEM,
+    PlannerOccurrence,
+    WeeklyPlannerWeek,
+    planner_slots,
+)
 from app.services.task_classification import is_fast_task as is_fast_task_model
 from app.services.system_task_schedule import matches_template_date
+from app.services.task_read_model import defer_task_text
+from app.services.weekly_snapshot_comparisons import (
+    COMPARE_BUCKETS,
+    comparison_cache_key,
+    live_week_revision,
+    load_comparison,
+    store_comparison,
+)
+from app.services.weekly_snapshot_tasks import (
+    defer_snapshot_payload,
+    load_snapshot_payloads,
+    load_snapshot_task_items,
+    snapshot_task_rows,
+)
 from app.services.project_display_title import build_project_display_title_map
 from app.services.project_classification import (
     is_mst_or_tt_project as _is_mst_or_tt_project,
@@ -91,7 +115,7 @@ from app.schemas.weekly_planner_snapshot import (
 )
 
 
-router = APIRouter()
+router = APIRouter(route_class=PreEncodedRoute)
 
 
 def _parse_ko_user_id(internal_notes: str | None) -> uuid.UUID | None:
@@ -1123,6 +1147,29 @@ def _tasks_by_key_from_snapshot_payload(payload: dict) -> dict[str, dict]:
     return {task["match_key"]: task for task in task_items if task.get("match_key")}
 
 
+async def _snapshot_tasks_by_key(
+    db: AsyncSession,
+    *snapshots: WeeklyPlannerSnapshot,
+) -> list[dict[str, dict]]:
+    """Read snapshot tasks from the indexed task table, one dict per snapshot.
+
+    Only snapshots saved before the table existed, or without task items, fall
+    back to loading and flattening the JSONB payload.
+    """
+    snapshot_ids = [snapshot.id for snapshot in snapshots]
+    stored = await load_snapshot_task_items(db, snapshot_ids)
+    payloads = await load_snapshot_payloads(
+        db, [snapshot_id for snapshot_id in snapshot_ids if snapshot_id not in stored]
+    )
+    result: list[dict[str, dict]] = []
+    for snapshot_id in snapshot_ids:
+        if snapshot_id in stored:
+            result.append({task["match_key"]: task for task in stored[snapshot_id]})
+        else:
+            result.append(_tasks_by_key_from_snapshot_payload(payloads.get(snapshot_id) or {}))
+    return result
+
+
 def _planned_last_day_for_task(planned_task: dict, *, week_end: date) -> date:
     occurrences = planned_task.get("occurrences") or []
     days = [occurrence.get("day") for occurrence in occurrences if occurrence.get("day") is not None]
@@ -1194,6 +1241,181 @@ def _classify_weekly_plan_performance(
     }
 
 
+def _classify_to_compare_out(
+    *,
+    planned_tasks: dict[str, dict],
+    actual_tasks: dict[str, dict],
+    week_end: date,
+    as_of_date: date,
+) -> dict[str, list[WeeklySnapshotCompareTaskOut]]:
+    buckets = _classify_weekly_plan_performance(
+        planned_tasks=planned_tasks,
+        actual_tasks=actual_tasks,
+        week_end=week_end,
+        as_of_date=as_of_date,
+    )
+    return {name: [_to_compare_task_out(task) for task in buckets[name]] for name in COMPARE_BUCKETS}
+
+
+def _comparison_result(
+    buckets: dict[str, list[WeeklySnapshotCompareTaskOut]],
+    *,
+    total_planned: int,
+    assignee_columns: list[tuple[uuid.UUID | None, str]] | None = None,
+) -> dict:
+    return jsonable_encoder(
+        {
+            "total_planned": total_planned,
+            "buckets": {name: [task.model_dump(mode="json") for task in buckets[name]] for name in COMPARE_BUCKETS},
+            "assignee_columns": [list(column) for column in assignee_columns or []],
+        }
+    )
+
+
+def _buckets_from_comparison(result: dict) -> dict[str, list[WeeklySnapshotCompareTaskOut]]:
+    stored = result.get("buckets") or {}
+    return {
+        name: [WeeklySnapshotCompareTaskOut.model_validate(task) for task in stored.get(name) or []]
+        for name in COMPARE_BUCKETS
+    }
+
+
+def _assignee_columns_from_department_payload(department_payload: dict | None) -> list[tuple[uuid.UUID | None, str]]:
+    if not department_payload:
+        return []
+
+    seen: set[str] = set()
+    columns: list[tuple[uuid.UUID | None, str]] = []
+    for day in department_payload.get("days") or []:
+        for user_day in day.get("users") or []:
+            name = (user_day.get("user_name") or "").strip()
+            if not name:
+                continue
+            user_id = _parse_uuid_value(user_day.get("user_id"))
+            key = str(user_id) if user_id is not None else f"name:{name.lower()}"
+            if key in seen:
+                continue
+            seen.add(key)
+            columns.append((user_id, name))
+
+    columns.sort(key=lambda item: item[1].lower())
+    return columns
+
+
+async def _snapshot_comparison(
+    db: AsyncSession,
+    baseline_snapshot: WeeklyPlannerSnapshot,
+    compare_snapshot: WeeklyPlannerSnapshot,
+    *,
+    week_end: date,
+) -> tuple[dict[str, list[WeeklySnapshotCompareTaskOut]], int]:
+    """Classify ``compare_snapshot`` against ``baseline_snapshot``.
+
+    Snapshots never change, so the result is computed once per pair and
+    shared by the JSON endpoints and the xlsx exports.
+    """
+    as_of_date = week_end + timedelta(days=1)
+    cache_key = comparison_cache_key(week_end, as_of_date)
+    cached = await load_comparison(
+        db,
+        baseline_snapshot_id=baseline_snapshot.id,
+        compare_snapshot_id=compare_snapshot.id,
+        cache_key=cache_key,
+    )
+    if cached is not None:
+        return _buckets_from_comparison(cached), int(cached.get("total_planned") or 0)
+
+    planned_tasks_by_key, actual_tasks_by_key = await _snapshot_tasks_by_key(
+        db, baseline_snapshot, compare_snapshot
+    )
+    buckets = _classify_to_compare_out(
+        planned_tasks=planned_tasks_by_key,
+        actual_tasks=actual_tasks_by_key,
+        week_end=week_end,
+        as_of_date=as_of_date,
+    )
+    await store_comparison(
+        baseline_snapshot_id=baseline_snapshot.id,
+        compare_snapshot_id=compare_snapshot.id,
+        cache_key=cache_key,
+        result=_comparison_result(buckets, total_planned=len(planned_tasks_by_key)),
+    )
+    return buckets, len(planned_tasks_by_key)
+
+
+async def _live_comparison(
+    db: AsyncSession,
+    user: User,
+    planned_snapshot: WeeklyPlannerSnapshot,
+    *,
+    department_id: uuid.UUID,
+    week_start: date,
+    week_end: date,
+) -> tuple[dict[str, list[WeeklySnapshotCompareTaskOut]], int, list[tuple[uuid.UUID | None, str]]]:
+    """Classify the live weekly planner against ``planned_snapshot``.
+
+    The live table is only rebuilt when the week's planner data revision or
+    the as-of day changed since the stored result was computed. Returns the
+    buckets, the planned task count and the current assignee columns.
+    """
+    as_of_date = min(_today_app_date(), week_end)
+    revision = await live_week_revision(db, department_id=department_id, week_start=week_start, week_end=week_end)
+    cache_key = comparison_cache_key(department_id, week_end, as_of_date, revision)
+    cached = await load_comparison(
+        db,
+        baseline_snapshot_id=planned_snapshot.id,
+        compare_snapshot_id=None,
+        cache_key=cache_key,
+    )
+    if cached is not None:
+        assignee_columns = [
+            (_parse_uuid_value(assignee_id), name) for assignee_id, name in cached.get("assignee_columns") or []
+        ]
+        return _buckets_from_comparison(cached), int(cached.get("total_planned") or 0), assignee_columns
+
+    (snapshot_tasks_by_key,) = await _snapshot_tasks_by_key(db, planned_snapshot)
+
+    current_weekly_table = await weekly_table_planner(
+        week_start=week_start,
+        department_id=department_id,
+        is_this_week=False,
+        db=db,
+        user=user,
+    )
+    current_table_json = jsonable_encoder(current_weekly_table)
+    current_departments = current_table_json.get("departments") or []
+    current_department_payload = current_departments[0] if current_departments else None
+    current_task_ids = _task_ids_from_department_payload(current_department_payload)
+    current_task_priorities = await _load_task_priority_map(db, current_task_ids)
+    current_task_items = _flatten_weekly_department_tasks(
+        current_department_payload,
+        task_priority_map=current_task_priorities,
+    )
+    current_tasks_by_key = {
+        task["match_key"]: task
+        for task in current_task_items
+    }
+
+    buckets = _classify_to_compare_out(
+        planned_tasks=snapshot_tasks_by_key,
+        actual_tasks=current_tasks_by_key,
+        week_end=week_end,
+        as_of_date=as_of_date,
+    )
+    assignee_columns = _assignee_columns_from_department_payload(current_department_payload)
+    await store_comparison(
+        baseline_snapshot_id=planned_snapshot.id,
+        compare_snapshot_id=None,
+        cache_key=cache_key,
+        result=_comparison_result(
+            buckets,
+            total_planned=len(snapshot_tasks_by_key),
+            assignee_columns=assignee_columns,
+        ),
+    )
+    return buckets, len(snapshot_tasks_by_key), assignee_columns
+
+
 def _group_compare_tasks_by_assignee(
     *,
     completed: list[WeeklySnapshotCompareTaskOut],
@@ -1777,15 +1999,63 @@ async def delete_weekly_plan(
     return Response(status_code=status.HTTP_204_NO_CONTENT)
 
 
-@router.get("/weekly-table", response_model=WeeklyTableResponse)
-async def weekly_table_planner(
+def _weekly_system_task_entry(item: PlannerOccurrence) -> WeeklyTableTaskEntry:
+    system_task = item.task
+    if system_task.status == TaskStatus.DONE:
+        task_status = TaskStatus.DONE
+        completed_at = system_task.completed_at
+    else:
+        task_status = TaskStatus.TODO
+        completed_at = None
+    return WeeklyTableTaskEntry(
+        task_id=system_task.id,
+        title=item.template.title,
+        status=task_status,
+        daily_status=None,
+        created_at=system_task.created_at,
+        completed_at=completed_at,
+        daily_products=None,
+        finish_period=item.finish_period,
+        fast_task_type=None,
+        is_bllok=False,
+        is_1h_report=False,
+        is_r1=False,
+        is_personal=False,
+        is_deadline_important=system_task.is_deadline_important,
+        ga_note_origin_id=None,
+        plan_note_origin_id=None,
+    )
+
+
+def _empty_weekly_planner_week(week_start: date, week_end: date) -> WeeklyPlannerWeek:
+    return WeeklyPlannerWeek(
+        week_start=week_start,
+        week_end=week_end,
+        saved_plan_id=None,
+        occurrences=lambda: iter(()),
+        table=lambda: WeeklyTableResponse(
+            week_start=week_start,
+            week_end=week_end,
+            departments=[],
+            saved_plan_id=None,
+        ),
+    )
+
+
+async def load_weekly_planner_week(
+    db: AsyncSession,
+    *,
+    user,
     week_start: date | None = None,
     department_id: uuid.UUID | None = None,
     is_this_week: bool = False,
-    db: AsyncSession = Depends(get_db),
-    user=Depends(get_current_user),
-) -> WeeklyTableResponse:
-    """Get weekly planner in table format organized by departments, users, days, and AM/PM"""
+) -> WeeklyPlannerWeek:
+    """Load one weekly-planner week with batched queries.
+
+    Access rules are the weekly table's. The returned week yields flat
+    occurrences for readers such as the planning audit and builds the
+    weekly-table response on demand.
+    """
     today = datetime.now(timezone.utc).date()
     
     # Determine which week to show
@@ -1824,12 +2094,7 @@ async def weekly_table_planner(
                 department_id = user.department_id
             elif user.department_id is None:
                 # User has no department - return empty response
-                return WeeklyTableResponse(
-                    week_start=week_start_date,
-                    week_end=week_end,
-                    departments=[],
-                    saved_plan_id=None,
-                )
+                return _empty_weekly_planner_week(week_start_date, week_end)
         dept_stmt = dept_stmt.where(Department.id == department_id)
     elif user.role not in (UserRole.ADMIN, UserRole.MANAGER):
         # Non-admin/manager users without department_id parameter should see their own department
@@ -1838,12 +2103,7 @@ async def weekly_table_planner(
             dept_stmt = dept_stmt.where(Department.id == user.department_id)
         else:
             # User has no department - return empty response
-            return WeeklyTableResponse(
-                week_start=week_start_date,
-                week_end=week_end,
-                departments=[],
-                saved_plan_id=None,
-            )
+            return _empty_weekly_planner_week(week_start_date, week_end)
     
     # Check if there's a saved plan for this week (after department_id is finalized)
     saved_plan_id: uuid.UUID | None = None
@@ -1872,7 +2132,9 @@ async def weekly_table_planner(
     
     # Get active tasks (including completed ones so they can show through completion day).
     # We don't filter by department here because we show tasks by assignee department.
-    task_stmt = select(Task).where(
+    # internal_notes carries Product Content production dates; descriptions
+    # are never rendered in the weekly table.
+    task_stmt = select(Task).options(*defer_task_text("description")).where(
         Task.is_active == True,
         Task.system_template_origin_id.is_(None),
     )
@@ -2505,8 +2767,6 @@ async def weekly_table_planner(
             return "P:"
         return None
 
-    departments_data: list[WeeklyTableDepartment] = []
-    
     # Debug: Log task counts
     logger.debug(f"Weekly planner: Found {len(week_tasks)} tasks for week {week_start_date} to {week_end}")
     
@@ -2515,8 +2775,9 @@ async def weekly_table_planner(
         order_value = u.weekly_planner_sort_order
         return (1 if order_value is None else 0, order_value or 0, name)
 
+    # Show only users from each department (exclude users with no department).
+    dept_users_by_dept: list[tuple[Department, list[User]]] = []
     for dept in departments:
-        # Show only users from this specific department (exclude users with no department)
         dept_users = [
             u
             for u in all_users
@@ -2524,503 +2785,348 @@ async def weekly_table_planner(
             and u.department_id == dept.id
             and not u.weekly_planner_hidden
         ]
-        dept_users = sorted(dept_users, key=_weekly_user_sort_key)
-        # Show tasks that belong to users in this department (regardless of task.department_id)
-        dept_user_ids = {u.id for u in dept_users}
-        dept_tasks = []
-        for t in week_tasks:
-            effective_ids = _effective_weekly_assignee_ids(t)
-            if effective_ids.intersection(dept_user_ids):
-                dept_tasks.append(t)
+        dept_users_by_dept.append((dept, sorted(dept_users, key=_weekly_user_sort_key)))
+
+    # Assignees and active ranges do not depend on the cell being painted,
+    # so resolve them once per task instead of once per user and day.
+    # Tasks show for users in a department regardless of task.department_id.
+    tasks_by_user: dict[uuid.UUID, list[Task]] = {}
+    for t in week_tasks:
+        for assignee_id in _effective_weekly_assignee_ids(t):
+            tasks_by_user.setdefault(assignee_id, []).append(t)
+    active_range_by_task = {t.id: _task_active_range(t) for t in week_tasks}
+
+    # Load opted-in generated system-task occurrences once for every shown user.
+    system_rows_by_user_day: dict[
+        tuple[uuid.UUID, date], list[tuple[Task, SystemTaskTemplate]]
+    ] = {}
+    shown_user_ids = {u.id for _, dept_users in dept_users_by_dept for u in dept_users}
+    if shown_user_ids:
+        system_task_local_day = cast(
+            func.timezone(
+                func.coalesce(SystemTaskTemplate.timezone, settings.APP_TIMEZONE),
+                func.coalesce(Task.due_date, Task.origin_run_at),
+            ),
+            Date,
+        )
+        weekly_system_rows = (
+            await db.execute(
+                select(Task, SystemTaskTemplate, system_task_local_day.label("local_day"))
+                .options(*defer_task_text())
+                .join(SystemTaskTemplate, Task.system_template_origin_id == SystemTaskTemplate.id)
+                .where(Task.assigned_to.in_(shown_user_ids))
+                .where(Task.system_template_origin_id.is_not(None))
+                .where(Task.is_active.is_(True))
+                .where(system_task_local_day >= working_days[0])
+                .where(system_task_local_day <= working_days[-1])
+                .where(SystemTaskTemplate.is_active.is_(True))
+                .where(SystemTaskTemplate.show_in_weekly_planner.is_(True))
+                .where(SystemTaskTemplate.approval_status == CommonApprovalStatus.approved)
+                .order_by(SystemTaskTemplate.title, Task.created_at.desc())
+            )
+        ).all()
+        for system_task, template, local_day in weekly_system_rows:
+            if system_task.assigned_to is None:
                 continue
+            system_rows_by_user_day.setdefault(
+                (system_task.assigned_to, local_day), []
+            ).append((system_task, template))
+
+    # Projects with due dates show for their members from Monday (or creation)
+    # until the due date, and stop on completion.
+    project_windows: list[tuple[uuid.UUID, date, date]] = []
+    for project in projects_with_due_dates:
+        project_due_date = _as_utc_date(project.due_date)
+        project_start_date = _as_utc_date(project.created_at)
+        if project_due_date is None or project_start_date is None:
+            continue
+        if project_start_date > week_end:
+            logger.debug(f"Project {project.title} start_date {project_start_date} is after week_end {week_end} - not showing")
+            continue
+        project_end_date = project_due_date
+        if project.completed_at is not None:
+            completed_day = _as_utc_date(project.completed_at)
+            if completed_day is not None:
+                project_end_date = min(project_end_date, completed_day)
+        project_windows.append(
+            (project.id, max(project_start_date, working_days[0]), min(project_end_date, week_end))
+        )
+
+    def _project_title(project_id: uuid.UUID) -> str:
+        return project_display_title_by_id.get(project_id) or (
+            project_map[project_id].title if project_id in project_map else "Unknown Project"
+        )
 
-        # Load opted-in generated system-task occurrences once for this department/week.
-        system_rows_by_user_day: dict[
-            tuple[uuid.UUID, date], list[tuple[Task, SystemTaskTemplate]]
-        ] = {}
-        if dept_user_ids:
-            system_task_local_day = cast(
-                func.timezone(
-                    func.coalesce(SystemTaskTemplate.timezone, settings.APP_TIMEZONE),
-                    func.coalesce(Task.due_date, Task.origin_run_at),
-                ),
-                Date,
+    def _user_day_occurrences(
+        dept: Department,
+        dept_user: User,
+        day_date: date,
+        allow_empty_project_entries: bool,
+    ) -> Iterator[PlannerOccurrence]:
+        user_name = dept_user.full_name or dept_user.username or ""
+
+        def occurrence(
+            slot: str,
+            kind: str,
+            task: Task | None,
+            finish_period: str | None,
+            *,
+            project_id: uuid.UUID | None = None,
+            template: SystemTaskTemplate | None = None,
+        ) -> PlannerOccurrence:
+            return PlannerOccurrence(
+                department_id=dept.id,
+                department_name=dept.name,
+                user_id=dept_user.id,
+                user_name=user_name,
+                day=day_date,
+                slot=slot,
+                kind=kind,
+                task=task,
+                project_id=project_id,
+                project_title=_project_title(project_id) if project_id is not None else None,
+                finish_period=finish_period,
+                template=template,
             )
-            weekly_system_rows = (
-                await db.execute(
-                    select(Task, SystemTaskTemplate, system_task_local_day.label("local_day"))
-                    .join(SystemTaskTemplate, Task.system_template_origin_id == SystemTaskTemplate.id)
-                    .where(Task.assigned_to.in_(dept_user_ids))
-                    .where(Task.system_template_origin_id.is_not(None))
-                    .where(Task.is_active.is_(True))
-                    .where(system_task_local_day >= working_days[0])
-                    .where(system_task_local_day <= working_days[-1])
-                    .where(SystemTaskTemplate.is_active.is_(True))
-                    .where(SystemTaskTemplate.show_in_weekly_planner.is_(True))
-                    .where(SystemTaskTemplate.approval_status == CommonApprovalStatus.approved)
-                    .order_by(SystemTaskTemplate.title, Task.created_at.desc())
-                )
-            ).all()
-            for system_task, template, local_day in weekly_system_rows:
-                if system_task.assigned_to is None:
-                    continue
-                system_rows_by_user_day.setdefault(
-                    (system_task.assigned_to, local_day), []
-                ).append((system_task, template))
-        
-        # Organize tasks by day and user
-        days_data: list[WeeklyTableDay] = []
-        
+
         # Keep weekly planner read-only: do not generate system tasks during page loads.
-        for day_date in working_days:
-            users_day_data: list[WeeklyTableUserDay] = []
-            
-            for dept_user in dept_users:
-                # Get tasks for this user on this day
-                user_task_ids = set()
-                for t in dept_tasks:
-                    effective_ids = _effective_weekly_assignee_ids(t)
-                    if dept_user.id in effective_ids:
-                        user_task_ids.add(t.id)
-                
-                # Planning-only per-day filtering:
-                # - single-day tasks show only on due_date
-                # - multi-day tasks show on each active day within [start_date..due_date]
-                user_tasks = []
-                for t in dept_tasks:
-                    if t.id not in user_task_ids:
-                        continue
-                    start, end = _task_active_range(t)
-                    has_progress_for_day = day_date in progress_days_by_task.get(t.id, set())
-                    if (start is None or end is None) and not has_progress_for_day:
-                        continue
-                    
-                    # DEBUG: Log day filtering for LEA BLLOK TASK
-                    if t.title and "LEA BLLOK" in t.title.upper():
-                        logger = logging.getLogger(__name__)
-                        appears_today = has_progress_for_day or (
-                            start is not None and end is not None and start <= day_date <= end
-                        )
-                        logger.warning(
-                            f"[DAY_FILTER DEBUG] task_id={t.id}, day={day_date}: "
-                            f"range=({start}, {end}), "
-                            f"appears_today={appears_today}, "
-                            f"check: {start} <= {day_date} <= {end}"
-                        )
-                    
-                    if has_progress_for_day or (start is not None and end is not None and start <= day_date <= end):
-                        user_tasks.append(t)
-                
-                # Add projects with due dates for this user
-                # Projects should show from Monday until due date
-                # If overdue (due_date < Monday) and not completed, show on Monday as late project
-                user_projects_with_due: set[uuid.UUID] = set()
-                user_late_projects: set[uuid.UUID] = set()
-                for project in projects_with_due_dates:
-                    # Check if user is a member of this project
-                    if project.id not in project_members_map:
-                        logger.debug(f"Project {project.title} (id={project.id}) has no members in map - skipping")
-                        continue
-                    if dept_user.id not in project_members_map[project.id]:
-                        logger.debug(f"Project {project.title} (id={project.id}) - user {dept_user.full_name} (id={dept_user.id}) is not a member. Members: {list(project_members_map[project.id])}")
-                        continue
-                    
-                    # No department filter here: project visibility is based on membership
-                    
-                    project_due_date = _as_utc_date(project.due_date)
-                    if project_due_date is None:
-                        continue
-                    project_start_date = _as_utc_date(project.created_at)
-                    if project_start_date is None:
-                        continue
-                    project_end_date = project_due_date
-                    if project.completed_at is not None:
-                        completed_day = _as_utc_date(project.completed_at)
-                        if completed_day is not None:
-                            project_end_date = min(project_end_date, completed_day)
-                    monday_of_week = working_days[0]
-                    week_end = working_days[-1]
-                    
-                    # Debug logging for this specific project
-                    logger.info(
-                        f"[PROJECT CHECK] {project.title}: "
-                        f"start={project_start_date}, due={project_due_date}, "
-                        f"monday={monday_of_week}, week_end={week_end}, "
-                        f"day={day_date}, user={dept_user.full_name}, "
-                        f"dept={dept.name}"
-                    )
-                    
-                    # Determine if project should show on this day (created -> due, stop on completion)
-                    should_show = False
-                    effective_start = max(project_start_date, monday_of_week)
-
-                    if project_start_date <= week_end:
-                        if day_date >= effective_start and day_date <= project_end_date and day_date <= week_end:
-                            should_show = True
-                            logger.debug(f"Project {project.title} showing from {effective_start} to {project_end_date} on {day_date}")
-                    else:
-                        logger.debug(f"Project {project.title} start_date {project_start_date} is after week_end {week_end} - not showing")
-                    
-                    if should_show:
-                        user_projects_with_due.add(project.id)
-                        logger.info(
-                            f"[PROJECT ADDED] {project.title} added to user_projects_with_due for "
-                            f"user={dept_user.full_name}, day={day_date}"
-                        )
-                        # Ensure project is in project_map
-                        if project.id not in project_map:
-                            project_map[project.id] = project
-                    else:
-                        logger.debug(
-                            f"[PROJECT SKIPPED] {project.title} NOT added - "
-                            f"start={project_start_date}, due={project_due_date}, "
-                            f"monday={monday_of_week}, day={day_date}, week_end={week_end}"
-                        )
-                
-                # Debug: Log user tasks found
-                if user_tasks:
-                    logger.debug(f"User {dept_user.full_name} on {day_date}: {len(user_tasks)} tasks")
-                if user_projects_with_due:
-                    logger.info(f"[USER PROJECTS] User {dept_user.full_name} on {day_date}: {len(user_projects_with_due)} projects with due dates: {list(user_projects_with_due)}")
-                else:
-                    logger.debug(f"User {dept_user.full_name} on {day_date}: NO projects with due dates")
-                
-                # Separate tasks by type: projects, system tasks, fast tasks
-                # And split by AM/PM based on finish_period
-                am_projects_map: dict[uuid.UUID, list[Task]] = {}
-                pm_projects_map: dict[uuid.UUID, list[Task]] = {}
-                am_system_tasks: list[WeeklyTableTaskEntry] = []
-                pm_system_tasks: list[WeeklyTableTaskEntry] = []
-                am_fast_tasks: list[WeeklyTableTaskEntry] = []
-                pm_fast_tasks: list[WeeklyTableTaskEntry] = []
-                
-                # Fetch generated occurrences only for templates explicitly opted into the weekly planner.
-                system_rows = system_rows_by_user_day.get((dept_user.id, day_date), [])
-
-                if system_rows:
-                    logger.debug(
-                        f"[SYSTEM TASKS] Found {len(system_rows)} system tasks for "
-                        f"{dept_user.username} on {day_date}"
-                    )
-
-                # Convert task rows to WeeklyTableTaskEntry.
-                for system_task, tmpl in system_rows:
-                    if system_task.status == TaskStatus.DONE:
-                        task_status = TaskStatus.DONE
-                        completed_at = system_task.completed_at
-                    else:
-                        task_status = TaskStatus.TODO
-                        completed_at = None
-
-                    finish_period_value = system_task.finish_period or tmpl.finish_period
-                    finish_period_upper = None
-                    if finish_period_value:
-                        finish_period_str = str(finish_period_value).strip()
-                        if finish_period_str:
-                            finish_period_upper = finish_period_str.upper()
-
-                    is_pm = finish_period_upper == "PM"
-                    is_both = not finish_period_upper or finish_period_upper not in ("AM", "PM")
-
-                    entry = WeeklyTableTaskEntry(
-                        task_id=system_task.id,
-                        title=tmpl.title,
-                        status=task_status,
-                        daily_status=None,
-                        created_at=system_task.created_at,
-                        completed_at=completed_at,
-                        daily_products=None,
-                        finish_period=finish_period_value,
-                        fast_task_type=None,
-                        is_bllok=False,
-                        is_1h_report=False,
-                        is_r1=False,
-                        is_personal=False,
-                        is_deadline_important=system_task.is_deadline_important,
-                        ga_note_origin_id=None,
-                        plan_note_origin_id=None,
-                    )
-
-                    if is_both:
-                        am_system_tasks.append(entry)
-                        pm_system_tasks.append(entry)
-                    elif is_pm:
-                        pm_system_tasks.append(entry)
-                    else:
-                        am_system_tasks.append(entry)
-
-                for task in user_tasks:
-                    # Handle finish_period: None or empty means both AM and PM
-                    # Check if finish_period is None, empty string, or not a valid AM/PM value
-                    finish_period_value = _finish_period_for_task_day(task, day_date)
-                    
-                    # Normalize the finish_period value
-                    finish_period_upper = None
-                    if finish_period_value:
-                        finish_period_str = str(finish_period_value).strip()
-                        if finish_period_str:
-                            finish_period_upper = finish_period_str.upper()
-                    
-                    # Determine which time slot(s) this task should appear in
-                    is_pm = finish_period_upper == "PM"
-                    is_am = finish_period_upper == "AM"
-                    # If finish_period is None, empty, or not "AM"/"PM", it should appear in both slots
-                    is_both = not finish_period_upper or finish_period_upper not in ("AM", "PM")
-                    
-                    # System tasks (have system_template_origin_id)
-                    if task.system_template_origin_id is not None:
+        for system_task, tmpl in system_rows_by_user_day.get((dept_user.id, day_date), []):
+            finish_period_value = system_task.finish_period or tmpl.finish_period
+            for slot in planner_slots(finish_period_value):
+                yield occurrence(slot, OCCURRENCE_SYSTEM, system_task, finish_period_value, template=tmpl)
+
+        # Planning-only per-day filtering:
+        # - single-day tasks show only on due_date
+        # - multi-day tasks show on each active day within [start_date..due_date]
+        # - days with progress rows always show the task
+        projects_in_slot: dict[str, set[uuid.UUID]] = {"AM": set(), "PM": set()}
+        for task in tasks_by_user.get(dept_user.id, ()):
+            start, end = active_range_by_task[task.id]
+            has_progress_for_day = day_date in progress_days_by_task.get(task.id, ())
+            if not has_progress_for_day and not (start is not None and end is not None and start <= day_date <= end):
+                continue
+            if task.system_template_origin_id is not None:
+                continue
+            # None, empty or anything but AM/PM appears in both slots.
+            finish_period_value = _finish_period_for_task_day(task, day_date)
+            if is_fast_task_model(task):
+                for slot in planner_slots(finish_period_value):
+                    if not _is_excluded(task.id, dept_user.id, day_date, slot):
+                        yield occurrence(slot, OCCURRENCE_FAST, task, finish_period_value)
+            elif task.project_id is not None:
+                # GA/PX-JAV assignee copies are personal work items. Do not hide them
+                # behind project-slot removals on another department's board.
+                note_origin = task.ga_note_origin_id is not None or task.plan_note_origin_id is not None
+                for slot in planner_slots(finish_period_value):
+                    if not note_origin and _is_project_excluded(task.project_id, dept_user.id, day_date, slot):
                         continue
-                    # Fast tasks (standalone ad-hoc tasks only)
-                    elif is_fast_task_model(task):
-                        daily_status_value = _daily_status_for_task_day(task, day_date)
-                        entry = WeeklyTableTaskEntry(
-                            task_id=task.id,
-                            title=task.title,
-                            status=TaskStatus(task.status) if task.status else TaskStatus.TODO,
-                            daily_status=daily_status_value,
-                            created_at=task.created_at,
-                            completed_at=task.completed_at,
-                            daily_products=task.daily_products,
-                            finish_period=finish_period_value,
-                            fast_task_type=get_fast_task_type(task),
-                            is_bllok=task.is_bllok,
-                            is_1h_report=task.is_1h_report,
-                            is_r1=task.is_r1,
-                            is_personal=task.is_personal,
-                            is_deadline_important=task.is_deadline_important,
-                            ga_note_origin_id=task.ga_note_origin_id,
-                            plan_note_origin_id=task.plan_note_origin_id,
-                        )
-                        if is_both:
-                            # Add to both AM and PM
-                            if not _is_excluded(task.id, dept_user.id, day_date, "AM"):
-                                am_fast_tasks.append(entry)
-                            if not _is_excluded(task.id, dept_user.id, day_date, "PM"):
-                                pm_fast_tasks.append(entry)
-                        elif is_pm:
-                            if not _is_excluded(task.id, dept_user.id, day_date, "PM"):
-                                pm_fast_tasks.append(entry)
-                        else:
-                            # Default to AM if not PM and not both
-                            if not _is_excluded(task.id, dept_user.id, day_date, "AM"):
-                                am_fast_tasks.append(entry)
-                    # Project tasks (have project_id)
-                    elif task.project_id is not None:
-                        # GA/PX-JAV assignee copies are personal work items. Do not hide them
-                        # behind project-slot removals on another department's board.
-                        note_origin = task.ga_note_origin_id is not None or task.plan_note_origin_id is not None
-                        if is_both:
-                            # Add to both AM and PM
-                            if (note_origin or not _is_project_excluded(task.project_id, dept_user.id, day_date, "AM")) and not _is_excluded(task.id, dept_user.id, day_date, "AM"):
-                                if task.project_id not in am_projects_map:
-                                    am_projects_map[task.project_id] = []
-                                am_projects_map[task.project_id].append(task)
-                            if (note_origin or not _is_project_excluded(task.project_id, dept_user.id, day_date, "PM")) and not _is_excluded(task.id, dept_user.id, day_date, "PM"):
-                                if task.project_id not in pm_projects_map:
-                                    pm_projects_map[task.project_id] = []
-                                pm_projects_map[task.project_id].append(task)
-                        elif is_pm:
-                            if (note_origin or not _is_project_excluded(task.project_id, dept_user.id, day_date, "PM")) and not _is_excluded(task.id, dept_user.id, day_date, "PM"):
-                                if task.project_id not in pm_projects_map:
-                                    pm_projects_map[task.project_id] = []
-                                pm_projects_map[task.project_id].append(task)
-                        else:
-                            # Default to AM if not PM and not both
-                            if (note_origin or not _is_project_excluded(task.project_id, dept_user.id, day_date, "AM")) and not _is_excluded(task.id, dept_user.id, day_date, "AM"):
-                                if task.project_id not in am_projects_map:
-                                    am_projects_map[task.project_id] = []
-                                am_projects_map[task.project_id].append(task)
-                
-                # Add projects with due dates that don't have tasks yet
-                # These projects should show for members even without tasks
-                # If project already has tasks in map, keep those tasks
-                allow_empty_project_entries = _should_add_empty_project_entry_for_department(
-                    dept.id,
-                    pc_dept_ids,
-                )
-                for project_id in user_projects_with_due:
-                    # Only add if not already in maps (from tasks above)
-                    # If project already has tasks, we keep those tasks
-                    # The project will show with its tasks on days with tasks,
-                    # and without tasks (but still visible) on other days until due date
-                    if not allow_empty_project_entries:
+                    if _is_excluded(task.id, dept_user.id, day_date, slot):
                         continue
-                    if project_id not in am_projects_map and project_id not in pm_projects_map:
-                        # Default to AM if no tasks exist
-                        if not _is_project_excluded(project_id, dept_user.id, day_date, "AM"):
-                            am_projects_map[project_id] = []
-                
-                # Convert project maps to lists with task details
-                # Include all projects, even if not in project_map (they'll show as "Unknown Project")
-                am_projects: list[WeeklyTableProjectEntry] = []
-                for project_id, tasks_list in am_projects_map.items():
-                    task_entries: list[WeeklyTableProjectTaskEntry] = []
-                    for t in tasks_list:
-                        base_total_products, base_completed_products = _task_product_counts(t)
-                        progress_counts = _progress_counts_for_day(t.id, day_date)
-                        daily_status_value = _override_daily_status_from_progress(
-                            _daily_status_for_task_day(t, day_date),
-                            progress_counts,
-                        )
-                        status_for_day = _status_for_day(
-                            status=TaskStatus(t.status) if t.status else TaskStatus.TODO,
-                            daily_status=daily_status_value,
-                            completed_at=t.completed_at,
-                            day_date=day_date,
-                        )
-                        total_products, completed_products, weekly_planned_products, day_total_products, day_done_products = _build_weekly_task_product_metrics(
-                            base_total=base_total_products,
-                            base_completed=base_completed_products,
-                            progress_counts=progress_counts,
-                            is_mst_tt_task=t.id in mst_tt_task_ids,
-                            status_for_day=status_for_day,
-                        )
-                        if t.id in mst_tt_task_ids and t.project_id is not None:
-                            weekly_planned_products = weekly_mst_tt_planned_by_user_project.get(
-                                (dept_user.id, t.project_id),
-                                weekly_planned_products if weekly_planned_products is not None else 0,
-                            )
-                        task_entries.append(
-                            WeeklyTableProjectTaskEntry(
-                                task_id=t.id,
-                                task_title=t.title,
-                                phase=t.phase,
-                                status=TaskStatus(t.status) if t.status else TaskStatus.TODO,
-                                daily_status=daily_status_value,
-                                created_at=t.created_at,
-                                completed_at=t.completed_at,
-                                daily_products=total_products,
-                                total_products=total_products,
-                                completed_products=completed_products,
-                                weekly_planned_products=weekly_planned_products,
-                                day_total_products=day_total_products,
-                                day_done_products=day_done_products,
-                                finish_period=_finish_period_for_task_day(t, day_date),
-                                is_bllok=t.is_bllok,
-                                is_1h_report=t.is_1h_report,
-                                is_r1=t.is_r1,
-                                is_personal=t.is_personal,
-                                is_deadline_important=t.is_deadline_important,
-                                ga_note_origin_id=t.ga_note_origin_id,
-                                plan_note_origin_id=t.plan_note_origin_id,
-                            )
-                        )
-                    am_projects.append(
-                        WeeklyTableProjectEntry(
-                            project_id=project_id,
-                            project_title=project_display_title_by_id.get(project_id)
-                            or (project_map[project_id].title if project_id in project_map else "Unknown Project"),
-                            project_total_products=project_map[project_id].total_products if project_id in project_map else None,
-                            project_current_phase=project_map[project_id].current_phase if project_id in project_map else None,
-                            project_type=project_map[project_id].project_type if project_id in project_map else None,
-                            task_count=len(tasks_list),
-                            tasks=task_entries,
-                            is_late=False,
-                        )
-                    )
-                pm_projects: list[WeeklyTableProjectEntry] = []
-                for project_id, tasks_list in pm_projects_map.items():
-                    task_entries: list[WeeklyTableProjectTaskEntry] = []
-                    for t in tasks_list:
-                        base_total_products, base_completed_products = _task_product_counts(t)
-                        progress_counts = _progress_counts_for_day(t.id, day_date)
-                        daily_status_value = _override_daily_status_from_progress(
-                            _daily_status_for_task_day(t, day_date),
-                            progress_counts,
-                        )
-                        status_for_day = _status_for_day(
-                            status=TaskStatus(t.status) if t.status else TaskStatus.TODO,
-                            daily_status=daily_status_value,
-                            completed_at=t.completed_at,
-                            day_date=day_date,
-                        )
-                        total_products, completed_products, weekly_planned_products, day_total_products, day_done_products = _build_weekly_task_product_metrics(
-                            base_total=base_total_products,
-                            base_completed=base_completed_products,
-                            progress_counts=progress_counts,
-                            is_mst_tt_task=t.id in mst_tt_task_ids,
-                            status_for_day=status_for_day,
-                        )
-                        if t.id in mst_tt_task_ids and t.project_id is not None:
-                            weekly_planned_products = weekly_mst_tt_planned_by_user_project.get(
-                                (dept_user.id, t.project_id),
-                                weekly_planned_products if weekly_planned_products is not None else 0,
-                            )
-                        task_entries.append(
-                            WeeklyTableProjectTaskEntry(
-                                task_id=t.id,
-                                task_title=t.title,
-                                phase=t.phase,
-                                status=TaskStatus(t.status) if t.status else TaskStatus.TODO,
-                                daily_status=daily_status_value,
-                                created_at=t.created_at,
-                                completed_at=t.completed_at,
-                                daily_products=total_products,
-                                total_products=total_products,
-                                completed_products=completed_products,
-                                weekly_planned_products=weekly_planned_products,
-                                day_total_products=day_total_products,
-                                day_done_products=day_done_products,
-                                finish_period=_finish_period_for_task_day(t, day_date),
-                                is_bllok=t.is_bllok,
-                                is_1h_report=t.is_1h_report,
-                                is_r1=t.is_r1,
-                                is_personal=t.is_personal,
-                                is_deadline_important=t.is_deadline_important,
-                                ga_note_origin_id=t.ga_note_origin_id,
-                                plan_note_origin_id=t.plan_note_origin_id,
-                            )
-                        )
-                    pm_projects.append(
-                        WeeklyTableProjectEntry(
-                            project_id=project_id,
-                            project_title=project_display_title_by_id.get(project_id)
-                            or (project_map[project_id].title if project_id in project_map else "Unknown Project"),
-                            project_total_products=project_map[project_id].total_products if project_id in project_map else None,
-                            project_current_phase=project_map[project_id].current_phase if project_id in project_map else None,
-                            project_type=project_map[project_id].project_type if project_id in project_map else None,
-                            task_count=len(tasks_list),
-                            tasks=task_entries,
-                            is_late=False,
-                        )
-                    )
-                
-                users_day_data.append(
-                    WeeklyTableUserDay(
-                        user_id=dept_user.id,
-                        user_name=dept_user.full_name or dept_user.username or "",
-                        am_projects=am_projects,
-                        pm_projects=pm_projects,
-                        am_system_tasks=am_system_tasks,
-                        pm_system_tasks=pm_system_tasks,
-                        am_fast_tasks=am_fast_tasks,
-                        pm_fast_tasks=pm_fast_tasks,
-                    )
-                )
-            
-            days_data.append(
-                WeeklyTableDay(
-                    date=day_date,
-                    users=users_day_data,
-                )
+                    projects_in_slot[slot].add(task.project_id)
+                    yield occurrence(slot, OCCURRENCE_PROJECT, task, finish_period_value, project_id=task.project_id)
+
+        # Projects with due dates show for members even without tasks (in AM);
+        # a project that already has tasks on this day keeps only those.
+        if not allow_empty_project_entries:
+            return
+        for project_id, show_from, show_until in project_windows:
+            if not show_from <= day_date <= show_until:
+                continue
+            if dept_user.id not in project_members_map.get(project_id, ()):
+                continue
+            if project_id in projects_in_slot["AM"] or project_id in projects_in_slot["PM"]:
+                continue
+            if not _is_project_excluded(project_id, dept_user.id, day_date, "AM"):
+                yield occurrence("AM", OCCURRENCE_PROJECT, None, None, project_id=project_id)
+
+    def occurrences() -> Iterator[PlannerOccurrence]:
+        for dept, dept_users in dept_users_by_dept:
+            allow_empty_project_entries = _should_add_empty_project_entry_for_department(
+                dept.id,
+                pc_dept_ids,
             )
-        
-        departments_data.append(
-            WeeklyTableDepartment(
-                department_id=dept.id,
-                department_name=dept.name,
-                days=days_data,
+            for day_date in working_days:
+                for dept_user in dept_users:
+                    yield from _user_day_occurrences(dept, dept_user, day_date, allow_empty_project_entries)
+
+    def _project_task_entry(item: PlannerOccurrence) -> WeeklyTableProjectTaskEntry:
+        t = item.task
+        day_date = item.day
+        base_total_products, base_completed_products = _task_product_counts(t)
+        progress_counts = _progress_counts_for_day(t.id, day_date)
+        daily_status_value = _override_daily_status_from_progress(
+            _daily_status_for_task_day(t, day_date),
+            progress_counts,
+        )
+        status_for_day = _status_for_day(
+            status=TaskStatus(t.status) if t.status else TaskStatus.TODO,
+            daily_status=daily_status_value,
+            completed_at=t.completed_at,
+            day_date=day_date,
+        )
+        total_products, completed_products, weekly_planned_products, day_total_products, day_done_products = _build_weekly_task_product_metrics(
+            base_total=base_total_products,
+            base_completed=base_completed_products,
+            progress_counts=progress_counts,
+            is_mst_tt_task=t.id in mst_tt_task_ids,
+            status_for_day=status_for_day,
+        )
+        if t.id in mst_tt_task_ids and t.project_id is not None:
+            weekly_planned_products = weekly_mst_tt_planned_by_user_project.get(
+                (item.user_id, t.project_id),
+                weekly_planned_products if weekly_planned_products is not None else 0,
             )
+        return WeeklyTableProjectTaskEntry(
+            task_id=t.id,
+            task_title=t.title,
+            phase=t.phase,
+            status=TaskStatus(t.status) if t.status else TaskStatus.TODO,
+            daily_status=daily_status_value,
+            created_at=t.created_at,
+            completed_at=t.completed_at,
+            daily_products=total_products,
+            total_products=total_products,
+            completed_products=completed_products,
+            weekly_planned_products=weekly_planned_products,
+            day_total_products=day_total_products,
+            day_done_products=day_done_products,
+            finish_period=item.finish_period,
+            is_bllok=t.is_bllok,
+            is_1h_report=t.is_1h_report,
+            is_r1=t.is_r1,
+            is_personal=t.is_personal,
+            is_deadline_important=t.is_deadline_important,
+            ga_note_origin_id=t.ga_note_origin_id,
+            plan_note_origin_id=t.plan_note_origin_id,
         )
-    
-    return WeeklyTableResponse(
+
+    def _project_entry(
+        project_id: uuid.UUID,
+        task_entries: list[WeeklyTableProjectTaskEntry],
+    ) -> WeeklyTableProjectEntry:
+        # Include all projects, even if not in project_map (they show as "Unknown Project").
+        project = project_map.get(project_id)
+        return WeeklyTableProjectEntry(
+            project_id=project_id,
+            project_title=_project_title(project_id),
+            project_total_products=project.total_products if project is not None else None,
+            project_current_phase=project.current_phase if project is not None else None,
+            project_type=project.project_type if project is not None else None,
+            task_count=len(task_entries),
+            tasks=task_entries,
+            is_late=False,
+        )
+
+    def _fast_task_entry(item: PlannerOccurrence) -> WeeklyTableTaskEntry:
+        task = item.task
+        return WeeklyTableTaskEntry(
+            task_id=task.id,
+            title=task.title,
+            status=TaskStatus(task.status) if task.status else TaskStatus.TODO,
+            daily_status=_daily_status_for_task_day(task, item.day),
+            created_at=task.created_at,
+            completed_at=task.completed_at,
+            daily_products=task.daily_products,
+            finish_period=item.finish_period,
+            fast_task_type=get_fast_task_type(task),
+            is_bllok=task.is_bllok,
+            is_1h_report=task.is_1h_report,
+            is_r1=task.is_r1,
+            is_personal=task.is_personal,
+            is_deadline_important=task.is_deadline_important,
+            ga_note_origin_id=task.ga_note_origin_id,
+            plan_note_origin_id=task.plan_note_origin_id,
+        )
+
+    def _user_day_entry(dept_user: User, items: list[PlannerOccurrence]) -> WeeklyTableUserDay:
+        projects: dict[str, dict[uuid.UUID, list[WeeklyTableProjectTaskEntry]]] = {"AM": {}, "PM": {}}
+        system_tasks: dict[str, list[WeeklyTableTaskEntry]] = {"AM": [], "PM": []}
+        fast_tasks: dict[str, list[WeeklyTableTaskEntry]] = {"AM": [], "PM": []}
+        # A task planned for both slots is one entry listed twice.
+        task_entries: dict[uuid.UUID, WeeklyTableTaskEntry] = {}
+        for item in items:
+            if item.kind == OCCURRENCE_PROJECT:
+                slot_tasks = projects[item.slot].setdefault(item.project_id, [])
+                if item.task is not None:
+                    slot_tasks.append(_project_task_entry(item))
+                continue
+            entry = task_entries.get(item.task.id)
+            if item.kind == OCCURRENCE_SYSTEM:
+                if entry is None:
+                    entry = task_entries[item.task.id] = _weekly_system_task_entry(item)
+                system_tasks[item.slot].append(entry)
+            else:
+                if entry is None:
+                    entry = task_entries[item.task.id] = _fast_task_entry(item)
+                fast_tasks[item.slot].append(entry)
+        return WeeklyTableUserDay(
+            user_id=dept_user.id,
+            user_name=dept_user.full_name or dept_user.username or "",
+            am_projects=[_project_entry(pid, entries) for pid, entries in projects["AM"].items()],
+            pm_projects=[_project_entry(pid, entries) for pid, entries in projects["PM"].items()],
+            am_system_tasks=system_tasks["AM"],
+            pm_system_tasks=system_tasks["PM"],
+            am_fast_tasks=fast_tasks["AM"],
+            pm_fast_tasks=fast_tasks["PM"],
+        )
+
+    def table() -> WeeklyTableResponse:
+        # Build table structure: Departments -> Days -> Users -> AM/PM
+        items_by_cell: dict[tuple[uuid.UUID, date, uuid.UUID], list[PlannerOccurrence]] = {}
+        for item in occurrences():
+            items_by_cell.setdefault((item.department_id, item.day, item.user_id), []).append(item)
+        return WeeklyTableResponse(
+            week_start=week_start_date,
+            week_end=week_end,
+            departments=[
+                WeeklyTableDepartment(
+                    department_id=dept.id,
+                    department_name=dept.name,
+                    days=[
+                        WeeklyTableDay(
+                            date=day_date,
+                            users=[
+                                _user_day_entry(dept_user, items_by_cell.get((dept.id, day_date, dept_user.id), []))
+                                for dept_user in dept_users
+                            ],
+                        )
+                        for day_date in working_days
+                    ],
+                )
+                for dept, dept_users in dept_users_by_dept
+            ],
+            saved_plan_id=saved_plan_id,
+        )
+
+    return WeeklyPlannerWeek(
         week_start=week_start_date,
         week_end=week_end,
-        departments=departments_data,
         saved_plan_id=saved_plan_id,
+        occurrences=occurrences,
+        table=table,
     )
 
 
+@router.get("/weekly-table", response_model=WeeklyTableResponse)
+@pre_encoded
+async def weekly_table_planner(
+    week_start: date | None = None,
+    department_id: uuid.UUID | None = None,
+    is_this_week: bool = False,
+    db: AsyncSession = Depends(get_db),
+    user=Depends(get_current_user),
+) -> WeeklyTableResponse:
+    """Get weekly planner in table format organized by departments, users, days, and AM/PM"""
+    week = await load_weekly_planner_week(
+        db,
+        user=user,
+        week_start=week_start,
+        department_id=department_id,
+        is_this_week=is_this_week,
+    )
+    return week.table()
+
+
 @router.post("/weekly-table/save-day", response_model=WeeklyPlannerSaveDayResponse)
 async def save_weekly_table_day(
     payload: WeeklyPlannerSaveDayRequest,
@@ -3339,12 +3445,15 @@ async def _create_and_store_weekly_snapshot(
         created_by=user.id,
     )
     db.add(snapshot)
+    await db.flush()
+    db.add_all(snapshot_task_rows(snapshot.id, snapshot_payload.get("task_items")))
     await db.commit()
     await db.refresh(snapshot)
 
     versions = (
         await db.execute(
             select(WeeklyPlannerSnapshot)
+            .options(*defer_snapshot_payload())
             .where(
                 WeeklyPlannerSnapshot.department_id == department_id,
                 WeeklyPlannerSnapshot.week_start_date == week_start,
@@ -3439,6 +3548,7 @@ async def weekly_snapshot_overview(
     snapshots = (
         await db.execute(
             select(WeeklyPlannerSnapshot)
+            .options(*defer_snapshot_payload())
             .where(
                 WeeklyPlannerSnapshot.department_id == department_id,
                 WeeklyPlannerSnapshot.week_start_date.in_(week_starts),
@@ -3541,6 +3651,7 @@ async def weekly_plan_vs_actual_compare(
     planned_official_snapshot = (
         await db.execute(
             select(WeeklyPlannerSnapshot)
+            .options(*defer_snapshot_payload())
             .where(
                 WeeklyPlannerSnapshot.department_id == department_id,
                 WeeklyPlannerSnapshot.week_start_date == normalized_week_start,
@@ -3561,45 +3672,21 @@ async def weekly_plan_vs_actual_compare(
             summary=WeeklySnapshotCompareSummaryOut(),
         )
 
-    snapshot_tasks_by_key = _tasks_by_key_from_snapshot_payload(planned_official_snapshot.payload or {})
-
-    current_weekly_table = await weekly_table_planner(
-        week_start=normalized_week_start,
+    buckets, total_planned, _ = await _live_comparison(
+        db,
+        user,
+        planned_official_snapshot,
         department_id=department_id,
-        is_this_week=False,
-        db=db,
-        user=user,
-    )
-    current_table_json = jsonable_encoder(current_weekly_table)
-    current_departments = current_table_json.get("departments") or []
-    current_department_payload = current_departments[0] if current_departments else None
-    current_task_ids = _task_ids_from_department_payload(current_department_payload)
-    current_task_priorities = await _load_task_priority_map(db, current_task_ids)
-    current_task_items = _flatten_weekly_department_tasks(
-        current_department_payload,
-        task_priority_map=current_task_priorities,
-    )
-    current_tasks_by_key = {
-        task["match_key"]: task
-        for task in current_task_items
-    }
-
-    today_local = _today_app_date()
-    as_of_date = min(today_local, week_end)
-
-    buckets = _classify_weekly_plan_performance(
-        planned_tasks=snapshot_tasks_by_key,
-        actual_tasks=current_tasks_by_key,
+        week_start=normalized_week_start,
         week_end=week_end,
-        as_of_date=as_of_date,
     )
 
-    completed = [_to_compare_task_out(task) for task in buckets["completed"]]
-    in_progress = [_to_compare_task_out(task) for task in buckets["in_progress"]]
-    pending = [_to_compare_task_out(task) for task in buckets["pending"]]
-    late = [_to_compare_task_out(task) for task in buckets["late"]]
-    additional = [_to_compare_task_out(task) for task in buckets["additional"]]
-    removed_or_canceled = [_to_compare_task_out(task) for task in buckets["removed_or_canceled"]]
+    completed = buckets["completed"]
+    in_progress = buckets["in_progress"]
+    pending = buckets["pending"]
+    late = buckets["late"]
+    additional = buckets["additional"]
+    removed_or_canceled = buckets["removed_or_canceled"]
 
     not_completed = [*in_progress, *pending, *late]
     added_during_week = list(additional)
@@ -3613,7 +3700,7 @@ async def weekly_plan_vs_actual_compare(
     removed_or_canceled.sort(key=lambda task: task.title.lower())
 
     summary = WeeklySnapshotCompareSummaryOut(
-        total_planned=len(snapshot_tasks_by_key),
+        total_planned=total_planned,
         completed=len(completed),
         in_progress=len(in_progress),
         pending=len(pending),
@@ -3672,6 +3759,7 @@ async def weekly_plan_vs_final_compare(
     planned_official_snapshot = (
         await db.execute(
             select(WeeklyPlannerSnapshot)
+            .options(*defer_snapshot_payload())
             .where(
                 WeeklyPlannerSnapshot.department_id == department_id,
                 WeeklyPlannerSnapshot.week_start_date == normalized_week_start,
@@ -3695,6 +3783,7 @@ async def weekly_plan_vs_final_compare(
     latest_final_snapshot = (
         await db.execute(
             select(WeeklyPlannerSnapshot)
+            .options(*defer_snapshot_payload())
             .where(
                 WeeklyPlannerSnapshot.department_id == department_id,
                 WeeklyPlannerSnapshot.week_start_date == normalized_week_start,
@@ -3706,7 +3795,7 @@ async def weekly_plan_vs_final_compare(
     ).scalar_one_or_none()
 
     if latest_final_snapshot is None:
-        planned_tasks_by_key = _tasks_by_key_from_snapshot_payload(planned_official_snapshot.payload or {})
+        (planned_tasks_by_key,) = await _snapshot_tasks_by_key(db, planned_official_snapshot)
         return WeeklySnapshotPlanVsActualOut(
             week_start=normalized_week_start,
             week_end=week_end,
@@ -3719,23 +3808,16 @@ async def weekly_plan_vs_final_compare(
             summary=WeeklySnapshotCompareSummaryOut(total_planned=len(planned_tasks_by_key)),
         )
 
-    planned_tasks_by_key = _tasks_by_key_from_snapshot_payload(planned_official_snapshot.payload or {})
-    final_tasks_by_key = _tasks_by_key_from_snapshot_payload(latest_final_snapshot.payload or {})
-
-    as_of_date = week_end + timedelta(days=1)
-    buckets = _classify_weekly_plan_performance(
-        planned_tasks=planned_tasks_by_key,
-        actual_tasks=final_tasks_by_key,
-        week_end=week_end,
-        as_of_date=as_of_date,
+    buckets, total_planned = await _snapshot_comparison(
+        db, planned_official_snapshot, latest_final_snapshot, week_end=week_end
     )
 
-    completed = [_to_compare_task_out(task) for task in buckets["completed"]]
-    in_progress = [_to_compare_task_out(task) for task in buckets["in_progress"]]
-    pending = [_to_compare_task_out(task) for task in buckets["pending"]]
-    late = [_to_compare_task_out(task) for task in buckets["late"]]
-    additional = [_to_compare_task_out(task) for task in buckets["additional"]]
-    removed_or_canceled = [_to_compare_task_out(task) for task in buckets["removed_or_canceled"]]
+    completed = buckets["completed"]
+    in_progress = buckets["in_progress"]
+    pending = buckets["pending"]
+    late = buckets["late"]
+    additional = buckets["additional"]
+    removed_or_canceled = buckets["removed_or_canceled"]
 
     not_completed = [*in_progress, *pending, *late]
     added_during_week = list(additional)
@@ -3748,7 +3830,7 @@ async def weekly_plan_vs_final_compare(
     removed_or_canceled.sort(key=lambda task: task.title.lower())
 
     summary = WeeklySnapshotCompareSummaryOut(
-        total_planned=len(planned_tasks_by_key),
+        total_planned=total_planned,
         completed=len(completed),
         in_progress=len(in_progress),
         pending=len(pending),
@@ -3804,13 +3886,21 @@ async def weekly_snapshot_compare_by_id(
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Choose two different snapshots.")
 
     baseline_snapshot = (
-        await db.execute(select(WeeklyPlannerSnapshot).where(WeeklyPlannerSnapshot.id == baseline_snapshot_id))
+        await db.execute(
+            select(WeeklyPlannerSnapshot)
+            .options(*defer_snapshot_payload())
+            .where(WeeklyPlannerSnapshot.id == baseline_snapshot_id)
+        )
     ).scalar_one_or_none()
     if baseline_snapshot is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Baseline snapshot not found")
 
     compare_snapshot = (
-        await db.execute(select(WeeklyPlannerSnapshot).where(WeeklyPlannerSnapshot.id == compare_snapshot_id))
+        await db.execute(
+            select(WeeklyPlannerSnapshot)
+            .options(*defer_snapshot_payload())
+            .where(WeeklyPlannerSnapshot.id == compare_snapshot_id)
+        )
     ).scalar_one_or_none()
     if compare_snapshot is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Comparison snapshot not found")
@@ -3831,23 +3921,16 @@ async def weekly_snapshot_compare_by_id(
     week_start = baseline_snapshot.week_start_date
     week_end = baseline_snapshot.week_end_date or _get_next_5_working_days(week_start)[-1]
 
-    planned_tasks_by_key = _tasks_by_key_from_snapshot_payload(baseline_snapshot.payload or {})
-    actual_tasks_by_key = _tasks_by_key_from_snapshot_payload(compare_snapshot.payload or {})
-
-    as_of_date = week_end + timedelta(days=1)
-    buckets = _classify_weekly_plan_performance(
-        planned_tasks=planned_tasks_by_key,
-        actual_tasks=actual_tasks_by_key,
-        week_end=week_end,
-        as_of_date=as_of_date,
+    buckets, total_planned = await _snapshot_comparison(
+        db, baseline_snapshot, compare_snapshot, week_end=week_end
     )
 
-    completed = [_to_compare_task_out(task) for task in buckets["completed"]]
-    in_progress = [_to_compare_task_out(task) for task in buckets["in_progress"]]
-    pending = [_to_compare_task_out(task) for task in buckets["pending"]]
-    late = [_to_compare_task_out(task) for task in buckets["late"]]
-    additional = [_to_compare_task_out(task) for task in buckets["additional"]]
-    removed_or_canceled = [_to_compare_task_out(task) for task in buckets["removed_or_canceled"]]
+    completed = buckets["completed"]
+    in_progress = buckets["in_progress"]
+    pending = buckets["pending"]
+    late = buckets["late"]
+    additional = buckets["additional"]
+    removed_or_canceled = buckets["removed_or_canceled"]
 
     not_completed = [*in_progress, *pending, *late]
     added_during_week = list(additional)
@@ -3860,7 +3943,7 @@ async def weekly_snapshot_compare_by_id(
     removed_or_canceled.sort(key=lambda task: task.title.lower())
 
     summary = WeeklySnapshotCompareSummaryOut(
-        total_planned=len(planned_tasks_by_key),
+        total_planned=total_planned,
         completed=len(completed),
         in_progress=len(in_progress),
         pending=len(pending),
@@ -3918,6 +4001,7 @@ async def weekly_snapshot_compare(
     rows = (
         await db.execute(
             select(WeeklyPlannerSnapshot)
+            .options(*defer_snapshot_payload())
             .where(
                 WeeklyPlannerSnapshot.department_id == department_id,
                 WeeklyPlannerSnapshot.week_start_date == normalized_week_start,
@@ -3928,6 +4012,9 @@ async def weekly_snapshot_compare(
 
     planned_rows = [row for row in rows if row.snapshot_type == WeeklySnapshotType.PLANNED.value]
     final_rows = [row for row in rows if row.snapshot_type == WeeklySnapshotType.FINAL.value]
+    # Only the two official versions are returned with their payload.
+    for official in planned_rows[:1] + final_rows[:1]:
+        await db.refresh(official, attribute_names=["payload"])
 
     planned_versions = [
         _snapshot_version_out(row, is_official=index == 0) for index, row in enumerate(planned_rows)
@@ -13,18 +13,12 @@ from app.db import get_db
 from app.models.primeflow_report_delivery_run import PrimeFlowReportDeliveryRun
 from app.models.user import User
 from app.services.px_jav_weekly_report import (
-    EXCEL_MIME,
-    PDF_MIME,
     REPORT_SLOT,
     REPORT_TYPE,
-    WORD_MIME,
+    build_attachments,
     build_px_jav_weekly_report,
     configured_recipient,
     deliver_px_jav_weekly_report,
-    render_docx,
-    render_pdf,
-    render_xlsx,
-    report_filename_stem,
     report_timezone,
 )
 
@@ -71,15 +65,9 @@ async def download_px_jav_weekly_report(
         timezone_name=report_timezone().key,
         recipient=configured_recipient(),
     )
-    renderers = {
-        "xlsx": (render_xlsx, EXCEL_MIME),
-        "docx": (render_docx, WORD_MIME),
-        "pdf": (render_pdf, PDF_MIME),
-    }
-    renderer, media_type = renderers[format]
-    filename = f"{report_filename_stem(report)}.{format}"
+    [(filename, content, media_type)] = await build_attachments(report, (format,))
     return Response(
-        content=renderer(report),
+        content=content,
         media_type=media_type,
         headers={"Content-Disposition": f'attachment; filename="{filename}"'},
     )
@@ -43,7 +43,7 @@ from app.schemas.question_library import (
     QuestionStatusSummary,
     QuestionStatusUpdate,
 )
-from app.services.notifications import add_notification, publish_notification
+from app.services.notifications import add_notification, publish_notifications
 
 
 router = APIRouter()
@@ -863,11 +863,7 @@ async def create_question_definition(
         task.completed_at = None
 
     await db.commit()
-    for notification in notifications:
-        try:
-            await publish_notification(user_id=notification.user_id, notification=notification)
-        except Exception:
-            pass
+    await publish_notifications(notifications)
     await db.refresh(question)
     return await _question_out(db, question, current_user)
 
@@ -102,7 +102,7 @@ from app.services.realization_daily import (
     _system_task_operational_day,
     calculate_daily_period,
 )
-from app.services.realization_evidence import _snapshot_tasks
+from app.services.realization_evidence import load_snapshot_tasks
 from app.services.realization_excel import build_realization_workbook
 from app.services.realization_periods import (
     RealizationWorkflowError,
@@ -117,8 +117,14 @@ from app.services.realization_people import (
     full_period_leave_user_ids,
     load_active_users_and_common_leave,
 )
-from app.services.realization_pulse import aggregate_monthly_pulses
+from app.services.realization_monthly import (
+    month_bounds,
+    monthly_aggregation,
+    monthly_person_aggregates,
+    refresh_monthly_aggregates,
+)
 from app.services.system_task_schedule import _is_working_day
+from app.services.weekly_snapshot_tasks import defer_snapshot_payload
 
 
 router = APIRouter()
@@ -201,7 +207,9 @@ async def _pinned_snapshots(
     rows = (
         (
             await db.execute(
-                select(WeeklyPlannerSnapshot).where(WeeklyPlannerSnapshot.id.in_(ids))
+                select(WeeklyPlannerSnapshot)
+                .options(*defer_snapshot_payload())
+                .where(WeeklyPlannerSnapshot.id.in_(ids))
             )
         ).scalars().all()
         if ids
@@ -667,9 +675,13 @@ async def _weekly_response(
 
     planned_tasks_by_user_day: dict[uuid.UUID, dict[str, list[dict]]] = {}
     if period.planned_snapshot_id is not None:
-        planned_snapshot = await db.get(WeeklyPlannerSnapshot, period.planned_snapshot_id)
+        planned_snapshot = await db.get(
+            WeeklyPlannerSnapshot,
+            period.planned_snapshot_id,
+            options=defer_snapshot_payload(),
+        )
         if planned_snapshot is not None:
-            for task in _snapshot_tasks(planned_snapshot).values():
+            for task in (await load_snapshot_tasks(db, planned_snapshot)).values():
                 occurrences = task.get("occurrences") or []
                 if not occurrences and task.get("planned_due_date"):
                     occurrences = [
@@ -2229,73 +2241,39 @@ async def get_monthly_realization(
     user: User = Depends(get_current_user),
 ) -> RealizationMonthlyOut:
     _ensure_department_scope(user, department_id)
-    start = month_start.replace(day=1)
-    next_month = date(start.year + (1 if start.month == 12 else 0), 1 if start.month == 12 else start.month + 1, 1)
-    end = next_month - timedelta(days=1)
+    start, end = month_bounds(month_start)
     department = await db.get(Department, department_id)
     if department is None:
         raise HTTPException(status_code=404, detail="Department not found")
-    # Read-only aggregation: monthly GET never creates a period or rewrites results.
-    rows = (
-        await db.execute(
-            select(RealizationPersonResult, RealizationPeriod)
-            .join(RealizationPeriod, RealizationPeriod.id == RealizationPersonResult.period_id)
-            .where(
-                RealizationPeriod.department_id == department_id,
-                RealizationPeriod.period_type == "WEEKLY",
-                RealizationPeriod.final_snapshot_id.is_not(None),
-                RealizationPeriod.start_date <= end,
-                RealizationPeriod.end_date >= start,
-                RealizationPeriod.status != RealizationPeriodStatus.OPEN.value,
-            )
-            .order_by(RealizationPeriod.start_date.asc())
-        )
-    ).all()
-    visible_rows = [
-        (result, period)
-        for result, period in rows
-        if can_view_person_result(
-            user,
-            subject_user_id=result.user_id,
-            subject_department_id=result.department_id,
-        )
-    ]
-    user_ids = {result.user_id for result, _ in visible_rows}
-    names = {
-        row.id: row.full_name
-        for row in (await db.execute(select(User).where(User.id.in_(user_ids)))).scalars().all()
-    } if user_ids else {}
-    weekly_by_user: dict[uuid.UUID, list[dict]] = {}
-    departments: dict[uuid.UUID, uuid.UUID | None] = {}
-    for result, period in visible_rows:
-        facts = result.facts_json or {}
-        pulse = (facts.get("pulse") or {}).get("pulse") or RealizationPulse.JUSTIFIED.value
-        weekly_by_user.setdefault(result.user_id, []).append(
-            {
-                "period_id": str(period.id),
-                "week_start": period.start_date.isoformat(),
-                "week_end": period.end_date.isoformat(),
-                "pulse": pulse,
-                "unresolved_pink_days": sum(
-                    1
-                    for item in facts.get("daily_timeline") or []
-                    if int(item.get("unresolved_pink_count") or 0) > 0
-                ) or (1 if int(facts.get("unresolved_pink_count") or 0) > 0 else 0),
-                "verified_positive_extras": int((facts.get("pulse") or {}).get("verified_extra_count") or 0),
-                "unresolved_negative_count": int((facts.get("pulse") or {}).get("unresolved_negative_count") or 0),
-                "verified_negative_count": int((facts.get("counters") or {}).get("negative_count") or 0),
-                "drilldown": {"week_start": period.start_date.isoformat()},
-            }
+    # Read-only: one stored rollup row per person, maintained as weekly
+    # results are calculated, reviewed and approved. Months not rolled up
+    # yet are computed from their weekly results.
+    aggregates = await monthly_person_aggregates(db, department_id=department_id, month_start=start)
+    names = (
+        dict(
+            (
+                await db.execute(
+                    select(User.id, User.full_name).where(User.id.in_([aggregate.user_id for aggregate in aggregates]))
+                )
+            ).all()
         )
-        departments[result.user_id] = result.department_id
+        if aggregates
+        else {}
+    )
+    rows = [(aggregate, names.get(aggregate.user_id)) for aggregate in aggregates]
     people = [
         RealizationMonthlyPersonOut(
-            user_id=user_id,
-            user_name=names.get(user_id, "Employee"),
-            department_id=departments.get(user_id),
-            aggregation=aggregate_monthly_pulses(weekly_rows),
+            user_id=aggregate.user_id,
+            user_name=full_name or "Employee",
+            department_id=aggregate.department_id,
+            aggregation=monthly_aggregation(aggregate),
+        )
+        for aggregate, full_name in sorted(rows, key=lambda row: row[1] or "")
+        if can_view_person_result(
+            user,
+            subject_user_id=aggregate.user_id,
+            subject_department_id=aggregate.department_id,
         )
-        for user_id, weekly_rows in sorted(weekly_by_user.items(), key=lambda item: names.get(item[0], ""))
     ]
     return RealizationMonthlyOut(
         month_start=start,
@@ -2540,6 +2518,7 @@ async def review_person_result(
     ).scalar_one_or_none()
     if remaining is None:
         transition_period(period, RealizationPeriodStatus.REVIEWED, actor_id=user.id)
+    await refresh_monthly_aggregates(db, weekly_period=period)
     await db.commit()
     await db.refresh(result)
     subject = (
@@ -2661,6 +2640,7 @@ async def approve_period(
         entity_id=period.id, action="approved",
         before={"status": "REVIEWED"}, after={"status": "APPROVED"},
     )
+    await refresh_monthly_aggregates(db, weekly_period=period)
     await db.commit()
     await db.refresh(period)
     return RealizationPeriodOut.model_validate(period)
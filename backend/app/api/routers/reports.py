@@ -12,9 +12,9 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from app.api.access import ensure_department_access
 from app.api.deps import get_current_user
 from app.config import settings
-from app.db import get_db
+from app.db import get_db, get_read_db
 from app.models.department import Department
-from app.models.enums import GaNoteStatus, UserRole, TaskStatus
+from app.models.enums import GaNoteStatus, UserRole
 from app.models.ga_note import GaNote
 from app.models.project import Project
 from app.models.daily_report_ga_entry import DailyReportGaEntry
@@ -42,13 +42,8 @@ from app.schemas.daily_report import (
 )
 from app.schemas.task import TaskAssigneeOut, TaskOut
 from app.services.project_display_title import build_project_display_title_map
-from app.services.daily_report_logic import (
-    completed_on_day,
-    planned_range_for_daily_report,
-    task_matches_department_scope,
-    task_is_visible_to_user,
-    business_days_between,
-)
+from app.services.daily_report_data import load_daily_report_tasks
+from app.services.daily_report_logic import business_days_between
 from app.services.daily_rlz_compliance import (
     REASON_LABELS, build_daily_rlz_compliance, build_daily_rlz_control,
     editable_until, is_editable_day,
@@ -290,7 +285,7 @@ async def daily_report(
     day: date,
     department_id: uuid.UUID | None = None,
     user_id: uuid.UUID | None = None,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     user=Depends(get_current_user),
 ) -> DailyReportResponse:
     """
@@ -308,39 +303,19 @@ async def daily_report(
 
     # --- Regular tasks (non-system) ---
     dept_code = await _department_code_for_id(db, department_id)
-    day_start = datetime.combine(day, time.min, tzinfo=timezone.utc)
-    day_end = day_start + timedelta(days=1)
-
-    task_stmt = (
-        select(Task)
-        .outerjoin(Project, Task.project_id == Project.id)
-        .where(Task.is_active.is_(True))
-        .where(Task.system_template_origin_id.is_(None))
-        .where(Task.due_date.is_not(None))
+    report_tasks = await load_daily_report_tasks(
+        db,
+        user_id=user_id,
+        day=day,
+        department_id=department_id,
+        dept_code=dept_code,
+        include_cross_department_assigned=True,
     )
-    include_cross_department_assigned = user_id is not None
-    if department_id is not None and not include_cross_department_assigned:
-        task_stmt = task_stmt.where(or_(Task.department_id == department_id, Project.department_id == department_id))
-
-    # Prefilter by user to avoid scanning all tasks (still apply KO filtering in Python for correctness).
-    if user_id is not None:
-        task_stmt = (
-            task_stmt.outerjoin(TaskAssignee, TaskAssignee.task_id == Task.id)
-            .where(
-                or_(
-                    Task.assigned_to == user_id,
-                    TaskAssignee.user_id == user_id,
-                    Task.internal_notes.ilike(f"%ko_user_id={user_id}%"),
-                    Task.internal_notes.ilike(f"%ko_user_id:%{user_id}%"),
-                    Task.internal_notes.ilike(f"%ko_user_id%{user_id}%"),
-                )
-            )
-            .distinct()
-        )
-
-    tasks = (await db.execute(task_stmt.order_by(Task.due_date, Task.created_at))).scalars().all()
-    task_ids = [t.id for t in tasks]
-    assignee_out_map = await _assignees_for_tasks(db, task_ids)
+    task_ids = report_tasks.task_ids
+    assignee_out_map = {
+        task_id: [_user_to_assignee(assignee) for assignee in assignees]
+        for task_id, assignees in report_tasks.assignees_by_task_id.items()
+    }
     comment_map = await _user_comments_for_tasks(db, task_ids, user_id)
     daily_rlz_map = {}
     if task_ids:
@@ -362,113 +337,32 @@ async def daily_report(
         ).all()
         one_h_slot_map = {task_id: slot for task_id, slot in rows}
 
-    assignee_ids_by_task: dict[uuid.UUID, set[uuid.UUID]] = {tid: set() for tid in task_ids}
-    if task_ids:
-        rows = (
-            await db.execute(
-                select(TaskAssignee.task_id, TaskAssignee.user_id).where(TaskAssignee.task_id.in_(task_ids))
-            )
-        ).all()
-        for tid, uid in rows:
-            assignee_ids_by_task.setdefault(tid, set()).add(uid)
-
-    project_ids = {t.project_id for t in tasks if t.project_id is not None}
-    projects: list[Project] = []
-    if project_ids:
-        projects = (
-            await db.execute(select(Project).where(Project.id.in_(project_ids)))
-        ).scalars().all()
-    project_by_id = {p.id: p for p in projects}
+    projects = list(report_tasks.project_by_id.values())
     display_title_by_id = await build_project_display_title_map(db, projects)
     project_title_by_id: dict[uuid.UUID, str] = {
         p.id: (display_title_by_id.get(p.id) or p.title or p.name or "") for p in projects if (p.title or p.name)
     }
 
-    tasks_today: list[DailyReportTaskItem] = []
-    tasks_overdue: list[DailyReportTaskItem] = []
-    for t in tasks:
-        project = project_by_id.get(t.project_id) if t.project_id else None
-        if not task_matches_department_scope(
-            t,
-            project=project,
-            department_id=department_id,
-            include_cross_department_assigned=include_cross_department_assigned,
-        ):
-            continue
-        if user_id is not None and not task_is_visible_to_user(
-            t,
-            user_id=user_id,
-            assignee_ids=assignee_ids_by_task.get(t.id),
-            project=project,
-            dept_code=dept_code,
-        ):
-            continue
-
-        planned_start, planned_end = planned_range_for_daily_report(t, dept_code)
-        if planned_start is None or planned_end is None:
-            continue
-
-        completed_today = completed_on_day(t.completed_at, day)
-        is_done = t.completed_at is not None or t.status == TaskStatus.DONE
-        if completed_today:
-            tasks_today.append(
-                DailyReportTaskItem(
-                    task=_task_to_out(
-                        t,
-                        assignee_out_map.get(t.id, []),
-                        user_comment=comment_map.get(t.id),
-                        one_h_report_slot=one_h_slot_map.get(t.id),
-                    ),
-                    project_title=project_title_by_id.get(t.project_id) if t.project_id else None,
-                    planned_start=planned_start,
-                    planned_end=planned_end,
-                    original_planned_end=t.original_due_date.date() if t.original_due_date else planned_end,
-                    is_overdue=False,
-                    late_days=None,
-                    rlz_daily_state=_daily_rlz_state_out(daily_rlz_map.get(t.id), day, comment_map.get(t.id)),
-                )
-            )
-            continue
+    def _report_task_item(t: Task, *, is_overdue: bool) -> DailyReportTaskItem:
+        planned_start, planned_end = report_tasks.planned_range_by_task_id[t.id]
+        return DailyReportTaskItem(
+            task=_task_to_out(
+                t,
+                assignee_out_map.get(t.id, []),
+                user_comment=comment_map.get(t.id),
+                one_h_report_slot=one_h_slot_map.get(t.id),
+            ),
+            project_title=project_title_by_id.get(t.project_id) if t.project_id else None,
+            planned_start=planned_start,
+            planned_end=planned_end,
+            original_planned_end=t.original_due_date.date() if t.original_due_date else planned_end,
+            is_overdue=is_overdue,
+            late_days=business_days_between(planned_end, day) if is_overdue else None,
+            rlz_daily_state=_daily_rlz_state_out(daily_rlz_map.get(t.id), day, comment_map.get(t.id)),
+        )
 
-        if planned_start <= day <= planned_end:
-            tasks_today.append(
-                DailyReportTaskItem(
-                    task=_task_to_out(
-                        t,
-                        assignee_out_map.get(t.id, []),
-                        user_comment=comment_map.get(t.id),
-                        one_h_report_slot=one_h_slot_map.get(t.id),
-                    ),
-                    project_title=project_title_by_id.get(t.project_id) if t.project_id else None,
-                    planned_start=planned_start,
-                    planned_end=planned_end,
-                    original_planned_end=t.original_due_date.date() if t.original_due_date else planned_end,
-                    is_overdue=False,
-                    late_days=None,
-                    rlz_daily_state=_daily_rlz_state_out(daily_rlz_map.get(t.id), day, comment_map.get(t.id)),
-                )
-            )
-        elif planned_end < day:
-            if is_done:
-                continue
-            late_days = business_days_between(planned_end, day)
-            tasks_overdue.append(
-                DailyReportTaskItem(
-                    task=_task_to_out(
-                        t,
-                        assignee_out_map.get(t.id, []),
-                        user_comment=comment_map.get(t.id),
-                        one_h_report_slot=one_h_slot_map.get(t.id),
-                    ),
-                    project_title=project_title_by_id.get(t.project_id) if t.project_id else None,
-                    planned_start=planned_start,
-                    planned_end=planned_end,
-                    original_planned_end=t.original_due_date.date() if t.original_due_date else planned_end,
-                    is_overdue=True,
-                    late_days=late_days,
-                    rlz_daily_state=_daily_rlz_state_out(daily_rlz_map.get(t.id), day, comment_map.get(t.id)),
-                )
-            )
+    tasks_today = [_report_task_item(t, is_overdue=False) for t in report_tasks.tasks_today]
+    tasks_overdue = [_report_task_item(t, is_overdue=True) for t in report_tasks.tasks_overdue]
 
     # --- System recurring tasks from `tasks` (origin_run_at) ---
     done_like_statuses = ("DONE", "NOT_DONE", "SKIPPED")
@@ -725,7 +619,7 @@ async def correct_daily_rlz_state(
 @router.get("/daily-rlz-compliance")
 async def daily_rlz_compliance(
     day: date, user_id: uuid.UUID | None = None,
-    db: AsyncSession = Depends(get_db), user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_read_db), user: User = Depends(get_current_user),
 ) -> dict:
     target_id = user.id if user.role == UserRole.STAFF else (user_id or user.id)
     return await build_daily_rlz_compliance(db, user_id=target_id, day=day)
@@ -734,7 +628,7 @@ async def daily_rlz_compliance(
 @router.get("/daily-rlz-control")
 async def daily_rlz_control(
     day: date, department_id: uuid.UUID | None = None, user_id: uuid.UUID | None = None,
-    db: AsyncSession = Depends(get_db), user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_read_db), user: User = Depends(get_current_user),
 ) -> dict:
     if user.role == UserRole.STAFF:
         raise HTTPException(status_code=403, detail="Forbidden")
@@ -748,7 +642,7 @@ async def daily_ga_table(
     day: date,
     department_id: uuid.UUID | None = None,
     user_id: uuid.UUID | None = None,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     user=Depends(get_current_user),
 ) -> DailyReportGaTableResponse:
     if user.role == UserRole.STAFF:
@@ -8,18 +8,9 @@ from fastapi import APIRouter, Depends, File, Form, HTTPException, UploadFile, s
 from fastapi.responses import Response
 
 from app.api.deps import get_current_user
-from app.services.excel_standardizer import (
-    ExcelStandardizationError,
-    MAX_UPLOAD_BYTES,
-    analyze_workbook,
-    initials_from_user,
-    standardize_workbook,
-)
-from app.services.word_standardizer import (
-    WordStandardizationError,
-    analyze_word_document,
-    standardize_word_document,
-)
+from app.services import standardization_engine
+from app.services.excel_standardizer import ExcelStandardizationError, MAX_UPLOAD_BYTES, initials_from_user
+from app.services.word_standardizer import WordStandardizationError
 
 
 router = APIRouter()
@@ -73,7 +64,7 @@ async def analyze_excel(
 ):
     content, filename = await _read_upload(file)
     try:
-        return analyze_workbook(content, filename).to_dict()
+        return (await standardization_engine.analyze_excel(content, filename)).to_dict()
     except ExcelStandardizationError as exc:
         raise _bad_request(exc) from exc
 
@@ -99,9 +90,9 @@ async def generate_excel(
             detail="Inicialet nuk mund të nxirren nga profili i përdoruesit në PrimeFlow.",
         )
     try:
-        workbook_bytes, output_filename, report = standardize_workbook(
-            content=content,
-            filename=filename,
+        workbook_bytes, output_filename, report = await standardization_engine.generate_excel(
+            content,
+            filename,
             initials=initials,
             missing_headers=parsed_missing_headers,
             description=description or None,
@@ -125,7 +116,7 @@ async def analyze_word(
 ):
     content, filename = await _read_upload(file, "uploaded.docx")
     try:
-        return analyze_word_document(content, filename).to_dict()
+        return (await standardization_engine.analyze_word(content, filename)).to_dict()
     except WordStandardizationError as exc:
         raise _bad_request(exc) from exc
 
@@ -144,9 +135,9 @@ async def generate_word(
             detail="Inicialet nuk mund të nxirren nga profili i përdoruesit në PrimeFlow.",
         )
     try:
-        document_bytes, output_filename, report = standardize_word_document(
-            content=content,
-            filename=filename,
+        document_bytes, output_filename, report = await standardization_engine.generate_word(
+            content,
+            filename,
             initials=initials,
             description=description or None,
         )
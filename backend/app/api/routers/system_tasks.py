@@ -18,6 +18,7 @@ from sqlalchemy.orm import noload
 from app.api.access import ensure_department_access
 from app.config import settings
 from app.api.deps import get_current_user, require_admin
+from app.api.serialization import PreEncodedRoute, pre_encoded
 from app.db import get_db
 from app.models.department import Department
 from app.models.enums import (
@@ -64,7 +65,7 @@ from app.services.meeting_system_tasks import (
 )
 
 
-router = APIRouter()
+router = APIRouter(route_class=PreEncodedRoute)
 
 
 def _enum_value(value) -> str | None:
@@ -581,6 +582,7 @@ async def _meeting_system_task_rows(
 
 
 @router.get("", response_model=list[SystemTaskOut])
+@pre_encoded
 async def list_system_tasks(
     department_id: uuid.UUID | None = None,
     only_active: bool = False,
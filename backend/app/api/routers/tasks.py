@@ -11,11 +11,13 @@ except ImportError:
 
 from fastapi import APIRouter, Depends, HTTPException, Response, status, Query
 from sqlalchemy import Date, cast, delete, exists, func, insert, literal, null, or_, select, union_all, update
+from sqlalchemy import inspect as sa_inspect
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import load_only
 
 from app.api.access import ensure_department_access, ensure_manager_or_admin, ensure_task_editor
 from app.api.deps import get_current_user
+from app.api.serialization import PreEncodedRoute, pre_encoded
 from app.db import get_db
 from app.models.enums import NotificationType, ProjectPhaseStatus, TaskPriority, TaskStatus, UserRole
 from app.models.department import Department
@@ -38,6 +40,9 @@ from app.models.user import User
 from app.schemas.task import (
     GaNoteTaskSummaryOut,
     TaskAssigneeOut,
+    TaskBulkUpdate,
+    TaskBulkUpdateOut,
+    TaskBulkUpdateResult,
     TaskCreate,
     TaskOut,
     TaskRemoveFromDayRequest,
@@ -45,7 +50,7 @@ from app.schemas.task import (
 )
 from pydantic import BaseModel, Field
 from app.services.audit import add_audit_log
-from app.services.notifications import add_notification, notification_task_preview, publish_notification
+from app.services.notifications import add_notification, notification_task_preview, publish_notifications
 from app.services.ko_task_assignee_sync import ensure_ko_user_is_task_assignee
 from app.services.task_daily_progress import upsert_explicit_task_daily_status, upsert_task_daily_progress
 from app.services.task_classification import is_fast_task as is_fast_task_model, is_fast_task_fields
@@ -60,7 +65,7 @@ from app.services.task_strike_events import (
 )
 
 
-router = APIRouter()
+router = APIRouter(route_class=PreEncodedRoute)
 
 MENTION_RE = re.compile(r"@([A-Za-z0-9_\\-\\.]{3,64})")
 TOTAL_PRODUCTS_RE = re.compile(r"total_products[:=]\s*(\d+)", re.IGNORECASE)
@@ -1250,6 +1255,7 @@ async def _clear_plan_note_conversion_if_no_active_tasks(
 
 
 @router.get("", response_model=list[TaskOut])
+@pre_encoded
 async def list_tasks(
     department_id: uuid.UUID | None = None,
     project_id: uuid.UUID | None = None,
@@ -1596,6 +1602,126 @@ async def update_fast_task_order(
     return Response(status_code=status.HTTP_204_NO_CONTENT)
 
 
+@router.patch("/bulk", response_model=TaskBulkUpdateOut)
+async def bulk_update_tasks(
+    payload: TaskBulkUpdate,
+    db: AsyncSession = Depends(get_db),
+    user=Depends(get_current_user),
+) -> TaskBulkUpdateOut:
+    """Apply many ``update_task`` patches in one transaction.
+
+    Tasks and the caller's assignments are loaded in batched queries. Each
+    patch runs in its own savepoint, so a rejected item is reported in its
+    result without undoing the others; everything that applied is committed
+    once and notifications are published after the commit.
+    """
+    task_ids = [item.task_id for item in payload.items]
+    if len(set(task_ids)) != len(task_ids):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Each task can only be patched once per request",
+        )
+
+    tasks_by_id = {
+        task.id: task
+        for task in (await db.execute(select(Task).where(Task.id.in_(task_ids)))).scalars().all()
+    }
+    assigned_task_ids = set(
+        (
+            await db.execute(
+                select(TaskAssignee.task_id).where(
+                    TaskAssignee.task_id.in_(list(tasks_by_id)),
+                    TaskAssignee.user_id == user.id,
+                )
+            )
+        ).scalars().all()
+    ) if tasks_by_id else set()
+
+    results: list[TaskBulkUpdateResult] = []
+    status_overrides: dict[uuid.UUID, TaskStatus | None] = {}
+    created_notifications: list[Notification] = []
+    for item in payload.items:
+        task = tasks_by_id.get(item.task_id)
+        if task is None:
+            results.append(
+                TaskBulkUpdateResult(
+                    task_id=item.task_id,
+                    ok=False,
+                    status_code=status.HTTP_404_NOT_FOUND,
+                    detail="Task not found",
+                )
+            )
+            continue
+        # A rolled-back savepoint expires the rows it touched, which can
+        # include this task when an earlier item updated its fast task group.
+        if sa_inspect(task).expired_attributes:
+            await db.refresh(task)
+        try:
+            async with db.begin_nested():
+                notifications, status_override = await _apply_task_update(
+                    db,
+                    task,
+                    item.patch,
+                    user,
+                    is_assigned_to_task=task.assigned_to == user.id or task.id in assigned_task_ids,
+                )
+        except HTTPException as exc:
+            results.append(
+                TaskBulkUpdateResult(
+                    task_id=item.task_id,
+                    ok=False,
+                    status_code=exc.status_code,
+                    detail=exc.detail,
+                )
+            )
+            continue
+        created_notifications.extend(notifications)
+        status_overrides[task.id] = status_override
+        results.append(TaskBulkUpdateResult(task_id=item.task_id, ok=True, status_code=status.HTTP_200_OK))
+
+    await db.commit()
+
+    await publish_notifications(created_notifications)
+
+    if not status_overrides:
+        return TaskBulkUpdateOut(results=results)
+
+    updated_task_ids = list(status_overrides)
+    updated_tasks = (
+        await db.execute(
+            select(Task)
+            .where(Task.id.in_(updated_task_ids))
+            .execution_options(populate_existing=True)
+        )
+    ).scalars().all()
+    updated_by_id = {task.id: task for task in updated_tasks}
+    assignee_map = await _assignees_for_tasks(db, updated_task_ids)
+    group_map = await _assignees_for_fast_task_groups(
+        db,
+        list({task.fast_task_group_id for task in updated_tasks if _uses_fast_task_group(task)}),
+    )
+    alignment_map: dict[uuid.UUID, list[uuid.UUID]] = {}
+    for task_id, alignment_user_id in (
+        await db.execute(
+            select(TaskAlignmentUser.task_id, TaskAlignmentUser.user_id)
+            .where(TaskAlignmentUser.task_id.in_(updated_task_ids))
+        )
+    ).all():
+        alignment_map.setdefault(task_id, []).append(alignment_user_id)
+
+    for result in results:
+        task = updated_by_id.get(result.task_id) if result.ok else None
+        if task is None:
+            continue
+        dto_assignees = assignee_map.get(task.id, [])
+        if _uses_fast_task_group(task):
+            dto_assignees = group_map.get(task.fast_task_group_id, dto_assignees)
+        dto = _task_to_out(task, dto_assignees or [], status_override=status_overrides[task.id])
+        dto.alignment_user_ids = alignment_map.get(task.id) or None
+        result.task = dto
+    return TaskBulkUpdateOut(results=results)
+
+
 @router.get("/{task_id}", response_model=TaskOut)
 async def get_task(
     task_id: uuid.UUID,
@@ -2023,11 +2149,7 @@ async def create_task(
 
             await db.commit()
 
-            for n in created_notifications:
-                try:
-                    await publish_notification(user_id=n.user_id, notification=n)
-                except Exception:
-                    pass
+            await publish_notifications(created_notifications)
 
             first = created_tasks[0]
             await db.refresh(first)
@@ -2149,11 +2271,7 @@ async def create_task(
 
                     await db.commit()
 
-                    for n in created_notifications:
-                        try:
-                            await publish_notification(user_id=n.user_id, notification=n)
-                        except Exception:
-                            pass
+                    await publish_notifications(created_notifications)
 
                     first = created_tasks[0]
                     await db.refresh(first)
@@ -2254,11 +2372,7 @@ async def create_task(
 
         await db.commit()
 
-        for n in created_notifications:
-            try:
-                await publish_notification(user_id=n.user_id, notification=n)
-            except Exception:
-                pass
+        await publish_notifications(created_notifications)
 
         first = created_tasks[0]
         await db.refresh(first)
@@ -2354,11 +2468,7 @@ async def create_task(
 
         await db.commit()
 
-        for n in created_notifications:
-            try:
-                await publish_notification(user_id=n.user_id, notification=n)
-            except Exception:
-                pass
+        await publish_notifications(created_notifications)
 
         # Return the first created task; clients typically refetch lists.
         first = created_tasks[0]
@@ -2521,11 +2631,7 @@ async def create_task(
 
     await db.commit()
 
-    for n in created_notifications:
-        try:
-            await publish_notification(user_id=n.user_id, notification=n)
-        except Exception:
-            pass
+    await publish_notifications(created_notifications)
 
     await db.refresh(task)
     assignee_map = await _assignees_for_tasks(db, [task.id])
@@ -2548,7 +2654,46 @@ async def update_task(
     task = (await db.execute(select(Task).where(Task.id == task_id))).scalar_one_or_none()
     if task is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Task not found")
-    is_assigned_to_task = await _is_user_assigned_to_task(db, task, user.id)
+    created_notifications, question_status_override = await _apply_task_update(db, task, payload, user)
+
+    await db.commit()
+
+    await publish_notifications(created_notifications)
+
+    await db.refresh(task)
+    assignee_map = await _assignees_for_tasks(db, [task.id])
+    dto_assignees = assignee_map.get(task.id, [])
+    if _uses_fast_task_group(task):
+        group_map = await _assignees_for_fast_task_groups(db, [task.fast_task_group_id])
+        dto_assignees = group_map.get(task.fast_task_group_id, dto_assignees)
+    dto = _task_to_out(task, dto_assignees or [], status_override=question_status_override)
+    if _payload_has_field(payload, "alignment_user_ids"):
+        dto.alignment_user_ids = payload.alignment_user_ids
+    else:
+        rows = (
+            await db.execute(select(TaskAlignmentUser.user_id).where(TaskAlignmentUser.task_id == task.id))
+        ).scalars().all()
+        dto.alignment_user_ids = list(rows) if rows else None
+    return dto
+
+
+async def _apply_task_update(
+    db: AsyncSession,
+    task: Task,
+    payload: TaskUpdate,
+    user,
+    *,
+    is_assigned_to_task: bool | None = None,
+) -> tuple[list[Notification], TaskStatus | None]:
+    """Validate and apply ``payload`` to ``task`` without committing.
+
+    Shared by ``update_task`` and ``bulk_update_tasks``. Audit and
+    notification rows are added to the session; the notifications are
+    returned for the caller to publish once it has committed, together with
+    the question-task status override for the response.
+    """
+    if is_assigned_to_task is None:
+        is_assigned_to_task = await _is_user_assigned_to_task(db, task, user.id)
     is_confirmation_assignee = task.confirmation_assignee_id is not None and task.confirmation_assignee_id == user.id
     
     # Check if user has permission to edit this task:
@@ -3407,29 +3552,7 @@ async def update_task(
                     after_description=task.description,
                 )
 
-    await db.commit()
-
-    for n in created_notifications:
-        try:
-            await publish_notification(user_id=n.user_id, notification=n)
-        except Exception:
-            pass
-
-    await db.refresh(task)
-    assignee_map = await _assignees_for_tasks(db, [task.id])
-    dto_assignees = assignee_map.get(task.id, [])
-    if _uses_fast_task_group(task):
-        group_map = await _assignees_for_fast_task_groups(db, [task.fast_task_group_id])
-        dto_assignees = group_map.get(task.fast_task_group_id, dto_assignees)
-    dto = _task_to_out(task, dto_assignees or [], status_override=question_status_override)
-    if alignment_set:
-        dto.alignment_user_ids = payload.alignment_user_ids
-    else:
-        rows = (
-            await db.execute(select(TaskAlignmentUser.user_id).where(TaskAlignmentUser.task_id == task.id))
-        ).scalars().all()
-        dto.alignment_user_ids = list(rows) if rows else None
-    return dto
+    return created_notifications, question_status_override
 
 
 @router.post("/{task_id}/deactivate", response_model=TaskOut)
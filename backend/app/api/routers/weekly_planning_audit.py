@@ -3,19 +3,18 @@ from __future__ import annotations
 import io
 import uuid
 from datetime import date, datetime, timedelta, timezone
-from pathlib import Path
 from zoneinfo import ZoneInfo
 
 from fastapi import APIRouter, Depends, File, HTTPException, Query, UploadFile, status
-from fastapi.responses import FileResponse
+from fastapi.responses import Response
 from openpyxl import load_workbook
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.access import ensure_manager_or_admin
 from app.api.deps import get_current_user
-from app.config import settings
-from app.db import get_db
+from app.db import get_db, get_read_db
+from app.integrations.storage import REPORTS_NAMESPACE, StorageError, download_response, get_storage
 from app.models.user import User
 from app.models.weekly_planning_audit import WeeklyPlanningAuditRun
 from app.schemas.weekly_planning_audit import (
@@ -33,6 +32,7 @@ from app.services.weekly_planning_audit import build_weekly_planning_audit
 from app.services.weekly_planning_audit_delivery import (
     MANUAL,
     REQUIRED_RECIPIENTS,
+    XLSX_MEDIA_TYPE,
     WeeklyPlanningAuditEmailError,
     generate_report_run,
     get_or_create_settings,
@@ -83,12 +83,13 @@ async def preview_weekly_planning_audit(
     week_start: date | None = None,
     slot: str = Query(default="10:30", pattern=r"^10:30$"),
     db: AsyncSession = Depends(get_db),
+    read_db: AsyncSession = Depends(get_read_db),
     user: User = Depends(get_current_user),
 ) -> WeeklyPlanningAuditPreviewOut:
     _ensure_report_manager(user)
     config = await get_or_create_settings(db)
     report = await build_weekly_planning_audit(
-        db,
+        read_db,
         week_start=week_start,
         slot=slot,
         timezone_name=config.timezone,
@@ -232,19 +233,23 @@ async def download_weekly_planning_audit(
     run_id: uuid.UUID,
     db: AsyncSession = Depends(get_db),
     user: User = Depends(get_current_user),
-) -> FileResponse:
+) -> Response:
     _ensure_report_manager(user)
     run = await db.get(WeeklyPlanningAuditRun, run_id)
     if run is None or not run.storage_path or not run.filename:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Report file not found")
-    root = Path(settings.REPORT_STORAGE_DIR).expanduser().resolve()
-    path = Path(run.storage_path).resolve()
-    if root not in path.parents or not path.is_file():
+    storage = get_storage(REPORTS_NAMESPACE)
+    try:
+        stored = await storage.exists(run.storage_path)
+    except StorageError:
+        stored = False
+    if not stored:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Report file not found")
-    return FileResponse(
-        path,
+    return await download_response(
+        storage,
+        run.storage_path,
         filename=run.filename,
-        media_type="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+        media_type=XLSX_MEDIA_TYPE,
     )
 
 
@@ -0,0 +1,91 @@
+"""Pre-encoded JSON responses for large list endpoints.
+
+FastAPI normally re-validates whatever an endpoint returns against a cloned
+``response_model``, dumps the validated copy to Python objects and only then
+encodes it. For endpoints that already build their response models, that is
+three passes over thousands of tasks. Endpoints marked with ``pre_encoded``
+and served by a router using ``PreEncodedRoute`` are instead written straight
+to JSON bytes by pydantic's serializer. Schema compliance of those endpoints
+is covered by ``tests/test_response_serialization.py`` instead of on every
+request.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import functools
+from typing import Any, Callable, TypeVar
+
+from fastapi import Response
+from fastapi.routing import APIRoute
+from pydantic import TypeAdapter
+from pydantic_core import PydanticSerializationError
+
+
+JSON_MEDIA_TYPE = "application/json"
+
+EndpointT = TypeVar("EndpointT", bound=Callable[..., Any])
+
+
+def pre_encoded(endpoint: EndpointT) -> EndpointT:
+    """Mark an endpoint whose return value already matches its ``response_model``.
+
+    The function itself is unchanged, so services that call it directly still
+    receive the response models.
+    """
+    endpoint.__pre_encoded__ = True
+    return endpoint
+
+
+@functools.lru_cache(maxsize=None)
+def response_adapter(response_model: Any) -> TypeAdapter:
+    return TypeAdapter(response_model)
+
+
+def encode_response(adapter: TypeAdapter, content: Any) -> bytes:
+    """Serialize ``content`` like FastAPI would, without validating it first."""
+    try:
+        return adapter.dump_json(content, by_alias=True, warnings="error")
+    except PydanticSerializationError:
+        # Plain dicts or ORM rows in an otherwise model-built payload take the slow path.
+        return adapter.dump_json(adapter.validate_python(content, from_attributes=True), by_alias=True)
+
+
+class PreEncodedRoute(APIRoute):
+    """Route class that skips response re-validation for ``pre_encoded`` endpoints."""
+
+    def get_route_handler(self):
+        if (
+            getattr(self.endpoint, "__pre_encoded__", False)
+            and self.response_model is not None
+            and asyncio.iscoroutinefunction(self.dependant.call)
+        ):
+            self.dependant.call = _encoding_call(self.dependant.call, self)
+        return super().get_route_handler()
+
+
+def _encoding_call(call: Callable[..., Any], route: APIRoute) -> Callable[..., Any]:
+    adapter = response_adapter(route.response_model)
+    response_param = route.dependant.response_param_name
+
+    @functools.wraps(call)
+    async def encoded(**values: Any) -> Response:
+        content = await call(**values)
+        if isinstance(content, Response):
+            return content
+        response = Response(
+            content=encode_response(adapter, content),
+            media_type=JSON_MEDIA_TYPE,
+            status_code=route.status_code or 200,
+        )
+        # Keep headers and status an endpoint set on its injected Response, as FastAPI does.
+        sub_response = values.get(response_param) if response_param else None
+        if sub_response is not None:
+            if sub_response.status_code:
+                response.status_code = sub_response.status_code
+            response.headers.raw.extend(
+                (key, value) for key, value in sub_response.headers.raw if key != b"content-length"
+            )
+        return response
+
+    return encoded
@@ -23,8 +23,24 @@ class Settings(BaseSettings):
     DB_MAX_OVERFLOW: int = 20
     DB_POOL_TIMEOUT: int = 30
     DB_POOL_RECYCLE: int = 1800
+    DB_STATEMENT_TIMEOUT_MS: int = 0
+    # Optional streaming replica for reports/exports; the read pool falls back
+    # to DATABASE_URL when unset but keeps its own size and timeout.
+    DATABASE_READ_URL: str | None = None
+    DB_READ_POOL_SIZE: int = 5
+    DB_READ_MAX_OVERFLOW: int = 5
+    DB_READ_STATEMENT_TIMEOUT_MS: int = 120000
     REDIS_ENABLED: bool = True
     REDIS_URL: str = "redis://localhost:6379/0"
+    # One shared async pool per process; callers wait up to the timeout for
+    # a free connection instead of opening more.
+    REDIS_MAX_CONNECTIONS: int = 50
+    REDIS_POOL_TIMEOUT_SECONDS: float = 5.0
+    # Window in which queued notifications are batched and coalesced per user
+    # and entity before one pipelined publish; 0 publishes immediately.
+    NOTIFICATION_DEBOUNCE_MS: int = 250
+    # Per-process LRU bound for cached project control-week metrics.
+    PROJECT_METRICS_CACHE_SIZE: int = 4096
     APP_TIMEZONE: str = "Europe/Budapest"
     SYSTEM_TASK_SCHEDULER_ENABLED: bool = True
     SYSTEM_TASK_SCHEDULER_HOUR: int = 6
@@ -47,12 +63,37 @@ class Settings(BaseSettings):
     STD_FEEDBACK_PROJECT_KEYWORDS: str = "STD"
     STD_FEEDBACK_REQUEST_TIMEOUT_SECONDS: int = 30
     STD_FEEDBACK_REQUEST_RETRIES: int = 3
+    # Local content-addressed cache of downloaded STD ticket attachments,
+    # evicted least-recently-used beyond the size bound.
+    STD_ATTACHMENT_CACHE_DIR: str = "uploads/std-attachments"
+    STD_ATTACHMENT_CACHE_MAX_MB: int = 1024
+    # Download attachments of synced tickets into the cache during the sync.
+    STD_ATTACHMENT_PREFETCH: bool = False
 
     # Legacy names remain readable during a rolling server deployment.
     STD_PRIMEFLOW_API_BASE_URL: str | None = None
     STD_PRIMEFLOW_API_TOKEN: str | None = None
+    # Rows validated and upserted per batch by the checklist template import.
+    CHECKLIST_IMPORT_CHUNK_SIZE: int = 500
     REPORT_STORAGE_DIR: str = "uploads/reports"
     REPORT_RETENTION_DAYS: int = 90
+    # Worker processes rendering report attachments; 0 renders on a thread instead.
+    REPORT_RENDER_WORKERS: int = 2
+    # Worker processes for the Excel/Word standardizer; 0 runs it on a thread
+    # without the time and memory limits.
+    STANDARDIZER_WORKERS: int = 2
+    STANDARDIZER_TIMEOUT_SECONDS: float = 120
+    STANDARDIZER_MEMORY_LIMIT_MB: int = 1536
+    # "local" keeps files under the *_DIR settings; "s3" stores them in an
+    # S3-compatible bucket (AWS S3, MinIO) and serves presigned downloads.
+    STORAGE_BACKEND: str = "local"
+    S3_ENDPOINT_URL: str = "https://s3.amazonaws.com"
+    S3_BUCKET: str | None = None
+    S3_REGION: str = "us-east-1"
+    S3_ACCESS_KEY_ID: str | None = None
+    S3_SECRET_ACCESS_KEY: str | None = None
+    S3_PRESIGN_EXPIRE_SECONDS: int = 300
+    S3_MULTIPART_PART_MB: int = 8
 
      # Add these three lines:
     ADMIN_EMAIL: str | None = None
@@ -91,6 +132,9 @@ class Settings(BaseSettings):
     REALIZATION_DAILY_ENABLED: bool = True
     REALIZATION_DAILY_HOUR: int = 16
     REALIZATION_DAILY_MINUTE: int = 20
+    # Departments calculated at once by the daily job (each holds one DB session).
+    REALIZATION_DAILY_CONCURRENCY: int = 4
+    REALIZATION_DAILY_DEPARTMENT_TIMEOUT_SECONDS: int = 300
     REALIZATION_AI_ENABLED: bool = False
     REALIZATION_AI_MODEL: str = "gpt-5.2"
     REALIZATION_AI_TIMEOUT_SECONDS: int = 45
@@ -107,6 +151,8 @@ class Settings(BaseSettings):
     EMAIL_PORT: int = 587
     EMAIL_USER: str | None = None
     EMAIL_PASSWORD: str | None = None
+    EMAIL_SMTP_POOL_SIZE: int = 2
+    EMAIL_SMTP_IDLE_SECONDS: int = 240
 
     @property
     def cors_origin_list(self) -> list[str]:
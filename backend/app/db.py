@@ -24,20 +24,61 @@ class Base(DeclarativeBase):
     metadata = metadata
 
 
+def _engine_options(
+    *,
+    pool_size: int,
+    max_overflow: int,
+    statement_timeout_ms: int,
+    read_only: bool = False,
+) -> dict:
+    server_settings: dict[str, str] = {}
+    if statement_timeout_ms > 0:
+        server_settings["statement_timeout"] = str(statement_timeout_ms)
+    if read_only:
+        server_settings["default_transaction_read_only"] = "on"
+    options = {
+        "pool_pre_ping": True,
+        "pool_size": pool_size,
+        "max_overflow": max_overflow,
+        "pool_timeout": settings.DB_POOL_TIMEOUT,
+        "pool_recycle": settings.DB_POOL_RECYCLE,
+        "pool_use_lifo": True,
+    }
+    if server_settings:
+        options["connect_args"] = {"server_settings": server_settings}
+    return options
+
+
 engine = create_async_engine(
     settings.DATABASE_URL,
-    pool_pre_ping=True,
-    pool_size=settings.DB_POOL_SIZE,
-    max_overflow=settings.DB_MAX_OVERFLOW,
-    pool_timeout=settings.DB_POOL_TIMEOUT,
-    pool_recycle=settings.DB_POOL_RECYCLE,
-    pool_use_lifo=True,
+    **_engine_options(
+        pool_size=settings.DB_POOL_SIZE,
+        max_overflow=settings.DB_MAX_OVERFLOW,
+        statement_timeout_ms=settings.DB_STATEMENT_TIMEOUT_MS,
+    ),
 )
 SessionLocal = async_sessionmaker(engine, expire_on_commit=False, class_=AsyncSession)
 
+# Reports and exports get their own pool (on the replica when configured) so a
+# burst of heavy reads cannot exhaust the connections interactive writes use.
+# Sessions are read-only at the PostgreSQL level even against the primary.
+read_engine = create_async_engine(
+    settings.DATABASE_READ_URL or settings.DATABASE_URL,
+    **_engine_options(
+        pool_size=settings.DB_READ_POOL_SIZE,
+        max_overflow=settings.DB_READ_MAX_OVERFLOW,
+        statement_timeout_ms=settings.DB_READ_STATEMENT_TIMEOUT_MS,
+        read_only=True,
+    ),
+)
+ReadSessionLocal = async_sessionmaker(read_engine, expire_on_commit=False, class_=AsyncSession)
+
 
 async def get_db() -> AsyncGenerator[AsyncSession, None]:
     async with SessionLocal() as session:
         yield session
 
 
+async def get_read_db() -> AsyncGenerator[AsyncSession, None]:
+    async with ReadSessionLocal() as session:
+        yield session
@@ -1,18 +1,186 @@
 from __future__ import annotations
 
-from functools import lru_cache
+import asyncio
+import threading
+import weakref
+from collections.abc import AsyncGenerator, AsyncIterator
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
 
-import redis
-from redis.asyncio import Redis as AsyncRedis
+from redis.asyncio import BlockingConnectionPool, Redis as AsyncRedis
+from redis.asyncio.client import Pipeline
+from redis.exceptions import LockError
 
 from app.config import settings
 
 
-@lru_cache
-def get_redis_sync() -> redis.Redis:
-    return redis.Redis.from_url(settings.REDIS_URL, decode_responses=True)
+# REDIS_URL=fakeredis:// runs against an in-process fakeredis server; it is
+# meant for tests and local runs without Redis and needs `fakeredis[lua]`.
+FAKE_REDIS_SCHEME = "fakeredis://"
 
+# Fixed-window counter: the first hit in a window sets its expiry, so the
+# whole check is one atomic round trip. Returns {count, ttl_ms}.
+_RATE_LIMIT_SCRIPT = """
+local count = redis.call('INCR', KEYS[1])
+if count == 1 then
+    redis.call('PEXPIRE', KEYS[1], ARGV[1])
+end
+local ttl = redis.call('PTTL', KEYS[1])
+if ttl < 0 then
+    redis.call('PEXPIRE', KEYS[1], ARGV[1])
+    ttl = tonumber(ARGV[1])
+end
+return {count, ttl}
+"""
 
-def create_redis_async() -> AsyncRedis:
-    return AsyncRedis.from_url(settings.REDIS_URL, decode_responses=True)
+# The app's client, opened by ``init_redis`` on the app loop.
+_app_client: tuple[asyncio.AbstractEventLoop, AsyncRedis] | None = None
+# Clients of other loops (Celery tasks, scripts), each closed with its loop.
+_loop_clients: weakref.WeakKeyDictionary[
+    asyncio.AbstractEventLoop, tuple[AsyncRedis, AsyncGenerator[None, None]]
+] = weakref.WeakKeyDictionary()
+_clients_lock = threading.Lock()
+_fake_server = None
 
+
+@dataclass(frozen=True, slots=True)
+class RateLimitResult:
+    allowed: bool
+    count: int
+    remaining: int
+    reset_ms: int
+
+
+def _build_client() -> AsyncRedis:
+    global _fake_server
+    if settings.REDIS_URL.startswith(FAKE_REDIS_SCHEME):
+        import fakeredis
+
+        if _fake_server is None:
+            _fake_server = fakeredis.FakeServer()
+        return fakeredis.FakeAsyncRedis(server=_fake_server, decode_responses=True)
+    pool = BlockingConnectionPool.from_url(
+        settings.REDIS_URL,
+        decode_responses=True,
+        max_connections=settings.REDIS_MAX_CONNECTIONS,
+        timeout=settings.REDIS_POOL_TIMEOUT_SECONDS,
+        health_check_interval=30,
+    )
+    return AsyncRedis(connection_pool=pool)
+
+
+def _close_with_loop(client: AsyncRedis) -> AsyncGenerator[None, None]:
+    async def closer() -> AsyncGenerator[None, None]:
+        try:
+            yield
+        finally:
+            await client.aclose()
+
+    generator = closer()
+    # Stepping it once registers it with the running loop; asyncio.run()
+    # finalizes a loop's async generators before closing it, which closes
+    # the client while its connections can still be shut down.
+    try:
+        generator.__anext__().send(None)
+    except StopIteration:
+        pass
+    return generator
+
+
+def get_redis() -> AsyncRedis:
+    """Return the process-wide async client backed by one shared pool.
+
+    The pool is opened by ``init_redis`` at startup. Code running outside
+    the app loop (Celery tasks, scripts) gets a client of its own loop,
+    because asyncio connections cannot cross event loops; it is reused
+    within that loop and closed when the loop shuts down.
+    """
+    loop = asyncio.get_running_loop()
+    app_client = _app_client
+    if app_client is not None and app_client[0] is loop:
+        return app_client[1]
+    with _clients_lock:
+        entry = _loop_clients.get(loop)
+        if entry is None:
+            client = _build_client()
+            entry = _loop_clients[loop] = (client, _close_with_loop(client))
+        return entry[0]
+
+
+async def init_redis() -> AsyncRedis:
+    global _app_client
+    loop = asyncio.get_running_loop()
+    # Fixed for the life of the app; other loops never replace it.
+    with _clients_lock:
+        if _app_client is None:
+            _app_client = (loop, _build_client())
+    return get_redis()
+
+
+async def close_redis() -> None:
+    global _app_client
+    loop = asyncio.get_running_loop()
+    with _clients_lock:
+        client = None
+        if _app_client is not None and _app_client[0] is loop:
+            client, _app_client = _app_client[1], None
+        entry = _loop_clients.pop(loop, None)
+    if client is not None:
+        await client.aclose()
+    if entry is not None:
+        await entry[1].aclose()
+
+
+@asynccontextmanager
+async def redis_pipeline(*, transaction: bool = False) -> AsyncIterator[Pipeline]:
+    """Queue commands on one pooled connection and send them in one round trip."""
+    async with get_redis().pipeline(transaction=transaction) as pipe:
+        yield pipe
+
+
+async def rate_limit(key: str, *, limit: int, window_seconds: float) -> RateLimitResult:
+    window_ms = max(1, int(window_seconds * 1000))
+    count, ttl = await get_redis().eval(_RATE_LIMIT_SCRIPT, 1, f"ratelimit:{key}", window_ms)
+    count, ttl = int(count), int(ttl)
+    return RateLimitResult(
+        allowed=count <= limit,
+        count=count,
+        remaining=max(0, limit - count),
+        reset_ms=ttl,
+    )
+
+
+@asynccontextmanager
+async def distributed_lock(
+    name: str,
+    *,
+    timeout: float = 60,
+    blocking_timeout: float | None = 0,
+) -> AsyncIterator[bool]:
+    """Hold ``lock:<name>`` across processes; yields whether it was acquired.
+
+    ``timeout`` bounds how long a crashed holder keeps the lock;
+    ``blocking_timeout`` is how long to wait for it (0 = try once,
+    ``None`` = wait forever).
+    """
+    lock = get_redis().lock(f"lock:{name}", timeout=timeout, blocking_timeout=blocking_timeout)
+    acquired = await lock.acquire(blocking=blocking_timeout != 0)
+    try:
+        yield acquired
+    finally:
+        if acquired:
+            try:
+                await lock.release()
+            except LockError:
+                # Expired and possibly taken over; nothing left to release.
+                pass
+
+
+async def redis_health(*, timeout: float = 1.0) -> str:
+    if not settings.REDIS_ENABLED:
+        return "disabled"
+    try:
+        await asyncio.wait_for(get_redis().ping(), timeout=timeout)
+    except Exception:
+        return "unavailable"
+    return "ok"
@@ -0,0 +1,615 @@
+from __future__ import annotations
+
+import asyncio
+import base64
+import hashlib
+import hmac
+import os
+import tempfile
+import xml.etree.ElementTree as ElementTree
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from datetime import datetime, timezone
+from functools import lru_cache
+from pathlib import Path
+from typing import Protocol
+from urllib.parse import quote
+
+import httpx
+from fastapi.responses import FileResponse, RedirectResponse, Response, StreamingResponse
+
+from app.config import settings
+
+
+CHUNK_SIZE = 1024 * 1024
+# S3 rejects multipart parts smaller than 5 MiB, except for the final part.
+S3_MIN_PART_SIZE = 5 * 1024 * 1024
+S3_XML_NAMESPACE = "http://s3.amazonaws.com/doc/2006-03-01/"
+UNSIGNED_PAYLOAD = "UNSIGNED-PAYLOAD"
+
+GA_NOTES_NAMESPACE = "ga-notes"
+PLAN_NOTES_NAMESPACE = "plan-notes"
+REPORTS_NAMESPACE = "reports"
+
+_BACKEND_DIR = Path(__file__).resolve().parents[2]
+
+ElementTree.register_namespace("", S3_XML_NAMESPACE)
+
+
+class StorageError(RuntimeError):
+    pass
+
+
+class StorageObjectNotFound(StorageError):
+    def __init__(self, key: str, code: str | None = None) -> None:
+        super().__init__(key)
+        # S3 error code of the 404, e.g. NoSuchKey or NoSuchLifecycleConfiguration.
+        self.code = code
+
+
+class StorageLimitExceeded(StorageError):
+    pass
+
+
+class StorageBackend(Protocol):
+    async def save_stream(
+        self,
+        key: str,
+        chunks: AsyncIterator[bytes],
+        *,
+        content_type: str | None = None,
+        max_bytes: int | None = None,
+    ) -> int: ...
+
+    async def put_bytes(self, key: str, content: bytes, *, content_type: str | None = None) -> None: ...
+
+    async def read_bytes(self, key: str) -> bytes: ...
+
+    def iter_chunks(self, key: str) -> AsyncIterator[bytes]: ...
+
+    async def exists(self, key: str) -> bool: ...
+
+    async def delete(self, key: str) -> None: ...
+
+    async def download_url(self, key: str, *, filename: str | None, content_type: str | None) -> str | None: ...
+
+    def local_file(self, key: str): ...
+
+    async def apply_retention(self, days: int) -> int: ...
+
+    async def close(self) -> None: ...
+
+
+async def iter_upload_chunks(upload, chunk_size: int = CHUNK_SIZE) -> AsyncIterator[bytes]:
+    while True:
+        chunk = await upload.read(chunk_size)
+        if not chunk:
+            break
+        yield chunk
+
+
+def _normalize_key(key: str) -> str:
+    parts = [part for part in key.replace("\\", "/").split("/") if part not in {"", "."}]
+    if not parts or any(part == ".." for part in parts):
+        raise StorageError(f"Invalid storage key: {key!r}")
+    return "/".join(parts)
+
+
+class LocalStorage:
+    """Filesystem backend rooted at one directory per namespace."""
+
+    def __init__(self, root: Path) -> None:
+        self.root = root.expanduser().resolve()
+
+    def _path(self, key: str) -> Path:
+        candidate = Path(key)
+        # Report runs created before the storage layer persisted absolute paths.
+        path = candidate.resolve() if candidate.is_absolute() else (self.root / _normalize_key(key)).resolve()
+        if self.root not in path.parents:
+            raise StorageError(f"Storage key escapes the storage root: {key!r}")
+        return path
+
+    async def save_stream(
+        self,
+        key: str,
+        chunks: AsyncIterator[bytes],
+        *,
+        content_type: str | None = None,
+        max_bytes: int | None = None,
+    ) -> int:
+        path = self._path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        size_bytes = 0
+        with tempfile.NamedTemporaryFile(dir=path.parent, prefix=".upload-", suffix=".tmp", delete=False) as handle:
+            temporary_path = Path(handle.name)
+            try:
+                async for chunk in chunks:
+                    size_bytes += len(chunk)
+                    if max_bytes is not None and size_bytes > max_bytes:
+                        raise StorageLimitExceeded(f"Object exceeds {max_bytes} bytes")
+                    handle.write(chunk)
+            except BaseException:
+                handle.close()
+                temporary_path.unlink(missing_ok=True)
+                raise
+        os.replace(temporary_path, path)
+        return size_bytes
+
+    async def put_bytes(self, key: str, content: bytes, *, content_type: str | None = None) -> None:
+        path = self._path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with tempfile.NamedTemporaryFile(dir=path.parent, prefix=".upload-", suffix=".tmp", delete=False) as handle:
+            handle.write(content)
+            temporary_path = Path(handle.name)
+        os.replace(temporary_path, path)
+
+    async def read_bytes(self, key: str) -> bytes:
+        path = self._path(key)
+        if not path.is_file():
+            raise StorageObjectNotFound(key)
+        return await asyncio.to_thread(path.read_bytes)
+
+    async def iter_chunks(self, key: str) -> AsyncIterator[bytes]:
+        path = self._path(key)
+        if not path.is_file():
+            raise StorageObjectNotFound(key)
+        with path.open("rb") as stream:
+            while True:
+                chunk = await asyncio.to_thread(stream.read, CHUNK_SIZE)
+                if not chunk:
+                    break
+                yield chunk
+
+    async def exists(self, key: str) -> bool:
+        return self._path(key).is_file()
+
+    async def delete(self, key: str) -> None:
+        path = self._path(key)
+        try:
+            path.unlink(missing_ok=True)
+            parent = path.parent
+            if parent != self.root and parent.exists() and not any(parent.iterdir()):
+                parent.rmdir()
+        except OSError:
+            pass
+
+    async def download_url(self, key: str, *, filename: str | None, content_type: str | None) -> str | None:
+        return None
+
+    @asynccontextmanager
+    async def local_file(self, key: str) -> AsyncIterator[Path]:
+        path = self._path(key)
+        if not path.is_file():
+            raise StorageObjectNotFound(key)
+        yield path
+
+    async def apply_retention(self, days: int) -> int:
+        cutoff = datetime.now(timezone.utc).timestamp() - days * 86400
+        removed = 0
+        if not self.root.exists():
+            return removed
+        for path in sorted(self.root.rglob("*"), reverse=True):
+            try:
+                if path.is_file() and path.stat().st_mtime < cutoff:
+                    path.unlink()
+                    removed += 1
+                elif path.is_dir() and not any(path.iterdir()):
+                    path.rmdir()
+            except OSError:
+                continue
+        return removed
+
+    async def close(self) -> None:
+        return None
+
+
+def _s3_error_code(body: bytes) -> str | None:
+    try:
+        return ElementTree.fromstring(body).findtext("Code") or None
+    except ElementTree.ParseError:
+        return None
+
+
+def _hmac(key: bytes, message: str) -> bytes:
+    return hmac.new(key, message.encode("utf-8"), hashlib.sha256).digest()
+
+
+def _uri_encode(value: str, *, safe: str = "-_.~") -> str:
+    return quote(value, safe=safe)
+
+
+class S3Storage:
+    """S3-compatible backend (AWS S3, MinIO) signed with AWS Signature V4.
+
+    Requests use path-style addressing so self-hosted MinIO endpoints work
+    without wildcard DNS. Objects live under ``<prefix>/`` in the bucket.
+    """
+
+    def __init__(
+        self,
+        *,
+        endpoint_url: str,
+        bucket: str,
+        prefix: str,
+        region: str,
+        access_key_id: str,
+        secret_access_key: str,
+        presign_expire_seconds: int = 300,
+        part_size: int = S3_MIN_PART_SIZE,
+        transport: httpx.AsyncBaseTransport | None = None,
+    ) -> None:
+        self.endpoint_url = endpoint_url.rstrip("/")
+        self.bucket = bucket
+        self.prefix = prefix.strip("/")
+        self.region = region
+        self.access_key_id = access_key_id
+        self.secret_access_key = secret_access_key
+        self.presign_expire_seconds = presign_expire_seconds
+        self.part_size = max(part_size, S3_MIN_PART_SIZE)
+        self._transport = transport
+        self._client: httpx.AsyncClient | None = None
+        self._client_loop: asyncio.AbstractEventLoop | None = None
+        self._host = httpx.URL(self.endpoint_url).netloc.decode("ascii")
+
+    def _client_for_loop(self) -> httpx.AsyncClient:
+        # Celery tasks run each job in a fresh event loop; a pooled client
+        # must never be reused across loops.
+        loop = asyncio.get_running_loop()
+        if self._client is None or self._client_loop is not loop or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                transport=self._transport,
+                timeout=httpx.Timeout(60.0, connect=10.0),
+            )
+            self._client_loop = loop
+        return self._client
+
+    def _object_key(self, key: str) -> str:
+        normalized = _normalize_key(key)
+        return f"{self.prefix}/{normalized}" if self.prefix else normalized
+
+    def _canonical_uri(self, object_key: str | None) -> str:
+        path = f"/{self.bucket}"
+        if object_key:
+            path += "/" + _uri_encode(object_key, safe="-_.~/")
+        return path
+
+    @staticmethod
+    def _canonical_query(params: dict[str, str]) -> str:
+        return "&".join(
+            f"{_uri_encode(name)}={_uri_encode(value)}"
+            for name, value in sorted(params.items())
+        )
+
+    def _signing_key(self, day: str) -> bytes:
+        key = _hmac(f"AWS4{self.secret_access_key}".encode("utf-8"), day)
+        key = _hmac(key, self.region)
+        key = _hmac(key, "s3")
+        return _hmac(key, "aws4_request")
+
+    def _signature(
+        self,
+        *,
+        method: str,
+        canonical_uri: str,
+        params: dict[str, str],
+        headers: dict[str, str],
+        payload_hash: str,
+        amz_date: str,
+    ) -> tuple[str, str]:
+        signed_names = sorted(name.lower() for name in headers)
+        lowered = {name.lower(): value.strip() for name, value in headers.items()}
+        canonical_headers = "".join(f"{name}:{lowered[name]}\n" for name in signed_names)
+        signed_headers = ";".join(signed_names)
+        canonical_request = "\n".join(
+            [
+                method,
+                canonical_uri,
+                self._canonical_query(params),
+                canonical_headers,
+                signed_headers,
+                payload_hash,
+            ]
+        )
+        scope = f"{amz_date[:8]}/{self.region}/s3/aws4_request"
+        string_to_sign = "\n".join(
+            [
+                "AWS4-HMAC-SHA256",
+                amz_date,
+                scope,
+                hashlib.sha256(canonical_request.encode("utf-8")).hexdigest(),
+            ]
+        )
+        signature = hmac.new(
+            self._signing_key(amz_date[:8]),
+            string_to_sign.encode("utf-8"),
+            hashlib.sha256,
+        ).hexdigest()
+        return signature, signed_headers
+
+    def _url(self, canonical_uri: str, params: dict[str, str]) -> str:
+        query = self._canonical_query(params)
+        return f"{self.endpoint_url}{canonical_uri}" + (f"?{query}" if query else "")
+
+    async def _request(
+        self,
+        method: str,
+        object_key: str | None,
+        *,
+        params: dict[str, str] | None = None,
+        content: bytes | None = None,
+        headers: dict[str, str] | None = None,
+    ) -> httpx.Response:
+        params = params or {}
+        amz_date = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+        payload_hash = hashlib.sha256(content).hexdigest() if content is not None else UNSIGNED_PAYLOAD
+        signed = {
+            "host": self._host,
+            "x-amz-content-sha256": payload_hash,
+            "x-amz-date": amz_date,
+            **(headers or {}),
+        }
+        canonical_uri = self._canonical_uri(object_key)
+        signature, signed_headers = self._signature(
+            method=method,
+            canonical_uri=canonical_uri,
+            params=params,
+            headers=signed,
+            payload_hash=payload_hash,
+            amz_date=amz_date,
+        )
+        signed["authorization"] = (
+            f"AWS4-HMAC-SHA256 Credential={self.access_key_id}/{amz_date[:8]}/{self.region}/s3/aws4_request, "
+            f"SignedHeaders={signed_headers}, Signature={signature}"
+        )
+        response = await self._client_for_loop().request(
+            method,
+            self._url(canonical_uri, params),
+            content=content,
+            headers=signed,
+        )
+        if response.status_code == 404:
+            raise StorageObjectNotFound(object_key or self.bucket, _s3_error_code(response.content))
+        if response.status_code >= 400:
+            raise StorageError(f"S3 {method} failed with HTTP {response.status_code}: {response.text[:500]}")
+        return response
+
+    async def save_stream(
+        self,
+        key: str,
+        chunks: AsyncIterator[bytes],
+        *,
+        content_type: str | None = None,
+        max_bytes: int | None = None,
+    ) -> int:
+        object_key = self._object_key(key)
+        content_headers = {"content-type": content_type} if content_type else {}
+        buffer = bytearray()
+        size_bytes = 0
+        upload_id: str | None = None
+        parts: list[tuple[int, str]] = []
+        try:
+            async for chunk in chunks:
+                size_bytes += len(chunk)
+                if max_bytes is not None and size_bytes > max_bytes:
+                    raise StorageLimitExceeded(f"Object exceeds {max_bytes} bytes")
+                buffer.extend(chunk)
+                if len(buffer) < self.part_size:
+                    continue
+                if upload_id is None:
+                    created = await self._request(
+                        "POST", object_key, params={"uploads": ""}, content=b"", headers=content_headers
+                    )
+                    upload_id = ElementTree.fromstring(created.content).findtext(f"{{{S3_XML_NAMESPACE}}}UploadId")
+                    if not upload_id:
+                        raise StorageError("S3 did not return a multipart UploadId")
+                parts.append(await self._upload_part(object_key, upload_id, len(parts) + 1, bytes(buffer)))
+                buffer.clear()
+
+            if upload_id is None:
+                await self._request("PUT", object_key, content=bytes(buffer), headers=content_headers)
+                return size_bytes
+            if buffer:
+                parts.append(await self._upload_part(object_key, upload_id, len(parts) + 1, bytes(buffer)))
+            completion = "".join(
+                f"<Part><PartNumber>{number}</PartNumber><ETag>{etag}</ETag></Part>"
+                for number, etag in parts
+            )
+            await self._request(
+                "POST",
+                object_key,
+                params={"uploadId": upload_id},
+                content=f"<CompleteMultipartUpload>{completion}</CompleteMultipartUpload>".encode("utf-8"),
+            )
+            return size_bytes
+        except BaseException:
+            if upload_id is not None:
+                try:
+                    await self._request("DELETE", object_key, params={"uploadId": upload_id})
+                except StorageError:
+                    pass
+            raise
+
+    async def _upload_part(self, object_key: str, upload_id: str, number: int, content: bytes) -> tuple[int, str]:
+        response = await self._request(
+            "PUT",
+            object_key,
+            params={"partNumber": str(number), "uploadId": upload_id},
+            content=content,
+        )
+        return number, response.headers.get("etag", "")
+
+    async def put_bytes(self, key: str, content: bytes, *, content_type: str | None = None) -> None:
+        headers = {"content-type": content_type} if content_type else {}
+        await self._request("PUT", self._object_key(key), content=content, headers=headers)
+
+    async def read_bytes(self, key: str) -> bytes:
+        return (await self._request("GET", self._object_key(key))).content
+
+    async def iter_chunks(self, key: str) -> AsyncIterator[bytes]:
+        object_key = self._object_key(key)
+        url = await self.download_url(key, filename=None, content_type=None)
+        async with self._client_for_loop().stream("GET", url) as response:
+            if response.status_code == 404:
+                raise StorageObjectNotFound(object_key)
+            if response.status_code >= 400:
+                raise StorageError(f"S3 GET failed with HTTP {response.status_code}")
+            async for chunk in response.aiter_bytes(CHUNK_SIZE):
+                yield chunk
+
+    async def exists(self, key: str) -> bool:
+        try:
+            await self._request("HEAD", self._object_key(key))
+        except StorageObjectNotFound:
+            return False
+        return True
+
+    async def delete(self, key: str) -> None:
+        try:
+            await self._request("DELETE", self._object_key(key))
+        except StorageObjectNotFound:
+            pass
+
+    async def download_url(self, key: str, *, filename: str | None, content_type: str | None) -> str:
+        amz_date = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+        params = {
+            "X-Amz-Algorithm": "AWS4-HMAC-SHA256",
+            "X-Amz-Credential": f"{self.access_key_id}/{amz_date[:8]}/{self.region}/s3/aws4_request",
+            "X-Amz-Date": amz_date,
+            "X-Amz-Expires": str(self.presign_expire_seconds),
+            "X-Amz-SignedHeaders": "host",
+        }
+        if filename:
+            params["response-content-disposition"] = (
+                f"attachment; filename*=UTF-8''{quote(filename, safe='')}"
+            )
+        if content_type:
+            params["response-content-type"] = content_type
+        canonical_uri = self._canonical_uri(self._object_key(key))
+        signature, _ = self._signature(
+            method="GET",
+            canonical_uri=canonical_uri,
+            params=params,
+            headers={"host": self._host},
+            payload_hash=UNSIGNED_PAYLOAD,
+            amz_date=amz_date,
+        )
+        params["X-Amz-Signature"] = signature
+        return self._url(canonical_uri, params)
+
+    @asynccontextmanager
+    async def local_file(self, key: str) -> AsyncIterator[Path]:
+        suffix = Path(key).suffix
+        with tempfile.TemporaryDirectory(prefix="primeflow-storage-") as directory:
+            path = Path(directory) / f"object{suffix}"
+            with path.open("wb") as handle:
+                async for chunk in self.iter_chunks(key):
+                    handle.write(chunk)
+            yield path
+
+    async def apply_retention(self, days: int) -> int:
+        """Install a bucket lifecycle rule that expires this namespace.
+
+        Other lifecycle rules on the bucket are preserved. Objects are removed
+        by the storage service itself, so nothing is counted here.
+        """
+        rule_id = f"primeflow-{self.prefix or 'root'}-retention"
+        try:
+            existing = await self._request("GET", None, params={"lifecycle": ""})
+            root = ElementTree.fromstring(existing.content)
+        except StorageObjectNotFound as exc:
+            # Only a bucket without lifecycle rules starts from an empty
+            # configuration; on any other failure the PUT would wipe the
+            # bucket's existing rules.
+            if exc.code not in (None, "NoSuchLifecycleConfiguration"):
+                raise
+            root = ElementTree.Element(f"{{{S3_XML_NAMESPACE}}}LifecycleConfiguration")
+        for rule in list(root):
+            if rule.findtext(f"{{{S3_XML_NAMESPACE}}}ID") == rule_id or rule.findtext("ID") == rule_id:
+                root.remove(rule)
+        rule = ElementTree.SubElement(root, f"{{{S3_XML_NAMESPACE}}}Rule")
+        ElementTree.SubElement(rule, f"{{{S3_XML_NAMESPACE}}}ID").text = rule_id
+        rule_filter = ElementTree.SubElement(rule, f"{{{S3_XML_NAMESPACE}}}Filter")
+        ElementTree.SubElement(rule_filter, f"{{{S3_XML_NAMESPACE}}}Prefix").text = (
+            f"{self.prefix}/" if self.prefix else ""
+        )
+        ElementTree.SubElement(rule, f"{{{S3_XML_NAMESPACE}}}Status").text = "Enabled"
+        expiration = ElementTree.SubElement(rule, f"{{{S3_XML_NAMESPACE}}}Expiration")
+        ElementTree.SubElement(expiration, f"{{{S3_XML_NAMESPACE}}}Days").text = str(max(1, days))
+        body = ElementTree.tostring(root, encoding="utf-8")
+        await self._request(
+            "PUT",
+            None,
+            params={"lifecycle": ""},
+            content=body,
+            headers={"content-md5": base64.b64encode(hashlib.md5(body).digest()).decode("ascii")},
+        )
+        return 0
+
+    async def close(self) -> None:
+        if self._client is not None and not self._client.is_closed:
+            await self._client.aclose()
+        self._client = None
+        self._client_loop = None
+
+
+def _local_root(namespace: str) -> Path:
+    if namespace == REPORTS_NAMESPACE:
+        return Path(settings.REPORT_STORAGE_DIR).expanduser().resolve()
+    configured = {
+        GA_NOTES_NAMESPACE: settings.GA_NOTES_UPLOAD_DIR,
+        PLAN_NOTES_NAMESPACE: settings.PLAN_NOTES_UPLOAD_DIR,
+    }.get(namespace)
+    if configured is None:
+        raise StorageError(f"Unknown storage namespace: {namespace}")
+    upload_base = Path(configured)
+    if not upload_base.is_absolute():
+        upload_base = _BACKEND_DIR / upload_base
+    return upload_base
+
+
+@lru_cache
+def get_storage(namespace: str) -> StorageBackend:
+    backend = settings.STORAGE_BACKEND.strip().lower()
+    if backend == "s3":
+        if not settings.S3_BUCKET or not settings.S3_ACCESS_KEY_ID or not settings.S3_SECRET_ACCESS_KEY:
+            raise StorageError("S3 storage requires S3_BUCKET, S3_ACCESS_KEY_ID and S3_SECRET_ACCESS_KEY")
+        return S3Storage(
+            endpoint_url=settings.S3_ENDPOINT_URL,
+            bucket=settings.S3_BUCKET,
+            prefix=namespace,
+            region=settings.S3_REGION,
+            access_key_id=settings.S3_ACCESS_KEY_ID,
+            secret_access_key=settings.S3_SECRET_ACCESS_KEY,
+            presign_expire_seconds=settings.S3_PRESIGN_EXPIRE_SECONDS,
+            part_size=settings.S3_MULTIPART_PART_MB * 1024 * 1024,
+        )
+    if backend != "local":
+        raise StorageError(f"Unsupported STORAGE_BACKEND: {settings.STORAGE_BACKEND}")
+    return LocalStorage(_local_root(namespace))
+
+
+async def close_storage() -> None:
+    for namespace in (GA_NOTES_NAMESPACE, PLAN_NOTES_NAMESPACE, REPORTS_NAMESPACE):
+        try:
+            await get_storage(namespace).close()
+        except StorageError:
+            continue
+
+
+async def download_response(
+    storage: StorageBackend,
+    key: str,
+    *,
+    filename: str | None,
+    media_type: str,
+    inline: bool = False,
+) -> Response:
+    """Serve a stored object, redirecting to a presigned URL when possible."""
+    url = await storage.download_url(key, filename=None if inline else filename, content_type=media_type)
+    if url:
+        return RedirectResponse(url, status_code=307)
+    if isinstance(storage, LocalStorage):
+        async with storage.local_file(key) as path:
+            return FileResponse(path, media_type=media_type, filename=None if inline else filename)
+    headers = {"Content-Disposition": f"attachment; filename*=UTF-8''{quote(filename, safe='')}"} if filename and not inline else None
+    return StreamingResponse(storage.iter_chunks(key), media_type=media_type, headers=headers)
@@ -1,22 +1,29 @@
 from __future__ import annotations
 
+import asyncio
 import logging
 import uuid
+from collections import Counter
 from datetime import date, datetime, timezone
+from time import perf_counter
 from zoneinfo import ZoneInfo
 
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.config import settings
-from app.db import SessionLocal
+from app.db import ReadSessionLocal, SessionLocal
 from app.models.department import Department
 from app.models.enums import UserRole
 from app.models.user import User
 from app.models.weekly_planner_snapshot import WeeklyPlannerSnapshot
 from app.schemas.weekly_planner_snapshot import WeeklySnapshotType
 from app.services.realization_calculator import calculate_weekly_period
-from app.services.realization_daily import calculate_daily_period
+from app.services.realization_daily import (
+    DailyRealizationDayData,
+    calculate_daily_period,
+    load_daily_realization_day_data,
+)
 from app.services.realization_periods import (
     ensure_daily_period,
     ensure_weekly_period,
@@ -69,76 +76,114 @@ async def _capture_automatic_snapshot(
     return snapshot
 
 
+async def _calculate_department_day(
+    *,
+    department_id: uuid.UUID,
+    actor: User,
+    day: date,
+    day_data: DailyRealizationDayData,
+) -> str:
+    """Capture and calculate one department's day in its own session."""
+    async with SessionLocal() as db:
+        try:
+            planned, _ = await select_weekly_snapshots(
+                db,
+                department_id=department_id,
+                week_start=normalize_week_start(day),
+            )
+            if planned is None:
+                await _capture_automatic_snapshot(
+                    db=db,
+                    actor=actor,
+                    department_id=department_id,
+                    day=day,
+                    snapshot_type=WeeklySnapshotType.PLANNED,
+                )
+            period, planned = await ensure_daily_period(
+                db,
+                department_id=department_id,
+                day=day,
+                created_by=actor.id,
+            )
+            if planned is None:
+                await db.rollback()
+                return "skipped"
+            await calculate_daily_period(
+                db,
+                period=period,
+                planned_snapshot=planned,
+                actor_id=actor.id,
+                day_data=day_data,
+            )
+            await db.commit()
+            return "calculated"
+        except Exception:
+            await db.rollback()
+            raise
+
+
 async def generate_daily_realization_snapshots() -> dict[str, int]:
-    """Create the stored end-of-day realization snapshot for every department."""
+    """Create the stored end-of-day realization snapshot for every department.
+
+    Users, leave and attendance are loaded once for the day; departments then
+    run concurrently, each in its own session and under its own timeout, so a
+    failing or slow department does not affect the others.
+    """
     day = datetime.now(ZoneInfo(settings.REALIZATION_TIMEZONE)).date()
     if not settings.REALIZATION_DAILY_ENABLED or not _is_working_day(day):
         return {"calculated": 0, "skipped": 0, "failed": 0}
 
-    calculated = skipped = failed = 0
     async with SessionLocal() as db:
         department_ids = (await db.execute(select(Department.id))).scalars().all()
-        admins = (
+        admin = (
             await db.execute(
                 select(User).where(User.role == UserRole.ADMIN, User.is_active.is_(True)).limit(1)
             )
-        ).scalars().all()
-        for department_id in department_ids:
-            manager = (
-                await db.execute(
-                    select(User)
-                    .where(
-                        User.department_id == department_id,
-                        User.role == UserRole.MANAGER,
-                        User.is_active.is_(True),
-                    )
-                    .limit(1)
-                )
-            ).scalar_one_or_none()
-            actor = manager or (admins[0] if admins else None)
-            if actor is None:
-                skipped += 1
-                continue
-            actor_id = actor.id
+        ).scalar_one_or_none()
+        day_data = await load_daily_realization_day_data(db, day=day)
+
+    semaphore = asyncio.Semaphore(max(1, settings.REALIZATION_DAILY_CONCURRENCY))
+
+    async def run(department_id: uuid.UUID) -> str:
+        manager = next(
+            (
+                user
+                for user in day_data.users_by_department.get(department_id, [])
+                if user.role == UserRole.MANAGER
+            ),
+            None,
+        )
+        actor = manager or admin
+        if actor is None:
+            return "skipped"
+        async with semaphore:
+            started = perf_counter()
             try:
-                planned, _ = await select_weekly_snapshots(
-                    db,
-                    department_id=department_id,
-                    week_start=normalize_week_start(day),
-                )
-                if planned is None:
-                    await _capture_automatic_snapshot(
-                        db=db,
-                        actor=actor,
+                async with asyncio.timeout(settings.REALIZATION_DAILY_DEPARTMENT_TIMEOUT_SECONDS):
+                    outcome = await _calculate_department_day(
                         department_id=department_id,
+                        actor=actor,
                         day=day,
-                        snapshot_type=WeeklySnapshotType.PLANNED,
+                        day_data=day_data,
                     )
-                period, planned = await ensure_daily_period(
-                    db,
-                    department_id=department_id,
-                    day=day,
-                    created_by=actor_id,
-                )
-                if planned is None:
-                    skipped += 1
-                    await db.rollback()
-                    continue
-                await calculate_daily_period(
-                    db,
-                    period=period,
-                    planned_snapshot=planned,
-                    actor_id=actor_id,
-                )
-                await db.commit()
-                calculated += 1
+            except TimeoutError:
+                outcome = "failed"
+                logger.error("Daily realization snapshot timed out for department %s", department_id)
             except Exception:
-                await db.rollback()
-                failed += 1
+                outcome = "failed"
                 logger.exception(
                     "Daily realization snapshot failed for department %s", department_id
                 )
-    return {"calculated": calculated, "skipped": skipped, "failed": failed}
+            logger.info(
+                "Daily realization department=%s outcome=%s duration_ms=%.0f",
+                department_id,
+                outcome,
+                (perf_counter() - started) * 1000,
+            )
+            return outcome
+
+    outcomes = Counter(await asyncio.gather(*(run(department_id) for department_id in department_ids)))
+    return {"calculated": outcomes["calculated"], "skipped": outcomes["skipped"], "failed": outcomes["failed"]}
 
 
 async def generate_weekly_realization_results() -> dict[str, int]:
@@ -201,13 +246,15 @@ async def generate_weekly_realization_results() -> dict[str, int]:
                     skipped += 1
                     await db.rollback()
                     continue
-                await calculate_weekly_period(
-                    db,
-                    period=period,
-                    planned_snapshot=planned,
-                    final_snapshot=final,
-                    actor_id=actor_id,
-                )
+                async with ReadSessionLocal() as read_db:
+                    await calculate_weekly_period(
+                        db,
+                        period=period,
+                        planned_snapshot=planned,
+                        final_snapshot=final,
+                        actor_id=actor_id,
+                        read_db=read_db,
+                    )
                 await db.commit()
                 calculated += 1
             except Exception:
@@ -12,9 +12,15 @@ from starlette.middleware.gzip import GZipMiddleware
 from app.auth.security import ACCESS_TOKEN_TYPE, decode_token, require_token_type
 from app.api.routers import api_router
 from app.config import settings
+from app.integrations.redis import close_redis, init_redis, redis_health
+from app.integrations.storage import close_storage
+from app.services.mail_delivery import close_pools as close_smtp_pools
 from app.services.meetings_report_scheduler import run_meetings_report_scheduler_forever
 from app.services.after_break_report_scheduler import run_after_break_report_scheduler_forever
 from app.services.morning_report_scheduler import run_morning_report_scheduler_forever
+from app.services.notifications import notification_dispatcher
+from app.services.report_rendering import shutdown_render_pool
+from app.services.standardization_engine import shutdown_standardizer_pool
 from app.services.tomorrow_print_report_scheduler import run_tomorrow_print_report_scheduler_forever
 from app.services.std_feedback_tickets import run_std_feedback_ticket_sync_forever
 from app.services.system_task_scheduler import run_system_task_scheduler_forever
@@ -48,13 +54,14 @@ std_feedback_sync_task: asyncio.Task | None = None
 
 @app.get("/health")
 async def health() -> dict:
-    return {"status": "ok", "build": os.getenv("APP_BUILD_SHA", "unknown")}
+    return {"status": "ok", "build": os.getenv("APP_BUILD_SHA", "unknown"), "redis": await redis_health()}
 
 
 @app.on_event("startup")
 async def _startup() -> None:
     global listener_task, scheduler_task, meetings_report_scheduler_task, after_break_report_scheduler_task, morning_report_scheduler_task, tomorrow_print_report_scheduler_task, std_feedback_sync_task
     if settings.REDIS_ENABLED:
+        await init_redis()
         listener_task = asyncio.create_task(start_notification_listener())
     if settings.SYSTEM_TASK_SCHEDULER_ENABLED:
         scheduler_task = asyncio.create_task(run_system_task_scheduler_forever())
@@ -118,6 +125,12 @@ async def _shutdown() -> None:
         except asyncio.CancelledError:
             pass
         std_feedback_sync_task = None
+    await notification_dispatcher.aclose()
+    await close_redis()
+    await close_storage()
+    shutdown_render_pool()
+    shutdown_standardizer_pool()
+    await asyncio.to_thread(close_smtp_pools)
 
 
 @app.websocket("/ws/notifications")
@@ -31,7 +31,9 @@ from app.models.morning_report_settings import MorningReportSettings
 from app.models.meeting_occurrence_status import MeetingOccurrenceStatus
 from app.models.microsoft_token import MicrosoftToken
 from app.models.notification import Notification
+from app.models.outbound_email import OutboundEmail
 from app.models.project import Project
+from app.models.project_metric_version import ProjectMetricVersion
 from app.models.primeflow_report_delivery_run import PrimeFlowReportDeliveryRun
 from app.models.primeflow_report_recipient import PrimeFlowReportRecipient
 from app.models.primeflow_report_schedule import PrimeFlowReportSchedule
@@ -53,6 +55,8 @@ from app.models.realization import (
     RealizationDailyApprovalEvent,
     RealizationDailyCloseEvent,
     RealizationDepartmentResult,
+    RealizationMonthlyDepartmentAggregate,
+    RealizationMonthlyPersonAggregate,
     RealizationObservation,
     RealizationPeriod,
     RealizationPersonResult,
@@ -80,7 +84,11 @@ from app.models.task_template import TaskTemplate
 from app.models.task_template_run import TaskTemplateRun
 from app.models.user import User
 from app.models.weekly_plan import WeeklyPlan
-from app.models.weekly_planner_snapshot import WeeklyPlannerSnapshot
+from app.models.weekly_planner_snapshot import (
+    WeeklyPlannerSnapshot,
+    WeeklyPlannerSnapshotTask,
+    WeeklySnapshotComparison,
+)
 from app.models.weekly_planner_legend_entry import WeeklyPlannerLegendEntry
 from app.models.weekly_planning_audit import (
     WeeklyPlanningAuditDelivery,
@@ -123,7 +131,9 @@ __all__ = [
     "MeetingOccurrenceStatus",
     "MicrosoftToken",
     "Notification",
+    "OutboundEmail",
     "Project",
+    "ProjectMetricVersion",
     "PrimeFlowReportDeliveryRun",
     "PrimeFlowReportRecipient",
     "PrimeFlowReportSchedule",
@@ -142,6 +152,8 @@ __all__ = [
     "RefreshToken",
     "RealizationDepartmentResult",
     "RealizationDailyApprovalEvent",
+    "RealizationMonthlyDepartmentAggregate",
+    "RealizationMonthlyPersonAggregate",
     "RealizationObservation",
     "RealizationPeriod",
     "RealizationPersonResult",
@@ -169,6 +181,8 @@ __all__ = [
     "User",
     "WeeklyPlan",
     "WeeklyPlannerSnapshot",
+    "WeeklyPlannerSnapshotTask",
+    "WeeklySnapshotComparison",
     "WeeklyPlannerLegendEntry",
     "WeeklyPlanningAuditDelivery",
     "WeeklyPlanningAuditRun",
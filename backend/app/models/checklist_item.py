@@ -2,7 +2,7 @@
 
 import uuid
 
-from sqlalchemy import Boolean, Enum, ForeignKey, Integer, Text
+from sqlalchemy import Boolean, Enum, ForeignKey, Index, Integer, String, Text, text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -12,6 +12,15 @@ from app.models.enums import ChecklistItemType
 
 class ChecklistItem(Base):
     __tablename__ = "checklist_items"
+    __table_args__ = (
+        Index(
+            "uq_checklist_items_checklist_import_key",
+            "checklist_id",
+            "import_key",
+            unique=True,
+            postgresql_where=text("import_key IS NOT NULL"),
+        ),
+    )
 
     id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     checklist_id: Mapped[uuid.UUID | None] = mapped_column(
@@ -36,6 +45,8 @@ class ChecklistItem(Base):
     title: Mapped[str | None] = mapped_column(Text, nullable=True)  # For TITLE and CHECKBOX
     comment: Mapped[str | None] = mapped_column(Text, nullable=True)  # For COMMENT
     is_checked: Mapped[bool | None] = mapped_column(Boolean, nullable=True)  # Only for CHECKBOX
+    # Content hash of the Excel row an item was imported from (template imports only).
+    import_key: Mapped[str | None] = mapped_column(String(64), nullable=True)
 
     # Relationships
     checklist: Mapped["Checklist"] = relationship("Checklist", back_populates="items")
@@ -0,0 +1,28 @@
+from __future__ import annotations
+
+import uuid
+from datetime import datetime
+
+from sqlalchemy import BigInteger, DateTime, func
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.db import Base
+
+
+class ProjectMetricVersion(Base):
+    """Change counter for the inputs of a project's control-week metrics.
+
+    Database triggers on ``tasks`` and ``task_daily_progress`` bump
+    ``version`` whenever a project's CONTROL tasks, the origin tasks they name
+    or their daily progress change (see the ``20260821_project_metric_versions``
+    and ``20260829_control_metric_bumps`` migrations); application
+    code only reads it to key cached metrics. A project without a row has
+    never changed since the migration and reads as version 0.
+    """
+
+    __tablename__ = "project_metric_versions"
+
+    project_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True)
+    version: Mapped[int] = mapped_column(BigInteger, nullable=False, default=0)
+    updated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
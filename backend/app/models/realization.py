@@ -679,3 +679,68 @@ class RealizationDailyApprovalEvent(Base):
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), nullable=False, server_default=func.now()
     )
+
+
+class RealizationMonthlyPersonAggregate(Base):
+    """Monthly Pulse rollup of one person's official weekly results.
+
+    Maintained by ``app.services.realization_monthly`` whenever a weekly
+    period is calculated, reviewed or approved. ``weekly_history`` holds the
+    per-week entries in week order; the counters are derived from it.
+    """
+
+    __tablename__ = "realization_monthly_person_aggregates"
+    __table_args__ = (
+        UniqueConstraint(
+            "department_id", "month_start", "user_id", name="uq_realization_monthly_person_aggregate"
+        ),
+    )
+
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    department_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True), ForeignKey("departments.id", ondelete="CASCADE"), nullable=False
+    )
+    month_start: Mapped[date] = mapped_column(Date, nullable=False)
+    user_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True
+    )
+    weekly_history: Mapped[list] = mapped_column(
+        JSONB, nullable=False, default=list, server_default=text("'[]'::jsonb")
+    )
+    plus_count: Mapped[int] = mapped_column(Integer, nullable=False, server_default="0")
+    plus_plus_count: Mapped[int] = mapped_column(Integer, nullable=False, server_default="0")
+    diamond_count: Mapped[int] = mapped_column(Integer, nullable=False, server_default="0")
+    question_count: Mapped[int] = mapped_column(Integer, nullable=False, server_default="0")
+    ok_count: Mapped[int] = mapped_column(Integer, nullable=False, server_default="0")
+    unresolved_pink_days: Mapped[int] = mapped_column(Integer, nullable=False, server_default="0")
+    verified_positive_extras: Mapped[int] = mapped_column(Integer, nullable=False, server_default="0")
+    unresolved_negative_evidence: Mapped[int] = mapped_column(Integer, nullable=False, server_default="0")
+    verified_negative_evidence: Mapped[int] = mapped_column(Integer, nullable=False, server_default="0")
+    trend: Mapped[list] = mapped_column(JSONB, nullable=False, default=list, server_default=text("'[]'::jsonb"))
+    current_pulse: Mapped[str | None] = mapped_column(String(20))
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False, server_default=func.now(), onupdate=func.now()
+    )
+
+
+class RealizationMonthlyDepartmentAggregate(Base):
+    __tablename__ = "realization_monthly_department_aggregates"
+    __table_args__ = (
+        UniqueConstraint("department_id", "month_start", name="uq_realization_monthly_department_aggregate"),
+    )
+
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    department_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True), ForeignKey("departments.id", ondelete="CASCADE"), nullable=False
+    )
+    month_start: Mapped[date] = mapped_column(Date, nullable=False)
+    people_count: Mapped[int] = mapped_column(Integer, nullable=False, server_default="0")
+    pulse_counts: Mapped[dict] = mapped_column(
+        JSONB, nullable=False, default=dict, server_default=text("'{}'::jsonb")
+    )
+    source_weekly_period_ids: Mapped[list] = mapped_column(
+        JSONB, nullable=False, default=list, server_default=text("'[]'::jsonb")
+    )
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False, server_default=func.now(), onupdate=func.now()
+    )
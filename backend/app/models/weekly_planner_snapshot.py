@@ -3,7 +3,7 @@ from __future__ import annotations
 import uuid
 from datetime import date, datetime
 
-from sqlalchemy import Date, DateTime, ForeignKey, Index, String, func
+from sqlalchemy import ARRAY, Boolean, Date, DateTime, ForeignKey, Index, Integer, String, Text, func, text
 from sqlalchemy.dialects.postgresql import JSONB, UUID
 from sqlalchemy.orm import Mapped, mapped_column
 
@@ -35,3 +35,84 @@ class WeeklyPlannerSnapshot(Base):
             "created_at",
         ),
     )
+
+
+class WeeklyPlannerSnapshotTask(Base):
+    """One planned occurrence of a task inside a weekly planner snapshot.
+
+    Rows mirror ``payload["task_items"]`` so comparisons can read a snapshot
+    through an index instead of loading and flattening the JSONB document.
+    Task-level fields are repeated on every occurrence row; assignees without
+    a planned slot get a row with ``day``/``slot`` left empty.
+    """
+
+    __tablename__ = "weekly_planner_snapshot_tasks"
+
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    snapshot_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True), ForeignKey("weekly_planner_snapshots.id", ondelete="CASCADE"), nullable=False
+    )
+    position: Mapped[int] = mapped_column(Integer, nullable=False)
+    match_key: Mapped[str] = mapped_column(Text, nullable=False)
+    task_id: Mapped[uuid.UUID | None] = mapped_column(UUID(as_uuid=True))
+    fallback_key: Mapped[str | None] = mapped_column(Text)
+    title: Mapped[str] = mapped_column(Text, nullable=False)
+    project_id: Mapped[uuid.UUID | None] = mapped_column(UUID(as_uuid=True))
+    project_title: Mapped[str | None] = mapped_column(Text)
+    source_type: Mapped[str] = mapped_column(String(20), nullable=False)
+    status: Mapped[str | None] = mapped_column(String(32))
+    daily_status: Mapped[str | None] = mapped_column(String(32))
+    completed_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True))
+    is_completed: Mapped[bool] = mapped_column(Boolean, nullable=False, default=False)
+    finish_period: Mapped[str | None] = mapped_column(String(20))
+    priority: Mapped[str | None] = mapped_column(String(20))
+    tags: Mapped[list[str]] = mapped_column(ARRAY(String), nullable=False, default=list)
+    planned_due_date: Mapped[datetime | None] = mapped_column(DateTime(timezone=True))
+    user_id: Mapped[uuid.UUID | None] = mapped_column(UUID(as_uuid=True))
+    user_name: Mapped[str | None] = mapped_column(String(255))
+    day: Mapped[date | None] = mapped_column(Date)
+    slot: Mapped[str | None] = mapped_column(String(10))
+
+    __table_args__ = (
+        Index("ix_weekly_planner_snapshot_tasks_match", "snapshot_id", "match_key", "user_id", "day", "slot"),
+        Index("ix_weekly_planner_snapshot_tasks_user_day", "snapshot_id", "user_id", "day", "slot"),
+        Index("ix_weekly_planner_snapshot_tasks_task_id", "task_id"),
+    )
+
+
+class WeeklySnapshotComparison(Base):
+    """Cached plan-vs-actual classification between two snapshots.
+
+    ``compare_snapshot_id`` is NULL for comparisons against the live planner;
+    ``cache_key`` then also carries the revision of the week's planner data.
+    """
+
+    __tablename__ = "weekly_snapshot_comparisons"
+
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    baseline_snapshot_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True), ForeignKey("weekly_planner_snapshots.id", ondelete="CASCADE"), nullable=False
+    )
+    compare_snapshot_id: Mapped[uuid.UUID | None] = mapped_column(
+        UUID(as_uuid=True), ForeignKey("weekly_planner_snapshots.id", ondelete="CASCADE")
+    )
+    cache_key: Mapped[str] = mapped_column(String(64), nullable=False)
+    result: Mapped[dict] = mapped_column(JSONB, nullable=False)
+    computed_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
+
+    __table_args__ = (
+        Index(
+            "uq_weekly_snapshot_comparisons_pair",
+            "baseline_snapshot_id",
+            "compare_snapshot_id",
+            unique=True,
+            postgresql_where=text("compare_snapshot_id IS NOT NULL"),
+        ),
+        Index(
+            "uq_weekly_snapshot_comparisons_live",
+            "baseline_snapshot_id",
+            unique=True,
+            postgresql_where=text("compare_snapshot_id IS NULL"),
+        ),
+        Index("ix_weekly_snapshot_comparisons_compare_snapshot_id", "compare_snapshot_id"),
+    )
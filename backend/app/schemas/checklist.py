@@ -52,3 +52,13 @@ class ChecklistUpdate(BaseModel):
 class ChecklistWithItemsOut(ChecklistOut):
     items: list[ChecklistItemOut] = []
 
+
+
+class ChecklistImportJobOut(BaseModel):
+    job_id: str
+    status: str
+    checklist_id: uuid.UUID | None = None
+    rows_read: int = 0
+    inserted: int = 0
+    skipped: int = 0
+    error: str | None = None
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import uuid
 from datetime import date, datetime
+from typing import Any
 
 from pydantic import BaseModel, EmailStr, Field
 
@@ -155,3 +156,24 @@ class TaskUpdate(BaseModel):
     fast_task_order: int | None = Field(default=None, ge=1)
     alignment_user_ids: list[uuid.UUID] | None = None
     completion_override_reason: str | None = Field(default=None, max_length=2000, exclude=True)
+
+
+class TaskBulkUpdateItem(BaseModel):
+    task_id: uuid.UUID
+    patch: TaskUpdate
+
+
+class TaskBulkUpdate(BaseModel):
+    items: list[TaskBulkUpdateItem] = Field(min_length=1, max_length=500)
+
+
+class TaskBulkUpdateResult(BaseModel):
+    task_id: uuid.UUID
+    ok: bool
+    status_code: int
+    detail: Any = None
+    task: TaskOut | None = None
+
+
+class TaskBulkUpdateOut(BaseModel):
+    results: list[TaskBulkUpdateResult]
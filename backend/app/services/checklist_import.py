@@ -0,0 +1,458 @@
+from __future__ import annotations
+
+import asyncio
+import concurrent.futures
+import hashlib
+import io
+import json
+import logging
+import re
+import threading
+import uuid
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Iterator
+
+import openpyxl
+from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import settings
+from app.db import SessionLocal
+from app.integrations.redis import get_redis
+from app.models.checklist import Checklist
+from app.models.checklist_item import ChecklistItem
+from app.models.enums import ChecklistItemType
+
+
+logger = logging.getLogger(__name__)
+
+HEADER_ALIASES = {
+    "nr": "nr",
+    "no": "nr",
+    "number": "nr",
+    "tasks": "title",
+    "task": "title",
+    "attributes": "title",
+    "attribute": "title",
+    "topic": "title",
+    "comment": "comment",
+    "comments": "comment",
+    "description": "description",
+    "pershkrimidetal": "description",
+    "pershkrimi": "description",
+    "check": "check",
+    "koha_e_perfundimit_manual": "time",
+    "koha_e_perfundimit": "time",
+    "time": "time",
+    "when": "time",
+    "owner": "owner",
+    "who": "owner",
+    "day": "day",
+    "dita": "day",
+    "date": "day",
+}
+MAX_UPLOAD_BYTES = 20 * 1024 * 1024
+ITEM_FIELDS = ("title", "description", "comment", "time", "owner", "day")
+_KNOWN_COLUMNS = {"nr", *ITEM_FIELDS, "check"}
+# Chunks parsed ahead of the database writes; the reader thread blocks beyond this.
+_QUEUE_DEPTH = 2
+_JOB_KEY_PREFIX = "checklist-import"
+_JOB_RETENTION_SECONDS = 24 * 60 * 60
+_LOCAL_JOB_LIMIT = 200
+
+_jobs: dict[str, "ChecklistImportProgress"] = {}
+_running: set[asyncio.Task] = set()
+
+
+class ChecklistImportError(ValueError):
+    pass
+
+
+@dataclass
+class ChecklistImportProgress:
+    job_id: str
+    status: str = "QUEUED"
+    checklist_id: str | None = None
+    rows_read: int = 0
+    inserted: int = 0
+    skipped: int = 0
+    error: str | None = None
+
+    def to_dict(self) -> dict[str, Any]:
+        return asdict(self)
+
+
+@dataclass(frozen=True)
+class _SheetHeader:
+    column_map: dict[int, str]
+    columns: list[dict[str, str]] = field(default_factory=list)
+
+
+class _ReaderStopped(Exception):
+    pass
+
+
+def _normalize_header(value: Any) -> str:
+    if value is None:
+        return ""
+    text = str(value).strip().lower()
+    if not text:
+        return ""
+    text = re.sub(r"[^\w]+", "_", text)
+    return re.sub(r"_+", "_", text).strip("_")
+
+
+def _clean_value(value: Any) -> str:
+    if value is None:
+        return ""
+    if isinstance(value, str):
+        return value.strip()
+    return str(value).strip()
+
+
+def _normalize_key(value: str) -> str:
+    return re.sub(r"\s+", " ", value.strip().lower())
+
+
+def content_key(values: dict[str, str]) -> str:
+    """The duplicate-detection key of an item's visible fields."""
+    return "|".join(_normalize_key(values.get(name) or "") for name in ITEM_FIELDS)
+
+
+def import_key(values: dict[str, str]) -> str:
+    return hashlib.sha256(content_key(values).encode("utf-8")).hexdigest()
+
+
+def _sheet_header(row: tuple[Any, ...]) -> _SheetHeader | None:
+    normalized = [_normalize_header(value) for value in row]
+    if not any(HEADER_ALIASES.get(header, "") for header in normalized if header):
+        return None
+    column_map: dict[int, str] = {}
+    columns: list[dict[str, str]] = []
+    seen: set[str] = set()
+    for col_idx, header in enumerate(normalized):
+        if not header:
+            continue
+        column_map[col_idx] = HEADER_ALIASES.get(header, header)
+        key = column_map[col_idx]
+        if key in seen:
+            key = f"{key}_{col_idx}"
+        seen.add(key)
+        columns.append({"key": key, "label": header.replace("_", " ").upper()})
+    return _SheetHeader(column_map=column_map, columns=columns)
+
+
+def row_values(row: tuple[Any, ...], column_map: dict[int, str]) -> dict[str, str] | None:
+    """Map one sheet row onto item fields; ``None`` for rows without content.
+
+    Columns that are not item fields are folded into the comment as
+    ``KEY: value`` lines.
+    """
+    if not any(value is not None and str(value).strip() for value in row):
+        return None
+    values = {column_map.get(idx, f"col_{idx}"): _clean_value(value) for idx, value in enumerate(row)}
+    item = {name: values.get(name) or "" for name in (*ITEM_FIELDS, "nr")}
+    extra_parts = [
+        f"{key.upper()}: {value}"
+        for key, value in values.items()
+        if key not in _KNOWN_COLUMNS and value
+    ]
+    if extra_parts:
+        extra_text = "\n".join(extra_parts)
+        item["comment"] = f"{item['comment']}\n{extra_text}".strip() if item["comment"] else extra_text
+    if not any(item[name] for name in ITEM_FIELDS):
+        return None
+    return item
+
+
+def iter_sheet_chunks(
+    source: Path | bytes,
+    *,
+    sheet_name: str | None = None,
+    chunk_size: int = 500,
+) -> Iterator[_SheetHeader | list[tuple[Any, ...]]]:
+    """Stream a sheet: its header first, then data rows in chunks.
+
+    The workbook is opened in read-only mode so rows are read from the file
+    as they are consumed instead of being loaded into memory up front.
+    """
+    workbook = openpyxl.load_workbook(
+        io.BytesIO(source) if isinstance(source, bytes) else source,
+        read_only=True,
+        data_only=True,
+    )
+    try:
+        if sheet_name and sheet_name not in workbook.sheetnames:
+            raise ChecklistImportError(f"Sheet not found: {sheet_name}")
+        worksheet = workbook[sheet_name] if sheet_name else workbook.active
+        rows = worksheet.iter_rows(values_only=True)
+        for row in rows:
+            header = _sheet_header(row)
+            if header is not None:
+                yield header
+                break
+        else:
+            raise ChecklistImportError("Could not find a header row with known columns.")
+        chunk: list[tuple[Any, ...]] = []
+        for row in rows:
+            chunk.append(row)
+            if len(chunk) >= chunk_size:
+                yield chunk
+                chunk = []
+        if chunk:
+            yield chunk
+    finally:
+        workbook.close()
+
+
+async def _stream_in_thread(
+    source: Path | bytes,
+    *,
+    sheet_name: str | None,
+    chunk_size: int,
+) -> tuple[asyncio.Queue, threading.Event, asyncio.Future]:
+    """Run ``iter_sheet_chunks`` on a worker thread feeding a bounded queue.
+
+    The thread blocks while the queue is full, so parsing never runs more than
+    ``_QUEUE_DEPTH`` chunks ahead of the database writes. The queue ends with
+    ``None`` or the reader's exception.
+    """
+    loop = asyncio.get_running_loop()
+    queue: asyncio.Queue = asyncio.Queue(maxsize=_QUEUE_DEPTH)
+    stop = threading.Event()
+
+    def put(item: Any) -> None:
+        future = asyncio.run_coroutine_threadsafe(queue.put(item), loop)
+        while True:
+            try:
+                future.result(timeout=0.5)
+                return
+            except concurrent.futures.TimeoutError:
+                if stop.is_set():
+                    future.cancel()
+                    raise _ReaderStopped from None
+
+    def read() -> None:
+        try:
+            for item in iter_sheet_chunks(source, sheet_name=sheet_name, chunk_size=chunk_size):
+                put(item)
+            put(None)
+        except _ReaderStopped:
+            return
+        except Exception as exc:  # handed to the consumer, which re-raises it
+            try:
+                put(exc)
+            except _ReaderStopped:
+                return
+
+    reader = loop.run_in_executor(None, read)
+    return queue, stop, reader
+
+
+async def _next_item(queue: asyncio.Queue) -> Any:
+    item = await queue.get()
+    if isinstance(item, Exception):
+        if isinstance(item, ChecklistImportError):
+            raise item
+        raise ChecklistImportError("The Excel file could not be read.") from item
+    return item
+
+
+async def _template_checklist(
+    db: AsyncSession,
+    *,
+    title: str,
+    group_key: str,
+    note: str | None,
+    position: int | None,
+    columns: list[dict[str, str]],
+) -> Checklist:
+    checklist = (
+        await db.execute(
+            select(Checklist).where(Checklist.group_key == group_key, Checklist.project_id.is_(None))
+        )
+    ).scalar_one_or_none()
+    if checklist is None:
+        checklist = Checklist(
+            id=uuid.uuid4(),
+            title=title,
+            group_key=group_key,
+            note=note,
+            position=position,
+            columns=columns,
+        )
+        db.add(checklist)
+    else:
+        if checklist.title != title:
+            checklist.title = title
+        if note is not None:
+            checklist.note = note
+        if position is not None:
+            checklist.position = position
+        if checklist.columns is None and columns:
+            checklist.columns = columns
+    await db.flush()
+    return checklist
+
+
+async def _existing_keys(db: AsyncSession, checklist_id: uuid.UUID) -> set[str]:
+    rows = (
+        await db.execute(
+            select(
+                ChecklistItem.import_key,
+                *(getattr(ChecklistItem, name) for name in ITEM_FIELDS),
+            ).where(ChecklistItem.checklist_id == checklist_id)
+        )
+    ).all()
+    keys: set[str] = set()
+    for row in rows:
+        if row[0]:
+            keys.add(row[0])
+        # Items created in the UI have no import key; match them by content.
+        keys.add(import_key({name: row[index + 1] or "" for index, name in enumerate(ITEM_FIELDS)}))
+    return keys
+
+
+async def _upsert_items(db: AsyncSession, rows: list[dict[str, Any]]) -> int:
+    if not rows:
+        return 0
+    stmt = (
+        pg_insert(ChecklistItem)
+        .values(rows)
+        .on_conflict_do_nothing(
+            index_elements=["checklist_id", "import_key"],
+            index_where=ChecklistItem.import_key.is_not(None),
+        )
+        .returning(ChecklistItem.id)
+    )
+    return len((await db.execute(stmt)).all())
+
+
+async def import_checklist_workbook(
+    db: AsyncSession,
+    source: Path | bytes,
+    *,
+    title: str,
+    group_key: str,
+    sheet_name: str | None = None,
+    note: str | None = None,
+    position: int | None = None,
+    chunk_size: int | None = None,
+    progress: ChecklistImportProgress | None = None,
+    on_progress: Callable[[ChecklistImportProgress], Awaitable[None]] | None = None,
+) -> ChecklistImportProgress:
+    """Import an Excel sheet into the ``group_key`` template checklist.
+
+    Rows are read on a worker thread and written one chunk per statement
+    with ``INSERT ... ON CONFLICT DO NOTHING``; each chunk is committed, so a
+    failed import can simply be run again. Rows matching an existing item
+    (by import key or visible content) are skipped.
+    """
+    progress = progress or ChecklistImportProgress(job_id=uuid.uuid4().hex)
+    progress.status = "RUNNING"
+    queue, stop, reader = await _stream_in_thread(
+        source,
+        sheet_name=sheet_name,
+        chunk_size=chunk_size or settings.CHECKLIST_IMPORT_CHUNK_SIZE,
+    )
+    try:
+        header: _SheetHeader = await _next_item(queue)
+        checklist = await _template_checklist(
+            db, title=title, group_key=group_key, note=note, position=position, columns=header.columns
+        )
+        checklist_id = checklist.id
+        progress.checklist_id = str(checklist_id)
+        seen = await _existing_keys(db, checklist_id)
+        await db.commit()
+
+        position_counter = 0
+        while (chunk := await _next_item(queue)) is not None:
+            rows: list[dict[str, Any]] = []
+            for row in chunk:
+                progress.rows_read += 1
+                values = row_values(row, header.column_map)
+                if values is None:
+                    continue
+                key = import_key(values)
+                if key in seen:
+                    progress.skipped += 1
+                    continue
+                seen.add(key)
+                nr_value = values["nr"]
+                rows.append(
+                    {
+                        "id": uuid.uuid4(),
+                        "checklist_id": checklist_id,
+                        "item_type": ChecklistItemType.CHECKBOX,
+                        "position": int(nr_value) - 1 if nr_value.isdigit() else position_counter,
+                        **{name: values[name] or None for name in ITEM_FIELDS},
+                        "is_checked": False,
+                        "import_key": key,
+                    }
+                )
+                position_counter += 1
+            inserted = await _upsert_items(db, rows)
+            await db.commit()
+            progress.inserted += inserted
+            progress.skipped += len(rows) - inserted
+            if on_progress is not None:
+                await on_progress(progress)
+    finally:
+        stop.set()
+        await reader
+    progress.status = "DONE"
+    return progress
+
+
+async def _publish(progress: ChecklistImportProgress) -> None:
+    _jobs[progress.job_id] = progress
+    while len(_jobs) > _LOCAL_JOB_LIMIT:
+        del _jobs[next(iter(_jobs))]
+    if not settings.REDIS_ENABLED:
+        return
+    try:
+        await get_redis().set(
+            f"{_JOB_KEY_PREFIX}:{progress.job_id}",
+            json.dumps(progress.to_dict()),
+            ex=_JOB_RETENTION_SECONDS,
+        )
+    except Exception:
+        logger.debug("Checklist import progress write failed", exc_info=True)
+
+
+async def get_import_progress(job_id: str) -> ChecklistImportProgress | None:
+    """Progress of an import job started by any API worker."""
+    if job_id in _jobs:
+        return _jobs[job_id]
+    if not settings.REDIS_ENABLED:
+        return None
+    try:
+        payload = await get_redis().get(f"{_JOB_KEY_PREFIX}:{job_id}")
+    except Exception:
+        logger.debug("Checklist import progress read failed", exc_info=True)
+        return None
+    return ChecklistImportProgress(**json.loads(payload)) if payload else None
+
+
+async def _run_import_job(progress: ChecklistImportProgress, content: bytes, **kwargs: Any) -> None:
+    try:
+        async with SessionLocal() as db:
+            await import_checklist_workbook(db, content, progress=progress, on_progress=_publish, **kwargs)
+    except ChecklistImportError as exc:
+        progress.status, progress.error = "FAILED", str(exc)
+    except Exception:
+        logger.exception("Checklist import job %s failed", progress.job_id)
+        progress.status, progress.error = "FAILED", "The import failed."
+    await _publish(progress)
+
+
+async def start_checklist_import(content: bytes, **kwargs: Any) -> ChecklistImportProgress:
+    """Start a background import of ``content`` and return its job progress."""
+    progress = ChecklistImportProgress(job_id=uuid.uuid4().hex)
+    await _publish(progress)
+    task = asyncio.create_task(_run_import_job(progress, content, **kwargs))
+    _running.add(task)
+    task.add_done_callback(_running.discard)
+    return progress
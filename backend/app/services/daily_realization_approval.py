@@ -1,7 +1,6 @@
 from __future__ import annotations
 
 import uuid
-from datetime import date
 
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -9,7 +8,6 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from app.models.realization import (
     RealizationDailyApprovalEvent,
     RealizationDailyCloseEvent,
-    RealizationPeriod,
 )
 
 
@@ -71,31 +69,3 @@ def approval_state_from_events(
         "source_close_event_id": str(approval.source_close_event_id) if approval and approval.source_close_event_id else None,
     }
 
-
-async def daily_approval_state(
-    db: AsyncSession,
-    *,
-    user_id: uuid.UUID,
-    day: date,
-    personal_close_status: str,
-) -> dict:
-    period = (await db.execute(
-        select(RealizationPeriod)
-        .where(
-            RealizationPeriod.period_type == "DAILY",
-            RealizationPeriod.start_date == day,
-            RealizationPeriod.end_date == day,
-            RealizationPeriod.department_id.is_not(None),
-        )
-        .join(RealizationDailyCloseEvent, RealizationDailyCloseEvent.period_id == RealizationPeriod.id)
-        .where(RealizationDailyCloseEvent.user_id == user_id)
-        .order_by(RealizationPeriod.created_at.desc())
-        .limit(1)
-    )).scalar_one_or_none()
-    if period is None:
-        return approval_state_from_events(None, None, personal_close_status=personal_close_status)
-    close_event = await latest_daily_close(db, period_id=period.id, user_id=user_id)
-    approval = await latest_daily_approval(db, period_id=period.id, user_id=user_id)
-    return approval_state_from_events(
-        approval, close_event, personal_close_status=personal_close_status
-    )
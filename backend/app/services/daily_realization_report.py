@@ -20,7 +20,7 @@ from app.models.task_daily_rlz_state import TaskDailyRlzState
 from app.models.user import User
 from app.services.daily_rlz_compliance import (
     REASON_LABELS,
-    build_daily_rlz_compliance,
+    build_daily_rlz_compliance_by_user,
     next_working_day,
 )
 
@@ -260,9 +260,10 @@ async def build_daily_realization_report(
     ))).scalars().all() if users else []
     state_map = {(row.user_id, row.task_id): row for row in state_rows}
 
+    compliance_by_user = await build_daily_rlz_compliance_by_user(db, user_ids=[user.id for user in users], day=day)
     people: list[dict[str, Any]] = []
     for user in users:
-        compliance = await build_daily_rlz_compliance(db, user_id=user.id, day=day)
+        compliance = compliance_by_user[user.id]
         evidence_by_id = {str(item["task_id"]): item for item in compliance.get("tasks") or []}
         raw_tasks = list(raw_tasks_by_user.get(user.id, []))
         raw_ids = {_identity(item) for item in raw_tasks}
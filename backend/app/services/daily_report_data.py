@@ -0,0 +1,179 @@
+from __future__ import annotations
+
+import uuid
+from dataclasses import dataclass, field
+from datetime import date, datetime, time, timedelta, timezone
+
+from sqlalchemy import Select, and_, func, literal_column, or_, select, union
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.enums import TaskStatus
+from app.models.project import Project
+from app.models.task import Task
+from app.models.task_assignee import TaskAssignee
+from app.models.user import User
+from app.services.daily_report_logic import (
+    completed_on_day,
+    planned_range_for_daily_report,
+    task_is_visible_to_user,
+    task_matches_department_scope,
+)
+
+
+# KO_USER_RE as a Postgres regex. Rendered as a literal rather than a bound
+# parameter so the planner matches the expression to ix_tasks_ko_user_id.
+KO_USER_ID_PATTERN = r"(?i)ko_user_id[:=]\s*([a-f0-9-]+)"
+ko_user_id_expr = func.lower(func.substring(Task.internal_notes, literal_column(f"'{KO_USER_ID_PATTERN}'")))
+
+
+@dataclass(slots=True)
+class DailyReportTasks:
+    """One user's regular (non-system) daily-report tasks for a day.
+
+    ``tasks_today`` and ``tasks_overdue`` keep due-date order. Projects and
+    assignees cover every candidate task, so callers do not query them again.
+    """
+
+    day: date
+    tasks_today: list[Task] = field(default_factory=list)
+    tasks_overdue: list[Task] = field(default_factory=list)
+    planned_range_by_task_id: dict[uuid.UUID, tuple[date, date]] = field(default_factory=dict)
+    project_by_id: dict[uuid.UUID, Project] = field(default_factory=dict)
+    assignees_by_task_id: dict[uuid.UUID, list[User]] = field(default_factory=dict)
+
+    @property
+    def tasks(self) -> list[Task]:
+        return self.tasks_today + self.tasks_overdue
+
+    @property
+    def task_ids(self) -> list[uuid.UUID]:
+        return [task.id for task in self.tasks]
+
+
+def daily_report_candidates_stmt(
+    *,
+    user_id: uuid.UUID,
+    day: date,
+    department_id: uuid.UUID | None = None,
+    include_cross_department_assigned: bool = True,
+    all_open: bool = False,
+) -> Select:
+    """Tasks that can appear on ``user_id``'s daily report for ``day``.
+
+    Candidates are found through the user's assignments (``tasks.assigned_to``,
+    ``task_assignees.user_id``, or a KO marker in internal notes) and limited
+    to tasks planned to start by ``day`` that are still open, due on or after
+    ``day``, or completed that day. The result is a superset; visibility and
+    planned ranges are still decided by ``daily_report_logic``.
+    """
+    assigned = union(
+        select(Task.id).where(Task.assigned_to == user_id),
+        select(TaskAssignee.task_id).where(TaskAssignee.user_id == user_id),
+        select(Task.id).where(ko_user_id_expr == str(user_id)),
+    ).subquery()
+    stmt = (
+        select(Task)
+        .where(Task.id.in_(select(assigned.c.id)))
+        .where(Task.is_active.is_(True))
+        .where(Task.system_template_origin_id.is_(None))
+        .where(Task.due_date.is_not(None))
+    )
+
+    is_open = and_(Task.completed_at.is_(None), Task.status.is_distinct_from(TaskStatus.DONE.value))
+    if all_open:
+        stmt = stmt.where(is_open)
+    else:
+        day_start = datetime.combine(day, time.min, tzinfo=timezone.utc)
+        day_end = day_start + timedelta(days=1)
+        completed_today = and_(Task.completed_at >= day_start, Task.completed_at < day_end)
+        stmt = stmt.where(or_(Task.due_date < day_end, Task.start_date < day_end, completed_today))
+        stmt = stmt.where(or_(Task.due_date >= day_start, is_open, completed_today))
+
+    if department_id is not None and not include_cross_department_assigned:
+        stmt = stmt.outerjoin(Project, Task.project_id == Project.id).where(
+            or_(Task.department_id == department_id, Project.department_id == department_id)
+        )
+    return stmt.order_by(Task.due_date, Task.created_at)
+
+
+async def load_daily_report_tasks(
+    db: AsyncSession,
+    *,
+    user_id: uuid.UUID,
+    day: date,
+    department_id: uuid.UUID | None,
+    dept_code: str | None,
+    include_cross_department_assigned: bool,
+    all_open: bool = False,
+) -> DailyReportTasks:
+    """Bucket ``user_id``'s tasks into today / overdue in three queries.
+
+    With ``all_open`` every open task the user can see lands in
+    ``tasks_today`` regardless of ``day``.
+    """
+    tasks = (
+        await db.execute(
+            daily_report_candidates_stmt(
+                user_id=user_id,
+                day=day,
+                department_id=department_id,
+                include_cross_department_assigned=include_cross_department_assigned,
+                all_open=all_open,
+            )
+        )
+    ).scalars().all()
+    result = DailyReportTasks(day=day)
+    if not tasks:
+        return result
+
+    task_ids = [task.id for task in tasks]
+    result.assignees_by_task_id = {task_id: [] for task_id in task_ids}
+    rows = (
+        await db.execute(
+            select(TaskAssignee.task_id, User)
+            .join(User, TaskAssignee.user_id == User.id)
+            .where(TaskAssignee.task_id.in_(task_ids))
+            .order_by(User.full_name)
+        )
+    ).all()
+    for task_id, assignee in rows:
+        result.assignees_by_task_id.setdefault(task_id, []).append(assignee)
+
+    project_ids = {task.project_id for task in tasks if task.project_id is not None}
+    if project_ids:
+        projects = (await db.execute(select(Project).where(Project.id.in_(project_ids)))).scalars().all()
+        result.project_by_id = {project.id: project for project in projects}
+
+    for task in tasks:
+        project = result.project_by_id.get(task.project_id) if task.project_id else None
+        if not task_matches_department_scope(
+            task,
+            project=project,
+            department_id=department_id,
+            include_cross_department_assigned=include_cross_department_assigned,
+        ):
+            continue
+        if not task_is_visible_to_user(
+            task,
+            user_id=user_id,
+            assignee_ids=[assignee.id for assignee in result.assignees_by_task_id.get(task.id, [])],
+            project=project,
+            dept_code=dept_code,
+        ):
+            continue
+
+        planned_start, planned_end = planned_range_for_daily_report(task, dept_code)
+        if planned_start is None or planned_end is None:
+            continue
+        result.planned_range_by_task_id[task.id] = (planned_start, planned_end)
+
+        is_done = task.completed_at is not None or task.status == TaskStatus.DONE
+        if all_open:
+            if not is_done:
+                result.tasks_today.append(task)
+            continue
+        if completed_on_day(task.completed_at, day) or planned_start <= day <= planned_end:
+            result.tasks_today.append(task)
+        elif planned_end < day and not is_done:
+            result.tasks_overdue.append(task)
+    return result
@@ -1,13 +1,14 @@
 from __future__ import annotations
 
 import uuid
+from collections import defaultdict
 from datetime import date, datetime, time, timedelta
 from zoneinfo import ZoneInfo
 
-from sqlalchemy import Date as SQLDate, cast, func, or_, select
+from sqlalchemy import Date as SQLDate, cast, func, or_, select, union
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.models.realization import RealizationDailyCloseEvent, RealizationPeriod
+from app.models.realization import RealizationDailyApprovalEvent, RealizationDailyCloseEvent, RealizationPeriod
 from app.models.task import Task
 from app.models.system_task_template import SystemTaskTemplate
 from app.models.task_assignee import TaskAssignee
@@ -18,7 +19,7 @@ from app.models.user import User
 from app.models.department import Department
 from app.models.enums import UserRole
 from app.services.one_h_slots import effective_slot_date
-from app.services.daily_realization_approval import daily_approval_state
+from app.services.daily_realization_approval import approval_state_from_events
 
 TIMEZONE_NAME = "Europe/Tirane"
 EDIT_CUTOFF = time(17, 0)
@@ -95,12 +96,16 @@ ISSUE_MESSAGES = {
 }
 
 
-async def relevant_tasks(db: AsyncSession, *, user_id: uuid.UUID, day: date) -> list[Task]:
+def _relevant_tasks_statement(*, user_ids: list[uuid.UUID], day: date):
     # Mirrors the regular-task membership used by Daily Report: assigned active tasks
     # with a due date that are current/overdue for the selected workday.
-    rows = (await db.execute(
-        select(Task)
-        .outerjoin(TaskAssignee, TaskAssignee.task_id == Task.id)
+    members = union(
+        select(Task.id.label("task_id"), Task.assigned_to.label("user_id")).where(Task.assigned_to.in_(user_ids)),
+        select(TaskAssignee.task_id, TaskAssignee.user_id).where(TaskAssignee.user_id.in_(user_ids)),
+    ).subquery("rlz_members")
+    return (
+        select(Task, members.c.user_id)
+        .join(members, members.c.task_id == Task.id)
         .outerjoin(SystemTaskTemplate, Task.system_template_origin_id == SystemTaskTemplate.id)
         .where(
             Task.is_active.is_(True), Task.due_date.is_not(None),
@@ -120,27 +125,95 @@ async def relevant_tasks(db: AsyncSession, *, user_id: uuid.UUID, day: date) ->
                     SQLDate,
                 ) == day,
             ),
-            or_(Task.assigned_to == user_id, TaskAssignee.user_id == user_id),
             func.date(func.coalesce(Task.start_date, Task.due_date)) <= day,
-        ).distinct().order_by(Task.due_date, Task.created_at)
-    )).scalars().all()
-    return list(rows)
+        ).order_by(Task.due_date, Task.created_at, Task.id)
+    )
 
 
-async def build_daily_rlz_compliance(db: AsyncSession, *, user_id: uuid.UUID, day: date,
-                                     now: datetime | None = None) -> dict:
-    tasks = await relevant_tasks(db, user_id=user_id, day=day)
-    task_ids = [task.id for task in tasks]
+async def relevant_tasks_by_user(db: AsyncSession, *, user_ids: list[uuid.UUID],
+                                 day: date) -> dict[uuid.UUID, list[Task]]:
+    tasks_by_user: dict[uuid.UUID, list[Task]] = {user_id: [] for user_id in user_ids}
+    if not user_ids:
+        return tasks_by_user
+    rows = (await db.execute(_relevant_tasks_statement(user_ids=user_ids, day=day))).all()
+    for task, user_id in rows:
+        tasks_by_user[user_id].append(task)
+    return tasks_by_user
+
+
+async def relevant_tasks(db: AsyncSession, *, user_id: uuid.UUID, day: date) -> list[Task]:
+    return (await relevant_tasks_by_user(db, user_ids=[user_id], day=day))[user_id]
+
+
+def _latest(events):
+    return max(events, key=lambda event: (event.created_at, event.id), default=None)
+
+
+async def _daily_close_and_approvals(db: AsyncSession, *, user_ids: list[uuid.UUID], day: date) -> dict:
+    """Latest personal close plus the approval inputs for each user, in two queries.
+
+    The personal close state reads the latest close event of any DAILY period
+    starting on ``day``. Manager approval uses the newest department-scoped
+    single-day period the user closed in, and that period's latest close and
+    approval events, as ``approval_state_from_events`` expects.
+    """
+    rows = (await db.execute(
+        select(RealizationDailyCloseEvent, RealizationPeriod)
+        .join(RealizationPeriod, RealizationPeriod.id == RealizationDailyCloseEvent.period_id)
+        .where(
+            RealizationDailyCloseEvent.user_id.in_(user_ids),
+            RealizationPeriod.period_type == "DAILY",
+            RealizationPeriod.start_date == day,
+        )
+    )).all()
+    closes_by_user: dict[uuid.UUID, list] = defaultdict(list)
+    approval_period: dict[uuid.UUID, RealizationPeriod] = {}
+    for close_event, period in rows:
+        closes_by_user[close_event.user_id].append((close_event, period))
+        if period.end_date == day and period.department_id is not None:
+            current = approval_period.get(close_event.user_id)
+            if current is None or period.created_at > current.created_at:
+                approval_period[close_event.user_id] = period
+    approvals_by_key: dict[tuple, list] = defaultdict(list)
+    if approval_period:
+        for approval in (await db.execute(
+            select(RealizationDailyApprovalEvent).where(
+                RealizationDailyApprovalEvent.period_id.in_({period.id for period in approval_period.values()}),
+                RealizationDailyApprovalEvent.user_id.in_(list(approval_period)),
+            )
+        )).scalars().all():
+            approvals_by_key[(approval.period_id, approval.user_id)].append(approval)
+    result = {}
+    for user_id in user_ids:
+        closes = closes_by_user.get(user_id, [])
+        period = approval_period.get(user_id)
+        result[user_id] = {
+            "latest_close": _latest(event for event, _ in closes),
+            "approval_close": _latest(event for event, row in closes if row is period) if period else None,
+            "approval": _latest(approvals_by_key.get((period.id, user_id), [])) if period else None,
+        }
+    return result
+
+
+async def build_daily_rlz_compliance_by_user(db: AsyncSession, *, user_ids: list[uuid.UUID], day: date,
+                                             now: datetime | None = None) -> dict[uuid.UUID, dict]:
+    """Daily RLZ compliance for many users from a fixed number of grouped queries."""
+    user_ids = list(dict.fromkeys(user_ids))
+    if not user_ids:
+        return {}
+    tasks_by_user = await relevant_tasks_by_user(db, user_ids=user_ids, day=day)
+    task_ids = list({task.id for tasks in tasks_by_user.values() for task in tasks})
     states = {}
-    slots = {}
     comments = {}
+    slots = {}
+    slot_changed = {}
     if task_ids:
-        states = {row.task_id: row for row in (await db.execute(select(TaskDailyRlzState).where(
-            TaskDailyRlzState.user_id == user_id, TaskDailyRlzState.day_date == day,
+        states = {(row.user_id, row.task_id): row for row in (await db.execute(select(TaskDailyRlzState).where(
+            TaskDailyRlzState.user_id.in_(user_ids), TaskDailyRlzState.day_date == day,
             TaskDailyRlzState.task_id.in_(task_ids),
         ))).scalars().all()}
-        comments = {row.task_id: row for row in (await db.execute(select(TaskUserComment).where(
-            TaskUserComment.user_id == user_id, TaskUserComment.task_id.in_(task_ids),
+        comments = {(row.user_id, row.task_id): row for row in (await db.execute(select(TaskUserComment).where(
+            TaskUserComment.user_id.in_(user_ids), TaskUserComment.task_id.in_(task_ids),
         ))).scalars().all()}
         slot_rows = (await db.execute(select(
             TaskOneHReportSlot.task_id, TaskOneHReportSlot.one_h_report_slot, TaskOneHReportSlot.updated_at
@@ -150,15 +223,29 @@ async def build_daily_rlz_compliance(db: AsyncSession, *, user_id: uuid.UUID, da
         ))).all()
         slots = {task_id: slot for task_id, slot, _ in slot_rows}
         slot_changed = {task_id: updated_at for task_id, _, updated_at in slot_rows}
-    else:
-        slot_changed = {}
+    events = await _daily_close_and_approvals(db, user_ids=user_ids, day=day)
+    return {
+        user_id: _evaluate_compliance(
+            user_id=user_id, day=day, now=now, tasks=tasks_by_user[user_id],
+            states=states, comments=comments, slots=slots, slot_changed=slot_changed,
+            **events[user_id],
+        )
+        for user_id in user_ids
+    }
+
+
+def _evaluate_compliance(*, user_id: uuid.UUID, day: date, now: datetime | None, tasks: list[Task],
+                         states: dict, comments: dict, slots: dict, slot_changed: dict,
+                         latest_close: RealizationDailyCloseEvent | None,
+                         approval_close: RealizationDailyCloseEvent | None,
+                         approval: RealizationDailyApprovalEvent | None) -> dict:
     evidence = []
     blockers = []
     latest_change: datetime | None = None
     minimum_due = next_working_day(day)
     for task in tasks:
-        state = states.get(task.id)
-        task_comment = comments.get(task.id)
+        state = states.get((user_id, task.id))
+        task_comment = comments.get((user_id, task.id))
         status = "DONE" if task.completed_at else str(getattr(task.status, "value", task.status))
         due = task.due_date.date() if task.due_date else None
         slot = slots.get(task.id) or task.one_h_report_slot
@@ -189,17 +276,11 @@ async def build_daily_rlz_compliance(db: AsyncSession, *, user_id: uuid.UUID, da
                         task_comment.updated_at if task_comment else None, slot_changed.get(task.id)):
             if changed and (latest_change is None or changed > latest_change):
                 latest_change = changed
-    latest_close = (await db.execute(
-        select(RealizationDailyCloseEvent).join(RealizationPeriod, RealizationPeriod.id == RealizationDailyCloseEvent.period_id).where(
-            RealizationDailyCloseEvent.user_id == user_id, RealizationPeriod.period_type == "DAILY",
-            RealizationPeriod.start_date == day,
-        ).order_by(RealizationDailyCloseEvent.created_at.desc(), RealizationDailyCloseEvent.id.desc()).limit(1)
-    )).scalar_one_or_none()
     saved = bool(latest_close and latest_close.action in {"CLOSE", "CORRECT"})
     stale = bool(saved and latest_change and latest_close and latest_change > latest_close.created_at)
     close_status = "STALE" if stale else "SAVED" if saved else "CLOSED_EDIT_WINDOW" if not is_editable_day(day, now) else "NOT_SAVED"
-    manager_approval = await daily_approval_state(
-        db, user_id=user_id, day=day, personal_close_status=close_status
+    manager_approval = approval_state_from_events(
+        approval, approval_close, personal_close_status=close_status
     )
     return {
         "day": day.isoformat(), "user_id": str(user_id), "tasks": evidence, "blockers": blockers,
@@ -214,6 +295,11 @@ async def build_daily_rlz_compliance(db: AsyncSession, *, user_id: uuid.UUID, da
     }
 
 
+async def build_daily_rlz_compliance(db: AsyncSession, *, user_id: uuid.UUID, day: date,
+                                     now: datetime | None = None) -> dict:
+    return (await build_daily_rlz_compliance_by_user(db, user_ids=[user_id], day=day, now=now))[user_id]
+
+
 async def build_daily_rlz_control(db: AsyncSession, *, day: date, department_id: uuid.UUID | None = None,
                                   user_id: uuid.UUID | None = None) -> dict:
     stmt = select(User).where(User.is_active.is_(True), User.department_id.is_not(None), User.role == UserRole.STAFF)
@@ -230,8 +316,9 @@ async def build_daily_rlz_control(db: AsyncSession, *, day: date, department_id:
                          "employees_approval_pending": 0, "employees_approval_stale": 0,
                          "tasks_missing_reason": 0, "tasks_missing_comment": 0,
                          "tasks_deadline_not_moved": 0, "tasks_missing_slot": 0}
+    reports = await build_daily_rlz_compliance_by_user(db, user_ids=[subject.id for subject in users], day=day)
     for subject in users:
-        report = await build_daily_rlz_compliance(db, user_id=subject.id, day=day)
+        report = reports[subject.id]
         totals["employees_checked"] += 1
         state = report["rlz_close_state"]["status"]
         if state in {"NOT_SAVED", "CLOSED_EDIT_WINDOW"}: totals["employees_not_saved"] += 1
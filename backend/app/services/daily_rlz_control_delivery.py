@@ -397,7 +397,9 @@ async def deliver_daily_rlz_control(
                 await db.commit()
                 return run
             if send:
-                message = await gmail.send_verified(subject, recipients_by_kind, body, html_body)
+                message = await gmail.send_verified(
+                    subject, recipients_by_kind, body, html_body, source=REPORT_TYPE, source_id=run.id,
+                )
                 run.status = "SENT"
                 run.gmail_message_id, run.gmail_thread_id = message.get("id"), message.get("threadId")
             else:
@@ -58,6 +58,23 @@ class WorkbookAnalysis:
         payload["has_missing_headers"] = any(sheet.missing_headers for sheet in self.sheets)
         return payload
 
+    @classmethod
+    def from_dict(cls, payload: dict[str, Any]) -> WorkbookAnalysis:
+        return cls(
+            filename=payload["filename"],
+            suggested_description=payload["suggested_description"],
+            sheets=[
+                SheetAnalysis(
+                    **{
+                        **sheet,
+                        "missing_headers": [MissingHeader(**item) for item in sheet["missing_headers"]],
+                    }
+                )
+                for sheet in payload["sheets"]
+            ],
+            empty_sheets=list(payload["empty_sheets"]),
+        )
+
 
 class ExcelStandardizationError(ValueError):
     pass
@@ -285,7 +302,10 @@ def _sanitize_description(value: str) -> str:
 
 
 def analyze_workbook(content: bytes, filename: str) -> WorkbookAnalysis:
-    workbook = _load_workbook(content, filename)
+    return _analyze_loaded_workbook(_load_workbook(content, filename), filename)
+
+
+def _analyze_loaded_workbook(workbook, filename: str) -> WorkbookAnalysis:
     sheets: list[SheetAnalysis] = []
     empty_sheets: list[str] = []
     for worksheet in workbook.worksheets:
@@ -446,11 +466,19 @@ def standardize_workbook(
     missing_headers: dict[str, dict[str, str]] | None = None,
     description: str | None = None,
     generated_at: datetime | None = None,
+    analysis: WorkbookAnalysis | None = None,
 ) -> tuple[bytes, str, dict[str, Any]]:
+    """Build the standardized workbook and its correction report.
+
+    ``analysis`` is the earlier ``analyze_workbook`` result for the same
+    content; without it the source workbook is analyzed as it is loaded.
+    """
     clean_initials = re.sub(r"[^0-9A-Za-zÀ-ž]", "", initials).upper()[:10]
     if not clean_initials:
         raise ExcelStandardizationError("Inicialet janë të detyrueshme për skedarin aktual.")
-    analysis = analyze_workbook(content, filename)
+    source_workbook = _load_workbook(content, filename)
+    if analysis is None:
+        analysis = _analyze_loaded_workbook(source_workbook, filename)
     missing_headers = missing_headers or {}
     for sheet in analysis.sheets:
         provided = missing_headers.get(sheet.name, {})
@@ -458,7 +486,6 @@ def standardize_workbook(
         if unresolved:
             raise ExcelStandardizationError(f"Plotëso header-at që mungojnë në {sheet.name}: {', '.join(unresolved)}.")
 
-    source_workbook = _load_workbook(content, filename)
     target_workbook = Workbook()
     target_workbook.remove(target_workbook.active)
     now = generated_at.astimezone(KOSOVO_TIMEZONE) if generated_at else datetime.now(KOSOVO_TIMEZONE)
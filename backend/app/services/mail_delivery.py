@@ -0,0 +1,297 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import queue
+import smtplib
+import ssl
+import threading
+import time
+import uuid
+from email.message import EmailMessage
+from typing import Callable
+
+from sqlalchemy import func, update
+
+from app.config import settings
+from app.db import SessionLocal
+from app.models.outbound_email import OutboundEmail
+
+
+logger = logging.getLogger(__name__)
+
+# Seconds to wait before the 2nd, 3rd and 4th attempt of a transient failure.
+RETRY_DELAYS = (2.0, 10.0, 30.0)
+# A connection idle for longer than this is probed with NOOP before reuse.
+NOOP_AFTER_SECONDS = 30.0
+
+
+def is_transient(exc: BaseException) -> bool:
+    """Connection drops and 4xx replies are worth retrying; auth and 5xx rejections are not.
+
+    A connection lost after the server started taking the message body is not
+    retried: the message may already have been accepted, and sending it again
+    would deliver it twice.
+    """
+    if isinstance(exc, smtplib.SMTPRecipientsRefused):
+        return False
+    if isinstance(exc, smtplib.SMTPResponseException):
+        return 400 <= exc.smtp_code < 500
+    if getattr(exc, "smtp_after_data", False):
+        return False
+    return isinstance(exc, (smtplib.SMTPServerDisconnected, smtplib.SMTPConnectError, OSError))
+
+
+class _SMTP(smtplib.SMTP):
+    """``smtplib.SMTP`` that remembers whether the DATA phase was entered."""
+
+    in_data = False
+
+    def getreply(self):
+        code, reply = super().getreply()
+        if code == 354:
+            self.in_data = True
+        return code, reply
+
+
+class SmtpConnection:
+    """One authenticated SMTP session that is kept open between messages."""
+
+    def __init__(self, host: str, port: int, user: str, password: str, *, timeout: float = 30) -> None:
+        self.host, self.port, self.user, self.password = host, port, user, password
+        self.timeout = timeout
+        self.smtp: smtplib.SMTP | None = None
+        self.last_used = 0.0
+
+    def _open(self) -> smtplib.SMTP:
+        smtp = _SMTP(self.host, self.port, timeout=self.timeout)
+        try:
+            smtp.ehlo()
+            smtp.starttls(context=ssl.create_default_context())
+            smtp.ehlo()
+            smtp.login(self.user, self.password)
+        except BaseException:
+            _quietly_close(smtp)
+            raise
+        return smtp
+
+    def _usable(self, idle_seconds: float) -> bool:
+        if self.smtp is None:
+            return False
+        idle = time.monotonic() - self.last_used
+        if idle > idle_seconds:
+            return False
+        if idle > NOOP_AFTER_SECONDS:
+            try:
+                return self.smtp.noop()[0] == 250
+            except (smtplib.SMTPException, OSError):
+                return False
+        return True
+
+    def send(self, message: EmailMessage, to_addrs: list[str], *, idle_seconds: float) -> bool:
+        """Send over the open session, reconnecting first if needed. Returns True if it connected."""
+        connected = False
+        if not self._usable(idle_seconds):
+            self.close()
+            self.smtp = self._open()
+            connected = True
+        self.smtp.in_data = False
+        try:
+            self.smtp.send_message(message, from_addr=self.user, to_addrs=to_addrs)
+        except BaseException as exc:
+            exc.smtp_after_data = self.smtp.in_data
+            # The session state after a failed DATA phase is unknown; start clean next time.
+            self.close()
+            raise
+        self.last_used = time.monotonic()
+        return connected
+
+    def close(self) -> None:
+        smtp, self.smtp = self.smtp, None
+        if smtp is not None:
+            _quietly_close(smtp)
+
+
+def _quietly_close(smtp: smtplib.SMTP) -> None:
+    try:
+        smtp.quit()
+    except Exception:
+        try:
+            smtp.close()
+        except Exception:
+            pass
+
+
+class SmtpPool:
+    """A bounded set of reusable SMTP sessions for one account.
+
+    ``send`` blocks and is meant to run in a worker thread. Up to ``size``
+    messages are in flight at once, each on its own authenticated session, so
+    concurrent report runs no longer wait on serial TLS handshakes.
+    """
+
+    def __init__(
+        self,
+        host: str,
+        port: int,
+        user: str,
+        password: str,
+        *,
+        size: int = 2,
+        idle_seconds: float = 240,
+        retry_delays: tuple[float, ...] = RETRY_DELAYS,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        self.host, self.port, self.user, self.password = host, port, user, password
+        self.idle_seconds = idle_seconds
+        self.retry_delays = retry_delays
+        self.sleep = sleep
+        self.connects = 0
+        self._slots = threading.BoundedSemaphore(max(1, size))
+        self._idle: queue.LifoQueue[SmtpConnection] = queue.LifoQueue()
+
+    def _checkout(self) -> SmtpConnection:
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            return SmtpConnection(self.host, self.port, self.user, self.password)
+
+    def send(self, message: EmailMessage, to_addrs: list[str]) -> int:
+        """Deliver ``message`` with retry and backoff; returns the number of attempts used.
+
+        The exception of the last attempt is re-raised with ``smtp_attempts`` set.
+        A session slot is only held while sending, not while backing off.
+        """
+        attempt = 0
+        while True:
+            attempt += 1
+            try:
+                self._send_once(message, to_addrs)
+                return attempt
+            except Exception as exc:
+                if not is_transient(exc) or attempt > len(self.retry_delays):
+                    exc.smtp_attempts = attempt
+                    raise
+                logger.warning(
+                    "SMTP send attempt %s for %s failed (%s); retrying",
+                    attempt, message.get("Message-ID"), type(exc).__name__,
+                )
+            self.sleep(self.retry_delays[attempt - 1])
+
+    def _send_once(self, message: EmailMessage, to_addrs: list[str]) -> None:
+        with self._slots:
+            connection = self._checkout()
+            try:
+                if connection.send(message, to_addrs, idle_seconds=self.idle_seconds):
+                    self.connects += 1
+            finally:
+                self._idle.put(connection)
+
+    def close(self) -> None:
+        while True:
+            try:
+                self._idle.get_nowait().close()
+            except queue.Empty:
+                return
+
+
+_pools: dict[tuple[str, int, str], SmtpPool] = {}
+_pools_lock = threading.Lock()
+
+
+def smtp_pool(host: str, port: int, user: str, password: str) -> SmtpPool:
+    key = (host, port, user)
+    with _pools_lock:
+        pool = _pools.get(key)
+        if pool is None or pool.password != password:
+            if pool is not None:
+                pool.close()
+            pool = SmtpPool(
+                host,
+                port,
+                user,
+                password,
+                size=settings.EMAIL_SMTP_POOL_SIZE,
+                idle_seconds=settings.EMAIL_SMTP_IDLE_SECONDS,
+            )
+            _pools[key] = pool
+        return pool
+
+
+def close_pools() -> None:
+    with _pools_lock:
+        pools = list(_pools.values())
+        _pools.clear()
+    for pool in pools:
+        pool.close()
+
+
+async def _queue_outbound(message: EmailMessage, recipients: dict[str, list[str]], *, source, source_id) -> uuid.UUID | None:
+    try:
+        async with SessionLocal() as db:
+            row = OutboundEmail(
+                message_id=str(message["Message-ID"]).strip("<>"),
+                source=source,
+                source_id=source_id,
+                subject=str(message["Subject"] or "")[:500],
+                recipients=recipients,
+                size_bytes=len(message.as_bytes()),
+                status="QUEUED",
+            )
+            db.add(row)
+            await db.commit()
+            return row.id
+    except Exception:
+        logger.warning("Could not queue outbound email %s", message.get("Message-ID"), exc_info=True)
+        return None
+
+
+async def _finish_outbound(outbound_id: uuid.UUID | None, *, status: str, attempts: int, error: str | None = None) -> None:
+    if outbound_id is None:
+        return
+    try:
+        async with SessionLocal() as db:
+            await db.execute(
+                update(OutboundEmail)
+                .where(OutboundEmail.id == outbound_id)
+                .values(
+                    status=status,
+                    attempt_count=attempts,
+                    last_error=error,
+                    sent_at=func.now() if status == "SENT" else None,
+                )
+            )
+            await db.commit()
+    except Exception:
+        logger.warning("Could not update outbound email %s", outbound_id, exc_info=True)
+
+
+async def deliver(
+    message: EmailMessage,
+    recipients: dict[str, list[str]],
+    *,
+    pool: SmtpPool,
+    source: str | None = None,
+    source_id: uuid.UUID | None = None,
+) -> int:
+    """Queue ``message`` in ``outbound_emails`` and send it through ``pool``.
+
+    Outbox bookkeeping is best effort: a database problem never blocks a
+    report that is ready to go out. Returns the number of SMTP attempts;
+    delivery errors propagate so callers keep recording them on their own
+    delivery runs.
+    """
+    to_addrs = sum(recipients.values(), [])
+    outbound_id = await _queue_outbound(message, recipients, source=source, source_id=source_id)
+    try:
+        attempts = await asyncio.to_thread(pool.send, message, to_addrs)
+    except Exception as exc:
+        await _finish_outbound(
+            outbound_id,
+            status="FAILED",
+            attempts=getattr(exc, "smtp_attempts", 1),
+            error=f"{type(exc).__name__}: {exc}"[:2000],
+        )
+        raise
+    await _finish_outbound(outbound_id, status="SENT", attempts=attempts)
+    return attempts
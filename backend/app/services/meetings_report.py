@@ -28,6 +28,7 @@ from app.services.primeflow_report import GmailService, report_timezone
 from app.services.primeflow_report import PrimeFlowClient
 from app.services.std_feedback_tickets import std_tickets_report_section
 from app.services.system_task_schedule import matches_template_date
+from app.services.task_read_model import defer_task_text
 
 REPORT_TYPE = "meetings_report"
 SECTION_TITLES = [
@@ -839,6 +840,7 @@ async def build_meetings_report_sections(db: AsyncSession, report_day: date) ->
 
     task_stmt = (
         select(Task)
+        .options(*defer_task_text())
         .where(Task.is_active.is_(True))
         .where(
             or_(
@@ -3177,7 +3179,9 @@ async def send_section_report(
 ) -> dict[str, Any]:
     gmail = GmailService()
     attachments = section_report_attachments(subject, report_code, report_day, sections, tomorrow=tomorrow)
-    return await gmail.send_verified(subject, recipients, plain_text, html_body, attachments=attachments)
+    return await gmail.send_verified(
+        subject, recipients, plain_text, html_body, attachments=attachments, source=f"meetings_{report_code.lower()}",
+    )
 
 
 async def send_meetings_report(
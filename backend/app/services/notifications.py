@@ -2,16 +2,19 @@ from __future__ import annotations
 
 import asyncio
 import json
+import logging
 import uuid
 from datetime import datetime, timezone
+from typing import Iterable
 
-from app.integrations.redis import get_redis_sync
+from app.integrations.redis import redis_pipeline
 from app.config import settings
 from app.models.enums import NotificationType
 from app.models.notification import Notification
 
 
 CHANNEL = "primex_notifications"
+logger = logging.getLogger(__name__)
 NOTIFICATION_TITLE_MAX_LEN = 300
 NOTIFICATION_BODY_MAX_LEN = 4000
 
@@ -71,9 +74,88 @@ def notification_to_payload(notification: Notification) -> dict:
     }
 
 
-async def publish_notification(*, user_id: uuid.UUID, notification: Notification) -> None:
+# Keys in Notification.data that name the entity a notification is about.
+_ENTITY_KEYS = ("task_id", "common_entry_id", "request_id", "ga_note_id")
+
+
+def notification_coalesce_key(user_id: uuid.UUID, notification: Notification) -> tuple:
+    """Events for the same user, type and entity replace each other while queued."""
+    data = notification.data if isinstance(notification.data, dict) else {}
+    entity = next((str(data[key]) for key in _ENTITY_KEYS if data.get(key)), None)
+    if entity is None:
+        return (str(user_id), str(notification.id))
+    return (str(user_id), notification.type.value, entity)
+
+
+class NotificationDispatcher:
+    """Publishes queued notifications to Redis in debounced, pipelined batches.
+
+    Callers enqueue notifications once their transaction has committed. The
+    first enqueue opens a ``NOTIFICATION_DEBOUNCE_MS`` window; everything
+    queued in that window is sent in one pipeline round trip, and a newer
+    event for the same user and entity replaces the queued one.
+    """
+
+    def __init__(self, *, debounce_seconds: float) -> None:
+        self.debounce_seconds = debounce_seconds
+        self._pending: dict[tuple, str] = {}
+        self._flush_task: asyncio.Task | None = None
+
+    def enqueue(self, user_id: uuid.UUID, notification: Notification) -> None:
+        key = notification_coalesce_key(user_id, notification)
+        self._pending.pop(key, None)
+        self._pending[key] = json.dumps(
+            {"user_id": str(user_id), "notification": {"type": "notification", **notification_to_payload(notification)}}
+        )
+
+    async def dispatch(self) -> None:
+        if not self._pending:
+            return
+        if self.debounce_seconds <= 0:
+            await self.flush()
+            return
+        task = self._flush_task
+        if task is None or task.done() or task.get_loop() is not asyncio.get_running_loop():
+            self._flush_task = asyncio.create_task(self._flush_later())
+
+    async def _flush_later(self) -> None:
+        # Notifications enqueued while a batch is being sent find this task
+        # still running, so keep flushing until nothing is left.
+        while self._pending:
+            await asyncio.sleep(self.debounce_seconds)
+            await self.flush()
+
+    async def flush(self) -> None:
+        pending, self._pending = self._pending, {}
+        if not pending:
+            return
+        try:
+            async with redis_pipeline() as pipe:
+                for payload in pending.values():
+                    pipe.publish(CHANNEL, payload)
+                await pipe.execute()
+        except Exception:
+            logger.exception("Failed to publish %d notification(s)", len(pending))
+
+    async def aclose(self) -> None:
+        if self._flush_task is not None and not self._flush_task.done():
+            self._flush_task.cancel()
+            try:
+                await self._flush_task
+            except asyncio.CancelledError:
+                pass
+        self._flush_task = None
+        await self.flush()
+
+
+notification_dispatcher = NotificationDispatcher(debounce_seconds=settings.NOTIFICATION_DEBOUNCE_MS / 1000)
+
+
+async def publish_notifications(notifications: Iterable[Notification]) -> None:
+    """Queue committed notifications for delivery; never raises."""
     if not settings.REDIS_ENABLED:
         return
-    client = get_redis_sync()
-    payload = json.dumps({"user_id": str(user_id), "notification": {"type": "notification", **notification_to_payload(notification)}})
-    await asyncio.to_thread(client.publish, CHANNEL, payload)
+    for notification in notifications:
+        notification_dispatcher.enqueue(notification.user_id, notification)
+    await notification_dispatcher.dispatch()
+
@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+import uuid
+from collections.abc import Callable, Iterator
+from dataclasses import dataclass
+from datetime import date
+from typing import TYPE_CHECKING, Any
+
+
+if TYPE_CHECKING:
+    from app.models.system_task_template import SystemTaskTemplate
+    from app.models.task import Task
+
+
+OCCURRENCE_PROJECT = "project"
+OCCURRENCE_FAST = "fast"
+OCCURRENCE_SYSTEM = "system"
+
+
+def planner_slots(finish_period: str | None) -> tuple[str, ...]:
+    """Weekly-planner slots for a finish period; anything but AM/PM fills both."""
+    value = str(finish_period).strip().upper() if finish_period else ""
+    if value == "PM":
+        return ("PM",)
+    if value == "AM":
+        return ("AM",)
+    return ("AM", "PM")
+
+
+@dataclass(frozen=True, slots=True)
+class PlannerOccurrence:
+    """One weekly-planner cell item: a task in a user's day slot.
+
+    ``kind`` is ``project``, ``fast`` or ``system``. A project item without
+    ``task`` is a project shown to its member on a day with no tasks.
+    """
+
+    department_id: uuid.UUID
+    department_name: str
+    user_id: uuid.UUID
+    user_name: str
+    day: date
+    slot: str
+    kind: str
+    task: Task | None
+    project_id: uuid.UUID | None = None
+    project_title: str | None = None
+    finish_period: str | None = None
+    template: SystemTaskTemplate | None = None
+
+    @property
+    def task_id(self) -> uuid.UUID | None:
+        return self.task.id if self.task is not None else None
+
+
+@dataclass(frozen=True, slots=True)
+class WeeklyPlannerWeek:
+    """A loaded weekly-planner week.
+
+    ``occurrences()`` yields the flat items department by department, day by
+    day and user by user; ``table()`` groups them into the weekly-table
+    response. Both work from the same in-memory state, so neither queries.
+    """
+
+    week_start: date
+    week_end: date
+    saved_plan_id: uuid.UUID | None
+    occurrences: Callable[[], Iterator[PlannerOccurrence]]
+    table: Callable[[], Any]
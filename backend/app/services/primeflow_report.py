@@ -7,12 +7,12 @@ import json
 import logging
 import os
 import re
-import smtplib
-import ssl
+import uuid
 import html
 import io
 from dataclasses import dataclass
 from datetime import date, datetime, time, timedelta
+from time import monotonic
 from email.message import EmailMessage
 from email.utils import make_msgid
 from typing import Any, Awaitable, Callable
@@ -22,6 +22,7 @@ import httpx
 from pydantic import BaseModel, Field
 
 from app.config import settings
+from app.services.mail_delivery import deliver, smtp_pool
 
 logger = logging.getLogger(__name__)
 REPORT_TYPE = "primeflow_1h"
@@ -1026,6 +1027,18 @@ async def retry(operation: Callable[[], Awaitable[Any]], *, delays: tuple[float,
     raise last
 
 
+# Raw Common View bodies by (API base URL, week start). A backfill and the
+# fresh delivery of an execute_chain, or report slots running side by side,
+# read the same weeks within seconds; each consumer parses its own copy.
+COMMON_VIEW_CACHE_SECONDS = 30.0
+_common_view_cache: dict[tuple[str, date], tuple[float, bytes]] = {}
+_common_view_inflight: dict[tuple[int, str, date], asyncio.Future] = {}
+
+
+def _week_monday(day: date) -> date:
+    return day - timedelta(days=day.weekday())
+
+
 @dataclass
 class PrimeFlowClient:
     base_url: str
@@ -1043,42 +1056,70 @@ class PrimeFlowClient:
             raise ValueError("PrimeFlow login response contained no access token")
         return self.access_token
 
-    async def common_view(self, day: date) -> dict[str, Any]:
+    async def _retrieve_week(self, week_start: date) -> bytes:
+        params = {
+            "week_start": week_start.isoformat(),
+            "include_all_departments": "true",
+            "freeze_one_h_slots": "false",
+            "max_items_per_bucket": 5000,
+        }
         async with httpx.AsyncClient(base_url=self.base_url, timeout=30) as client:
-            async def retrieve(week_day: date) -> dict[str, Any]:
-                params = {
-                    "week_start": week_day.isoformat(),
-                    "include_all_departments": "true",
-                    "freeze_one_h_slots": "false",
-                    "max_items_per_bucket": 5000,
-                }
+            token = await self._token(client)
+            response = await client.get(
+                "/api/common-view",
+                params=params,
+                headers={"Authorization": f"Bearer {token}", "Cache-Control": "no-cache"},
+            )
+            if response.status_code == 401:
+                self.access_token = None
                 token = await self._token(client)
                 response = await client.get(
                     "/api/common-view",
                     params=params,
                     headers={"Authorization": f"Bearer {token}", "Cache-Control": "no-cache"},
                 )
-                if response.status_code == 401:
-                    self.access_token = None
-                    token = await self._token(client)
-                    response = await client.get(
-                        "/api/common-view",
-                        params=params,
-                        headers={"Authorization": f"Bearer {token}", "Cache-Control": "no-cache"},
-                    )
-                response.raise_for_status()
-                payload = response.json()
-                if any((payload.get("guardrails", {}).get("truncated") or {}).values()):
-                    raise ValueError("Common View contains truncated buckets")
-                return payload
-            current = await retry(lambda: retrieve(day))
-            if day.weekday() != 0:
-                return current
-            previous = await retry(lambda: retrieve(previous_working_day(day)))
+            response.raise_for_status()
+        payload = response.json()
+        if any((payload.get("guardrails", {}).get("truncated") or {}).values()):
+            raise ValueError("Common View contains truncated buckets")
+        return response.content
+
+    async def _week(self, week_start: date) -> dict[str, Any]:
+        """One week of Common View, shared by concurrent and back-to-back callers.
+
+        Identical requests in flight on this event loop are coalesced into one
+        fetch, and a successful body is reused for COMMON_VIEW_CACHE_SECONDS.
+        """
+        key = (self.base_url, week_start)
+        cached = _common_view_cache.get(key)
+        if cached is not None and cached[0] > monotonic():
+            return json.loads(cached[1])
+
+        flight_key = (id(asyncio.get_running_loop()), *key)
+        flight = _common_view_inflight.get(flight_key)
+        if flight is None:
+            flight = asyncio.ensure_future(retry(lambda: self._retrieve_week(week_start)))
+            _common_view_inflight[flight_key] = flight
+
+            def settle(done: asyncio.Future) -> None:
+                _common_view_inflight.pop(flight_key, None)
+                if not done.cancelled() and done.exception() is None:
+                    _common_view_cache[key] = (monotonic() + COMMON_VIEW_CACHE_SECONDS, done.result())
+
+            flight.add_done_callback(settle)
+        # Shielded so one cancelled caller does not fail the others waiting on the same fetch.
+        return json.loads(await asyncio.shield(flight))
+
+    async def common_view(self, day: date) -> dict[str, Any]:
+        weeks = [_week_monday(day)]
+        if day.weekday() == 0:
+            weeks.append(_week_monday(previous_working_day(day)))
+        current, *previous_weeks = await asyncio.gather(*(self._week(week) for week in weeks))
+        for previous in previous_weeks:
             for bucket, values in (previous.get("items") or {}).items():
                 current.setdefault("items", {}).setdefault(bucket, []).extend(values)
             current["generated_at"] = max(current["generated_at"], previous["generated_at"])
-            return current
+        return current
 
 
 class GmailService:
@@ -1106,9 +1147,11 @@ class GmailService:
         html_body: str | None = None,
         attachments: list[tuple[str, bytes, str]] | None = None,
         message_id: str | None = None,
+        source: str | None = None,
+        source_id: uuid.UUID | None = None,
     ) -> dict[str, Any]:
+        """Send through the pooled SMTP sessions; ``source``/``source_id`` tag the outbox row."""
         recipient_map = recipients if isinstance(recipients, dict) else {"to": recipients, "cc": [], "bcc": []}
-        all_recipients = sum(recipient_map.values(), [])
         if not recipient_map["to"]:
             raise ValueError("At least one To recipient is required")
         message = EmailMessage()
@@ -1132,16 +1175,13 @@ class GmailService:
             maintype, subtype = mime_type.split("/", 1)
             message.add_attachment(content, maintype=maintype, subtype=subtype, filename=filename)
 
-        def send_smtp() -> None:
-            context = ssl.create_default_context()
-            with smtplib.SMTP(self.host, self.port, timeout=30) as smtp:
-                smtp.ehlo()
-                smtp.starttls(context=context)
-                smtp.ehlo()
-                smtp.login(self.sender, self.password)
-                smtp.send_message(message, from_addr=self.sender, to_addrs=all_recipients)
-
-        await asyncio.to_thread(send_smtp)
+        await deliver(
+            message,
+            recipient_map,
+            pool=smtp_pool(self.host, self.port, self.sender, self.password),
+            source=source,
+            source_id=source_id,
+        )
         return {
             "id": message_id.strip("<>"),
             "threadId": None,
@@ -23,7 +23,7 @@ from app.models.task import Task
 from app.models.task_strike_event import TaskStrikeEvent
 from app.models.user import User
 from app.services.primeflow_report import (
-    GmailService, GmailVerificationError, PrimeFlowClient,
+    REPORT_TYPE, GmailService, GmailVerificationError, PrimeFlowClient,
     ReportDocument, ReportReminderQuestion, ReportUndiscussedNote, clean_description, build_report_document,
     predecessor, render_docx, render_html, render_plain_text, render_png, report_subject, report_timezone,
 )
@@ -325,6 +325,7 @@ async def deliver_report(
             ]
             message = await gmail.send_verified(
                 subject, recipient_map, body, html_body, attachments=attachments,
+                source=REPORT_TYPE, source_id=run.id,
             )
             run.status = "SENT"
             run.gmail_message_id, run.gmail_thread_id = message.get("id"), message.get("threadId")
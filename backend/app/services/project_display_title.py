@@ -1,16 +1,21 @@
 from __future__ import annotations
 
+import json
+import logging
 import re
-import time
 import uuid
+from collections import OrderedDict
 from datetime import date, datetime, timedelta
 from typing import Any
 
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.config import settings
+from app.integrations.redis import get_redis, redis_pipeline
 from app.models.enums import ProjectPhaseStatus
 from app.models.project import Project
+from app.models.project_metric_version import ProjectMetricVersion
 from app.models.task import Task
 from app.models.task_daily_progress import TaskDailyProgress
 from app.services.project_classification import is_mst_or_tt_identity
@@ -20,6 +25,8 @@ COMPLETED_PRODUCTS_RE = re.compile(r"completed_products[:=]\s*(\d+)", re.IGNOREC
 ORIGIN_TASK_ID_RE = re.compile(r"origin_task_id[:=]\s*([a-f0-9-]+)", re.IGNORECASE)
 TRAILING_TOTAL_RE = re.compile(r"\((\d+)\)\s*$")
 
+logger = logging.getLogger(__name__)
+
 
 def _parse_int(pattern: re.Pattern[str], text: str | None) -> int | None:
     if not text:
@@ -299,14 +306,116 @@ def build_display_title(
     return f"{base} ({resolved_total}/{done_total}/{realized_week})"
 
 
-# --- Simple in-memory TTL cache for display title maps ---
-# Key: str(department_id) or "" for no department.
-# Value: (monotonic timestamp, result dict).
-_display_title_cache: dict[str, tuple[float, dict[uuid.UUID, str]]] = {}
-_CACHE_TTL = 30.0  # seconds
+# Control-week metrics are cached per (project, week, metric version, project
+# total). Triggers bump project_metric_versions whenever a project's product
+# counts or daily progress change, so a changed project simply misses; nothing
+# is refreshed on a timer. Entries live in a bounded per-process LRU in front
+# of Redis, which shares them between workers. The Redis expiry only reclaims
+# keys of superseded versions.
+_METRICS_KEY_PREFIX = "project-metrics"
+_METRICS_REDIS_RETENTION_SECONDS = 7 * 24 * 60 * 60
+_metrics_cache: OrderedDict[str, dict[str, int | bool | None]] = OrderedDict()
+
+
+def _metrics_cache_key(
+    project: Project,
+    week_start: date,
+    week_end: date,
+    version: int,
+) -> str:
+    total = "" if project.total_products is None else project.total_products
+    return f"{_METRICS_KEY_PREFIX}:{project.id}:{week_start.isoformat()}:{week_end.isoformat()}:{version}:{total}"
+
+
+def _remember_metrics(key: str, metrics: dict[str, int | bool | None]) -> None:
+    _metrics_cache[key] = metrics
+    _metrics_cache.move_to_end(key)
+    while len(_metrics_cache) > settings.PROJECT_METRICS_CACHE_SIZE:
+        _metrics_cache.popitem(last=False)
+
+
+async def _shared_metrics(keys: list[str]) -> list[str | None]:
+    if not keys or not settings.REDIS_ENABLED:
+        return [None] * len(keys)
+    try:
+        return await get_redis().mget(keys)
+    except Exception:
+        logger.debug("Project metrics cache read failed", exc_info=True)
+        return [None] * len(keys)
+
+
+async def _share_metrics(payloads: dict[str, str]) -> None:
+    if not payloads or not settings.REDIS_ENABLED:
+        return
+    try:
+        async with redis_pipeline() as pipe:
+            for key, payload in payloads.items():
+                pipe.set(key, payload, ex=_METRICS_REDIS_RETENTION_SECONDS)
+            await pipe.execute()
+    except Exception:
+        logger.debug("Project metrics cache write failed", exc_info=True)
 
 
-async def _build_project_display_title_map_uncached(
+async def cached_project_control_week_metrics(
+    db: AsyncSession,
+    projects: list[Project],
+    week_start: date | None = None,
+    week_end: date | None = None,
+) -> dict[uuid.UUID, dict[str, int | bool | None]]:
+    """``compute_project_control_week_metrics`` for ``projects``, served from cache where current."""
+    if not projects:
+        return {}
+    normalized_week_start, normalized_week_end = _normalize_week_range(week_start, week_end)
+    project_by_id = {project.id: project for project in projects}
+    version_rows = (
+        await db.execute(
+            select(ProjectMetricVersion.project_id, ProjectMetricVersion.version)
+            .where(ProjectMetricVersion.project_id.in_(list(project_by_id)))
+        )
+    ).all()
+    version_by_id = {project_id: int(version) for project_id, version in version_rows}
+    key_by_id = {
+        project_id: _metrics_cache_key(
+            project, normalized_week_start, normalized_week_end, version_by_id.get(project_id, 0)
+        )
+        for project_id, project in project_by_id.items()
+    }
+
+    out: dict[uuid.UUID, dict[str, int | bool | None]] = {}
+    for project_id, key in key_by_id.items():
+        metrics = _metrics_cache.get(key)
+        if metrics is not None:
+            _metrics_cache.move_to_end(key)
+            out[project_id] = dict(metrics)
+
+    missing = [project_id for project_id in key_by_id if project_id not in out]
+    shared = await _shared_metrics([key_by_id[project_id] for project_id in missing])
+    for project_id, payload in zip(missing, shared):
+        if payload:
+            metrics = json.loads(payload)
+            _remember_metrics(key_by_id[project_id], metrics)
+            out[project_id] = dict(metrics)
+
+    missing = [project_id for project_id in key_by_id if project_id not in out]
+    if missing:
+        computed = await compute_project_control_week_metrics(
+            db,
+            missing,
+            week_start=normalized_week_start,
+            week_end=normalized_week_end,
+            project_total_by_id={project_id: project_by_id[project_id].total_products for project_id in missing},
+        )
+        payloads: dict[str, str] = {}
+        for project_id in missing:
+            metrics = computed[project_id]
+            _remember_metrics(key_by_id[project_id], metrics)
+            payloads[key_by_id[project_id]] = json.dumps(metrics)
+            out[project_id] = dict(metrics)
+        await _share_metrics(payloads)
+    return out
+
+
+async def build_project_display_title_map(
     db: AsyncSession,
     projects: list[Project],
     week_start: date | None = None,
@@ -323,13 +432,11 @@ async def _build_project_display_title_map_uncached(
         out[project.id] = raw_title
 
     if metric_projects:
-        project_total_by_id = {p.id: p.total_products for p in metric_projects}
-        progress_map = await compute_project_control_week_metrics(
+        progress_map = await cached_project_control_week_metrics(
             db,
-            [p.id for p in metric_projects],
+            metric_projects,
             week_start=week_start,
             week_end=week_end,
-            project_total_by_id=project_total_by_id,
         )
         for project in metric_projects:
             out[project.id] = build_display_title(
@@ -340,29 +447,3 @@ async def _build_project_display_title_map_uncached(
             )
 
     return out
-
-
-async def build_project_display_title_map(
-    db: AsyncSession,
-    projects: list[Project],
-    week_start: date | None = None,
-    week_end: date | None = None,
-    department_id: uuid.UUID | None = None,
-) -> dict[uuid.UUID, str]:
-    if not projects:
-        return {}
-
-    cache_key = str(department_id)
-    now = time.monotonic()
-    if cache_key in _display_title_cache:
-        ts, cached = _display_title_cache[cache_key]
-        if now - ts < _CACHE_TTL:
-            # Return cached titles for known projects, fall back to raw title for unknowns
-            result = {}
-            for p in projects:
-                result[p.id] = cached.get(p.id) or (p.title or "").strip() or "Untitled project"
-            return result
-
-    result = await _build_project_display_title_map_uncached(db, projects, week_start, week_end)
-    _display_title_cache[cache_key] = (now, result)
-    return result
@@ -10,6 +10,7 @@ import re
 import uuid
 from collections import defaultdict
 from datetime import date, datetime, time, timedelta
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Literal
 from zoneinfo import ZoneInfo
@@ -47,6 +48,7 @@ from app.models.task import Task
 from app.models.task_assignee import TaskAssignee
 from app.models.user import User
 from app.services.primeflow_report import GmailService, GmailVerificationError, clean_description
+from app.services.report_rendering import RenderJob, content_hash, render_attachments
 
 
 logger = logging.getLogger(__name__)
@@ -443,7 +445,7 @@ def render_xlsx(report: PxJavWeeklyReport) -> bytes:
     detail_sheet = workbook.create_sheet("KONTROLLI PX JAV")
 
     summary_sheet.append(["RAPORTI PX JAV", report.report_date])
-    summary_sheet.append(["Gjeneruar", report.generated_at.replace(tzinfo=None)])
+    summary_sheet.append(["Gjeneruar", _generated_minute(report).replace(tzinfo=None)])
     summary_sheet.append(["Nga", report.period_start.replace(tzinfo=None)])
     summary_sheet.append(["Deri", report.period_end.replace(tzinfo=None)])
     summary_sheet.append(["Timezone", report.timezone])
@@ -736,6 +738,7 @@ def render_docx(report: PxJavWeeklyReport) -> bytes:
     return output.getvalue()
 
 
+@lru_cache(maxsize=1)
 def _register_pdf_fonts() -> tuple[str, str]:
     candidates = [
         (Path("C:/Windows/Fonts/arial.ttf"), Path("C:/Windows/Fonts/arialbd.ttf")),
@@ -888,15 +891,38 @@ def render_pdf(report: PxJavWeeklyReport) -> bytes:
     return output.getvalue()
 
 
-def build_attachments(report: PxJavWeeklyReport) -> list[tuple[str, bytes, str]]:
+def _generated_minute(report: PxJavWeeklyReport) -> datetime:
+    return report.generated_at.replace(second=0, microsecond=0)
+
+
+def report_content_key(report: PxJavWeeklyReport) -> str:
+    # The files show generated_at to the minute, so unchanged rows built
+    # within the same minute reuse the first rendering.
+    payload = report.model_dump(mode="json", exclude={"generated_at"})
+    payload["generated_at"] = _generated_minute(report).isoformat()
+    return content_hash(payload)
+
+
+def attachment_jobs(report: PxJavWeeklyReport, formats: tuple[str, ...] = ("xlsx", "docx", "pdf")) -> list[RenderJob]:
     stem = report_filename_stem(report)
+    renderers = {
+        "xlsx": (render_xlsx, EXCEL_MIME),
+        "docx": (render_docx, WORD_MIME),
+        "pdf": (render_pdf, PDF_MIME),
+    }
     return [
-        (f"{stem}.xlsx", render_xlsx(report), EXCEL_MIME),
-        (f"{stem}.docx", render_docx(report), WORD_MIME),
-        (f"{stem}.pdf", render_pdf(report), PDF_MIME),
+        RenderJob(f"{stem}.{extension}", renderers[extension][1], renderers[extension][0], (report,))
+        for extension in formats
     ]
 
 
+async def build_attachments(
+    report: PxJavWeeklyReport,
+    formats: tuple[str, ...] = ("xlsx", "docx", "pdf"),
+) -> list[tuple[str, bytes, str]]:
+    return await render_attachments(report_content_key(report), attachment_jobs(report, formats))
+
+
 async def deliver_px_jav_weekly_report(
     report_date: date | None = None,
     *,
@@ -999,7 +1025,9 @@ async def deliver_px_jav_weekly_report(
                 recipient_map,
                 body,
                 html_body,
-                attachments=build_attachments(report),
+                attachments=await build_attachments(report),
+                source=REPORT_TYPE,
+                source_id=run.id,
             )
             run.status = "SENT"
             run.gmail_message_id = message.get("id")
@@ -17,6 +17,7 @@ from app.models.realization import (
     RealizationPolicyVersion,
 )
 from app.services.realization_evidence import collect_weekly_evidence
+from app.services.realization_monthly import refresh_monthly_aggregates
 from app.services.realization_narrative import build_albanian_narrative
 from app.services.realization_periods import require_recalculable, transition_period
 from app.services.realization_pulse import build_recovery, calculate_pulse
@@ -678,7 +679,14 @@ async def calculate_weekly_period(
     planned_snapshot: Any,
     final_snapshot: Any,
     actor_id: uuid.UUID,
+    read_db: AsyncSession | None = None,
 ) -> tuple[list[RealizationPersonResult], RealizationDepartmentResult]:
+    """Calculate weekly person and department results.
+
+    ``read_db`` lets batch callers collect evidence through the reporting
+    pool; interactive callers leave it unset so evidence added in the same
+    transaction is visible.
+    """
     require_recalculable(period)
     if planned_snapshot is None or final_snapshot is None:
         raise ValueError("PLANNED and FINAL snapshots are required before calculation")
@@ -690,7 +698,7 @@ async def calculate_weekly_period(
         )
     ).scalar_one()
     evidence = await collect_weekly_evidence(
-        db,
+        read_db or db,
         period=period,
         planned_snapshot=planned_snapshot,
         final_snapshot=final_snapshot,
@@ -865,4 +873,5 @@ async def calculate_weekly_period(
     else:
         period.calculated_at = datetime.now(timezone.utc)
     await db.flush()
+    await refresh_monthly_aggregates(db, weekly_period=period)
     return results, department_result
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import uuid
 from collections import defaultdict
+from dataclasses import dataclass
 from datetime import date, datetime, time, timedelta, timezone
 from typing import Any
 from zoneinfo import ZoneInfo
@@ -27,12 +28,46 @@ from app.models.task_daily_progress import TaskDailyProgress
 from app.models.task_user_comment import TaskUserComment
 from app.models.weekly_planner_snapshot import WeeklyPlannerSnapshot
 from app.services.realization_calculator import build_live_questions, build_project_progress
-from app.services.realization_evidence import _snapshot_tasks
-from app.services.realization_people import load_active_users_and_common_leave
+from app.services.realization_evidence import load_snapshot_tasks
+from app.models.user import User
+from app.services.realization_people import (
+    CommonLeaveCoverage,
+    load_active_users_and_common_leave,
+    load_active_users_by_department_and_common_leave,
+)
 from app.services.realization_periods import require_recalculable, transition_period
 from app.services.realization_pulse import build_recovery, calculate_pulse
 
 
+@dataclass(frozen=True)
+class DailyRealizationDayData:
+    """Per-day inputs shared by every department's daily calculation."""
+
+    day: date
+    users_by_department: dict[uuid.UUID, list[User]]
+    common_leave: dict[uuid.UUID, CommonLeaveCoverage]
+    attendance_by_user: dict[uuid.UUID, list[AttendanceLog]]
+
+
+async def load_daily_realization_day_data(db: AsyncSession, *, day: date) -> DailyRealizationDayData:
+    users_by_department, common_leave = await load_active_users_by_department_and_common_leave(
+        db,
+        start_date=day,
+        end_date=day,
+    )
+    attendance_by_user: dict[uuid.UUID, list[AttendanceLog]] = defaultdict(list)
+    for row in (
+        await db.execute(select(AttendanceLog).where(AttendanceLog.date == day))
+    ).scalars().all():
+        attendance_by_user[row.user_id].append(row)
+    return DailyRealizationDayData(
+        day=day,
+        users_by_department=users_by_department,
+        common_leave=common_leave,
+        attendance_by_user=dict(attendance_by_user),
+    )
+
+
 def _local_date(value: datetime | None) -> date | None:
     if value is None:
         return None
@@ -176,14 +211,19 @@ async def calculate_daily_period(
     planned_snapshot: WeeklyPlannerSnapshot,
     actor_id: uuid.UUID,
     only_user_id: uuid.UUID | None = None,
+    day_data: DailyRealizationDayData | None = None,
 ) -> tuple[list[RealizationPersonResult], RealizationDepartmentResult | None]:
-    """Persist an immutable-by-day operational snapshot for one department."""
+    """Persist an immutable-by-day operational snapshot for one department.
+
+    ``day_data`` supplies users, leave and attendance already loaded for the
+    period's day, as the scheduled job does for all departments at once.
+    """
     require_recalculable(period)
     if planned_snapshot is None:
         raise ValueError("PLANNED snapshot is required for daily realization")
 
     day = period.start_date
-    planned = _snapshot_tasks(planned_snapshot)
+    planned = await load_snapshot_tasks(db, planned_snapshot)
     planned_ids = {row["task_id"] for row in planned.values() if row.get("task_id")}
     question_task_ids = set(
         (
@@ -206,12 +246,22 @@ async def calculate_daily_period(
         }
         planned_ids -= question_task_ids
 
-    department_users, common_leave = await load_active_users_and_common_leave(
-        db,
-        department_id=period.department_id,
-        start_date=day,
-        end_date=day,
-    )
+    if day_data is not None and day_data.day != day:
+        day_data = None
+    if day_data is not None:
+        department_users = day_data.users_by_department.get(period.department_id, [])
+        common_leave = {
+            user.id: day_data.common_leave[user.id]
+            for user in department_users
+            if user.id in day_data.common_leave
+        }
+    else:
+        department_users, common_leave = await load_active_users_and_common_leave(
+            db,
+            department_id=period.department_id,
+            start_date=day,
+            end_date=day,
+        )
     department_user_ids = {user.id for user in department_users}
 
     zone = ZoneInfo(settings.REALIZATION_TIMEZONE)
@@ -547,13 +597,18 @@ async def calculate_daily_period(
             if fact["source_type"] == "fast":
                 people[user_id]["counters"]["fast_task_count"] += 1
 
-    attendance = (
-        await db.execute(
-            select(AttendanceLog).where(
-                AttendanceLog.user_id.in_(list(people)), AttendanceLog.date == day
+    if day_data is not None:
+        attendance = [
+            row for user_id in people for row in day_data.attendance_by_user.get(user_id, [])
+        ]
+    else:
+        attendance = (
+            await db.execute(
+                select(AttendanceLog).where(
+                    AttendanceLog.user_id.in_(list(people)), AttendanceLog.date == day
+                )
             )
-        )
-    ).scalars().all() if people else []
+        ).scalars().all() if people else []
     for row in attendance:
         person = people.get(row.user_id)
         if person is None:
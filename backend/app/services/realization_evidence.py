@@ -25,6 +25,12 @@ from app.services.realization_people import (
     load_active_users_and_common_leave,
 )
 from app.services.system_task_schedule import _is_working_day
+from app.services.task_read_model import EVIDENCE_TASK_PROJECTION
+from app.services.weekly_snapshot_tasks import (
+    load_snapshot_payloads,
+    load_snapshot_roster,
+    load_snapshot_task_items,
+)
 
 
 def qualifies_as_verified_extra(
@@ -116,7 +122,21 @@ def _status(value: Any) -> str:
 
 def _snapshot_tasks(snapshot: WeeklyPlannerSnapshot) -> dict[str, dict[str, Any]]:
     """Read the canonical match keys persisted by the existing planner."""
-    rows = (snapshot.payload or {}).get("task_items") or []
+    return _snapshot_task_map((snapshot.payload or {}).get("task_items") or [])
+
+
+async def load_snapshot_tasks(
+    db: AsyncSession, snapshot: WeeklyPlannerSnapshot
+) -> dict[str, dict[str, Any]]:
+    """Like ``_snapshot_tasks`` but served from ``weekly_planner_snapshot_tasks``."""
+    stored = await load_snapshot_task_items(db, [snapshot.id])
+    if snapshot.id in stored:
+        return _snapshot_task_map(stored[snapshot.id])
+    payload = (await load_snapshot_payloads(db, [snapshot.id])).get(snapshot.id) or {}
+    return _snapshot_task_map(payload.get("task_items") or [])
+
+
+def _snapshot_task_map(rows: list[dict[str, Any]]) -> dict[str, dict[str, Any]]:
     tasks: dict[str, dict[str, Any]] = {}
     for raw in rows:
         task_id = _uuid(raw.get("task_id"))
@@ -177,6 +197,23 @@ def _snapshot_users(snapshot: WeeklyPlannerSnapshot) -> dict[uuid.UUID, str]:
     return users
 
 
+async def load_snapshot_users(
+    db: AsyncSession,
+    snapshot: WeeklyPlannerSnapshot,
+    tasks: dict[str, dict[str, Any]] | None = None,
+) -> dict[uuid.UUID, str]:
+    """Like ``_snapshot_users`` without transferring the snapshot payload."""
+    users = dict((await load_snapshot_roster(db, [snapshot.id])).get(snapshot.id) or {})
+    if tasks is None:
+        tasks = await load_snapshot_tasks(db, snapshot)
+    for task in tasks.values():
+        for assignee in task["assignees"]:
+            user_id = assignee.get("assignee_id")
+            if user_id is not None:
+                users[user_id] = assignee.get("assignee_name") or users.get(user_id, "Employee")
+    return users
+
+
 def _local(value: datetime | None) -> datetime | None:
     if value is None:
         return None
@@ -324,33 +361,34 @@ async def collect_weekly_evidence(
     am_cutoff: time,
     pm_cutoff: time,
 ) -> dict[str, Any]:
-    planned = _snapshot_tasks(planned_snapshot)
-    final = _snapshot_tasks(final_snapshot)
+    planned = await load_snapshot_tasks(db, planned_snapshot)
+    final = await load_snapshot_tasks(db, final_snapshot)
     task_ids = {
         task["task_id"] for task in [*planned.values(), *final.values()] if task["task_id"]
     }
     completed_department_tasks = (
         await db.execute(
-            select(Task).where(
+            select(Task.id, Task.completed_at).where(
                 Task.department_id == period.department_id,
                 Task.completed_at.is_not(None),
                 Task.completed_at <= final_snapshot.created_at,
             )
         )
-    ).scalars().all()
-    completed_department_tasks = [
-        task
-        for task in completed_department_tasks
-        if period.start_date
-        <= (_local(task.completed_at) or task.completed_at).date()
-        <= period.end_date
-    ]
+    ).all()
     completed_outside_snapshot_ids = {
-        task.id for task in completed_department_tasks if task.id not in task_ids
+        task_id
+        for task_id, completed_at in completed_department_tasks
+        if task_id not in task_ids
+        and period.start_date
+        <= (_local(completed_at) or completed_at).date()
+        <= period.end_date
     }
     task_ids.update(completed_outside_snapshot_ids)
     tasks = (
-        (await db.execute(select(Task).where(Task.id.in_(task_ids)))).scalars().all()
+        await EVIDENCE_TASK_PROJECTION.fetch(
+            db,
+            EVIDENCE_TASK_PROJECTION.select().where(Task.id.in_(task_ids)),
+        )
         if task_ids
         else []
     )
@@ -502,8 +540,8 @@ async def collect_weekly_evidence(
 
     for active_user in active_users:
         ensure_person(active_user.id, active_user.full_name)
-    for snapshot in (planned_snapshot, final_snapshot):
-        for user_id, name in _snapshot_users(snapshot).items():
+    for snapshot, snapshot_tasks in ((planned_snapshot, planned), (final_snapshot, final)):
+        for user_id, name in (await load_snapshot_users(db, snapshot, snapshot_tasks)).items():
             ensure_person(user_id, name)
     for observation in evidence_observations:
         if observation.user_id is not None:
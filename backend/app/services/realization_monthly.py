@@ -2,13 +2,18 @@ from __future__ import annotations
 
 import uuid
 from collections import Counter
+from datetime import date, timedelta
+from typing import Any
 
 from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.models.enums import RealizationPeriodStatus
+from app.models.enums import RealizationPeriodStatus, RealizationPulse
 from app.models.realization import (
     RealizationDepartmentResult,
+    RealizationMonthlyDepartmentAggregate,
+    RealizationMonthlyPersonAggregate,
     RealizationPeriod,
     RealizationPersonResult,
 )
@@ -16,6 +21,257 @@ from app.services.realization_periods import require_recalculable, transition_pe
 from app.services.realization_pulse import aggregate_monthly_pulses
 
 
+_AGGREGATE_COUNTERS = (
+    "plus_count",
+    "plus_plus_count",
+    "diamond_count",
+    "question_count",
+    "ok_count",
+    "unresolved_pink_days",
+    "verified_positive_extras",
+    "unresolved_negative_evidence",
+    "verified_negative_evidence",
+)
+
+
+def month_bounds(day: date) -> tuple[date, date]:
+    start = day.replace(day=1)
+    next_month = date(start.year + (1 if start.month == 12 else 0), 1 if start.month == 12 else start.month + 1, 1)
+    return start, next_month - timedelta(days=1)
+
+
+def _months_between(start: date, end: date) -> list[date]:
+    months: list[date] = []
+    current = start.replace(day=1)
+    while current <= end:
+        months.append(current)
+        current = month_bounds(current)[1] + timedelta(days=1)
+    return months
+
+
+def monthly_week_entry(result: RealizationPersonResult, period: RealizationPeriod) -> dict[str, Any]:
+    """One weekly person result as a monthly ``weekly_history`` entry."""
+    facts = result.facts_json or {}
+    pulse_facts = facts.get("pulse") or {}
+    return {
+        "period_id": str(period.id),
+        "week_start": period.start_date.isoformat(),
+        "week_end": period.end_date.isoformat(),
+        "pulse": pulse_facts.get("pulse") or RealizationPulse.JUSTIFIED.value,
+        "unresolved_pink_days": sum(
+            1
+            for item in facts.get("daily_timeline") or []
+            if int(item.get("unresolved_pink_count") or 0) > 0
+        ) or (1 if int(facts.get("unresolved_pink_count") or 0) > 0 else 0),
+        "verified_positive_extras": int(pulse_facts.get("verified_extra_count") or 0),
+        "unresolved_negative_count": int(pulse_facts.get("unresolved_negative_count") or 0),
+        "verified_negative_count": int((facts.get("counters") or {}).get("negative_count") or 0),
+        "drilldown": {"week_start": period.start_date.isoformat()},
+    }
+
+
+def monthly_aggregation(aggregate: RealizationMonthlyPersonAggregate) -> dict[str, Any]:
+    """The stored rollup in ``aggregate_monthly_pulses`` shape."""
+    return {
+        "weekly_history": list(aggregate.weekly_history or []),
+        **{name: getattr(aggregate, name) for name in _AGGREGATE_COUNTERS},
+        "trend": list(aggregate.trend or []),
+        "current_pulse": aggregate.current_pulse,
+    }
+
+
+def _is_official_week(period: RealizationPeriod) -> bool:
+    return (
+        period.period_type == "WEEKLY"
+        and period.final_snapshot_id is not None
+        and period.status != RealizationPeriodStatus.OPEN.value
+    )
+
+
+def _apply_history(aggregate: RealizationMonthlyPersonAggregate, history: list[dict[str, Any]]) -> None:
+    history.sort(key=lambda entry: entry["week_start"])
+    rollup = aggregate_monthly_pulses(history)
+    aggregate.weekly_history = history
+    for name in _AGGREGATE_COUNTERS:
+        setattr(aggregate, name, rollup[name])
+    aggregate.trend = rollup["trend"]
+    aggregate.current_pulse = rollup["current_pulse"]
+
+
+async def _official_weeks(db: AsyncSession, *, department_id: uuid.UUID, month_start: date) -> list[RealizationPeriod]:
+    month_end = month_bounds(month_start)[1]
+    periods = (
+        await db.execute(
+            select(RealizationPeriod).where(
+                RealizationPeriod.period_type == "WEEKLY",
+                RealizationPeriod.department_id == department_id,
+                RealizationPeriod.start_date <= month_end,
+                RealizationPeriod.end_date >= month_start,
+            )
+        )
+    ).scalars().all()
+    return [period for period in periods if _is_official_week(period)]
+
+
+async def _week_entries(db: AsyncSession, periods: list[RealizationPeriod]) -> dict[uuid.UUID, list[dict[str, Any]]]:
+    """``weekly_history`` entries per user for the official weeks in ``periods``."""
+    by_id = {period.id: period for period in periods if _is_official_week(period)}
+    entries: dict[uuid.UUID, list[dict[str, Any]]] = {}
+    if not by_id:
+        return entries
+    results = (
+        await db.execute(select(RealizationPersonResult).where(RealizationPersonResult.period_id.in_(list(by_id))))
+    ).scalars().all()
+    for result in results:
+        entries.setdefault(result.user_id, []).append(monthly_week_entry(result, by_id[result.period_id]))
+    return entries
+
+
+async def _locked_department_aggregate(
+    db: AsyncSession, *, department_id: uuid.UUID, month_start: date
+) -> tuple[RealizationMonthlyDepartmentAggregate, bool]:
+    """The month's department row, locked for this transaction; True if it was just created.
+
+    Every refresh of a month takes this lock first, so concurrent weeks do
+    not overwrite each other's ``weekly_history`` changes.
+    """
+    created = (
+        await db.execute(
+            pg_insert(RealizationMonthlyDepartmentAggregate)
+            .values(id=uuid.uuid4(), department_id=department_id, month_start=month_start)
+            .on_conflict_do_nothing(index_elements=["department_id", "month_start"])
+            .returning(RealizationMonthlyDepartmentAggregate.id)
+        )
+    ).scalar_one_or_none()
+    aggregate = (
+        await db.execute(
+            select(RealizationMonthlyDepartmentAggregate)
+            .where(
+                RealizationMonthlyDepartmentAggregate.department_id == department_id,
+                RealizationMonthlyDepartmentAggregate.month_start == month_start,
+            )
+            .with_for_update()
+        )
+    ).scalar_one()
+    return aggregate, created is not None
+
+
+async def refresh_monthly_aggregates(db: AsyncSession, *, weekly_period: RealizationPeriod) -> None:
+    """Fold one weekly period's person results into its months' aggregates.
+
+    Only that week's entries are replaced; other weeks already stored for the
+    month are kept, so the cost does not grow with the month's history. The
+    first refresh of a month (including months from before the rollup tables
+    existed) folds in every official week of the month instead.
+    """
+    if weekly_period.period_type != "WEEKLY" or weekly_period.department_id is None:
+        return
+    department_id = weekly_period.department_id
+    week_entries = await _week_entries(db, [weekly_period])
+
+    for month_start in _months_between(weekly_period.start_date, weekly_period.end_date):
+        department_aggregate, created = await _locked_department_aggregate(
+            db, department_id=department_id, month_start=month_start
+        )
+        replaced = {str(weekly_period.id)}
+        entries = week_entries
+        if created:
+            periods = await _official_weeks(db, department_id=department_id, month_start=month_start)
+            replaced |= {str(period.id) for period in periods}
+            entries = await _week_entries(db, periods)
+        aggregates = {
+            row.user_id: row
+            for row in (
+                await db.execute(
+                    select(RealizationMonthlyPersonAggregate)
+                    .where(
+                        RealizationMonthlyPersonAggregate.department_id == department_id,
+                        RealizationMonthlyPersonAggregate.month_start == month_start,
+                    )
+                    .with_for_update()
+                )
+            ).scalars().all()
+        }
+        for user_id in set(aggregates) | set(entries):
+            aggregate = aggregates.get(user_id)
+            history = [
+                entry
+                for entry in (aggregate.weekly_history if aggregate is not None else [])
+                if entry.get("period_id") not in replaced
+            ]
+            history.extend(entries.get(user_id, []))
+            if not history:
+                if aggregate is not None:
+                    await db.delete(aggregate)
+                    del aggregates[user_id]
+                continue
+            if aggregate is None:
+                aggregate = RealizationMonthlyPersonAggregate(
+                    department_id=department_id,
+                    month_start=month_start,
+                    user_id=user_id,
+                )
+                db.add(aggregate)
+                aggregates[user_id] = aggregate
+            _apply_history(aggregate, history)
+
+        department_aggregate.people_count = len(aggregates)
+        department_aggregate.pulse_counts = dict(
+            Counter(aggregate.current_pulse for aggregate in aggregates.values())
+        )
+        department_aggregate.source_weekly_period_ids = sorted(
+            {
+                entry["period_id"]
+                for aggregate in aggregates.values()
+                for entry in aggregate.weekly_history
+            }
+        )
+    await db.flush()
+
+
+async def monthly_person_aggregates(
+    db: AsyncSession,
+    *,
+    department_id: uuid.UUID,
+    month_start: date,
+) -> list[RealizationMonthlyPersonAggregate]:
+    """The month's per-person rollups.
+
+    A month that was never refreshed has no department row; its rollups are
+    computed from the weekly results instead and are not stored.
+    """
+    built = (
+        await db.execute(
+            select(RealizationMonthlyDepartmentAggregate.id).where(
+                RealizationMonthlyDepartmentAggregate.department_id == department_id,
+                RealizationMonthlyDepartmentAggregate.month_start == month_start,
+            )
+        )
+    ).scalar_one_or_none()
+    if built is not None:
+        return list(
+            (
+                await db.execute(
+                    select(RealizationMonthlyPersonAggregate).where(
+                        RealizationMonthlyPersonAggregate.department_id == department_id,
+                        RealizationMonthlyPersonAggregate.month_start == month_start,
+                    )
+                )
+            ).scalars().all()
+        )
+    periods = await _official_weeks(db, department_id=department_id, month_start=month_start)
+    aggregates: list[RealizationMonthlyPersonAggregate] = []
+    for user_id, history in (await _week_entries(db, periods)).items():
+        aggregate = RealizationMonthlyPersonAggregate(
+            department_id=department_id,
+            month_start=month_start,
+            user_id=user_id,
+        )
+        _apply_history(aggregate, history)
+        aggregates.append(aggregate)
+    return aggregates
+
+
 async def calculate_monthly_period(
     db: AsyncSession,
     *,
@@ -25,38 +281,10 @@ async def calculate_monthly_period(
     if period.period_type != "MONTHLY" or period.department_id is None:
         raise ValueError("A department MONTHLY period is required")
     require_recalculable(period)
-    weekly_rows = (
-        await db.execute(
-            select(RealizationPersonResult, RealizationPeriod)
-            .join(RealizationPeriod, RealizationPeriod.id == RealizationPersonResult.period_id)
-            .where(
-                RealizationPeriod.department_id == period.department_id,
-                RealizationPeriod.period_type == "WEEKLY",
-                RealizationPeriod.final_snapshot_id.is_not(None),
-                RealizationPeriod.start_date <= period.end_date,
-                RealizationPeriod.end_date >= period.start_date,
-                RealizationPeriod.status != RealizationPeriodStatus.OPEN.value,
-            )
-            .order_by(RealizationPeriod.start_date.asc())
-        )
-    ).all()
-    by_user: dict[uuid.UUID, list[dict]] = {}
-    for weekly_result, weekly_period in weekly_rows:
-        facts = weekly_result.facts_json or {}
-        pulse = (facts.get("pulse") or {}).get("pulse") or "OK"
-        by_user.setdefault(weekly_result.user_id, []).append(
-            {
-                "period_id": str(weekly_period.id),
-                "week_start": weekly_period.start_date.isoformat(),
-                "week_end": weekly_period.end_date.isoformat(),
-                "pulse": pulse,
-                "unresolved_pink_days": 1 if int(facts.get("unresolved_pink_count") or 0) else 0,
-                "verified_positive_extras": int((facts.get("pulse") or {}).get("verified_extra_count") or 0),
-                "unresolved_negative_count": int((facts.get("pulse") or {}).get("unresolved_negative_count") or 0),
-                "verified_negative_count": int((facts.get("counters") or {}).get("negative_count") or 0),
-                "drilldown": {"week_start": weekly_period.start_date.isoformat()},
-            }
-        )
+    aggregates = await monthly_person_aggregates(
+        db, department_id=period.department_id, month_start=month_bounds(period.start_date)[0]
+    )
+    by_user = {aggregate.user_id: aggregate for aggregate in aggregates}
     existing = {
         row.user_id: row
         for row in (
@@ -72,8 +300,7 @@ async def calculate_monthly_period(
             await db.delete(stale)
     results: list[RealizationPersonResult] = []
     pulse_counts: Counter[str] = Counter()
-    for user_id, rows in by_user.items():
-        aggregation = aggregate_monthly_pulses(rows)
+    for user_id, aggregate in by_user.items():
         result = existing.get(user_id)
         if result is None:
             result = RealizationPersonResult(
@@ -84,15 +311,15 @@ async def calculate_monthly_period(
             db.add(result)
         result.facts_json = {
             "report_mode": "MONTHLY_OPERATIONAL",
-            "aggregation": aggregation,
-            "source_weekly_period_ids": [row["period_id"] for row in rows],
+            "aggregation": monthly_aggregation(aggregate),
+            "source_weekly_period_ids": [entry["period_id"] for entry in aggregate.weekly_history],
         }
         result.suggested_symbol = None
         result.suggested_level = None
         result.final_symbol = None
         result.final_level = None
         results.append(result)
-        pulse_counts[aggregation["current_pulse"]] += 1
+        pulse_counts[aggregate.current_pulse] += 1
     department_result = (
         await db.execute(
             select(RealizationDepartmentResult).where(
@@ -97,6 +97,43 @@ async def load_active_users_and_common_leave(
     return active_users, coverage
 
 
+async def load_active_users_by_department_and_common_leave(
+    db: AsyncSession,
+    *,
+    start_date: date,
+    end_date: date,
+) -> tuple[dict[uuid.UUID, list[User]], dict[uuid.UUID, CommonLeaveCoverage]]:
+    """``load_active_users_and_common_leave`` for every department in two queries."""
+    active_users = (
+        await db.execute(
+            select(User)
+            .where(
+                User.department_id.is_not(None),
+                User.is_active.is_(True),
+            )
+            .order_by(User.full_name.asc(), User.id.asc())
+        )
+    ).scalars().all()
+    users_by_department: dict[uuid.UUID, list[User]] = defaultdict(list)
+    for user in active_users:
+        users_by_department[user.department_id].append(user)
+    if not active_users:
+        return {}, {}
+
+    entries = (
+        await db.execute(
+            select(CommonEntry).where(CommonEntry.category == CommonCategory.annual_leave)
+        )
+    ).scalars().all()
+    coverage = build_common_leave_coverage(
+        entries,
+        user_ids={user.id for user in active_users},
+        start_date=start_date,
+        end_date=end_date,
+    )
+    return dict(users_by_department), coverage
+
+
 def full_period_leave_user_ids(
     coverage: dict[uuid.UUID, CommonLeaveCoverage],
     *,
@@ -11,6 +11,7 @@ from app.models.enums import RealizationPeriodStatus
 from app.models.realization import RealizationPeriod, RealizationPolicyVersion
 from app.models.weekly_planner_snapshot import WeeklyPlannerSnapshot
 from app.services.system_task_schedule import _is_working_day
+from app.services.weekly_snapshot_tasks import defer_snapshot_payload
 
 
 class RealizationWorkflowError(ValueError):
@@ -65,6 +66,7 @@ async def select_weekly_snapshots(
     rows = (
         await db.execute(
             select(WeeklyPlannerSnapshot)
+            .options(*defer_snapshot_payload())
             .where(
                 WeeklyPlannerSnapshot.department_id == department_id,
                 WeeklyPlannerSnapshot.week_start_date == week_start,
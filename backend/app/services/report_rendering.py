@@ -0,0 +1,134 @@
+from __future__ import annotations
+
+import asyncio
+import functools
+import hashlib
+import json
+import logging
+import multiprocessing
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass, field
+from typing import Any, Callable, Sequence
+
+from app.config import settings
+from app.integrations.storage import REPORTS_NAMESPACE, StorageBackend, StorageError, get_storage
+
+
+logger = logging.getLogger(__name__)
+
+RENDERED_PREFIX = "rendered"
+
+_executor: ProcessPoolExecutor | None = None
+_executor_lock = threading.Lock()
+
+
+@dataclass(frozen=True, slots=True)
+class RenderJob:
+    """One attachment format: a module-level renderer and the arguments it is called with."""
+
+    filename: str
+    content_type: str
+    render: Callable[..., bytes]
+    args: tuple = ()
+    kwargs: dict[str, Any] = field(default_factory=dict)
+
+
+def content_hash(payload: Any) -> str:
+    return hashlib.sha256(
+        json.dumps(payload, ensure_ascii=False, sort_keys=True, default=str).encode("utf-8")
+    ).hexdigest()
+
+
+def rendered_storage_key(content_key: str, filename: str) -> str:
+    return f"{RENDERED_PREFIX}/{content_key}/{filename}"
+
+
+def _warm_worker() -> None:
+    # Runs once per worker process, so font files are parsed once instead of per PDF.
+    from app.services.px_jav_weekly_report import _register_pdf_fonts
+
+    _register_pdf_fonts()
+
+
+def _render_executor() -> ProcessPoolExecutor | None:
+    global _executor
+    workers = settings.REPORT_RENDER_WORKERS
+    # Celery prefork children are daemonic and may not start processes of their own.
+    if workers <= 0 or multiprocessing.current_process().daemon:
+        return None
+    with _executor_lock:
+        if _executor is None:
+            _executor = ProcessPoolExecutor(
+                max_workers=workers,
+                # spawn: the API process runs threads, which fork does not copy safely.
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_warm_worker,
+            )
+        return _executor
+
+
+def shutdown_render_pool() -> None:
+    global _executor
+    with _executor_lock:
+        executor, _executor = _executor, None
+    if executor is not None:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+async def run_renderer(render: Callable[..., bytes], /, *args: Any, **kwargs: Any) -> bytes:
+    """Run a CPU-bound renderer in the render pool without blocking the event loop."""
+    call = functools.partial(render, *args, **kwargs)
+    executor = _render_executor()
+    if executor is None:
+        return await asyncio.to_thread(call)
+    try:
+        return await asyncio.get_running_loop().run_in_executor(executor, call)
+    except BrokenProcessPool:
+        logger.warning("Report render pool broke; rendering %s on a thread", getattr(render, "__name__", render))
+        shutdown_render_pool()
+        return await asyncio.to_thread(call)
+
+
+async def _load_rendered(storage: StorageBackend, key: str) -> bytes | None:
+    try:
+        if await storage.exists(key):
+            return await storage.read_bytes(key)
+    except StorageError:
+        logger.warning("Could not read rendered report %s", key, exc_info=True)
+    return None
+
+
+async def _store_rendered(storage: StorageBackend, key: str, content: bytes, content_type: str) -> None:
+    try:
+        await storage.put_bytes(key, content, content_type=content_type)
+    except StorageError:
+        logger.warning("Could not store rendered report %s", key, exc_info=True)
+
+
+async def _rendered(storage: StorageBackend | None, content_key: str, job: RenderJob) -> bytes:
+    if storage is None:
+        return await run_renderer(job.render, *job.args, **job.kwargs)
+    key = rendered_storage_key(content_key, job.filename)
+    content = await _load_rendered(storage, key)
+    if content is None:
+        content = await run_renderer(job.render, *job.args, **job.kwargs)
+        await _store_rendered(storage, key, content, job.content_type)
+    return content
+
+
+async def render_attachments(content_key: str, jobs: Sequence[RenderJob]) -> list[tuple[str, bytes, str]]:
+    """Render ``jobs`` concurrently, reusing files stored under ``content_key``.
+
+    ``content_key`` must identify the report content (see ``content_hash``), so
+    a resend or a manual download of unchanged data reads the stored files
+    instead of rebuilding them. Storage problems only cost a re-render.
+    """
+    try:
+        storage = get_storage(REPORTS_NAMESPACE)
+    except StorageError:
+        logger.warning("Report storage is unavailable; rendering without reuse", exc_info=True)
+        storage = None
+    contents = await asyncio.gather(*(_rendered(storage, content_key, job) for job in jobs))
+    return [(job.filename, content, job.content_type) for job, content in zip(jobs, contents)]
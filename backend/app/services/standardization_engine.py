@@ -0,0 +1,282 @@
+from __future__ import annotations
+
+import asyncio
+import functools
+import hashlib
+import json
+import logging
+import multiprocessing
+import os
+import signal
+import threading
+import uuid
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable
+
+from app.config import settings
+from app.integrations.redis import get_redis
+from app.services.excel_standardizer import (
+    ExcelStandardizationError,
+    WorkbookAnalysis,
+    analyze_workbook,
+    standardize_workbook,
+)
+from app.services.word_standardizer import (
+    WordAnalysis,
+    WordStandardizationError,
+    analyze_word_document,
+    standardize_word_document,
+)
+
+
+logger = logging.getLogger(__name__)
+
+TIMEOUT_MESSAGE = "Përpunimi i skedarit zgjati shumë. Provo me një skedar më të vogël."
+MEMORY_MESSAGE = "Skedari është shumë i madh për t'u përpunuar."
+_ANALYSIS_KEY_PREFIX = "standardizer-analysis"
+_ANALYSIS_CACHE_SIZE = 32
+_ANALYSIS_RETENTION_SECONDS = 60 * 60
+# How long a job may run past its alarm before its worker process exits.
+_TIMEOUT_GRACE_SECONDS = 5
+# Workers are replaced after this many jobs, returning a large file's memory.
+_MAX_TASKS_PER_WORKER = 20
+# Exit status of a worker stopped by its watchdog.
+_WATCHDOG_EXIT_CODE = 70
+
+_executor: ProcessPoolExecutor | None = None
+_executor_lock = threading.Lock()
+# Jobs whose worker was stopped by the watchdog, reported back by the workers.
+_overran_queue: Any = None
+_overran_jobs: set[str] = set()
+_worker_overran_queue: Any = None
+_analysis_cache: OrderedDict[str, dict[str, Any]] = OrderedDict()
+
+
+class _JobTimeout(Exception):
+    pass
+
+
+def _init_worker(memory_limit_mb: int, overran_queue: Any) -> None:
+    global _worker_overran_queue
+    _worker_overran_queue = overran_queue
+    if memory_limit_mb <= 0:
+        return
+    try:
+        import resource
+
+        limit = memory_limit_mb * 1024 * 1024
+        resource.setrlimit(resource.RLIMIT_AS, (limit, limit))
+    except (ImportError, ValueError, OSError):
+        logger.warning("Could not limit standardizer worker memory", exc_info=True)
+
+
+def _raise_timeout(signum, frame) -> None:
+    raise _JobTimeout
+
+
+def _watchdog(job_id: str, deadline: float, done: threading.Event) -> None:
+    # The alarm cannot interrupt a job stuck in C code; exit this worker so
+    # the pool replaces it. Other workers and their jobs are left alone.
+    if done.wait(deadline):
+        return
+    if _worker_overran_queue is not None:
+        _worker_overran_queue.put(job_id)
+    os._exit(_WATCHDOG_EXIT_CODE)
+
+
+def _run_limited(
+    call: Callable[[], Any],
+    timeout: float,
+    grace: float,
+    error_type: type[Exception],
+    job_id: str,
+) -> Any:
+    """Run ``call`` in a worker process, stopping it after ``timeout`` seconds.
+
+    The deadline starts when the worker picks the job up, not while it waits
+    in the pool queue. Timeouts and memory exhaustion surface as
+    ``error_type`` so the API answers them like any other unreadable file.
+    """
+    done = threading.Event()
+    use_alarm = timeout > 0 and hasattr(signal, "setitimer")
+    if timeout > 0:
+        threading.Thread(target=_watchdog, args=(job_id, timeout + grace, done), daemon=True).start()
+    if use_alarm:
+        previous = signal.signal(signal.SIGALRM, _raise_timeout)
+        signal.setitimer(signal.ITIMER_REAL, timeout)
+    try:
+        return call()
+    except _JobTimeout:
+        raise error_type(TIMEOUT_MESSAGE) from None
+    except MemoryError:
+        raise error_type(MEMORY_MESSAGE) from None
+    finally:
+        done.set()
+        if use_alarm:
+            signal.setitimer(signal.ITIMER_REAL, 0)
+            signal.signal(signal.SIGALRM, previous)
+
+
+def _standardizer_executor() -> ProcessPoolExecutor | None:
+    global _executor, _overran_queue
+    workers = settings.STANDARDIZER_WORKERS
+    # Celery prefork children are daemonic and may not start processes of their own.
+    if workers <= 0 or multiprocessing.current_process().daemon:
+        return None
+    with _executor_lock:
+        if _executor is None:
+            # spawn: the API process runs threads, which fork does not copy safely.
+            context = multiprocessing.get_context("spawn")
+            if _overran_queue is None:
+                _overran_queue = context.SimpleQueue()
+            _executor = ProcessPoolExecutor(
+                max_workers=workers,
+                mp_context=context,
+                initializer=_init_worker,
+                initargs=(settings.STANDARDIZER_MEMORY_LIMIT_MB, _overran_queue),
+                max_tasks_per_child=_MAX_TASKS_PER_WORKER,
+            )
+        return _executor
+
+
+def _discard_pool(executor: ProcessPoolExecutor) -> None:
+    global _executor
+    with _executor_lock:
+        # Every job of a broken pool fails at once; only the first caller
+        # replaces it, the rest must not throw away its successor.
+        if _executor is executor:
+            _executor = None
+    executor.shutdown(wait=False)
+
+
+def _job_overran(job_id: str) -> bool:
+    with _executor_lock:
+        while _overran_queue is not None and not _overran_queue.empty():
+            _overran_jobs.add(_overran_queue.get())
+        if job_id in _overran_jobs:
+            _overran_jobs.discard(job_id)
+            return True
+        return False
+
+
+def shutdown_standardizer_pool() -> None:
+    global _executor
+    with _executor_lock:
+        executor, _executor = _executor, None
+    if executor is not None:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+async def _run(func: Callable[..., Any], /, *args: Any, error_type: type[Exception], **kwargs: Any) -> Any:
+    call = functools.partial(func, *args, **kwargs)
+    timeout = settings.STANDARDIZER_TIMEOUT_SECONDS
+    # A worker stopped for someone else's job breaks the whole pool; jobs
+    # caught up in that get one more try on the replacement pool.
+    for attempt in range(2):
+        executor = _standardizer_executor()
+        if executor is None:
+            return await asyncio.to_thread(call)
+        job_id = uuid.uuid4().hex
+        try:
+            return await asyncio.get_running_loop().run_in_executor(
+                executor, _run_limited, call, timeout, _TIMEOUT_GRACE_SECONDS, error_type, job_id
+            )
+        except BrokenProcessPool:
+            _discard_pool(executor)
+            if _job_overran(job_id):
+                logger.warning("Standardizer job %s timed out; its worker was stopped", func.__name__)
+                raise error_type(TIMEOUT_MESSAGE) from None
+            logger.warning("Standardizer pool broke while running %s (attempt %d)", func.__name__, attempt + 1)
+    raise error_type(MEMORY_MESSAGE)
+
+
+def _analysis_key(kind: str, content: bytes, filename: str) -> str:
+    # The filename is part of the analysis (file type, suggested description).
+    name = hashlib.sha256(filename.encode("utf-8")).hexdigest()[:16]
+    return f"{_ANALYSIS_KEY_PREFIX}:{kind}:{hashlib.sha256(content).hexdigest()}:{name}"
+
+
+def _remember_analysis(key: str, payload: dict[str, Any]) -> None:
+    _analysis_cache[key] = payload
+    _analysis_cache.move_to_end(key)
+    while len(_analysis_cache) > _ANALYSIS_CACHE_SIZE:
+        _analysis_cache.popitem(last=False)
+
+
+async def _cached_analysis(key: str) -> dict[str, Any] | None:
+    payload = _analysis_cache.get(key)
+    if payload is not None:
+        _analysis_cache.move_to_end(key)
+        return payload
+    if not settings.REDIS_ENABLED:
+        return None
+    try:
+        raw = await get_redis().get(key)
+    except Exception:
+        logger.debug("Standardizer analysis cache read failed", exc_info=True)
+        return None
+    if raw is None:
+        return None
+    payload = json.loads(raw)
+    _remember_analysis(key, payload)
+    return payload
+
+
+async def _store_analysis(key: str, payload: dict[str, Any]) -> None:
+    _remember_analysis(key, payload)
+    if not settings.REDIS_ENABLED:
+        return
+    try:
+        await get_redis().set(key, json.dumps(payload, ensure_ascii=False), ex=_ANALYSIS_RETENTION_SECONDS)
+    except Exception:
+        logger.debug("Standardizer analysis cache write failed", exc_info=True)
+
+
+async def analyze_excel(content: bytes, filename: str) -> WorkbookAnalysis:
+    """``analyze_workbook`` off the event loop, cached by file content."""
+    key = await asyncio.to_thread(_analysis_key, "excel", content, filename)
+    cached = await _cached_analysis(key)
+    if cached is not None:
+        return WorkbookAnalysis.from_dict(cached)
+    analysis = await _run(analyze_workbook, content, filename, error_type=ExcelStandardizationError)
+    await _store_analysis(key, analysis.to_dict())
+    return analysis
+
+
+async def generate_excel(content: bytes, filename: str, **kwargs: Any) -> tuple[bytes, str, dict[str, Any]]:
+    """``standardize_workbook`` off the event loop, reusing a cached analysis."""
+    cached = await _cached_analysis(await asyncio.to_thread(_analysis_key, "excel", content, filename))
+    return await _run(
+        standardize_workbook,
+        content,
+        filename,
+        analysis=WorkbookAnalysis.from_dict(cached) if cached is not None else None,
+        error_type=ExcelStandardizationError,
+        **kwargs,
+    )
+
+
+async def analyze_word(content: bytes, filename: str) -> WordAnalysis:
+    """``analyze_word_document`` off the event loop, cached by file content."""
+    key = await asyncio.to_thread(_analysis_key, "word", content, filename)
+    cached = await _cached_analysis(key)
+    if cached is not None:
+        return WordAnalysis.from_dict(cached)
+    analysis = await _run(analyze_word_document, content, filename, error_type=WordStandardizationError)
+    await _store_analysis(key, analysis.to_dict())
+    return analysis
+
+
+async def generate_word(content: bytes, filename: str, **kwargs: Any) -> tuple[bytes, str, dict[str, Any]]:
+    """``standardize_word_document`` off the event loop, reusing a cached analysis."""
+    cached = await _cached_analysis(await asyncio.to_thread(_analysis_key, "word", content, filename))
+    return await _run(
+        standardize_word_document,
+        content,
+        filename,
+        analysis=WordAnalysis.from_dict(cached) if cached is not None else None,
+        error_type=WordStandardizationError,
+        **kwargs,
+    )
@@ -0,0 +1,204 @@
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import tempfile
+from collections.abc import AsyncIterator
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+from typing import BinaryIO
+
+from app.config import settings
+
+
+logger = logging.getLogger(__name__)
+
+_READ_CHUNK_BYTES = 64 * 1024
+_BACKEND_DIR = Path(__file__).resolve().parents[2]
+
+
+@dataclass(frozen=True, slots=True)
+class CachedAttachment:
+    path: Path
+    etag: str
+    media_type: str
+    size: int
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """Weak comparison of an ``If-None-Match`` header against ``etag``."""
+    if not if_none_match:
+        return False
+    candidates = {value.strip().removeprefix("W/") for value in if_none_match.split(",")}
+    return "*" in candidates or etag in candidates
+
+
+class StdAttachmentCache:
+    """Content-addressed local cache of STD ticket attachments.
+
+    Bodies are stored once per SHA-256 under ``blobs/``; ``refs/`` maps an
+    (external ticket, file) pair to its digest and media type. Serving a
+    blob touches its mtime, and the least recently used blobs are evicted
+    once the cache exceeds ``max_bytes``. STD file ids are immutable, so a
+    cached body never needs revalidating upstream.
+    """
+
+    def __init__(self, root: Path, *, max_bytes: int) -> None:
+        self.root = root.expanduser().resolve()
+        self.max_bytes = max_bytes
+
+    def _ref_path(self, external_id: str, file_id: str) -> Path:
+        digest = hashlib.sha256(f"{external_id}/{file_id}".encode()).hexdigest()
+        return self.root / "refs" / f"{digest}.json"
+
+    def _blob_path(self, digest: str) -> Path:
+        return self.root / "blobs" / digest[:2] / digest
+
+    def get(self, external_id: str, file_id: str) -> CachedAttachment | None:
+        ref_path = self._ref_path(external_id, file_id)
+        try:
+            ref = json.loads(ref_path.read_text())
+            blob_path = self._blob_path(str(ref["sha256"]))
+            size = blob_path.stat().st_size
+            os.utime(blob_path)
+        except (OSError, ValueError, KeyError):
+            return None
+        return CachedAttachment(
+            path=blob_path,
+            etag=f'"{ref["sha256"]}"',
+            media_type=str(ref.get("media_type") or "application/octet-stream"),
+            size=size,
+        )
+
+    def open_blob(self, attachment: CachedAttachment) -> BinaryIO | None:
+        """Open a cached body, or ``None`` if it was evicted since ``get``.
+
+        An open handle keeps reading the body even if it is evicted later.
+        """
+        try:
+            return attachment.path.open("rb")
+        except FileNotFoundError:
+            return None
+
+    async def tee(
+        self,
+        external_id: str,
+        file_id: str,
+        chunks: AsyncIterator[bytes],
+        *,
+        media_type: str,
+    ) -> AsyncIterator[bytes]:
+        """Yield ``chunks`` unchanged while writing them into the cache.
+
+        The body is only cached once it has been read to the end; an aborted
+        download or one larger than the whole cache leaves nothing behind.
+        File work runs in threads so a slow disk never stalls the event loop.
+        """
+        blobs_dir = self.root / "blobs"
+        await asyncio.to_thread(blobs_dir.mkdir, parents=True, exist_ok=True)
+        digest = hashlib.sha256()
+        size_bytes = 0
+        handle = await asyncio.to_thread(
+            tempfile.NamedTemporaryFile, dir=blobs_dir, prefix=".download-", suffix=".tmp", delete=False
+        )
+        temporary_path = Path(handle.name)
+        try:
+            async for chunk in chunks:
+                if handle is not None:
+                    size_bytes += len(chunk)
+                    if size_bytes > self.max_bytes:
+                        await asyncio.to_thread(_discard, handle, temporary_path)
+                        handle = None
+                    else:
+                        digest.update(chunk)
+                        await asyncio.to_thread(handle.write, chunk)
+                yield chunk
+            if handle is not None:
+                await asyncio.to_thread(handle.close)
+                await asyncio.to_thread(
+                    self._commit, external_id, file_id, temporary_path, digest.hexdigest(), media_type
+                )
+        finally:
+            await asyncio.to_thread(_discard, handle, temporary_path)
+
+    async def store(
+        self,
+        external_id: str,
+        file_id: str,
+        chunks: AsyncIterator[bytes],
+        *,
+        media_type: str,
+    ) -> CachedAttachment | None:
+        async for _chunk in self.tee(external_id, file_id, chunks, media_type=media_type):
+            pass
+        return await asyncio.to_thread(self.get, external_id, file_id)
+
+    def _commit(
+        self,
+        external_id: str,
+        file_id: str,
+        temporary_path: Path,
+        sha256: str,
+        media_type: str,
+    ) -> None:
+        blob_path = self._blob_path(sha256)
+        blob_path.parent.mkdir(parents=True, exist_ok=True)
+        if blob_path.exists():
+            os.utime(blob_path)
+        else:
+            os.replace(temporary_path, blob_path)
+        ref_path = self._ref_path(external_id, file_id)
+        ref_path.parent.mkdir(parents=True, exist_ok=True)
+        with tempfile.NamedTemporaryFile(
+            "w", dir=ref_path.parent, prefix=".ref-", suffix=".tmp", delete=False
+        ) as handle:
+            json.dump({"sha256": sha256, "media_type": media_type}, handle)
+        os.replace(handle.name, ref_path)
+        self.evict()
+
+    def evict(self) -> int:
+        """Drop least recently used blobs until the cache fits ``max_bytes``."""
+        blobs: list[tuple[float, int, Path]] = []
+        for path in (self.root / "blobs").glob("*/*"):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            blobs.append((stat.st_mtime, stat.st_size, path))
+        total = sum(size for _, size, _ in blobs)
+        removed = 0
+        for _, size, path in sorted(blobs):
+            if total <= self.max_bytes:
+                break
+            path.unlink(missing_ok=True)
+            total -= size
+            removed += 1
+        # Refs to evicted blobs read as misses and are rewritten on the next fetch.
+        return removed
+
+
+def _discard(handle: BinaryIO | None, temporary_path: Path) -> None:
+    if handle is not None:
+        handle.close()
+    temporary_path.unlink(missing_ok=True)
+
+
+async def read_blob(handle: BinaryIO) -> AsyncIterator[bytes]:
+    """Stream an opened cached body off the event loop, closing it at the end."""
+    try:
+        while chunk := await asyncio.to_thread(handle.read, _READ_CHUNK_BYTES):
+            yield chunk
+    finally:
+        await asyncio.to_thread(handle.close)
+
+
+@lru_cache
+def get_std_attachment_cache() -> StdAttachmentCache:
+    root = Path(settings.STD_ATTACHMENT_CACHE_DIR)
+    if not root.is_absolute():
+        root = _BACKEND_DIR / root
+    return StdAttachmentCache(root, max_bytes=settings.STD_ATTACHMENT_CACHE_MAX_MB * 1024 * 1024)
@@ -3,6 +3,8 @@ from __future__ import annotations
 import asyncio
 import logging
 import os
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 from datetime import date, datetime, timezone
 from typing import Any
 
@@ -13,6 +15,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from app.config import settings
 from app.models.std_feedback_ticket import StdFeedbackSyncState, StdFeedbackTicket
 from app.services.primeflow_report import report_timezone
+from app.services.std_attachment_cache import get_std_attachment_cache
 
 
 logger = logging.getLogger(__name__)
@@ -231,15 +234,27 @@ class StdFeedbackClient:
     async def close(self) -> None:
         await self._client.aclose()
 
-    async def _get(self, path: str, *, params: dict[str, Any] | None = None) -> httpx.Response:
+    async def _get(
+        self,
+        path: str,
+        *,
+        params: dict[str, Any] | None = None,
+        stream: bool = False,
+    ) -> httpx.Response:
         retries = max(1, settings.STD_FEEDBACK_REQUEST_RETRIES)
         last_error: Exception | None = None
         for attempt in range(retries):
+            response: httpx.Response | None = None
             try:
-                response = await self._client.get(path, params=params)
+                response = await self._client.send(
+                    self._client.build_request("GET", path, params=params),
+                    stream=stream,
+                )
                 response.raise_for_status()
                 return response
             except (httpx.TransportError, httpx.HTTPStatusError) as exc:
+                if stream and response is not None:
+                    await response.aclose()
                 last_error = exc
                 if isinstance(exc, httpx.HTTPStatusError) and exc.response.status_code < 500:
                     raise
@@ -262,8 +277,14 @@ class StdFeedbackClient:
         response = await self._get(f"/feedback-tickets/{external_id}")
         return _ticket_payload(response.json())
 
-    async def get_file(self, external_id: str, file_id: str) -> httpx.Response:
-        return await self._get(f"/feedback-tickets/{external_id}/files/{file_id}")
+    @asynccontextmanager
+    async def stream_file(self, external_id: str, file_id: str) -> AsyncIterator[httpx.Response]:
+        """Open an attachment download; the body is read with ``aiter_bytes``."""
+        response = await self._get(f"/feedback-tickets/{external_id}/files/{file_id}", stream=True)
+        try:
+            yield response
+        finally:
+            await response.aclose()
 
 
 async def _existing_by_external_ids(
@@ -366,6 +387,7 @@ async def sync_std_feedback_tickets(
     synced = 0
     pages = 0
     seen_cursors: set[tuple[str, str]] = set()
+    synced_tickets: list[StdFeedbackTicket] = []
     try:
         while True:
             data = await active_client.list_tickets(params)
@@ -383,9 +405,11 @@ async def sync_std_feedback_tickets(
                     detail = await active_client.get_ticket(external_id)
                     payload = {**summary, **detail}
                 if is_external_ticket_payload(payload) or existing is not None:
-                    await _upsert_std_ticket(db, payload, existing=existing)
+                    ticket = await _upsert_std_ticket(db, payload, existing=existing)
                     if is_external_ticket_payload(payload):
                         synced += 1
+                        if ticket is not None:
+                            synced_tickets.append(ticket)
 
             pagination = _pagination_payload(data)
             cursor = _cursor_from_page(data, rows)
@@ -411,6 +435,9 @@ async def sync_std_feedback_tickets(
         state.last_successful_sync_at = datetime.now(timezone.utc)
         state.last_sync_error = None
         await db.commit()
+        if settings.STD_ATTACHMENT_PREFETCH and synced_tickets:
+            prefetched = await prefetch_std_ticket_attachments(active_client, synced_tickets)
+            logger.info("std_feedback_attachments_prefetched: %s", prefetched)
         return {"ok": True, "synced": synced, "pages": pages, "initial_sync": initial_sync}
     except Exception as exc:
         await db.rollback()
@@ -460,6 +487,48 @@ def ticket_files(ticket: StdFeedbackTicket) -> list[dict[str, Any]]:
     return [item for item in value if isinstance(item, dict)] if isinstance(value, list) else []
 
 
+def attachment_media_type(response: httpx.Response, metadata: dict[str, Any]) -> str:
+    return (
+        response.headers.get("content-type")
+        or str(metadata.get("content_type") or "application/octet-stream")
+    )
+
+
+async def prefetch_std_ticket_attachments(
+    client: StdFeedbackClient,
+    tickets: list[StdFeedbackTicket],
+) -> int:
+    """Download attachments of ``tickets`` that are not cached yet.
+
+    Failures are logged and skipped so a broken attachment never fails the
+    ticket sync; the download route fetches it on demand instead.
+    """
+    cache = get_std_attachment_cache()
+    prefetched = 0
+    for ticket in tickets:
+        for metadata in ticket_files(ticket):
+            file_id = _stringify(metadata.get("id"))
+            if not file_id or await asyncio.to_thread(cache.get, ticket.external_id, file_id) is not None:
+                continue
+            size = _int_or_none(metadata.get("size"))
+            if size is not None and size > cache.max_bytes:
+                continue
+            try:
+                async with client.stream_file(ticket.external_id, file_id) as upstream:
+                    cached = await cache.store(
+                        ticket.external_id,
+                        file_id,
+                        upstream.aiter_bytes(),
+                        media_type=attachment_media_type(upstream, metadata),
+                    )
+            except Exception:
+                logger.warning("std_feedback_attachment_prefetch_failed")
+                continue
+            if cached is not None:
+                prefetched += 1
+    return prefetched
+
+
 def _status_is(*values: str):
     return func.lower(StdFeedbackTicket.status).in_([value.casefold() for value in values])
 
@@ -0,0 +1,89 @@
+from __future__ import annotations
+
+from collections import namedtuple
+from typing import Any
+
+from sqlalchemy import Select, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import defer
+
+from app.models.task import Task
+
+
+# Free-text columns that can be large; read paths that only need scheduling
+# and ownership facts should never transfer them.
+TASK_TEXT_FIELDS = ("description", "internal_notes")
+
+
+class TaskProjection:
+    """Column-projected task reads returning compact named tuples.
+
+    Rows are plain tuples: no identity map, no change tracking and no lazy
+    loaders. Reading a column the projection does not select raises
+    ``AttributeError``, so a missing field is caught instead of read as empty.
+    """
+
+    __slots__ = ("fields", "row_type")
+
+    def __init__(self, *fields: str) -> None:
+        unknown = [name for name in fields if name not in Task.__table__.columns]
+        if unknown:
+            raise ValueError(f"Unknown task columns: {', '.join(unknown)}")
+        if "id" not in fields:
+            fields = ("id", *fields)
+        self.fields = tuple(dict.fromkeys(fields))
+        self.row_type = namedtuple("TaskRow", self.fields)
+
+    def select(self) -> Select:
+        return select(*(getattr(Task, name) for name in self.fields))
+
+    def row(self, values: Any) -> Any:
+        return self.row_type._make(values)
+
+    async def fetch(self, db: AsyncSession, stmt: Select) -> list[Any]:
+        make = self.row_type._make
+        return [make(values) for values in (await db.execute(stmt)).all()]
+
+
+def defer_task_text(*fields: str) -> tuple:
+    """Loader options that skip large text columns on full ``Task`` loads.
+
+    ``raiseload`` turns an accidental access into an immediate error instead
+    of an implicit per-row lazy load, which async sessions cannot perform.
+    """
+    names = fields or TASK_TEXT_FIELDS
+    return tuple(defer(getattr(Task, name), raiseload=True) for name in names)
+
+
+# The task CSV/XLSX exports write the description column, so it is read here;
+# internal_notes is not.
+EXPORT_TASK_PROJECTION = TaskProjection(
+    "id",
+    "title",
+    "description",
+    "status",
+    "priority",
+    "department_id",
+    "project_id",
+    "assigned_to",
+    "start_date",
+    "due_date",
+    "created_at",
+    "completed_at",
+)
+
+EVIDENCE_TASK_PROJECTION = TaskProjection(
+    "id",
+    "title",
+    "status",
+    "department_id",
+    "project_id",
+    "assigned_to",
+    "confirmation_assignee_id",
+    "system_template_origin_id",
+    "meeting_origin_id",
+    "due_date",
+    "original_due_date",
+    "completed_at",
+    "created_at",
+)
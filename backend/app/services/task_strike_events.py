@@ -3,9 +3,11 @@ from __future__ import annotations
 import hashlib
 import re
 import uuid
-from dataclasses import dataclass
+from collections import Counter
+from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Iterable
+from functools import lru_cache
+from typing import Iterable, Mapping
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -19,6 +21,10 @@ STRIKE_TIMESTAMP_SUFFIX = re.compile(
     r"\s+(?P<hour>\d{2}):(?P<minute>\d{2})\s+(?P<day>\d{2})\.(?P<month>\d{2})\s*$"
 )
 CHECKLIST_ITEM = re.compile(r"(?m)^\s*(?:\d+\.\s+|[•*-]\s+)")
+POINT_MARKER = re.compile(r"^(?:\d+\.|[•*-])\s*")
+# Parsed texts are keyed by their content, so editing a description or title
+# simply misses the cache; stale entries age out of the LRU.
+POINT_INDEX_CACHE_SIZE = 4096
 
 
 @dataclass(frozen=True)
@@ -159,20 +165,48 @@ def _point_entries(value: str | None, *, field_name: str) -> list[tuple[StrikePo
     return entries
 
 
-def _struck_points_by_identity(value: str | None, *, field_name: str) -> dict[str, StrikePoint]:
-    """Return currently struck points using the position-aware key."""
+@dataclass(frozen=True)
+class TextPointIndex:
+    """A text's points parsed once: heading, points and the struck subset.
 
-    raw = value or ""
-    entries = _point_entries(raw, field_name=field_name)
-    result: dict[str, StrikePoint] = {}
-    for match in DONE_BLOCK.finditer(raw):
+    Instances are shared through ``text_point_index``'s cache and must be
+    treated as read-only.
+    """
+
+    heading: str
+    points: tuple[StrikePoint, ...]
+    struck: Mapping[str, StrikePoint] = field(default_factory=dict)
+    legacy_key_counts: Mapping[str, int] = field(default_factory=dict)
+
+
+@lru_cache(maxsize=POINT_INDEX_CACHE_SIZE)
+def text_point_index(value: str, field_name: str) -> TextPointIndex:
+    """Parse ``value`` into its strikable points, cached by text content."""
+
+    entries = _point_entries(value, field_name=field_name)
+    struck: dict[str, StrikePoint] = {}
+    for match in DONE_BLOCK.finditer(value):
         # Only the content inside the markers is struck. Including the closing
         # marker can overlap the following numbered point on the next line.
         done_start, done_end = match.span(1)
         for point, start, end in entries:
             if start < done_end and done_start < end:
-                result[point.key] = point
-    return result
+                struck[point.key] = point
+    cleaned = TECHNICAL_TAGS.sub("", value).strip()
+    first = CHECKLIST_ITEM.search(cleaned)
+    points = tuple(point for point, _start, _end in entries)
+    return TextPointIndex(
+        heading=cleaned[:first.start()].strip() if first else "",
+        points=points,
+        struck=struck,
+        legacy_key_counts=Counter(point.legacy_key for point in points),
+    )
+
+
+def _struck_points_by_identity(value: str | None, *, field_name: str) -> dict[str, StrikePoint]:
+    """Return currently struck points using the position-aware key."""
+
+    return dict(text_point_index(value or "", field_name).struck)
 
 
 def struck_points(value: str | None, *, field_name: str = "DESCRIPTION") -> dict[str, StrikePoint]:
@@ -273,18 +307,6 @@ def record_title_strike_events(
     )
 
 
-def _text_points(value: str | None, *, field_name: str) -> tuple[str, list[StrikePoint], set[str]]:
-    """Split text into report points, keeping numbered headings out of the list."""
-
-    raw = value or ""
-    cleaned = TECHNICAL_TAGS.sub("", raw).strip()
-    matches = list(CHECKLIST_ITEM.finditer(cleaned))
-    heading = cleaned[:matches[0].start()].strip() if matches else ""
-    points = [point for point, _start, _end in _point_entries(raw, field_name=field_name)]
-    current_done = set(_struck_points_by_identity(raw, field_name=field_name))
-    return heading, points, current_done
-
-
 def render_text_for_interval(
     text: str | None,
     events: Iterable[TaskStrikeEvent],
@@ -307,32 +329,39 @@ def render_text_for_interval(
         if event_field == field_name and event.occurred_at <= interval_end:
             latest[event.point_key] = event
             relevant_events.append(event)
+    # Built on first use: only legacy events without an identity key need it.
+    latest_by_text: dict[str, tuple[int, TaskStrikeEvent]] | None = None
 
     def event_for_point(point: StrikePoint) -> TaskStrikeEvent | None:
         """Find an event even when an older UI save omitted ``1.`` from it."""
 
+        nonlocal latest_by_text
         exact = latest.get(point.key)
         if exact is not None:
             return exact
         # Old events only have a text-based key. One such event cannot identify
         # which of several identical bullets was actually struck.
-        if sum(candidate.legacy_key == point.legacy_key for candidate in points) != 1:
+        if index.legacy_key_counts.get(point.legacy_key, 0) != 1:
             return None
         legacy = latest.get(point.legacy_key)
         if legacy is not None:
             return legacy
+        if latest_by_text is None:
+            latest_by_text = {}
+            for position, event in enumerate(relevant_events):
+                event_text = _normalise(getattr(event, "point_text", "")).casefold()
+                if event_text:
+                    latest_by_text[event_text] = (position, event)
         full = _normalise(point.text).casefold()
-        without_marker = re.sub(r"^(?:\d+\.|[•*-])\s*", "", full)
-        compatible = []
-        for event in relevant_events:
-            event_text = _normalise(getattr(event, "point_text", "")).casefold()
-            if not event_text:
-                continue
-            if event_text in {full, without_marker}:
-                compatible.append(event)
-        return compatible[-1] if compatible else None
+        compatible = [
+            latest_by_text[candidate]
+            for candidate in {full, POINT_MARKER.sub("", full)}
+            if candidate in latest_by_text
+        ]
+        return max(compatible, key=lambda item: item[0])[1] if compatible else None
 
-    heading, points, current_done = _text_points(text, field_name=field_name)
+    index = text_point_index(text or "", field_name)
+    heading, points, current_done = index.heading, index.points, index.struck
     plain_parts = [heading] if heading else []
     marked_parts = [heading] if heading else []
     for point in points:
@@ -514,5 +514,10 @@ async def build_tomorrow_print_report(
 
 async def send_tomorrow_print_report(report: dict[str, Any], recipients: dict[str, list[str]]) -> dict[str, Any]:
     return await GmailService().send_verified(
-        report["subject"], recipients, report["plain_text"], report["html"], attachments=report.get("attachments")
+        report["subject"],
+        recipients,
+        report["plain_text"],
+        report["html"],
+        attachments=report.get("attachments"),
+        source="tomorrow_print",
     )
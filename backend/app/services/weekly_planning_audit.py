@@ -23,6 +23,7 @@ from app.models.task import Task
 from app.models.user import User
 from app.services.common_leave import parse_common_view_annual_leave
 from app.services.daily_report_logic import ko_rule_applies_for_task, parse_ko_user_id
+from app.services.planner_occurrences import OCCURRENCE_FAST, OCCURRENCE_PROJECT, OCCURRENCE_SYSTEM
 
 
 REPORT_VERSION = "1.2"
@@ -775,6 +776,13 @@ def audit_error_dedup_key(user_id: uuid.UUID, error: AuditError) -> tuple[str, .
     return (str(user_id), error.task_id or "", error.rule_code)
 
 
+_PLANNER_SOURCES = {
+    OCCURRENCE_PROJECT: "Weekly Planner / project",
+    OCCURRENCE_FAST: "Weekly Planner / fast task",
+    OCCURRENCE_SYSTEM: "Weekly Planner / system task",
+}
+
+
 def _occurrence_key(item: AuditTaskOccurrence) -> tuple[str, str, str]:
     return (
         str(item.user_id),
@@ -791,7 +799,7 @@ async def _planner_occurrences(
 ) -> list[AuditTaskOccurrence]:
     # Imported lazily to avoid router-package initialization cycles while still
     # using the exact read-only Weekly Planner query as the source of occurrences.
-    from app.api.routers.planners import weekly_table_planner
+    from app.api.routers.planners import load_weekly_planner_week
 
     planner_user = SimpleNamespace(
         id=uuid.UUID(int=0),
@@ -799,58 +807,29 @@ async def _planner_occurrences(
         department_id=None,
         full_name="Weekly Planning Audit",
     )
-    planner = await weekly_table_planner(
-        week_start=week_start,
-        department_id=None,
-        is_this_week=False,
-        db=db,
-        user=planner_user,
-    )
+    week = await load_weekly_planner_week(db, user=planner_user, week_start=week_start)
     raw: list[dict[str, Any]] = []
-    for department in planner.departments:
-        for day in department.days:
-            for person in day.users:
-                for period, projects in (("AM", person.am_projects), ("PM", person.pm_projects)):
-                    for project in projects:
-                        for task in project.tasks:
-                            raw.append({
-                                "user_id": person.user_id,
-                                "employee": person.user_name,
-                                "department": department.department_name,
-                                "task_date": day.date,
-                                "task_id": task.task_id,
-                                "project_id": project.project_id,
-                                "project_name": project.project_title,
-                                "finish_period": task.finish_period or period,
-                                "is_system": False,
-                                "source": "Weekly Planner / project",
-                            })
-                for period, tasks in (("AM", person.am_fast_tasks), ("PM", person.pm_fast_tasks)):
-                    for task in tasks:
-                        raw.append({
-                            "user_id": person.user_id,
-                            "employee": person.user_name,
-                            "department": department.department_name,
-                            "task_date": day.date,
-                            "task_id": task.task_id,
-                            "title": task.title,
-                            "finish_period": task.finish_period or period,
-                            "is_system": False,
-                            "source": "Weekly Planner / fast task",
-                        })
-                for period, tasks in (("AM", person.am_system_tasks), ("PM", person.pm_system_tasks)):
-                    for task in tasks:
-                        raw.append({
-                            "user_id": person.user_id,
-                            "employee": person.user_name,
-                            "department": department.department_name,
-                            "task_date": day.date,
-                            "task_id": task.task_id,
-                            "title": task.title,
-                            "finish_period": task.finish_period or period,
-                            "is_system": True,
-                            "source": "Weekly Planner / system task",
-                        })
+    for occurrence in week.occurrences():
+        if occurrence.task is None:
+            continue
+        item = {
+            "user_id": occurrence.user_id,
+            "employee": occurrence.user_name,
+            "department": occurrence.department_name,
+            "task_date": occurrence.day,
+            "task_id": occurrence.task_id,
+            "finish_period": occurrence.finish_period or occurrence.slot,
+            "is_system": occurrence.kind == OCCURRENCE_SYSTEM,
+            "source": _PLANNER_SOURCES[occurrence.kind],
+        }
+        if occurrence.kind == OCCURRENCE_PROJECT:
+            item["project_id"] = occurrence.project_id
+            item["project_name"] = occurrence.project_title
+        else:
+            item["title"] = (
+                occurrence.template.title if occurrence.kind == OCCURRENCE_SYSTEM else occurrence.task.title
+            )
+        raw.append(item)
 
     task_ids = sorted({item["task_id"] for item in raw if item.get("task_id")}, key=str)
     task_map: dict[uuid.UUID, Task] = {}
@@ -3,23 +3,23 @@ from __future__ import annotations
 import hashlib
 import logging
 import os
-import tempfile
 import uuid
 from datetime import date, datetime, timedelta
-from pathlib import Path
 from zoneinfo import ZoneInfo
 
 from sqlalchemy import func, select, text
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.config import settings
-from app.db import SessionLocal
+from app.db import ReadSessionLocal, SessionLocal
+from app.integrations.storage import REPORTS_NAMESPACE, StorageBackend, StorageError, get_storage
 from app.models.weekly_planning_audit import (
     WeeklyPlanningAuditDelivery,
     WeeklyPlanningAuditRun,
     WeeklyPlanningAuditSettings,
 )
 from app.services.primeflow_report import GmailService
+from app.services.report_rendering import run_renderer
 from app.services.weekly_planning_audit import (
     build_weekly_planning_audit,
     normalize_week_start,
@@ -36,6 +36,7 @@ REPORT_TYPE = "weekly_planning_audit"
 SCHEDULED = "SCHEDULED"
 MANUAL = "MANUAL"
 APPROVED_SLOT = "10:30"
+XLSX_MEDIA_TYPE = "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
 REQUIRED_RECIPIENTS = (
     "130primex.eu@gmail.com",
     "info@primexeu.com",
@@ -149,24 +150,12 @@ def record_delivery_failure(
     run.error_message = message
 
 
-def _storage_root() -> Path:
-    return Path(settings.REPORT_STORAGE_DIR).expanduser().resolve()
+def _report_storage() -> StorageBackend:
+    return get_storage(REPORTS_NAMESPACE)
 
 
-def _safe_run_path(run_id: uuid.UUID, filename: str) -> Path:
-    root = _storage_root()
-    target_dir = (root / str(run_id)).resolve()
-    if target_dir != root and root not in target_dir.parents:
-        raise RuntimeError("Invalid report storage target")
-    target_dir.mkdir(parents=True, exist_ok=True)
-    return target_dir / filename
-
-
-def _write_atomic(path: Path, content: bytes) -> None:
-    with tempfile.NamedTemporaryFile(dir=path.parent, prefix=".weekly-audit-", suffix=".tmp", delete=False) as handle:
-        handle.write(content)
-        temporary_path = Path(handle.name)
-    os.replace(temporary_path, path)
+def _run_storage_key(run_id: uuid.UUID, filename: str) -> str:
+    return f"{run_id}/{filename}"
 
 
 async def generate_report_run(
@@ -224,24 +213,26 @@ async def generate_report_run(
 
     abbreviation_override = config.abbreviation_dictionary or None
     try:
-        report = await build_weekly_planning_audit(
-            db,
-            week_start=normalized_start,
-            slot=slot,
-            timezone_name=config.timezone,
-            abbreviation_override=abbreviation_override,
-            abbreviation_version=config.abbreviation_version,
-        )
+        async with ReadSessionLocal() as read_db:
+            report = await build_weekly_planning_audit(
+                read_db,
+                week_start=normalized_start,
+                slot=slot,
+                timezone_name=config.timezone,
+                abbreviation_override=abbreviation_override,
+                abbreviation_version=config.abbreviation_version,
+            )
         filename = report_filename(report)
-        workbook = build_weekly_planning_audit_workbook(
+        workbook = await run_renderer(
+            build_weekly_planning_audit_workbook,
             report,
             recipients=recipients,
             run_id=str(run.id),
             message_id=None,
         )
         checksum = hashlib.sha256(workbook).hexdigest()
-        path = _safe_run_path(run.id, filename)
-        _write_atomic(path, workbook)
+        storage_key = _run_storage_key(run.id, filename)
+        await _report_storage().put_bytes(storage_key, workbook, content_type=XLSX_MEDIA_TYPE)
         run.generated_at = report.generated_at
         run.status = "GENERATED"
         run.included_user_count = len(report.people)
@@ -251,7 +242,7 @@ async def generate_report_run(
         run.high_count = sum(item.severity == "HIGH" for item in report.errors)
         run.filename = filename
         run.file_checksum = checksum
-        run.storage_path = str(path)
+        run.storage_path = storage_key
         run.subject = report_subject(report)
         run.report_payload = report.to_dict()
         await db.flush()
@@ -299,9 +290,12 @@ async def send_report_run(
         raise ValueError("Report run not found")
     if not run.storage_path or not run.filename or not run.file_checksum:
         raise ValueError("Report file is not available")
-    path = Path(run.storage_path).resolve()
-    root = _storage_root()
-    if root not in path.parents or not path.is_file():
+    storage = _report_storage()
+    try:
+        stored = await storage.exists(run.storage_path)
+    except StorageError:
+        stored = False
+    if not stored:
         raise ValueError("Stored report file is missing")
 
     if not resend:
@@ -348,7 +342,7 @@ async def send_report_run(
     await db.refresh(delivery)
 
     try:
-        attachment = path.read_bytes()
+        attachment = await storage.read_bytes(run.storage_path)
         if hashlib.sha256(attachment).hexdigest() != run.file_checksum:
             raise ValueError("Stored report checksum does not match")
         sender_domain = os.environ.get("EMAIL_USER", "primeflow.local").rsplit("@", 1)[-1]
@@ -365,9 +359,11 @@ async def send_report_run(
             attachments=[(
                 run.filename,
                 attachment,
-                "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+                XLSX_MEDIA_TYPE,
             )],
             message_id=stable_message_id,
+            source=REPORT_TYPE,
+            source_id=delivery.id,
         )
         delivery.status = "SENT"
         # SMTP confirms acceptance but does not return a Gmail provider ID.
@@ -415,11 +411,15 @@ async def generate_and_send_scheduled(slot: str, week_start: date | None = None)
 
 
 async def cleanup_expired_report_files() -> int:
+    """Apply report retention to storage and detach expired runs.
+
+    Local storage deletes files past retention; S3 storage installs a bucket
+    lifecycle rule so the object store expires them without this job.
+    """
     now = datetime.now(ZoneInfo(settings.WEEKLY_PLANNING_AUDIT_TIMEZONE))
-    removed = 0
-    root = _storage_root()
     async with SessionLocal() as db:
         config = await get_or_create_settings(db)
+        removed = await _report_storage().apply_retention(config.retention_days)
         cutoff = now - timedelta(days=config.retention_days)
         rows = (await db.execute(
             select(WeeklyPlanningAuditRun).where(
@@ -428,11 +428,7 @@ async def cleanup_expired_report_files() -> int:
             )
         )).scalars().all()
         for run in rows:
-            path = Path(run.storage_path or "").resolve()
-            if root in path.parents and path.is_file():
-                path.unlink()
-                removed += 1
             run.storage_path = None
         await db.commit()
-    logger.info("weekly_planning_audit_cleanup removed=%s", removed)
+    logger.info("weekly_planning_audit_cleanup removed=%s detached=%s", removed, len(rows))
     return removed
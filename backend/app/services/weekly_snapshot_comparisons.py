@@ -0,0 +1,207 @@
+from __future__ import annotations
+
+import hashlib
+import logging
+import uuid
+from datetime import date
+from typing import Any
+
+from sqlalchemy import String, and_, cast, exists, func, or_, select
+from sqlalchemy.dialects.postgresql import aggregate_order_by, insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db import SessionLocal
+from app.models.enums import ProjectPhaseStatus
+from app.models.project import Project
+from app.models.project_member import ProjectMember
+from app.models.project_planner_exclusion import ProjectPlannerExclusion
+from app.models.system_task_occurrence import SystemTaskOccurrence
+from app.models.system_task_template import SystemTaskTemplate
+from app.models.task import Task
+from app.models.task_assignee import TaskAssignee
+from app.models.task_daily_progress import TaskDailyProgress
+from app.models.task_planner_exclusion import TaskPlannerExclusion
+from app.models.user import User
+from app.models.weekly_plan import WeeklyPlan
+from app.models.weekly_planner_snapshot import WeeklySnapshotComparison
+
+
+logger = logging.getLogger(__name__)
+
+# Bump when the classification rules or the cached result shape change so
+# previously stored comparisons are recomputed instead of served.
+COMPARISON_VERSION = 1
+
+COMPARE_BUCKETS = ("completed", "in_progress", "pending", "late", "additional", "removed_or_canceled")
+
+
+def comparison_cache_key(*parts: Any) -> str:
+    raw = "|".join(str(part) for part in (COMPARISON_VERSION, *parts))
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+def _row_set_digest(*columns: Any, where: Any) -> Any:
+    # md5 of the sorted rows: adding, removing, swapping or editing any row
+    # in scope changes it, which a count/max pair can miss.
+    row = func.concat_ws(":", *(cast(column, String) for column in columns))
+    return (
+        select(func.md5(func.coalesce(func.array_to_string(func.array_agg(aggregate_order_by(row, row)), ","), "")))
+        .where(where)
+        .scalar_subquery()
+    )
+
+
+async def live_week_revision(
+    db: AsyncSession,
+    *,
+    department_id: uuid.UUID,
+    week_start: date,
+    week_end: date,
+) -> str:
+    """Fingerprint the data the live weekly planner of one department is built from.
+
+    One round trip over the rows the planner can read for the department and
+    week: its users and their tasks, assignments, projects and memberships,
+    the system templates and occurrences assigned to them, the week's
+    progress and exclusions and the saved weekly plan. Rows are digested by
+    key and ``updated_at``, so edits elsewhere leave the cached comparison in
+    place while any relevant change invalidates it.
+    """
+    user_ids = select(User.id).where(User.department_id == department_id)
+    task_ids = select(Task.id).where(
+        Task.is_active.is_(True),
+        or_(
+            Task.assigned_to.in_(user_ids),
+            exists(select(1).where(TaskAssignee.task_id == Task.id, TaskAssignee.user_id.in_(user_ids))),
+            # CONTROL tasks can be owned through internal_notes; the planner reads all of them.
+            Task.phase == ProjectPhaseStatus.CONTROL.value,
+        ),
+    )
+    project_ids = select(Project.id).where(
+        or_(
+            Project.department_id == department_id,
+            Project.id.in_(select(Task.project_id).where(Task.id.in_(task_ids))),
+            Project.id.in_(select(ProjectMember.project_id).where(ProjectMember.user_id.in_(user_ids))),
+        )
+    )
+    user_id_array = select(func.array_agg(User.id)).where(User.department_id == department_id).scalar_subquery()
+    digests = [
+        _row_set_digest(User.id, User.updated_at, where=User.department_id == department_id),
+        _row_set_digest(Task.id, Task.updated_at, where=Task.id.in_(task_ids)),
+        _row_set_digest(TaskAssignee.task_id, TaskAssignee.user_id, where=TaskAssignee.task_id.in_(task_ids)),
+        _row_set_digest(Project.id, Project.updated_at, where=Project.id.in_(project_ids)),
+        _row_set_digest(
+            ProjectMember.project_id, ProjectMember.user_id, where=ProjectMember.project_id.in_(project_ids)
+        ),
+        _row_set_digest(
+            TaskPlannerExclusion.id,
+            TaskPlannerExclusion.time_slot,
+            where=and_(
+                TaskPlannerExclusion.day_date.between(week_start, week_end),
+                TaskPlannerExclusion.user_id.in_(user_ids),
+            ),
+        ),
+        _row_set_digest(
+            ProjectPlannerExclusion.id,
+            ProjectPlannerExclusion.time_slot,
+            where=and_(
+                ProjectPlannerExclusion.day_date.between(week_start, week_end),
+                ProjectPlannerExclusion.user_id.in_(user_ids),
+            ),
+        ),
+        # Earlier days are read too: unfinished progress carries into the week.
+        _row_set_digest(
+            TaskDailyProgress.id,
+            TaskDailyProgress.updated_at,
+            where=and_(TaskDailyProgress.task_id.in_(task_ids), TaskDailyProgress.day_date <= week_end),
+        ),
+        _row_set_digest(
+            SystemTaskTemplate.id,
+            SystemTaskTemplate.updated_at,
+            where=or_(
+                SystemTaskTemplate.department_id == department_id,
+                SystemTaskTemplate.department_id.is_(None),
+                SystemTaskTemplate.default_assignee_id.in_(user_ids),
+                SystemTaskTemplate.assignee_ids.overlap(user_id_array),
+            ),
+        ),
+        _row_set_digest(
+            SystemTaskOccurrence.id,
+            SystemTaskOccurrence.updated_at,
+            where=and_(
+                SystemTaskOccurrence.occurrence_date.between(week_start, week_end),
+                SystemTaskOccurrence.user_id.in_(user_ids),
+            ),
+        ),
+        _row_set_digest(
+            WeeklyPlan.id,
+            WeeklyPlan.updated_at,
+            where=and_(WeeklyPlan.department_id == department_id, WeeklyPlan.start_date == week_start),
+        ),
+    ]
+    values = (await db.execute(select(*digests))).one()
+    return comparison_cache_key(*values)
+
+
+async def load_comparison(
+    db: AsyncSession,
+    *,
+    baseline_snapshot_id: uuid.UUID,
+    compare_snapshot_id: uuid.UUID | None,
+    cache_key: str,
+) -> dict | None:
+    stmt = select(WeeklySnapshotComparison.result).where(
+        WeeklySnapshotComparison.baseline_snapshot_id == baseline_snapshot_id,
+        WeeklySnapshotComparison.cache_key == cache_key,
+    )
+    if compare_snapshot_id is None:
+        stmt = stmt.where(WeeklySnapshotComparison.compare_snapshot_id.is_(None))
+    else:
+        stmt = stmt.where(WeeklySnapshotComparison.compare_snapshot_id == compare_snapshot_id)
+    return (await db.execute(stmt)).scalar_one_or_none()
+
+
+async def store_comparison(
+    *,
+    baseline_snapshot_id: uuid.UUID,
+    compare_snapshot_id: uuid.UUID | None,
+    cache_key: str,
+    result: dict,
+) -> None:
+    """Upsert a computed comparison on the primary.
+
+    Runs in its own session because callers may hold a read-only replica
+    session; a failed write only costs a recomputation on the next view.
+    """
+    where = (
+        WeeklySnapshotComparison.compare_snapshot_id.is_(None)
+        if compare_snapshot_id is None
+        else WeeklySnapshotComparison.compare_snapshot_id.is_not(None)
+    )
+    index_elements = (
+        [WeeklySnapshotComparison.baseline_snapshot_id]
+        if compare_snapshot_id is None
+        else [WeeklySnapshotComparison.baseline_snapshot_id, WeeklySnapshotComparison.compare_snapshot_id]
+    )
+    stmt = pg_insert(WeeklySnapshotComparison).values(
+        id=uuid.uuid4(),
+        baseline_snapshot_id=baseline_snapshot_id,
+        compare_snapshot_id=compare_snapshot_id,
+        cache_key=cache_key,
+        result=result,
+    )
+    stmt = stmt.on_conflict_do_update(
+        index_elements=index_elements,
+        index_where=where,
+        set_={
+            "cache_key": stmt.excluded.cache_key,
+            "result": stmt.excluded.result,
+            "computed_at": func.now(),
+        },
+    )
+    try:
+        async with SessionLocal() as session:
+            await session.execute(stmt)
+            await session.commit()
+    except Exception:
+        logger.warning("Could not store weekly snapshot comparison", exc_info=True)
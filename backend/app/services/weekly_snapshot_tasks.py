@@ -0,0 +1,254 @@
+from __future__ import annotations
+
+import uuid
+from collections import defaultdict
+from datetime import date, datetime
+from typing import Any, Iterable
+
+from sqlalchemy import column, func, select, true
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import defer
+
+from app.models.weekly_planner_snapshot import WeeklyPlannerSnapshot, WeeklyPlannerSnapshotTask
+
+
+def _uuid(value: Any) -> uuid.UUID | None:
+    if value is None or value == "":
+        return None
+    try:
+        return value if isinstance(value, uuid.UUID) else uuid.UUID(str(value))
+    except (TypeError, ValueError):
+        return None
+
+
+def _date(value: Any) -> date | None:
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date):
+        return value
+    if not value:
+        return None
+    try:
+        return date.fromisoformat(str(value)[:10])
+    except ValueError:
+        return None
+
+
+def _datetime(value: Any) -> datetime | None:
+    if isinstance(value, datetime):
+        return value
+    if not value:
+        return None
+    try:
+        return datetime.fromisoformat(str(value).replace("Z", "+00:00"))
+    except ValueError:
+        return None
+
+
+def defer_snapshot_payload() -> tuple:
+    """Loader options for snapshot reads that only need metadata.
+
+    Like ``defer_task_text`` this uses ``raiseload`` so an accidental payload
+    access fails loudly instead of attempting an async lazy load.
+    """
+    return (defer(WeeklyPlannerSnapshot.payload, raiseload=True),)
+
+
+def _assignee_key(user_id: uuid.UUID | None, user_name: str | None) -> str:
+    return str(user_id) if user_id is not None else f"name:{(user_name or '').lower()}"
+
+
+def snapshot_task_rows(
+    snapshot_id: uuid.UUID,
+    task_items: Iterable[dict] | None,
+) -> list[WeeklyPlannerSnapshotTask]:
+    """Explode ``payload["task_items"]`` into one row per planned occurrence."""
+    rows: list[WeeklyPlannerSnapshotTask] = []
+    for position, item in enumerate(task_items or []):
+        task_id = _uuid(item.get("task_id"))
+        fallback_key = item.get("fallback_key")
+        base = {
+            "snapshot_id": snapshot_id,
+            "position": position,
+            "match_key": item.get("match_key")
+            or (f"id:{task_id}" if task_id is not None else f"fallback:{fallback_key or ''}"),
+            "task_id": task_id,
+            "fallback_key": fallback_key,
+            "title": item.get("title") or "(Untitled task)",
+            "project_id": _uuid(item.get("project_id")),
+            "project_title": item.get("project_title"),
+            "source_type": item.get("source_type") or "project",
+            "status": item.get("status"),
+            "daily_status": item.get("daily_status"),
+            "completed_at": _datetime(item.get("completed_at")),
+            "is_completed": bool(item.get("is_completed")),
+            "finish_period": item.get("finish_period"),
+            "priority": item.get("priority"),
+            "tags": list(item.get("tags") or []),
+            "planned_due_date": _datetime(item.get("due_date")),
+        }
+        covered: set[str] = set()
+        for occurrence in item.get("occurrences") or []:
+            user_id = _uuid(occurrence.get("assignee_id"))
+            user_name = occurrence.get("assignee_name")
+            if user_id is not None or user_name:
+                covered.add(_assignee_key(user_id, user_name))
+            rows.append(
+                WeeklyPlannerSnapshotTask(
+                    **base,
+                    user_id=user_id,
+                    user_name=user_name,
+                    day=_date(occurrence.get("day")),
+                    slot=occurrence.get("time_slot"),
+                )
+            )
+        for assignee in item.get("assignees") or []:
+            user_id = _uuid(assignee.get("assignee_id"))
+            user_name = assignee.get("assignee_name") or "Unassigned"
+            key = _assignee_key(user_id, user_name)
+            if key in covered:
+                continue
+            covered.add(key)
+            rows.append(WeeklyPlannerSnapshotTask(**base, user_id=user_id, user_name=user_name))
+        if not item.get("occurrences") and not covered:
+            rows.append(WeeklyPlannerSnapshotTask(**base))
+    return rows
+
+
+def task_items_from_rows(rows: Iterable[Any]) -> list[dict]:
+    """Rebuild ``task_items`` dicts in the shape the planner flattener produces."""
+    items: dict[tuple[int, str], dict] = {}
+    for row in rows:
+        item = items.get((row.position, row.match_key))
+        if item is None:
+            item = items[(row.position, row.match_key)] = {
+                "match_key": row.match_key,
+                "task_id": row.task_id,
+                "fallback_key": row.fallback_key,
+                "title": row.title,
+                "project_id": row.project_id,
+                "project_title": row.project_title,
+                "source_type": row.source_type,
+                "status": row.status,
+                "daily_status": row.daily_status,
+                "completed_at": row.completed_at,
+                "is_completed": bool(row.is_completed),
+                "finish_period": row.finish_period,
+                "priority": row.priority,
+                "tags": list(row.tags or []),
+                "due_date": row.planned_due_date,
+                "_assignees": {},
+                "occurrences": [],
+            }
+        if row.user_id is not None or row.user_name:
+            key = _assignee_key(row.user_id, row.user_name)
+            item["_assignees"].setdefault(
+                key,
+                {"assignee_id": row.user_id, "assignee_name": row.user_name or "Unassigned"},
+            )
+        if row.day is not None or row.slot is not None:
+            item["occurrences"].append(
+                {
+                    "day": row.day,
+                    "time_slot": row.slot,
+                    "assignee_id": row.user_id,
+                    "assignee_name": row.user_name,
+                }
+            )
+
+    result: list[dict] = []
+    for _, item in sorted(items.items(), key=lambda entry: entry[0]):
+        item["assignees"] = sorted(
+            item.pop("_assignees").values(),
+            key=lambda assignee: (
+                1 if assignee["assignee_id"] is None else 0,
+                (assignee["assignee_name"] or "").lower(),
+            ),
+        )
+        item["occurrences"].sort(
+            key=lambda occurrence: (
+                occurrence.get("day") or date.min,
+                occurrence.get("time_slot") or "",
+                occurrence.get("assignee_name") or "",
+            )
+        )
+        result.append(item)
+    return result
+
+
+async def load_snapshot_task_items(
+    db: AsyncSession,
+    snapshot_ids: Iterable[uuid.UUID],
+) -> dict[uuid.UUID, list[dict]]:
+    """Return stored task items per snapshot.
+
+    Snapshots created before the task table existed have no rows and are left
+    out of the result; callers fall back to the JSONB payload for those.
+    """
+    ids = list(dict.fromkeys(snapshot_ids))
+    if not ids:
+        return {}
+    rows = (
+        await db.execute(
+            select(*WeeklyPlannerSnapshotTask.__table__.columns)
+            .where(WeeklyPlannerSnapshotTask.snapshot_id.in_(ids))
+            .order_by(WeeklyPlannerSnapshotTask.snapshot_id, WeeklyPlannerSnapshotTask.position)
+        )
+    ).all()
+    by_snapshot: dict[uuid.UUID, list[Any]] = defaultdict(list)
+    for row in rows:
+        by_snapshot[row.snapshot_id].append(row)
+    return {snapshot_id: task_items_from_rows(items) for snapshot_id, items in by_snapshot.items()}
+
+
+async def load_snapshot_payloads(
+    db: AsyncSession,
+    snapshot_ids: Iterable[uuid.UUID],
+) -> dict[uuid.UUID, dict]:
+    ids = list(dict.fromkeys(snapshot_ids))
+    if not ids:
+        return {}
+    rows = (
+        await db.execute(
+            select(WeeklyPlannerSnapshot.id, WeeklyPlannerSnapshot.payload).where(
+                WeeklyPlannerSnapshot.id.in_(ids)
+            )
+        )
+    ).all()
+    return {snapshot_id: payload or {} for snapshot_id, payload in rows}
+
+
+async def load_snapshot_roster(
+    db: AsyncSession,
+    snapshot_ids: Iterable[uuid.UUID],
+) -> dict[uuid.UUID, dict[uuid.UUID, str]]:
+    """Return the employees shown in each snapshot, including those without tasks.
+
+    The user objects are extracted server-side so only ids and names leave the
+    database, not the planner cells nested under each user.
+    """
+    ids = list(dict.fromkeys(snapshot_ids))
+    if not ids:
+        return {}
+    user = func.jsonb_path_query(
+        WeeklyPlannerSnapshot.payload, "$.department.days[*].users[*]"
+    ).table_valued(column("value", JSONB)).lateral("snapshot_user")
+    rows = (
+        await db.execute(
+            select(
+                WeeklyPlannerSnapshot.id,
+                user.c.value["user_id"].astext,
+                user.c.value["user_name"].astext,
+            )
+            .select_from(WeeklyPlannerSnapshot)
+            .join(user, true())
+            .where(WeeklyPlannerSnapshot.id.in_(ids))
+        )
+    ).all()
+    roster: dict[uuid.UUID, dict[uuid.UUID, str]] = {snapshot_id: {} for snapshot_id in ids}
+    for snapshot_id, raw_user_id, user_name in rows:
+        user_id = _uuid(raw_user_id)
+        if user_id is not None:
+            roster[snapshot_id][user_id] = user_name or "Employee"
+    return roster
@@ -58,6 +58,17 @@ class WordAnalysis:
         payload["is_compliant"] = all(check.compliant for check in self.checks)
         return payload
 
+    @classmethod
+    def from_dict(cls, payload: dict[str, Any]) -> WordAnalysis:
+        return cls(
+            filename=payload["filename"],
+            suggested_description=payload["suggested_description"],
+            paragraphs=payload["paragraphs"],
+            tables=payload["tables"],
+            sections=payload["sections"],
+            checks=[ComplianceCheck(**check) for check in payload["checks"]],
+        )
+
 
 def _text(value: Any) -> str:
     return "" if value is None else str(value).strip()
@@ -175,7 +186,10 @@ def _uses_narrow_margins(document) -> bool:
 
 
 def analyze_word_document(content: bytes, filename: str) -> WordAnalysis:
-    document = _load_document(content, filename)
+    return _analyze_loaded_document(_load_document(content, filename), filename)
+
+
+def _analyze_loaded_document(document, filename: str) -> WordAnalysis:
     sections = list(document.sections)
     header_logo = all(_has_official_logo(section.header) for section in sections)
     logo_proportions = all(_official_logo_keeps_proportions(section.header) for section in sections)
@@ -390,15 +404,22 @@ def standardize_word_document(
     initials: str,
     description: str | None = None,
     generated_at: datetime | None = None,
+    analysis: WordAnalysis | None = None,
 ) -> tuple[bytes, str, dict[str, Any]]:
+    """Apply the PrimEx header, footer and margins and verify the result.
+
+    ``analysis`` is the earlier ``analyze_word_document`` result for the same
+    content; without it the document is analyzed as it is loaded.
+    """
     clean_initials = re.sub(r"[^0-9A-Za-zÀ-ž]", "", initials).upper()[:10]
     if not clean_initials:
         raise WordStandardizationError("Inicialet janë të detyrueshme për dokumentin aktual.")
     if not LOGO_PATH.is_file():
         raise WordStandardizationError("Logoja zyrtare PrimEx mungon në server.")
 
-    analysis = analyze_word_document(content, filename)
     document = _load_document(content, filename)
+    if analysis is None:
+        analysis = _analyze_loaded_document(document, filename)
     now = generated_at.astimezone(KOSOVO_TIMEZONE) if generated_at else datetime.now(KOSOVO_TIMEZONE)
     description_value = _sanitize_description(description or "") or analysis.suggested_description
     output_filename = f"{description_value}_{now.strftime('%d.%m.%Y')}_{clean_initials}.docx"
@@ -6,7 +6,7 @@ import logging
 import uuid
 
 from app.config import settings
-from app.integrations.redis import create_redis_async
+from app.integrations.redis import get_redis
 from app.websocket.manager import manager
 
 
@@ -21,10 +21,9 @@ async def start_notification_listener() -> None:
 
     while True:
         pubsub = None
-        client = None
         try:
-            client = create_redis_async()
-            pubsub = client.pubsub()
+            # The subscription holds one connection from the shared pool.
+            pubsub = get_redis().pubsub()
             await pubsub.subscribe(CHANNEL)
             async for message in pubsub.listen():
                 if message.get("type") != "message":
@@ -52,14 +51,5 @@ async def start_notification_listener() -> None:
                         await close_result
             except Exception:
                 pass
-            try:
-                if client is not None:
-                    closer = getattr(client, "aclose", None) or getattr(client, "close", None)
-                    if closer is not None:
-                        close_result = closer()
-                        if asyncio.iscoroutine(close_result):
-                            await close_result
-            except Exception:
-                pass
         await asyncio.sleep(2)
 
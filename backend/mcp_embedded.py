@@ -0,0 +1,161 @@
+"""In-process execution of read-only Primeflow API endpoints for the MCP server.
+
+Enabled with ``PRIMEFLOW_MCP_EMBEDDED=1``. Instead of an HTTP round trip plus a
+JSON encode/decode of the whole response, the allowlisted GET endpoints are
+called directly with an own DB session and the service account as principal.
+Results are dumped from the response models once, optionally limited to the
+fields the calling tool actually uses.
+"""
+
+from __future__ import annotations
+
+import inspect
+import os
+from functools import lru_cache
+from typing import Any, Callable, get_type_hints
+
+from fastapi import HTTPException, Request, Response
+from fastapi.params import Depends as DependsParam
+from fastapi.routing import APIRoute
+from pydantic import BaseModel, TypeAdapter
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload
+
+from app.api.deps import get_current_user
+from app.api.routers import api_router
+from app.db import SessionLocal, get_db, get_read_db
+from app.models.user import User
+
+
+API_PREFIX = "/api"
+
+# Read-only endpoints the MCP tools call most; everything else still goes over HTTP.
+EMBEDDED_GET_PATHS = frozenset(
+    {
+        "/api/tasks",
+        "/api/users",
+        "/api/departments",
+        "/api/projects",
+        "/api/common-view",
+    }
+)
+
+
+class EmbeddedUnsupported(Exception):
+    """The endpoint cannot be executed in-process; callers fall back to HTTP."""
+
+
+def service_email() -> str:
+    email = (os.getenv("PRIMEFLOW_MCP_SERVICE_EMAIL") or os.getenv("PRIMEFLOW_EMAIL") or "").strip()
+    if not email:
+        raise RuntimeError("Set PRIMEFLOW_MCP_SERVICE_EMAIL or PRIMEFLOW_EMAIL for embedded MCP mode.")
+    return email
+
+
+@lru_cache(maxsize=None)
+def _route(path: str) -> APIRoute:
+    if path not in EMBEDDED_GET_PATHS:
+        raise EmbeddedUnsupported(path)
+    for route in api_router.routes:
+        if isinstance(route, APIRoute) and "GET" in route.methods and API_PREFIX + route.path == path:
+            return route
+    raise EmbeddedUnsupported(path)
+
+
+@lru_cache(maxsize=None)
+def _response_adapter(route: APIRoute) -> TypeAdapter | None:
+    return TypeAdapter(route.response_model) if route.response_model is not None else None
+
+
+async def _principal(db: AsyncSession) -> User:
+    # Same lookup as get_current_user, keyed by the service account instead of a token.
+    user = (
+        await db.execute(
+            select(User)
+            .options(joinedload(User.department))
+            .where(func.lower(User.email) == service_email().lower())
+        )
+    ).scalar_one_or_none()
+    if user is None or not user.is_active:
+        raise RuntimeError("The MCP service account is missing or inactive.")
+    return user
+
+
+async def _resolve_dependency(dependency: Callable[..., Any], db: AsyncSession, user: User) -> Any:
+    if dependency in (get_db, get_read_db):
+        return db
+    if dependency is get_current_user:
+        return user
+    # Role guards such as require_admin only take the current user.
+    parameters = inspect.signature(dependency).parameters.values()
+    if all(
+        isinstance(parameter.default, DependsParam) and parameter.default.dependency is get_current_user
+        for parameter in parameters
+    ):
+        return await dependency(*(user for _ in parameters))
+    raise EmbeddedUnsupported(getattr(dependency, "__name__", repr(dependency)))
+
+
+async def _endpoint_kwargs(
+    route: APIRoute,
+    path: str,
+    params: dict[str, Any],
+    db: AsyncSession,
+    user: User,
+) -> dict[str, Any]:
+    hints = get_type_hints(route.endpoint)
+    kwargs: dict[str, Any] = {}
+    for name, parameter in inspect.signature(route.endpoint).parameters.items():
+        annotation = hints.get(name)
+        default = parameter.default
+        if isinstance(default, DependsParam):
+            kwargs[name] = await _resolve_dependency(default.dependency, db, user)
+        elif annotation is Request:
+            kwargs[name] = Request({"type": "http", "method": "GET", "path": path, "headers": [], "query_string": b""})
+        elif annotation is Response:
+            kwargs[name] = Response()
+        elif name in params:
+            # Same lax coercion FastAPI applies to query strings (UUIDs, dates, enums, bools).
+            kwargs[name] = TypeAdapter(annotation).validate_python(params[name]) if annotation else params[name]
+        elif default is inspect.Parameter.empty:
+            raise ValueError(f"Missing required parameter {name} for {path}")
+        else:
+            kwargs[name] = getattr(default, "default", default)
+    unknown = set(params) - set(kwargs)
+    if unknown:
+        raise ValueError(f"Unknown parameters for {path}: {', '.join(sorted(unknown))}")
+    return kwargs
+
+
+def _dump(route: APIRoute, result: Any, fields: frozenset[str] | None) -> Any:
+    if isinstance(result, Response):
+        raise EmbeddedUnsupported(f"{route.path} returned a raw response")
+    if isinstance(result, list) and all(isinstance(item, BaseModel) for item in result):
+        return [item.model_dump(mode="json", include=fields) for item in result]
+    if isinstance(result, BaseModel):
+        return result.model_dump(mode="json", include=fields)
+    adapter = _response_adapter(route)
+    if adapter is None:
+        return result
+    return adapter.dump_python(adapter.validate_python(result, from_attributes=True), mode="json", include=fields)
+
+
+async def get(path: str, params: dict[str, Any] | None = None, *, fields: frozenset[str] | None = None) -> Any:
+    """Run an allowlisted GET endpoint in-process and return its JSON-compatible body.
+
+    ``fields`` limits list items (or a single object) to those keys, so large
+    text fields are never dumped. Raises ``EmbeddedUnsupported`` when the path
+    is not served in-process and ``RuntimeError`` with the API-style message on
+    HTTP errors.
+    """
+    route = _route(path)
+    clean_params = {key: value for key, value in (params or {}).items() if value is not None}
+    async with SessionLocal() as db:
+        user = await _principal(db)
+        kwargs = await _endpoint_kwargs(route, path, clean_params, db, user)
+        try:
+            result = await route.endpoint(**kwargs)
+        except HTTPException as exc:
+            raise RuntimeError(f"Primeflow API GET {path} failed ({exc.status_code}): {exc.detail}") from exc
+        return _dump(route, result, fields)
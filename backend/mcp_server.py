@@ -4,9 +4,10 @@ import base64
 import json
 import re
 import time
+from contextlib import asynccontextmanager
 from datetime import date, datetime, time as datetime_time, timedelta, timezone
 from pathlib import Path
-from typing import Any, Literal
+from typing import Any, AsyncIterator, Literal
 from urllib.parse import urljoin
 from zoneinfo import ZoneInfo
 
@@ -28,10 +29,27 @@ READONLY_DATABASE_URL = os.getenv("PRIMEFLOW_READONLY_DATABASE_URL")
 REQUEST_TIMEOUT = float(os.getenv("PRIMEFLOW_MCP_TIMEOUT", "30"))
 MCP_HOST = os.getenv("PRIMEFLOW_MCP_HOST", "0.0.0.0")
 MCP_PORT = int(os.getenv("PRIMEFLOW_MCP_PORT", "8010"))
+HTTP_MAX_CONNECTIONS = int(os.getenv("PRIMEFLOW_MCP_HTTP_MAX_CONNECTIONS", "20"))
+HTTP2_ENABLED = os.getenv("PRIMEFLOW_MCP_HTTP2", "1").lower() in {"1", "true", "yes"}
+DB_POOL_MIN_SIZE = int(os.getenv("PRIMEFLOW_MCP_DB_POOL_MIN", "1"))
+DB_POOL_MAX_SIZE = int(os.getenv("PRIMEFLOW_MCP_DB_POOL_MAX", "5"))
+DB_STATEMENT_TIMEOUT_MS = int(os.getenv("PRIMEFLOW_MCP_DB_STATEMENT_TIMEOUT_MS", "15000"))
+# Run the common read endpoints in-process (see mcp_embedded.py) instead of over HTTP.
+EMBEDDED_MODE = os.getenv("PRIMEFLOW_MCP_EMBEDDED", "").lower() in {"1", "true", "yes"}
 APP_TIMEZONE = os.getenv("APP_TIMEZONE", "Europe/Budapest")
 _token_cache: dict[str, Any] = {"access_token": ACCESS_TOKEN, "expires_at": 0}
 _lookup_cache: dict[str, dict[str, Any]] = {}
 LOOKUP_CACHE_SECONDS = 60
+_http_client: httpx.AsyncClient | None = None
+_db_pool: asyncpg.Pool | None = None
+_db_pool_lock = asyncio.Lock()
+_pool_sessions = 0
+_pool_stats: dict[str, float] = {
+    "http_requests": 0,
+    "http_seconds": 0.0,
+    "db_queries": 0,
+    "db_seconds": 0.0,
+}
 
 PRIMEFLOW_GUIDE = """
 Primeflow is an internal task, project, planning, reporting, and operations system.
@@ -104,7 +122,113 @@ Endpoint guidance:
 - run_readonly_sql allows only SELECT/WITH statements and runs in a read-only transaction. Never use database tools for create/update/delete actions.
 """
 
-mcp = FastMCP("primeflow", instructions=PRIMEFLOW_GUIDE, host=MCP_HOST, port=MCP_PORT)
+
+def _http() -> httpx.AsyncClient:
+    """Shared keep-alive client for all API calls; auth headers are sent per request."""
+    global _http_client
+    if _http_client is None or _http_client.is_closed:
+        _http_client = httpx.AsyncClient(
+            base_url=API_BASE_URL,
+            timeout=REQUEST_TIMEOUT,
+            http2=HTTP2_ENABLED,
+            limits=httpx.Limits(
+                max_connections=HTTP_MAX_CONNECTIONS,
+                max_keepalive_connections=HTTP_MAX_CONNECTIONS,
+                keepalive_expiry=60,
+            ),
+        )
+    return _http_client
+
+
+async def _http_send(method: str, path: str, **kwargs: Any) -> httpx.Response:
+    started = time.perf_counter()
+    try:
+        return await _http().request(method, path, **kwargs)
+    finally:
+        _pool_stats["http_requests"] += 1
+        _pool_stats["http_seconds"] += time.perf_counter() - started
+
+
+async def _pool() -> asyncpg.Pool:
+    global _db_pool
+    if _db_pool is None:
+        async with _db_pool_lock:
+            if _db_pool is None:
+                _db_pool = await asyncpg.create_pool(
+                    _db_url(),
+                    min_size=DB_POOL_MIN_SIZE,
+                    max_size=DB_POOL_MAX_SIZE,
+                    server_settings={
+                        "application_name": "primeflow-mcp",
+                        "statement_timeout": str(DB_STATEMENT_TIMEOUT_MS),
+                    },
+                )
+    return _db_pool
+
+
+async def _open_pools() -> None:
+    _http()
+    if READONLY_DATABASE_URL:
+        try:
+            await _pool()
+        except (OSError, asyncpg.PostgresError) as exc:
+            # DB tools retry on first use; API tools must not depend on the DB being up.
+            print(f"Primeflow MCP read-only DB pool unavailable at startup: {type(exc).__name__}: {exc}")
+
+
+async def _close_pools() -> None:
+    global _http_client, _db_pool
+    client, pool = _http_client, _db_pool
+    _http_client, _db_pool = None, None
+    if client is not None:
+        await client.aclose()
+    if pool is not None:
+        await pool.close()
+
+
+@asynccontextmanager
+async def _lifespan(_server: FastMCP) -> AsyncIterator[None]:
+    # FastMCP enters the lifespan once per client session (every SSE connection),
+    # so the pools stay open while any session is active.
+    global _pool_sessions
+    _pool_sessions += 1
+    try:
+        await _open_pools()
+        yield
+    finally:
+        _pool_sessions -= 1
+        if not _pool_sessions:
+            await _close_pools()
+
+
+def _pool_metrics() -> dict[str, Any]:
+    http_requests = int(_pool_stats["http_requests"])
+    db_queries = int(_pool_stats["db_queries"])
+    metrics: dict[str, Any] = {
+        "active_sessions": _pool_sessions,
+        "http": {
+            "open": _http_client is not None and not _http_client.is_closed,
+            "http2": HTTP2_ENABLED,
+            "max_connections": HTTP_MAX_CONNECTIONS,
+            "requests": http_requests,
+            "avg_ms": round(_pool_stats["http_seconds"] * 1000 / http_requests, 2) if http_requests else None,
+        },
+        "db": {
+            "open": _db_pool is not None,
+            "min_size": DB_POOL_MIN_SIZE,
+            "max_size": DB_POOL_MAX_SIZE,
+            "statement_timeout_ms": DB_STATEMENT_TIMEOUT_MS,
+            "queries": db_queries,
+            "avg_ms": round(_pool_stats["db_seconds"] * 1000 / db_queries, 2) if db_queries else None,
+        },
+    }
+    if _db_pool is not None:
+        metrics["db"]["size"] = _db_pool.get_size()
+        metrics["db"]["idle"] = _db_pool.get_idle_size()
+    return metrics
+
+
+mcp = FastMCP("primeflow", instructions=PRIMEFLOW_GUIDE, host=MCP_HOST, port=MCP_PORT, lifespan=_lifespan)
 
 UUID_RE = re.compile(r"^[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}$")
 FORBIDDEN_SQL_RE = re.compile(
@@ -132,11 +256,11 @@ async def _access_token() -> str:
     primeflow_email = os.getenv("PRIMEFLOW_EMAIL")
     primeflow_password = os.getenv("PRIMEFLOW_PASSWORD")
     if primeflow_email and primeflow_password:
-        async with httpx.AsyncClient(base_url=API_BASE_URL, timeout=REQUEST_TIMEOUT) as client:
-            response = await client.post(
-                "/api/auth/login",
-                json={"email": primeflow_email, "password": primeflow_password},
-            )
+        response = await _http_send(
+            "POST",
+            "/api/auth/login",
+            json={"email": primeflow_email, "password": primeflow_password},
+        )
         response.raise_for_status()
         token = response.json()["access_token"]
         _token_cache["access_token"] = token
@@ -174,7 +298,28 @@ def _api_error_detail(response: httpx.Response) -> str:
         return response.text.strip()[:2000] or response.reason_phrase
 
 
+_NOT_EMBEDDED = object()
+
+
+async def _embedded_get(path: str, params: dict[str, Any] | None = None, *, fields: frozenset[str] | None = None) -> Any:
+    """Serve a GET in-process when embedded mode covers the path, else return ``_NOT_EMBEDDED``."""
+    if not EMBEDDED_MODE:
+        return _NOT_EMBEDDED
+    import mcp_embedded
+
+    if path not in mcp_embedded.EMBEDDED_GET_PATHS:
+        return _NOT_EMBEDDED
+    try:
+        return await mcp_embedded.get(path, params, fields=fields)
+    except mcp_embedded.EmbeddedUnsupported:
+        return _NOT_EMBEDDED
+
+
 async def _request(method: str, path: str, *, params: dict[str, Any] | None = None, json: Any = None) -> Any:
+    if method.upper() == "GET":
+        embedded = await _embedded_get(path, params)
+        if embedded is not _NOT_EMBEDDED:
+            return embedded
     clean_params = {key: value for key, value in (params or {}).items() if value is not None}
     response: httpx.Response | None = None
     transient = {429, 500, 502, 503, 504}
@@ -185,8 +330,7 @@ async def _request(method: str, path: str, *, params: dict[str, Any] | None = No
         if delay:
             await asyncio.sleep(delay)
         try:
-            async with httpx.AsyncClient(base_url=API_BASE_URL, timeout=REQUEST_TIMEOUT, headers=await _headers()) as client:
-                response = await client.request(method, path, params=clean_params, json=json)
+            response = await _http_send(method, path, params=clean_params, json=json, headers=await _headers())
         except (httpx.ConnectError, httpx.ConnectTimeout, httpx.ReadTimeout, httpx.RemoteProtocolError) as exc:
             last_error = exc
             print(f"Primeflow API transient failure method={method.upper()} path={path} attempt={attempt}")
@@ -259,13 +403,16 @@ def _quote_ident(value: str) -> str:
 
 
 async def _db_fetch(sql: str, *args: Any) -> list[dict[str, Any]]:
-    conn = await asyncpg.connect(_db_url())
+    pool = await _pool()
+    started = time.perf_counter()
     try:
-        async with conn.transaction(readonly=True):
-            rows = await conn.fetch(sql, *args)
-            return [dict(row) for row in rows]
+        async with pool.acquire() as conn:
+            async with conn.transaction(readonly=True):
+                rows = await conn.fetch(sql, *args)
+                return [dict(row) for row in rows]
     finally:
-        await conn.close()
+        _pool_stats["db_queries"] += 1
+        _pool_stats["db_seconds"] += time.perf_counter() - started
 
 
 def _parse_json_arg(value: str | None, *, default: Any) -> Any:
@@ -600,6 +747,43 @@ async def _users_by_id() -> dict[str, dict[str, Any]]:
     return {str(user.get("id")): user for user in users}
 
 
+# Every task key read by the summary tools below (_compact_task, type/open/overdue
+# checks, per-day and per-person grouping). Embedded mode only dumps these.
+TASK_SUMMARY_FIELDS = frozenset(
+    {
+        "id",
+        "title",
+        "status",
+        "priority",
+        "one_h_report_slot",
+        "finish_period",
+        "start_date",
+        "due_date",
+        "original_due_date",
+        "planned_date",
+        "created_at",
+        "completed_at",
+        "progress_percentage",
+        "assignees",
+        "assigned_to",
+        "project_id",
+        "is_deadline_important",
+        "is_bllok",
+        "is_r1",
+        "is_1h_report",
+        "ga_note_origin_id",
+        "is_personal",
+    }
+)
+
+
+async def _summary_tasks(params: dict[str, Any]) -> list[dict[str, Any]]:
+    tasks = await _embedded_get("/api/tasks", params, fields=TASK_SUMMARY_FIELDS)
+    if tasks is _NOT_EMBEDDED:
+        tasks = await _request("GET", "/api/tasks", params=params)
+    return tasks
+
+
 def _compact_task(task: dict[str, Any], today: date | None = None) -> dict[str, Any]:
     today = today or datetime.now(_local_tz()).date()
     compact = {
@@ -781,8 +965,9 @@ async def primeflow_api_request(
     response: httpx.Response | None = None
     for attempt in range(2):
         try:
-            async with httpx.AsyncClient(base_url=API_BASE_URL, timeout=REQUEST_TIMEOUT, headers=await _headers()) as client:
-                response = await client.request(method_upper, normalized_path, params=params, json=body)
+            response = await _http_send(
+                method_upper, normalized_path, params=params, json=body, headers=await _headers()
+            )
         except httpx.RequestError as exc:
             raise RuntimeError(f"Primeflow API is unreachable for {method_upper} {normalized_path}: {exc}") from exc
         if response.status_code != 401 or attempt == 1:
@@ -1904,28 +2089,24 @@ async def get_tasks_today(
     user_id = await _resolve_user_id(user_ref, department_ref)
     department_id = await _resolve_department_id(department_ref)
     day, start, end = _day_bounds(day_date)
-    tasks = await _request(
-        "GET",
-        "/api/tasks",
-        params={
+    tasks = await _summary_tasks(
+        {
             "assigned_to": user_id,
             "department_id": department_id,
             "window_from": start,
             "window_to": end,
             "include_done": not unfinished_only,
-        },
+        }
     )
     if include_overdue:
         overdue_before = datetime.fromisoformat(start) - timedelta(microseconds=1)
-        overdue_tasks = await _request(
-            "GET",
-            "/api/tasks",
-            params={
+        overdue_tasks = await _summary_tasks(
+            {
                 "assigned_to": user_id,
                 "department_id": department_id,
                 "due_to": overdue_before.isoformat(),
                 "include_done": False,
-            },
+            }
         )
         existing_ids = {str(task.get("id")) for task in tasks}
         tasks = [task for task in overdue_tasks if str(task.get("id")) not in existing_ids] + tasks
@@ -1961,16 +2142,14 @@ async def get_tasks_this_week(
     user_id = await _resolve_user_id(user_ref, department_ref)
     department_id = await _resolve_department_id(department_ref)
     monday, sunday, window_from, window_to = _week_bounds(_week_start(week_start, week))
-    tasks = await _request(
-        "GET",
-        "/api/tasks",
-        params={
+    tasks = await _summary_tasks(
+        {
             "assigned_to": user_id,
             "department_id": department_id,
             "window_from": window_from,
             "window_to": window_to,
             "include_done": not unfinished_only,
-        },
+        }
     )
     if unfinished_only:
         tasks = [task for task in tasks if _task_is_open(task)]
@@ -2014,11 +2193,7 @@ async def get_all_open_tasks_by_person(
     """
     normalized_type = _normalize_task_type(task_type)
     department_id = await _resolve_department_id(department_ref)
-    tasks = await _request(
-        "GET",
-        "/api/tasks",
-        params={"department_id": department_id, "include_done": False},
-    )
+    tasks = await _summary_tasks({"department_id": department_id, "include_done": False})
     tasks = [task for task in tasks if _task_matches_type(task, normalized_type)]
     people = _group_tasks_by_person(tasks, await _users_by_id())
     for person in people:
@@ -2042,15 +2217,13 @@ async def get_overdue_tasks(
     today = datetime.now(_local_tz()).date()
     tz = _local_tz()
     due_before = datetime.combine(today, datetime_time.min, tzinfo=tz) - timedelta(microseconds=1)
-    tasks = await _request(
-        "GET",
-        "/api/tasks",
-        params={
+    tasks = await _summary_tasks(
+        {
             "assigned_to": user_id,
             "department_id": department_id,
             "due_to": due_before.isoformat(),
             "include_done": False,
-        },
+        }
     )
     tasks = [task for task in tasks if _task_overdue_days(task, today)]
     return {
@@ -2521,12 +2694,8 @@ async def get_person_workload(
     monday, sunday, window_from, window_to = _week_bounds(_week_start(week_start, week))
     today = datetime.now(_local_tz()).date()
     open_tasks, week_tasks = await asyncio.gather(
-        _request("GET", "/api/tasks", params={"assigned_to": user_id, "include_done": False}),
-        _request(
-            "GET",
-            "/api/tasks",
-            params={"assigned_to": user_id, "window_from": window_from, "window_to": window_to},
-        ),
+        _summary_tasks({"assigned_to": user_id, "include_done": False}),
+        _summary_tasks({"assigned_to": user_id, "window_from": window_from, "window_to": window_to}),
     )
     overdue = [task for task in open_tasks if _task_overdue_days(task, today)]
     one_h = [task for task in open_tasks if task.get("is_1h_report")]
@@ -2575,7 +2744,7 @@ async def get_department_overview(
     monday = _week_start(week_start, week)
     users, open_tasks, projects = await asyncio.gather(
         _cached_lookup("users", "/api/users"),
-        _request("GET", "/api/tasks", params={"department_id": department_id, "include_done": False}),
+        _summary_tasks({"department_id": department_id, "include_done": False}),
         _request("GET", "/api/projects", params={"department_id": department_id}),
     )
     members = [user for user in users if str(user.get("department_id")) == department_id]
@@ -2814,6 +2983,12 @@ async def export_report(
     }
 
 
+@mcp.tool()
+async def get_mcp_pool_metrics() -> dict[str, Any]:
+    """Connection pool usage of this MCP server: shared API client and read-only DB pool."""
+    return _pool_metrics()
+
+
 @mcp.tool()
 async def health_check() -> dict[str, Any]:
     """Read-only functional health check for MCP, authentication, and Common View."""
@@ -2827,6 +3002,8 @@ async def health_check() -> dict[str, Any]:
         "build_sha": os.getenv("APP_BUILD_SHA", "unknown"),
         "application_timezone": APP_TIMEZONE,
         "report_timezone": os.getenv("PRIMEFLOW_REPORT_TIMEZONE", "Europe/Tirane"),
+        "embedded_mode": EMBEDDED_MODE,
+        "pools": _pool_metrics(),
     }
     try:
         await _access_token()
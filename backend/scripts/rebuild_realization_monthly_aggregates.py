@@ -0,0 +1,37 @@
+from __future__ import annotations
+
+import argparse
+import asyncio
+from datetime import date
+
+from sqlalchemy import select
+
+from app.db import SessionLocal
+from app.models.realization import RealizationPeriod
+from app.services.realization_monthly import refresh_monthly_aggregates
+
+
+async def _run(since: date | None) -> int:
+    async with SessionLocal() as db:
+        query = select(RealizationPeriod).where(RealizationPeriod.period_type == "WEEKLY")
+        if since is not None:
+            query = query.where(RealizationPeriod.end_date >= since)
+        periods = (await db.execute(query.order_by(RealizationPeriod.start_date.asc()))).scalars().all()
+        for period in periods:
+            await refresh_monthly_aggregates(db, weekly_period=period)
+            await db.commit()
+        return len(periods)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Rebuild monthly Realization aggregates from stored weekly results."
+    )
+    parser.add_argument("--since", type=date.fromisoformat, default=None, help="Only weeks ending on/after YYYY-MM-DD.")
+    args = parser.parse_args()
+    count = asyncio.run(_run(args.since))
+    print(f"Rebuilt monthly aggregates from {count} weekly periods.")
+
+
+if __name__ == "__main__":
+    main()
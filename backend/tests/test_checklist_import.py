@@ -0,0 +1,147 @@
+import asyncio
+import io
+import unittest
+import uuid
+from unittest.mock import patch
+
+from openpyxl import Workbook
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.sql.dml import Insert
+
+from app.models.checklist import Checklist
+from app.services import checklist_import
+from app.services.checklist_import import (
+    ChecklistImportError,
+    get_import_progress,
+    import_checklist_workbook,
+    import_key,
+)
+
+
+class _Result:
+    def __init__(self, value) -> None:
+        self.value = value
+
+    def scalar_one_or_none(self):
+        return self.value
+
+    def all(self):
+        return self.value
+
+
+class _Db:
+    def __init__(self, checklist=None, existing=()) -> None:
+        self.checklist = checklist
+        self.existing = list(existing)
+        self.added = []
+        self.inserts = []
+        self.commits = 0
+
+    async def execute(self, statement):
+        if isinstance(statement, Insert):
+            sql = str(statement.compile(dialect=postgresql.dialect()))
+            self.inserts.append(sql)
+            return _Result([(uuid.uuid4(),)] * sql.count("%(import_key_m"))
+        if statement.column_descriptions[0]["entity"] is Checklist:
+            return _Result(self.checklist)
+        return _Result(self.existing)
+
+    def add(self, row) -> None:
+        self.added.append(row)
+
+    async def flush(self) -> None:
+        return None
+
+    async def commit(self) -> None:
+        self.commits += 1
+
+
+class _Session:
+    def __init__(self, db) -> None:
+        self.db = db
+
+    async def __aenter__(self):
+        return self.db
+
+    async def __aexit__(self, *exc) -> None:
+        return None
+
+
+def _workbook(rows) -> bytes:
+    workbook = Workbook()
+    sheet = workbook.active
+    sheet.append(["CHECKLIST TITLE"])
+    sheet.append(["NR", "TASK", "OWNER", "EXTRA"])
+    for row in rows:
+        sheet.append(row)
+    output = io.BytesIO()
+    workbook.save(output)
+    return output.getvalue()
+
+
+class TestChecklistImport(unittest.IsolatedAsyncioTestCase):
+    async def test_rows_are_streamed_and_upserted_in_chunks(self) -> None:
+        rows = [[index + 1, f"Point {index}", "AB", None] for index in range(1200)]
+        rows.append([None, "Point 0", "AB", None])
+        rows.append([None, None, None, None])
+        rows.append([None, "Last", "", "note"])
+        db = _Db()
+        seen_progress = []
+
+        async def on_progress(progress):
+            seen_progress.append(progress.inserted)
+
+        progress = await import_checklist_workbook(
+            db, _workbook(rows), title="Template", group_key="TPL", chunk_size=500, on_progress=on_progress
+        )
+
+        self.assertEqual(progress.status, "DONE")
+        self.assertEqual((progress.rows_read, progress.inserted, progress.skipped), (1203, 1201, 1))
+        self.assertEqual(seen_progress, [500, 1000, 1201])
+        self.assertEqual(len(db.inserts), 3)
+        self.assertIn("ON CONFLICT (checklist_id, import_key) WHERE import_key IS NOT NULL DO NOTHING", db.inserts[0])
+        checklist = db.added[0]
+        self.assertEqual(progress.checklist_id, str(checklist.id))
+        self.assertEqual([column["key"] for column in checklist.columns], ["nr", "title", "owner", "extra"])
+
+    async def test_existing_items_are_skipped_by_content(self) -> None:
+        checklist = Checklist(id=uuid.uuid4(), title="Template", group_key="TPL")
+        existing = [(None, "point 0", None, None, None, "ab", None)]
+        db = _Db(checklist, existing)
+
+        progress = await import_checklist_workbook(
+            db, _workbook([[1, "Point  0", "AB", None], [2, "Point 1", "AB", None]]), title="Template", group_key="TPL"
+        )
+
+        self.assertEqual((progress.inserted, progress.skipped), (1, 1))
+        self.assertEqual(db.added, [])
+        self.assertEqual(import_key({"title": "Point  0", "owner": "AB"}), import_key({"title": "point 0", "owner": "ab"}))
+
+    async def test_a_sheet_without_known_headers_fails_cleanly(self) -> None:
+        workbook = Workbook()
+        workbook.active.append(["Foo", "Bar"])
+        output = io.BytesIO()
+        workbook.save(output)
+
+        with self.assertRaises(ChecklistImportError):
+            await import_checklist_workbook(_Db(), output.getvalue(), title="Template", group_key="TPL")
+
+    async def test_background_job_reports_progress(self) -> None:
+        db = _Db()
+
+        with (
+            patch.object(checklist_import.settings, "REDIS_ENABLED", False),
+            patch.object(checklist_import, "SessionLocal", side_effect=lambda: _Session(db)),
+        ):
+            progress = await checklist_import.start_checklist_import(
+                _workbook([[1, "Point", "AB", None]]), title="Template", group_key="TPL"
+            )
+            self.assertEqual(progress.status, "QUEUED")
+            await asyncio.gather(*checklist_import._running)
+            finished = await get_import_progress(progress.job_id)
+
+        self.assertEqual((finished.status, finished.inserted), ("DONE", 1))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,128 @@
+import unittest
+import uuid
+from datetime import date, datetime, timezone
+from types import SimpleNamespace
+
+from sqlalchemy.dialects import postgresql
+
+from app.services.daily_report_data import KO_USER_ID_PATTERN, daily_report_candidates_stmt, load_daily_report_tasks
+from app.services.daily_report_logic import KO_USER_RE
+
+
+class _Result:
+    def __init__(self, value) -> None:
+        self.value = value
+
+    def scalars(self):
+        return self
+
+    def all(self):
+        return self.value
+
+
+class _Db:
+    def __init__(self, *responses) -> None:
+        self.responses = list(responses)
+        self.statements = []
+
+    async def execute(self, statement):
+        self.statements.append(statement)
+        return _Result(self.responses.pop(0))
+
+
+def _task(user_id, *, start, due, completed_at=None, status="TODO", project_id=None):
+    return SimpleNamespace(
+        id=uuid.uuid4(),
+        assigned_to=user_id,
+        project_id=project_id,
+        department_id=None,
+        phase="PRODUCT",
+        internal_notes=None,
+        status=status,
+        start_date=datetime.combine(start, datetime.min.time(), tzinfo=timezone.utc),
+        due_date=datetime.combine(due, datetime.min.time(), tzinfo=timezone.utc),
+        completed_at=completed_at,
+    )
+
+
+class TestDailyReportCandidates(unittest.TestCase):
+    def test_candidates_use_assignment_lookups_and_a_day_window(self) -> None:
+        user_id = uuid.uuid4()
+        sql = str(
+            daily_report_candidates_stmt(user_id=user_id, day=date(2026, 3, 4)).compile(
+                dialect=postgresql.dialect()
+            )
+        )
+
+        self.assertIn("UNION", sql)
+        self.assertNotIn("SELECT DISTINCT", sql)
+        self.assertNotIn("JOIN projects", sql)
+        self.assertIn("tasks.due_date <", sql)
+        self.assertIn("tasks.due_date >=", sql)
+        self.assertNotIn("ILIKE", sql)
+        # Inline, so it matches the expression of ix_tasks_ko_user_id.
+        self.assertIn(f"lower(SUBSTRING(tasks.internal_notes FROM '{KO_USER_ID_PATTERN}'))", sql)
+        self.assertEqual(KO_USER_ID_PATTERN, f"(?i){KO_USER_RE.pattern}")
+
+
+class TestLoadDailyReportTasks(unittest.IsolatedAsyncioTestCase):
+    async def _load(self, tasks, **kwargs):
+        user_id = kwargs.pop("user_id")
+        project = SimpleNamespace(id=uuid.uuid4(), title="Catalog", department_id=None, project_type="GENERAL")
+        db = _Db(tasks, [], [project])
+        report = await load_daily_report_tasks(
+            db,
+            user_id=user_id,
+            day=date(2026, 3, 4),
+            department_id=None,
+            dept_code="DEV",
+            include_cross_department_assigned=True,
+            **kwargs,
+        )
+        return report, db
+
+    async def test_tasks_are_bucketed_in_a_constant_number_of_queries(self) -> None:
+        user_id = uuid.uuid4()
+        current = _task(user_id, start=date(2026, 3, 2), due=date(2026, 3, 6), project_id=uuid.uuid4())
+        overdue = _task(user_id, start=date(2026, 3, 2), due=date(2026, 3, 3))
+        done_today = _task(
+            user_id,
+            start=date(2026, 3, 9),
+            due=date(2026, 3, 9),
+            completed_at=datetime(2026, 3, 4, 10, tzinfo=timezone.utc),
+        )
+        done_late = _task(user_id, start=date(2026, 3, 2), due=date(2026, 3, 3), status="DONE")
+        someone_else = _task(uuid.uuid4(), start=date(2026, 3, 2), due=date(2026, 3, 6))
+
+        report, db = await self._load([current, overdue, done_today, done_late, someone_else], user_id=user_id)
+        many = [
+            _task(user_id, start=date(2026, 3, 2), due=date(2026, 3, 6), project_id=uuid.uuid4()) for _ in range(50)
+        ]
+        many_report, many_db = await self._load(many, user_id=user_id)
+
+        self.assertEqual(report.tasks_today, [current, done_today])
+        self.assertEqual(report.tasks_overdue, [overdue])
+        self.assertEqual(report.planned_range_by_task_id[overdue.id], (date(2026, 3, 2), date(2026, 3, 3)))
+        self.assertEqual(len(db.statements), 3)
+        self.assertEqual(len(many_report.tasks_today), 50)
+        self.assertEqual(len(many_db.statements), 3)
+
+    async def test_all_open_lists_every_open_task_as_today(self) -> None:
+        user_id = uuid.uuid4()
+        future = _task(user_id, start=date(2026, 4, 1), due=date(2026, 4, 2))
+        overdue = _task(user_id, start=date(2026, 3, 2), due=date(2026, 3, 3))
+
+        report, _db = await self._load([future, overdue], user_id=user_id, all_open=True)
+
+        self.assertEqual(report.tasks_today, [future, overdue])
+        self.assertEqual(report.tasks_overdue, [])
+
+    async def test_no_candidates_skip_the_follow_up_queries(self) -> None:
+        report, db = await self._load([], user_id=uuid.uuid4())
+
+        self.assertEqual(report.tasks, [])
+        self.assertEqual(len(db.statements), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
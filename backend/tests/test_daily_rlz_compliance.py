@@ -1,13 +1,15 @@
 import asyncio
-from datetime import date, datetime
+from datetime import date, datetime, timezone
+from types import SimpleNamespace
 import uuid
 from zoneinfo import ZoneInfo
 
 import pytest
+from sqlalchemy.dialects import postgresql
 
 from app.services.daily_rlz_compliance import (
-    REASON_LABELS, is_closable_day, is_editable_day, next_working_day, relevant_tasks,
-    task_issue_codes,
+    REASON_LABELS, build_daily_rlz_compliance_by_user, is_closable_day, is_editable_day,
+    next_working_day, relevant_tasks, task_issue_codes,
 )
 from app.services.daily_rlz_control_delivery import render_html, render_plain, subject_for
 
@@ -72,6 +74,9 @@ class _CaptureResult:
     def scalars(self):
         return _EmptyScalars()
 
+    def all(self):
+        return []
+
 
 class _CaptureDb:
     statement = None
@@ -151,3 +156,58 @@ def test_control_html_colors_in_progress_yellow():
 
 def test_control_subject_uses_configured_schedule_time():
     assert subject_for(DAY, "15:30").endswith("15:30")
+
+
+class _Rows:
+    def __init__(self, rows):
+        self.rows = rows
+
+    def scalars(self):
+        return self
+
+    def all(self):
+        return self.rows
+
+
+def test_compliance_for_many_users_uses_grouped_queries():
+    elsa, ardit = uuid.uuid4(), uuid.uuid4()
+    at = datetime(2026, 8, 12, 14, 0, tzinfo=timezone.utc)
+    task = SimpleNamespace(
+        id=uuid.uuid4(), title="Kontroll", status="TODO", completed_at=None,
+        due_date=datetime(2026, 8, 13, 10, 0, tzinfo=timezone.utc), original_due_date=None,
+        one_h_report_slot=None, is_1h_report=False, is_r1=False, system_template_origin_id=None,
+        project_id=uuid.uuid4(), updated_at=at,
+    )
+    period = SimpleNamespace(id=uuid.uuid4(), end_date=DAY, department_id=uuid.uuid4(), created_at=at)
+    close = SimpleNamespace(id=uuid.uuid4(), user_id=elsa, period_id=period.id, action="CLOSE",
+                            created_at=datetime(2026, 8, 12, 15, 0, tzinfo=timezone.utc))
+    approval = SimpleNamespace(id=uuid.uuid4(), user_id=elsa, period_id=period.id, action="APPROVE",
+                               source_close_event_id=close.id, created_at=close.created_at,
+                               actor_user_id=uuid.uuid4(), approval_comment=None, reason=None)
+    state = SimpleNamespace(user_id=elsa, task_id=task.id, reason_code="WAITING_CLIENT", comment=None, updated_at=at)
+    responses = [
+        [(task, elsa)],  # relevant tasks for both users
+        [state],  # daily RLZ states
+        [],  # user comments
+        [],  # 1H slots
+        [(close, period)],  # close events of the day
+        [approval],  # approvals for the approval periods
+    ]
+    statements = []
+
+    class Db:
+        async def execute(self, statement):
+            statements.append(str(statement.compile(dialect=postgresql.dialect())))
+            return _Rows(responses.pop(0))
+
+    now = datetime(2026, 8, 12, 16, 0, tzinfo=ZoneInfo("Europe/Tirane"))
+    reports = asyncio.run(build_daily_rlz_compliance_by_user(Db(), user_ids=[elsa, ardit], day=DAY, now=now))
+
+    assert len(statements) == 6
+    assert "task_assignees.user_id IN" in statements[0]
+    assert reports[elsa]["compliant"] and reports[elsa]["tasks"][0]["reason_code"] == "WAITING_CLIENT"
+    assert reports[elsa]["rlz_close_state"]["status"] == "SAVED"
+    assert reports[elsa]["manager_approval"]["status"] == "APPROVED"
+    assert reports[ardit]["tasks"] == []
+    assert reports[ardit]["rlz_close_state"]["status"] == "NOT_SAVED"
+    assert reports[ardit]["manager_approval"]["status"] == "PENDING"
@@ -0,0 +1,163 @@
+from __future__ import annotations
+
+import smtplib
+import unittest
+from email.message import EmailMessage
+from unittest.mock import AsyncMock, patch
+
+from app.services import mail_delivery
+from app.services.mail_delivery import SmtpPool, deliver
+
+
+RealSmtp = mail_delivery._SMTP
+
+
+class FakeSmtp:
+    """Local SMTP stand-in that records the session lifecycle."""
+
+    instances: list["FakeSmtp"] = []
+    failures: list[BaseException] = []
+    # Raised once the server has answered DATA with 354.
+    body_failures: list[BaseException] = []
+    in_data = False
+
+    def __init__(self, host, port, timeout=None):
+        self.logins = 0
+        self.sent: list[EmailMessage] = []
+        self.closed = False
+        FakeSmtp.instances.append(self)
+
+    def ehlo(self):
+        return 250, b"ok"
+
+    def starttls(self, **kwargs):
+        return 220, b"ready"
+
+    def login(self, user, password):
+        self.logins += 1
+
+    def noop(self):
+        return 250, b"ok"
+
+    def send_message(self, message, from_addr=None, to_addrs=None):
+        if FakeSmtp.failures:
+            raise FakeSmtp.failures.pop(0)
+        self.in_data = True
+        if FakeSmtp.body_failures:
+            raise FakeSmtp.body_failures.pop(0)
+        self.sent.append(message)
+
+    def quit(self):
+        self.closed = True
+
+
+def _message(subject: str) -> EmailMessage:
+    message = EmailMessage()
+    message["From"] = "sender@example.com"
+    message["To"] = "team@example.com"
+    message["Subject"] = subject
+    message["Message-ID"] = f"<{subject}@example.com>"
+    message.set_content("body")
+    return message
+
+
+class TestSmtpPool(unittest.TestCase):
+    def setUp(self) -> None:
+        FakeSmtp.instances, FakeSmtp.failures, FakeSmtp.body_failures = [], [], []
+        patcher = patch.object(mail_delivery, "_SMTP", FakeSmtp)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.sleeps: list[float] = []
+        self.pool = SmtpPool("smtp.local", 587, "sender@example.com", "secret", size=1, sleep=self.sleeps.append)
+
+    def test_messages_reuse_one_authenticated_session(self) -> None:
+        for index in range(3):
+            self.assertEqual(self.pool.send(_message(f"m{index}"), ["team@example.com"]), 1)
+
+        self.assertEqual(len(FakeSmtp.instances), 1)
+        self.assertEqual(FakeSmtp.instances[0].logins, 1)
+        self.assertEqual(len(FakeSmtp.instances[0].sent), 3)
+        self.assertEqual(self.pool.connects, 1)
+
+    def test_dropped_connection_is_retried_with_backoff_on_a_new_session(self) -> None:
+        FakeSmtp.failures = [smtplib.SMTPServerDisconnected("gone"), smtplib.SMTPResponseException(421, b"busy")]
+
+        attempts = self.pool.send(_message("retry"), ["team@example.com"])
+
+        self.assertEqual(attempts, 3)
+        self.assertEqual(self.sleeps, list(mail_delivery.RETRY_DELAYS[:2]))
+        self.assertEqual(len(FakeSmtp.instances), 3)
+        self.assertTrue(FakeSmtp.instances[0].closed)
+
+    def test_slot_is_released_while_backing_off(self) -> None:
+        FakeSmtp.failures = [smtplib.SMTPServerDisconnected("gone")]
+        free_during_sleep = []
+
+        def sleep(seconds: float) -> None:
+            acquired = self.pool._slots.acquire(blocking=False)
+            free_during_sleep.append(acquired)
+            if acquired:
+                self.pool._slots.release()
+
+        self.pool.sleep = sleep
+        self.assertEqual(self.pool.send(_message("backoff"), ["team@example.com"]), 2)
+        self.assertEqual(free_during_sleep, [True])
+
+    def test_connection_lost_after_data_is_not_resent(self) -> None:
+        FakeSmtp.body_failures = [smtplib.SMTPServerDisconnected("gone")]
+
+        with self.assertRaises(smtplib.SMTPServerDisconnected) as raised:
+            self.pool.send(_message("maybe-sent"), ["team@example.com"])
+
+        self.assertEqual(raised.exception.smtp_attempts, 1)
+        self.assertEqual(self.sleeps, [])
+
+    def test_temporary_rejection_of_the_body_is_retried(self) -> None:
+        FakeSmtp.body_failures = [smtplib.SMTPDataError(451, b"try again later")]
+
+        self.assertEqual(self.pool.send(_message("deferred"), ["team@example.com"]), 2)
+        self.assertEqual(self.sleeps, [mail_delivery.RETRY_DELAYS[0]])
+
+    def test_data_phase_is_tracked_from_the_server_reply(self) -> None:
+        smtp = RealSmtp()
+        with patch.object(smtplib.SMTP, "getreply", side_effect=[(250, b"ok"), (354, b"go ahead")]):
+            smtp.getreply()
+            self.assertFalse(smtp.in_data)
+            smtp.getreply()
+        self.assertTrue(smtp.in_data)
+
+    def test_permanent_rejection_is_not_retried(self) -> None:
+        FakeSmtp.failures = [smtplib.SMTPResponseException(550, b"mailbox unavailable")]
+
+        with self.assertRaises(smtplib.SMTPResponseException) as raised:
+            self.pool.send(_message("rejected"), ["team@example.com"])
+
+        self.assertEqual(raised.exception.smtp_attempts, 1)
+        self.assertEqual(self.sleeps, [])
+
+
+class TestDeliver(unittest.IsolatedAsyncioTestCase):
+    async def test_outbox_row_is_queued_then_marked_with_the_outcome(self) -> None:
+        pool = SmtpPool("smtp.local", 587, "sender@example.com", "secret", sleep=lambda _: None)
+        queued, finished = AsyncMock(return_value="row-1"), AsyncMock()
+        recipients = {"to": ["team@example.com"], "cc": [], "bcc": ["audit@example.com"]}
+
+        with (
+            patch.object(mail_delivery, "_SMTP", FakeSmtp),
+            patch.object(mail_delivery, "_queue_outbound", queued),
+            patch.object(mail_delivery, "_finish_outbound", finished),
+        ):
+            FakeSmtp.instances, FakeSmtp.failures = [], []
+            await deliver(_message("a"), recipients, pool=pool, source="primeflow_1h")
+            FakeSmtp.failures = [smtplib.SMTPResponseException(535, b"bad credentials")]
+            with self.assertRaises(smtplib.SMTPResponseException):
+                await deliver(_message("b"), recipients, pool=pool)
+
+        self.assertEqual(queued.await_args_list[0].kwargs["source"], "primeflow_1h")
+        self.assertEqual(finished.await_args_list[0].kwargs, {"status": "SENT", "attempts": 1})
+        self.assertEqual(finished.await_args_list[1].kwargs["status"], "FAILED")
+        self.assertIn("bad credentials", finished.await_args_list[1].kwargs["error"])
+
+
+if __name__ == "__main__":
+    unittest.main()
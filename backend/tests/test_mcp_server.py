@@ -1,5 +1,9 @@
 import unittest
-from unittest.mock import AsyncMock, patch
+import uuid
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import httpx
 
 import mcp_server
 
@@ -475,6 +479,107 @@ class TestPeopleAndStepsTools(unittest.IsolatedAsyncioTestCase):
         self.assertTrue(payload["is_1h_report"])
 
 
+class TestMcpConnectionPools(unittest.IsolatedAsyncioTestCase):
+    async def test_requests_reuse_shared_client_and_are_counted(self) -> None:
+        client = SimpleNamespace(request=AsyncMock(return_value=httpx.Response(200, json={"ok": True})))
+        before = mcp_server._pool_stats["http_requests"]
+        with (
+            patch.object(mcp_server, "_http", return_value=client),
+            patch.object(mcp_server, "_headers", AsyncMock(return_value={"Authorization": "Bearer t"})),
+        ):
+            await mcp_server._request("GET", "/api/tasks")
+            await mcp_server._request("GET", "/api/users")
+
+        self.assertEqual(client.request.await_count, 2)
+        self.assertEqual(client.request.await_args.kwargs["headers"], {"Authorization": "Bearer t"})
+        self.assertEqual(mcp_server._pool_stats["http_requests"] - before, 2)
+
+    async def test_db_fetch_uses_pooled_readonly_connection(self) -> None:
+        transaction = MagicMock()
+        transaction.__aenter__ = AsyncMock()
+        transaction.__aexit__ = AsyncMock(return_value=False)
+        conn = SimpleNamespace(
+            transaction=MagicMock(return_value=transaction),
+            fetch=AsyncMock(return_value=[{"table_name": "tasks"}]),
+        )
+        acquire = MagicMock()
+        acquire.__aenter__ = AsyncMock(return_value=conn)
+        acquire.__aexit__ = AsyncMock(return_value=False)
+        pool = SimpleNamespace(acquire=MagicMock(return_value=acquire))
+
+        with (
+            patch.object(mcp_server, "_pool", AsyncMock(return_value=pool)),
+            patch.object(mcp_server.asyncpg, "connect", AsyncMock(side_effect=AssertionError("no direct connect"))),
+        ):
+            rows = await mcp_server._db_fetch("select 1")
+
+        self.assertEqual(rows, [{"table_name": "tasks"}])
+        conn.transaction.assert_called_once_with(readonly=True)
+
+    async def test_pools_close_after_last_session(self) -> None:
+        open_pools, close_pools = AsyncMock(), AsyncMock()
+        with (
+            patch.object(mcp_server, "_open_pools", open_pools),
+            patch.object(mcp_server, "_close_pools", close_pools),
+        ):
+            async with mcp_server._lifespan(mcp_server.mcp):
+                async with mcp_server._lifespan(mcp_server.mcp):
+                    self.assertEqual(mcp_server._pool_metrics()["active_sessions"], 2)
+                close_pools.assert_not_awaited()
+
+        close_pools.assert_awaited_once()
+        self.assertEqual(open_pools.await_count, 2)
+
+
+class TestMcpEmbeddedMode(unittest.IsolatedAsyncioTestCase):
+    async def test_endpoint_kwargs_coerce_query_strings_and_inject_principal(self) -> None:
+        import mcp_embedded
+
+        db, user = object(), SimpleNamespace(id=uuid.uuid4())
+        department_id = uuid.uuid4()
+        kwargs = await mcp_embedded._endpoint_kwargs(
+            mcp_embedded._route("/api/tasks"),
+            "/api/tasks",
+            {"department_id": str(department_id), "include_done": "false", "window_from": "2026-07-09T00:00:00+02:00"},
+            db,
+            user,
+        )
+
+        self.assertEqual(kwargs["department_id"], department_id)
+        self.assertIs(kwargs["include_done"], False)
+        self.assertEqual(kwargs["window_from"].isoformat(), "2026-07-09T00:00:00+02:00")
+        self.assertIsNone(kwargs["ga_note_origin_ids"])
+        self.assertIs(kwargs["db"], db)
+        self.assertIs(kwargs["user"], user)
+        with self.assertRaises(ValueError):
+            await mcp_embedded._endpoint_kwargs(
+                mcp_embedded._route("/api/tasks"), "/api/tasks", {"bogus": 1}, db, user
+            )
+
+    async def test_unsupported_paths_are_not_embedded(self) -> None:
+        import mcp_embedded
+
+        with self.assertRaises(mcp_embedded.EmbeddedUnsupported):
+            mcp_embedded._route("/api/tasks/export")
+
+    async def test_summary_tools_run_in_process_with_projected_fields(self) -> None:
+        import mcp_embedded
+
+        tasks = [{"id": "t1", "title": "Deck", "status": "TODO", "assignees": [{"id": "u1", "full_name": "Elsa"}]}]
+        embedded_get = AsyncMock(return_value=tasks)
+        with (
+            patch.object(mcp_server, "EMBEDDED_MODE", True),
+            patch.object(mcp_embedded, "get", embedded_get),
+            patch.object(mcp_server, "_http_send", AsyncMock(side_effect=AssertionError("no HTTP"))),
+            patch.object(mcp_server, "_users_by_id", AsyncMock(return_value={})),
+        ):
+            result = await mcp_server.get_tasks_today(day_date="2026-07-09")
+
+        self.assertEqual(result["total_tasks"], 1)
+        self.assertEqual(embedded_get.await_args.args[0], "/api/tasks")
+        self.assertEqual(embedded_get.await_args.kwargs["fields"], mcp_server.TASK_SUMMARY_FIELDS)
+
+
 class TestNewToolsRegistered(unittest.IsolatedAsyncioTestCase):
     async def test_all_new_tools_are_registered(self) -> None:
         tools = {tool.name for tool in await mcp_server.mcp.list_tools()}
@@ -504,6 +609,7 @@ class TestNewToolsRegistered(unittest.IsolatedAsyncioTestCase):
             "void_realization_observation",
             "approve_weekly_realization",
             "lock_weekly_realization",
+            "get_mcp_pool_metrics",
         }
         self.assertTrue(expected.issubset(tools), expected - tools)
 
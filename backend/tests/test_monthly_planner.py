@@ -0,0 +1,77 @@
+import importlib.util
+import io
+import unittest
+import uuid
+from datetime import date
+from pathlib import Path
+from types import SimpleNamespace
+
+from alembic.migration import MigrationContext
+from alembic.operations import Operations
+from sqlalchemy.dialects import postgresql
+
+from app.api.routers import planners
+
+
+class _Result:
+    def __init__(self, value) -> None:
+        self.value = value
+
+    def scalars(self):
+        return self
+
+    def all(self):
+        return self.value
+
+    def scalar_one(self):
+        return self.value
+
+
+class TestMonthlyPlanner(unittest.IsolatedAsyncioTestCase):
+    async def test_completed_tasks_are_counted_once_by_their_planned_day(self) -> None:
+        statements = []
+
+        class Db:
+            async def execute(self, statement):
+                statements.append(str(statement.compile(dialect=postgresql.dialect())))
+                return _Result([] if len(statements) == 1 else 2)
+
+        user = SimpleNamespace(role=planners.UserRole.ADMIN, id=uuid.uuid4(), department_id=None)
+        response = await planners.monthly_planner(
+            year=2026, month=1, department_id=uuid.uuid4(), db=Db(), user=user
+        )
+
+        planned_day = "coalesce(CAST(tasks.due_date AS DATE), CAST(tasks.start_date AS DATE))"
+        self.assertEqual(len(statements), 3)
+        self.assertTrue(all(planned_day in statement for statement in statements))
+        self.assertFalse(any("task_calendar_days" in statement for statement in statements))
+        self.assertEqual((response.month_start, response.month_end), (date(2026, 1, 1), date(2026, 1, 31)))
+        self.assertEqual(response.summary.month_completed, 2)
+        self.assertEqual(response.tasks, [])
+
+
+class TestDropTaskCalendarMigration(unittest.TestCase):
+    def test_upgrade_drops_the_calendar_and_downgrade_restores_it(self) -> None:
+        path = Path(__file__).parents[1] / "alembic" / "versions" / "20260830_drop_task_calendar_days.py"
+        spec = importlib.util.spec_from_file_location("drop_task_calendar_days_migration", path)
+        migration = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(migration)
+        output = io.StringIO()
+        context = MigrationContext.configure(
+            dialect_name="postgresql", opts={"as_sql": True, "output_buffer": output}
+        )
+        with Operations.context(context):
+            migration.upgrade()
+            upgrade_sql = output.getvalue()
+            migration.downgrade()
+        downgrade_sql = output.getvalue()[len(upgrade_sql):]
+
+        self.assertIn("DROP TABLE task_calendar_days", upgrade_sql)
+        self.assertIn("DROP TRIGGER IF EXISTS tasks_task_calendar ON tasks", upgrade_sql)
+        self.assertIn("CREATE TABLE task_calendar_days", downgrade_sql)
+        self.assertIn("task_calendar_refresh(p_task_id uuid, p_timezone text)", downgrade_sql)
+        self.assertEqual(downgrade_sql.count("EXECUTE FUNCTION task_calendar_trigger("), 4)
+
+
+if __name__ == "__main__":
+    unittest.main()
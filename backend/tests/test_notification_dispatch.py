@@ -0,0 +1,115 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import unittest
+import uuid
+from contextlib import asynccontextmanager
+from datetime import datetime, timezone
+from unittest.mock import patch
+
+from app.models.enums import NotificationType
+from app.models.notification import Notification
+from app.services import notifications
+from app.services.notifications import NotificationDispatcher
+
+
+class _Pipeline:
+    def __init__(self, client: "_Client") -> None:
+        self.client = client
+        self.commands: list[tuple[str, str]] = []
+
+    async def __aenter__(self) -> "_Pipeline":
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        return None
+
+    def publish(self, channel: str, payload: str) -> None:
+        self.commands.append((channel, payload))
+
+    async def execute(self) -> None:
+        await asyncio.sleep(self.client.execute_delay)
+        self.client.round_trips.append(list(self.commands))
+
+
+class _Client:
+    def __init__(self) -> None:
+        self.round_trips: list[list[tuple[str, str]]] = []
+        self.execute_delay = 0.0
+
+    @asynccontextmanager
+    async def pipeline(self, *, transaction: bool = False):
+        async with _Pipeline(self) as pipe:
+            yield pipe
+
+
+def _notification(user_id: uuid.UUID, title: str, data: dict | None) -> Notification:
+    return Notification(
+        id=uuid.uuid4(),
+        user_id=user_id,
+        type=NotificationType.assignment,
+        title=title,
+        data=data,
+        created_at=datetime(2026, 3, 2, 8, 0, tzinfo=timezone.utc),
+    )
+
+
+class NotificationDispatcherTests(unittest.IsolatedAsyncioTestCase):
+    async def test_window_publishes_one_pipeline_and_coalesces_per_entity(self) -> None:
+        client = _Client()
+        user_id = uuid.uuid4()
+        task_id = str(uuid.uuid4())
+        dispatcher = NotificationDispatcher(debounce_seconds=0.01)
+        with patch.object(notifications, "redis_pipeline", new=client.pipeline):
+            for title in ("Assigned", "Updated"):
+                dispatcher.enqueue(user_id, _notification(user_id, title, {"task_id": task_id}))
+                await dispatcher.dispatch()
+            dispatcher.enqueue(user_id, _notification(user_id, "Other task", {"task_id": str(uuid.uuid4())}))
+            dispatcher.enqueue(user_id, _notification(user_id, "No entity", None))
+            await dispatcher.dispatch()
+            self.assertEqual(client.round_trips, [])
+            await dispatcher._flush_task
+
+        self.assertEqual(len(client.round_trips), 1)
+        titles = [json.loads(payload)["notification"]["title"] for _, payload in client.round_trips[0]]
+        self.assertEqual(titles, ["Updated", "Other task", "No entity"])
+        self.assertEqual({channel for channel, _ in client.round_trips[0]}, {notifications.CHANNEL})
+
+    async def test_notifications_queued_during_a_slow_send_are_flushed(self) -> None:
+        client = _Client()
+        client.execute_delay = 0.05
+        user_id = uuid.uuid4()
+        dispatcher = NotificationDispatcher(debounce_seconds=0.01)
+        with patch.object(notifications, "redis_pipeline", new=client.pipeline):
+            dispatcher.enqueue(user_id, _notification(user_id, "First", {"task_id": "t-1"}))
+            await dispatcher.dispatch()
+            await asyncio.sleep(0.03)
+            dispatcher.enqueue(user_id, _notification(user_id, "During send", {"task_id": "t-2"}))
+            await dispatcher.dispatch()
+            await dispatcher._flush_task
+
+        titles = [
+            [json.loads(payload)["notification"]["title"] for _, payload in round_trip]
+            for round_trip in client.round_trips
+        ]
+        self.assertEqual(titles, [["First"], ["During send"]])
+        self.assertEqual(dispatcher._pending, {})
+
+    async def test_close_flushes_pending_notifications(self) -> None:
+        client = _Client()
+        user_id = uuid.uuid4()
+        dispatcher = NotificationDispatcher(debounce_seconds=60)
+        with patch.object(notifications, "redis_pipeline", new=client.pipeline):
+            dispatcher.enqueue(user_id, _notification(user_id, "Assigned", {"task_id": "t-1"}))
+            await dispatcher.dispatch()
+            await dispatcher.aclose()
+
+        self.assertEqual(len(client.round_trips), 1)
+        payload = json.loads(client.round_trips[0][0][1])
+        self.assertEqual(payload["user_id"], str(user_id))
+        self.assertEqual(payload["notification"]["title"], "Assigned")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,104 @@
+import unittest
+import uuid
+from datetime import date
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+
+from app.api.routers import planners
+from app.services import weekly_planning_audit
+from app.services.planner_occurrences import (
+    OCCURRENCE_PROJECT,
+    OCCURRENCE_SYSTEM,
+    PlannerOccurrence,
+    WeeklyPlannerWeek,
+    planner_slots,
+)
+
+
+class _Result:
+    def __init__(self, value) -> None:
+        self.value = value
+
+    def scalars(self):
+        return self
+
+    def all(self):
+        return self.value
+
+
+class _Db:
+    def __init__(self, *responses) -> None:
+        self.responses = list(responses)
+
+    async def execute(self, statement):
+        return _Result(self.responses.pop(0))
+
+
+class TestPlannerSlots(unittest.TestCase):
+    def test_only_am_or_pm_pins_a_single_slot(self) -> None:
+        self.assertEqual(planner_slots(" pm "), ("PM",))
+        self.assertEqual(planner_slots("AM"), ("AM",))
+        self.assertEqual(planner_slots(None), ("AM", "PM"))
+        self.assertEqual(planner_slots("ALL"), ("AM", "PM"))
+
+
+class TestAuditPlannerOccurrences(unittest.IsolatedAsyncioTestCase):
+    async def test_audit_reads_flat_occurrences_without_building_the_table(self) -> None:
+        department_id = uuid.uuid4()
+        user_id = uuid.uuid4()
+        project = SimpleNamespace(id=uuid.uuid4(), title="Catalog", department_id=department_id)
+        project_task = SimpleNamespace(
+            id=uuid.uuid4(), title="Upload", project_id=project.id, department_id=department_id,
+        )
+        system_task = SimpleNamespace(id=uuid.uuid4(), title="generated", project_id=None, department_id=None)
+        template = SimpleNamespace(title="Daily sync")
+        day = date(2026, 3, 2)
+
+        def occurrence(slot, kind, task, **kwargs):
+            return PlannerOccurrence(
+                department_id=department_id,
+                department_name="Development",
+                user_id=user_id,
+                user_name="Ann",
+                day=day,
+                slot=slot,
+                kind=kind,
+                task=task,
+                **kwargs,
+            )
+
+        week = WeeklyPlannerWeek(
+            week_start=day,
+            week_end=date(2026, 3, 6),
+            saved_plan_id=None,
+            occurrences=lambda: iter([
+                occurrence("AM", OCCURRENCE_SYSTEM, system_task, template=template),
+                occurrence("AM", OCCURRENCE_PROJECT, project_task, project_id=project.id, project_title="DEV Catalog"),
+                occurrence("PM", OCCURRENCE_PROJECT, project_task, project_id=project.id, project_title="DEV Catalog"),
+                occurrence("AM", OCCURRENCE_PROJECT, None, project_id=project.id, project_title="DEV Catalog"),
+            ]),
+            table=lambda: self.fail("the audit must not build the weekly table"),
+        )
+        loader = AsyncMock(return_value=week)
+        db = _Db([], [project], [(department_id, "DEV")])
+        with (
+            patch.object(planners, "load_weekly_planner_week", new=loader),
+            patch.object(weekly_planning_audit, "ko_rule_applies_for_task", return_value=False),
+        ):
+            rows = await weekly_planning_audit._planner_occurrences(
+                db, week_start=day, timezone_name="Europe/Tirane",
+            )
+
+        self.assertEqual(loader.await_args.kwargs["week_start"], day)
+        by_source = {row.source: row for row in rows}
+        self.assertEqual(len(rows), 2)
+        self.assertEqual(by_source["Weekly Planner / system task"].title, "Daily sync")
+        self.assertTrue(by_source["Weekly Planner / system task"].is_system)
+        project_row = by_source["Weekly Planner / project"]
+        self.assertEqual(project_row.task_id, project_task.id)
+        self.assertEqual(project_row.project_name, "Catalog")
+        self.assertEqual(project_row.finish_period, "PM")
+
+
+if __name__ == "__main__":
+    unittest.main()
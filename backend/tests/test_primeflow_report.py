@@ -6,10 +6,13 @@ import os
 import uuid
 import zipfile
 import asyncio
+import json
 from datetime import date, datetime, timezone
 from types import SimpleNamespace
 from unittest.mock import patch
 
+from app.services import primeflow_report
+from app.services.mail_delivery import close_pools
 from app.services.primeflow_report_access import can_manage_reports
 from app.services.primeflow_report import (
     GmailService, STATUS_MARKERS, build_report, clean_description, clean_title, employee_initials,
@@ -26,6 +29,7 @@ from app.services.task_strike_events import (
     render_text_for_interval,
     strike_timestamp_datetime,
     split_strike_timestamp,
+    text_point_index,
 )
 from app.services.primeflow_report_delivery import (
     _undiscussed_px_notes_statement,
@@ -79,7 +83,8 @@ class PrimeFlowReportTests(unittest.TestCase):
                 sent_messages.append(message)
 
         with patch.dict(os.environ, {"EMAIL_USER": "sender@example.com", "EMAIL_PASSWORD": "app-password"}):
-            with patch("app.services.primeflow_report.smtplib.SMTP", FakeSmtp):
+            with patch("app.services.mail_delivery._SMTP", FakeSmtp):
+                self.addCleanup(close_pools)
                 asyncio.run(GmailService().send_verified(
                     "Report", ["recipient@example.com"], "Plain", "<strong>HTML</strong>",
                     attachments=[
@@ -708,6 +713,40 @@ class PrimeFlowReportTests(unittest.TestCase):
         self.assertIn("color:#16a34a;text-decoration:line-through", html)
         self.assertIn("color:#2563eb;text-decoration:line-through", html)
 
+    def test_point_index_is_parsed_once_per_text_and_refreshed_on_edit(self) -> None:
+        description = "Heading\n[[done]]1. Shared point[[/done]]\n2. Open point"
+        index = text_point_index(description, "DESCRIPTION")
+        self.assertIs(text_point_index(description, "DESCRIPTION"), index)
+        self.assertEqual(index.heading, "Heading")
+        self.assertEqual([point.text for point in index.points], ["1. Shared point", "2. Open point"])
+        self.assertEqual([point.text for point in index.struck.values()], ["1. Shared point"])
+
+        edited = text_point_index("Heading\n1. Shared point\n[[done]]2. Open point[[/done]]", "DESCRIPTION")
+        self.assertIsNot(edited, index)
+        self.assertEqual([point.text for point in edited.struck.values()], ["2. Open point"])
+
+        # Record-time diffs get their own copy, so the cached entry stays intact.
+        session = SimpleNamespace(rows=[])
+        session.add = session.rows.append
+        record_description_strike_events(
+            session, task_id=uuid.uuid4(), actor_user_id=None,
+            before_description=description, after_description="Heading\n1. Shared point\n2. Open point",
+        )
+        self.assertEqual([row.action for row in session.rows], ["UNSTRUCK"])
+        self.assertEqual(len(text_point_index(description, "DESCRIPTION").struck), 1)
+
+        legacy_event = SimpleNamespace(
+            id="legacy", point_key=point_key("Shared point"), point_text="Shared point",
+            action="STRUCK", occurred_at=datetime(2026, 8, 10, 10, 20, tzinfo=timezone.utc),
+        )
+        _plain, marked = render_description_for_interval(
+            description,
+            [legacy_event],
+            interval_start=datetime(2026, 8, 10, 10, 0, tzinfo=timezone.utc),
+            interval_end=datetime(2026, 8, 10, 11, 0, tzinfo=timezone.utc),
+        )
+        self.assertIn("[[done:blue]]1. Shared point[[/done]]", marked)
+
     def test_strike_report_windows_end_before_the_final_email_delivery(self) -> None:
         report_day = date(2026, 8, 10)
         self.assertEqual(strike_interval_start(report_day, "10:00").strftime("%H:%M"), "08:00")
@@ -899,5 +938,51 @@ class PrimeFlowReportTests(unittest.TestCase):
         self.assertNotIn("[[done:blue]]Second plain line[[/done]]", marked)
 
 
+class PrimeFlowClientCommonViewTests(unittest.IsolatedAsyncioTestCase):
+    def setUp(self) -> None:
+        primeflow_report._common_view_cache.clear()
+        primeflow_report._common_view_inflight.clear()
+        self.client = primeflow_report.PrimeFlowClient("http://api.local", "svc@example.com", "secret")
+        self.started: list[date] = []
+        self.release = asyncio.Event()
+
+    async def _retrieve(self, _client, week_start: date) -> bytes:
+        self.started.append(week_start)
+        await self.release.wait()
+        payload = {
+            "generated_at": f"{week_start.isoformat()}T08:00:00+00:00",
+            "items": {"oneH": [{"week": week_start.isoformat()}]},
+            "guardrails": {"truncated": {}},
+        }
+        return json.dumps(payload).encode()
+
+    async def test_monday_fetches_both_weeks_concurrently_and_merges_them(self) -> None:
+        with patch.object(primeflow_report.PrimeFlowClient, "_retrieve_week", side_effect=self._retrieve, autospec=True):
+            pending = asyncio.create_task(self.client.common_view(date(2026, 7, 27)))
+            for _ in range(10):
+                await asyncio.sleep(0)
+            self.assertEqual(len(self.started), 2)
+            self.release.set()
+            data = await pending
+
+        self.assertEqual(sorted(self.started), [date(2026, 7, 20), date(2026, 7, 27)])
+        self.assertEqual([item["week"] for item in data["items"]["oneH"]], ["2026-07-27", "2026-07-20"])
+        self.assertEqual(data["generated_at"], "2026-07-27T08:00:00+00:00")
+
+    async def test_identical_requests_share_one_fetch_and_get_private_copies(self) -> None:
+        self.release.set()
+        with patch.object(primeflow_report.PrimeFlowClient, "_retrieve_week", side_effect=self._retrieve, autospec=True):
+            first, second = await asyncio.gather(
+                self.client.common_view(date(2026, 7, 28)),
+                self.client.common_view(date(2026, 7, 29)),
+            )
+            first["items"]["oneH"].append({"week": "mutated"})
+            third = await self.client.common_view(date(2026, 7, 28))
+
+        self.assertEqual(self.started, [date(2026, 7, 27)])
+        self.assertEqual(second, third)
+        self.assertEqual(len(third["items"]["oneH"]), 1)
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -1,12 +1,22 @@
+import importlib.util
+import io
 import unittest
 import uuid
 from datetime import date
+from pathlib import Path
 from types import SimpleNamespace
+from unittest.mock import patch
 
+from alembic.migration import MigrationContext
+from alembic.operations import Operations
+
+from app.config import settings
 from app.models.enums import ProjectType
+from app.services import project_display_title
 from app.services.project_display_title import (
     build_display_title,
     build_project_display_title_map,
+    cached_project_control_week_metrics,
     compute_project_control_week_metrics,
 )
 
@@ -34,6 +44,7 @@ class TestProjectDisplayTitle(unittest.IsolatedAsyncioTestCase):
         project_id = uuid.uuid4()
         db = _FakeAsyncSession(
             [
+                [],  # metric versions
                 [],  # control tasks
             ]
         )
@@ -194,5 +205,102 @@ class TestProjectDisplayTitle(unittest.IsolatedAsyncioTestCase):
         self.assertEqual(bucket["realised_week"], 5)
 
 
+class TestProjectControlMetricsCache(unittest.IsolatedAsyncioTestCase):
+    def setUp(self) -> None:
+        patcher = patch.object(settings, "REDIS_ENABLED", False)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        project_display_title._metrics_cache.clear()
+        self.addCleanup(project_display_title._metrics_cache.clear)
+
+    async def test_metrics_are_reused_until_the_project_version_changes(self):
+        project = SimpleNamespace(id=uuid.uuid4(), total_products=50)
+        task_id = uuid.uuid4()
+        controls = [(task_id, project.id, 50, "total_products=50", None, None)]
+        week = {"week_start": date(2026, 2, 23), "week_end": date(2026, 3, 1)}
+        db = _FakeAsyncSession(
+            [
+                [],  # metric versions
+                controls,
+                [(task_id, 10)],  # all-time completed_value rows
+                [(task_id, 4)],  # weekly completed_delta rows
+                [],  # metric versions: unchanged, served from cache
+                [(project.id, 1)],  # metric versions: progress changed
+                controls,
+                [(task_id, 12)],
+                [(task_id, 6)],
+            ]
+        )
+
+        first = await cached_project_control_week_metrics(db, [project], **week)
+        cached = await cached_project_control_week_metrics(db, [project], **week)
+        changed = await cached_project_control_week_metrics(db, [project], **week)
+
+        self.assertEqual(first, cached)
+        self.assertEqual((first[project.id]["done_total"], first[project.id]["realised_week"]), (10, 4))
+        self.assertEqual((changed[project.id]["done_total"], changed[project.id]["realised_week"]), (12, 6))
+        self.assertEqual(db._responses, [])
+
+    async def test_cache_is_keyed_by_week_and_bounded(self):
+        project = SimpleNamespace(id=uuid.uuid4(), total_products=None)
+        db = _FakeAsyncSession([[], [], [], []])
+
+        with patch.object(settings, "PROJECT_METRICS_CACHE_SIZE", 1):
+            await cached_project_control_week_metrics(
+                db, [project], week_start=date(2026, 2, 23), week_end=date(2026, 3, 1)
+            )
+            await cached_project_control_week_metrics(
+                db, [project], week_start=date(2026, 3, 2), week_end=date(2026, 3, 8)
+            )
+
+        self.assertEqual(db._responses, [])
+        self.assertEqual(len(project_display_title._metrics_cache), 1)
+        self.assertIn(":2026-03-02:", next(iter(project_display_title._metrics_cache)))
+
+
+
+class TestProjectMetricVersionTrigger(unittest.TestCase):
+    def test_dependent_control_tasks_are_found_through_the_origin_index(self) -> None:
+        path = Path(__file__).parents[1] / "alembic" / "versions" / "20260827_index_control_origin_task_id.py"
+        spec = importlib.util.spec_from_file_location("control_origin_task_index_migration", path)
+        migration = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(migration)
+        output = io.StringIO()
+        context = MigrationContext.configure(
+            dialect_name="postgresql", opts={"as_sql": True, "output_buffer": output}
+        )
+        with Operations.context(context):
+            migration.upgrade()
+        upgrade_sql = output.getvalue()
+        trigger_sql = upgrade_sql.split("CREATE OR REPLACE FUNCTION", 1)[1]
+
+        self.assertIn(f"ON tasks ({migration._ORIGIN_TASK_ID_EXPR}) WHERE phase = 'CONTROL'", upgrade_sql)
+        self.assertIn(f"{migration._ORIGIN_TASK_ID_EXPR} = origin_id::text", trigger_sql)
+        self.assertNotIn("ILIKE", trigger_sql)
+        self.assertIn("IF TG_OP <> 'UPDATE'", trigger_sql)
+        self.assertIn(
+            f"'(?i){project_display_title.ORIGIN_TASK_ID_RE.pattern}'", migration._ORIGIN_TASK_ID_EXPR
+        )
+
+    def test_only_control_tasks_and_their_origins_bump_versions(self) -> None:
+        path = Path(__file__).parents[1] / "alembic" / "versions" / "20260829_limit_project_metric_bumps.py"
+        spec = importlib.util.spec_from_file_location("control_metric_bumps_migration", path)
+        migration = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(migration)
+        output = io.StringIO()
+        context = MigrationContext.configure(
+            dialect_name="postgresql", opts={"as_sql": True, "output_buffer": output}
+        )
+        with Operations.context(context):
+            migration.upgrade()
+        sql = output.getvalue()
+
+        self.assertIn("SELECT NEW.project_id AS project_id WHERE NEW.phase = 'CONTROL'", sql)
+        self.assertIn(f"{migration._ORIGIN_TASK_ID_EXPR} = changed_id::text", sql)
+        self.assertIn("AND t.phase = 'CONTROL'", sql)
+        self.assertEqual(sql.count("ORDER BY"), 2)
+        self.assertNotIn("PERFORM project_metric_version_bump(NEW.project_id)", sql)
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -1,9 +1,13 @@
 from __future__ import annotations
 
+import asyncio
 import io
+import tempfile
 import unittest
 import zipfile
 from datetime import date, datetime
+from pathlib import Path
+from unittest.mock import MagicMock, patch
 from zoneinfo import ZoneInfo
 
 from docx import Document
@@ -11,6 +15,8 @@ from openpyxl import load_workbook
 
 from app.celery_app import celery_app
 from app.config import settings
+from app.integrations.storage import LocalStorage
+from app.services import px_jav_weekly_report, report_rendering
 from app.services.px_jav_weekly_report import (
     EXCEL_MIME,
     PDF_MIME,
@@ -192,6 +198,10 @@ class PxJavWeeklyReportTests(unittest.TestCase):
         self.assertEqual(detail["B8"].value, "31.12 / PA TASK")
         self.assertEqual(detail["D8"].value, "31.12.2026")
         self.assertEqual(detail["I8"].value, "FUNDVIT")
+        summary = workbook["PËRMBLEDHJE"]
+        self.assertEqual(summary["A2"].value, "Gjeneruar")
+        self.assertEqual(summary["B2"].value, datetime(2026, 8, 20, 15, 50))
+        self.assertEqual(summary["A8"].value, "Treguesi")
         workbook.close()
 
     def test_docx_is_landscape_with_repeating_header_and_all_rows(self) -> None:
@@ -202,6 +212,7 @@ class PxJavWeeklyReportTests(unittest.TestCase):
         self.assertEqual(len(document.tables), 2)
         self.assertEqual(len(document.tables[1].rows), 8)
         self.assertEqual(len(document.tables[1].columns), 10)
+        self.assertEqual(section.footer.paragraphs[0].text, "Gjeneruar 20.08.2026 15:50 | Europe/Tirane")
         self.assertEqual(document.tables[1].cell(1, 1).text, "PA TASK")
         self.assertEqual(document.tables[1].cell(2, 1).text, "PA TASK")
         self.assertEqual(document.tables[1].cell(3, 1).text, "TASK PËR J.T")
@@ -222,7 +233,13 @@ class PxJavWeeklyReportTests(unittest.TestCase):
         pdf = render_pdf(self.report)
         self.assertTrue(pdf.startswith(b"%PDF"))
         self.assertGreater(len(pdf), 2_000)
-        attachments = build_attachments(self.report)
+        storage = LocalStorage(Path(self._temporary_dir()))
+        with (
+            patch.object(settings, "REPORT_RENDER_WORKERS", 2),
+            patch.object(report_rendering, "get_storage", return_value=storage),
+        ):
+            self.addCleanup(report_rendering.shutdown_render_pool)
+            attachments = asyncio.run(build_attachments(self.report))
         self.assertEqual(
             [mime for _, _, mime in attachments],
             [EXCEL_MIME, WORD_MIME, PDF_MIME],
@@ -233,6 +250,34 @@ class PxJavWeeklyReportTests(unittest.TestCase):
         )
         self.assertTrue(all(payload for _, payload, _ in attachments))
 
+    def test_attachments_are_reused_while_report_content_is_unchanged(self) -> None:
+        storage = LocalStorage(Path(self._temporary_dir()))
+        render = MagicMock(side_effect=lambda report: report.model_dump_json().encode("utf-8"))
+        tirane = ZoneInfo("Europe/Tirane")
+        regenerated = self.report.model_copy(update={"generated_at": datetime(2026, 8, 20, 15, 50, 40, tzinfo=tirane)})
+        next_minute = self.report.model_copy(update={"generated_at": datetime(2026, 8, 20, 16, 5, tzinfo=tirane)})
+        changed = self.report.model_copy(update={"period_note_count": 7})
+        with (
+            patch.object(settings, "REPORT_RENDER_WORKERS", 0),
+            patch.object(report_rendering, "get_storage", return_value=storage),
+            patch.object(px_jav_weekly_report, "render_xlsx", render),
+        ):
+            first = asyncio.run(build_attachments(self.report, ("xlsx",)))
+            resent = asyncio.run(build_attachments(regenerated, ("xlsx",)))
+            self.assertEqual(render.call_count, 1)
+            self.assertEqual(resent, first)
+            asyncio.run(build_attachments(next_minute, ("xlsx",)))
+            self.assertEqual(render.call_count, 2)
+            asyncio.run(build_attachments(changed, ("xlsx",)))
+            self.assertEqual(render.call_count, 3)
+        self.assertTrue(first[0][0].endswith(".xlsx"))
+        self.assertEqual(first[0][2], EXCEL_MIME)
+
+    def _temporary_dir(self) -> str:
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        return directory.name
+
     def test_schedule_recipient_and_timezone_match_request(self) -> None:
         entry = celery_app.conf.beat_schedule["px-jav-weekly-report-thursday-1550"]
         self.assertEqual(entry["task"], "app.celery_tasks.send_px_jav_weekly_report")
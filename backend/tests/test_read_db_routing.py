@@ -0,0 +1,58 @@
+import unittest
+
+from fastapi.routing import APIRoute
+
+from app.api.routers import exports, reports
+from app.config import settings
+from app.db import _engine_options, engine, get_db, get_read_db, read_engine
+
+
+def _route_dependencies(route: APIRoute) -> set:
+    return {dependency.call for dependency in route.dependant.dependencies}
+
+
+class TestReadDbRouting(unittest.TestCase):
+    def test_read_pool_is_read_only_with_its_own_timeout(self):
+        options = _engine_options(pool_size=3, max_overflow=1, statement_timeout_ms=5000, read_only=True)
+
+        self.assertEqual(options["pool_size"], 3)
+        self.assertEqual(options["max_overflow"], 1)
+        self.assertEqual(
+            options["connect_args"]["server_settings"],
+            {"statement_timeout": "5000", "default_transaction_read_only": "on"},
+        )
+
+    def test_primary_pool_without_timeout_keeps_server_defaults(self):
+        options = _engine_options(pool_size=20, max_overflow=20, statement_timeout_ms=0)
+
+        self.assertNotIn("connect_args", options)
+
+    def test_read_engine_is_a_separate_pool(self):
+        self.assertIsNot(read_engine.pool, engine.pool)
+        if not settings.DATABASE_READ_URL:
+            self.assertEqual(
+                read_engine.url.render_as_string(hide_password=False),
+                engine.url.render_as_string(hide_password=False),
+            )
+
+    def test_export_routes_use_the_read_pool(self):
+        routes = [route for route in exports.router.routes if isinstance(route, APIRoute)]
+
+        self.assertTrue(any(get_read_db in _route_dependencies(route) for route in routes))
+        for route in routes:
+            self.assertNotIn(get_db, _route_dependencies(route), route.path)
+
+    def test_report_reads_use_read_pool_and_writes_stay_on_primary(self):
+        for route in reports.router.routes:
+            if not isinstance(route, APIRoute):
+                continue
+            dependencies = _route_dependencies(route)
+            if route.methods == {"GET"}:
+                self.assertIn(get_read_db, dependencies, route.path)
+            else:
+                self.assertIn(get_db, dependencies, route.path)
+                self.assertNotIn(get_read_db, dependencies, route.path)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,100 @@
+import asyncio
+import unittest
+import uuid
+from datetime import date
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+
+from app.config import settings
+from app.jobs import realization as realization_job
+from app.models.enums import UserRole
+from app.services.realization_daily import DailyRealizationDayData
+
+
+class _Result:
+    def __init__(self, value) -> None:
+        self.value = value
+
+    def scalars(self):
+        return self
+
+    def all(self):
+        return self.value
+
+    def scalar_one_or_none(self):
+        return self.value
+
+
+class _Session:
+    def __init__(self, *responses) -> None:
+        self.responses = list(responses)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        return None
+
+    async def execute(self, statement):
+        return _Result(self.responses.pop(0))
+
+
+class TestDailyRealizationJob(unittest.IsolatedAsyncioTestCase):
+    async def test_departments_run_concurrently_and_fail_in_isolation(self) -> None:
+        ok_ids = [uuid.uuid4() for _ in range(3)]
+        failing_id, slow_id, no_actor_id = uuid.uuid4(), uuid.uuid4(), uuid.uuid4()
+        department_ids = [*ok_ids, failing_id, slow_id, no_actor_id]
+        managers = {
+            department_id: [SimpleNamespace(id=uuid.uuid4(), role=UserRole.MANAGER)]
+            for department_id in department_ids
+            if department_id != no_actor_id
+        }
+        day_data = DailyRealizationDayData(
+            day=date(2026, 3, 4),
+            users_by_department=managers,
+            common_leave={},
+            attendance_by_user={},
+        )
+        running = peak = 0
+
+        async def calculate(*, department_id, actor, day, day_data):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            try:
+                await asyncio.sleep(0.01)
+                if department_id == failing_id:
+                    raise RuntimeError("boom")
+                if department_id == slow_id:
+                    await asyncio.sleep(5)
+                self.assertEqual(actor, managers[department_id][0])
+                return "calculated"
+            finally:
+                running -= 1
+
+        loader = AsyncMock(return_value=day_data)
+        with (
+            patch.multiple(
+                settings,
+                REALIZATION_DAILY_ENABLED=True,
+                REALIZATION_DAILY_CONCURRENCY=2,
+                REALIZATION_DAILY_DEPARTMENT_TIMEOUT_SECONDS=0.2,
+            ),
+            patch.object(realization_job, "_is_working_day", return_value=True),
+            patch.object(realization_job, "SessionLocal", side_effect=lambda: _Session(department_ids, None)),
+            patch.object(realization_job, "load_daily_realization_day_data", new=loader),
+            patch.object(realization_job, "_calculate_department_day", side_effect=calculate),
+            self.assertLogs(realization_job.logger, level="INFO") as logs,
+        ):
+            result = await realization_job.generate_daily_realization_snapshots()
+
+        self.assertEqual(result, {"calculated": 3, "skipped": 1, "failed": 2})
+        self.assertEqual(peak, 2)
+        loader.assert_awaited_once()
+        timings = [line for line in logs.output if "duration_ms=" in line]
+        self.assertEqual(len(timings), 5)
+        self.assertTrue(any(f"department={slow_id} outcome=failed" in line for line in timings))
+
+
+if __name__ == "__main__":
+    unittest.main()
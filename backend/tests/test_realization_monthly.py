@@ -0,0 +1,194 @@
+import unittest
+import uuid
+from datetime import date
+from types import SimpleNamespace
+
+from sqlalchemy.dialects import postgresql
+
+from app.models.realization import RealizationMonthlyDepartmentAggregate, RealizationMonthlyPersonAggregate
+from app.services.realization_monthly import (
+    monthly_aggregation,
+    monthly_person_aggregates,
+    refresh_monthly_aggregates,
+)
+
+
+class _Result:
+    def __init__(self, value) -> None:
+        self.value = value
+
+    def scalars(self):
+        return self
+
+    def all(self):
+        return self.value
+
+    def scalar_one_or_none(self):
+        return self.value
+
+    def scalar_one(self):
+        return self.value
+
+
+class _Db:
+    def __init__(self, *responses) -> None:
+        self.responses = list(responses)
+        self.statements = []
+        self.added = []
+        self.deleted = []
+
+    async def execute(self, statement):
+        self.statements.append(str(statement.compile(dialect=postgresql.dialect())))
+        return _Result(self.responses.pop(0))
+
+    def add(self, row) -> None:
+        self.added.append(row)
+
+    async def delete(self, row) -> None:
+        self.deleted.append(row)
+
+    async def flush(self) -> None:
+        return None
+
+
+def _week(department_id, start, end, *, status="CALCULATED"):
+    return SimpleNamespace(
+        id=uuid.uuid4(),
+        period_type="WEEKLY",
+        department_id=department_id,
+        start_date=start,
+        end_date=end,
+        final_snapshot_id=uuid.uuid4(),
+        status=status,
+    )
+
+
+def _result(period, user_id, pulse, *, pink=0):
+    return SimpleNamespace(
+        period_id=period.id,
+        user_id=user_id,
+        facts_json={"pulse": {"pulse": pulse, "verified_extra_count": 1}, "unresolved_pink_count": pink},
+    )
+
+
+class TestRefreshMonthlyAggregates(unittest.IsolatedAsyncioTestCase):
+    async def test_a_week_is_folded_into_every_month_it_overlaps(self) -> None:
+        department_id = uuid.uuid4()
+        user_id = uuid.uuid4()
+        week = _week(department_id, date(2026, 3, 30), date(2026, 4, 3))
+        march = RealizationMonthlyDepartmentAggregate(department_id=department_id, month_start=date(2026, 3, 1))
+        april = RealizationMonthlyDepartmentAggregate(department_id=department_id, month_start=date(2026, 4, 1))
+        result = _result(week, user_id, "?", pink=2)
+        db = _Db([result], None, march, [], None, april, [])
+
+        await refresh_monthly_aggregates(db, weekly_period=week)
+
+        people = [row for row in db.added if isinstance(row, RealizationMonthlyPersonAggregate)]
+        self.assertEqual([row.month_start for row in people], [date(2026, 3, 1), date(2026, 4, 1)])
+        self.assertEqual([march.pulse_counts, april.pulse_counts], [{"?": 1}, {"?": 1}])
+        aggregation = monthly_aggregation(people[0])
+        self.assertEqual(aggregation["question_count"], 1)
+        self.assertEqual(aggregation["unresolved_pink_days"], 1)
+        self.assertEqual(aggregation["verified_positive_extras"], 1)
+        self.assertEqual(aggregation["current_pulse"], "?")
+        # The month row is locked before the person rows are read and rewritten.
+        self.assertIn("ON CONFLICT (department_id, month_start) DO NOTHING", db.statements[1])
+        self.assertIn("FOR UPDATE", db.statements[2])
+        self.assertIn("FOR UPDATE", db.statements[3])
+
+    async def test_the_first_refresh_of_a_month_backfills_its_earlier_weeks(self) -> None:
+        department_id = uuid.uuid4()
+        user_id = uuid.uuid4()
+        earlier = _week(department_id, date(2026, 3, 2), date(2026, 3, 6))
+        reopened = _week(department_id, date(2026, 3, 9), date(2026, 3, 13), status="OPEN")
+        week = _week(department_id, date(2026, 3, 16), date(2026, 3, 20))
+        department = RealizationMonthlyDepartmentAggregate(department_id=department_id, month_start=date(2026, 3, 1))
+        db = _Db(
+            [_result(week, user_id, "++")],
+            uuid.uuid4(),
+            department,
+            [earlier, reopened, week],
+            [_result(earlier, user_id, "+"), _result(week, user_id, "++")],
+            [],
+        )
+
+        await refresh_monthly_aggregates(db, weekly_period=week)
+
+        (aggregate,) = db.added
+        self.assertEqual([entry["period_id"] for entry in aggregate.weekly_history], [str(earlier.id), str(week.id)])
+        self.assertEqual(aggregate.trend, ["+", "++"])
+        self.assertEqual(department.source_weekly_period_ids, sorted([str(earlier.id), str(week.id)]))
+
+    async def test_recalculating_a_week_replaces_only_its_entry(self) -> None:
+        department_id = uuid.uuid4()
+        user_id = uuid.uuid4()
+        earlier = _week(department_id, date(2026, 3, 2), date(2026, 3, 6))
+        week = _week(department_id, date(2026, 3, 9), date(2026, 3, 13))
+        aggregate = RealizationMonthlyPersonAggregate(
+            department_id=department_id,
+            month_start=date(2026, 3, 1),
+            user_id=user_id,
+            weekly_history=[
+                {"period_id": str(week.id), "week_start": "2026-03-09", "pulse": "?"},
+                {"period_id": str(earlier.id), "week_start": "2026-03-02", "pulse": "+"},
+            ],
+        )
+        department = RealizationMonthlyDepartmentAggregate(department_id=department_id, month_start=date(2026, 3, 1))
+        db = _Db([_result(week, user_id, "++")], None, department, [aggregate])
+
+        await refresh_monthly_aggregates(db, weekly_period=week)
+
+        self.assertEqual([entry["period_id"] for entry in aggregate.weekly_history], [str(earlier.id), str(week.id)])
+        self.assertEqual(aggregate.trend, ["+", "++"])
+        self.assertEqual((aggregate.plus_count, aggregate.plus_plus_count), (1, 1))
+        self.assertEqual(department.people_count, 1)
+        self.assertEqual(department.source_weekly_period_ids, sorted([str(earlier.id), str(week.id)]))
+        self.assertEqual(db.added, [])
+
+    async def test_a_week_that_is_no_longer_official_drops_out(self) -> None:
+        department_id = uuid.uuid4()
+        week = _week(department_id, date(2026, 3, 9), date(2026, 3, 13), status="OPEN")
+        aggregate = RealizationMonthlyPersonAggregate(
+            department_id=department_id,
+            month_start=date(2026, 3, 1),
+            user_id=uuid.uuid4(),
+            weekly_history=[{"period_id": str(week.id), "week_start": "2026-03-09", "pulse": "+"}],
+        )
+        department = RealizationMonthlyDepartmentAggregate(department_id=department_id, month_start=date(2026, 3, 1))
+        db = _Db(None, department, [aggregate])
+
+        await refresh_monthly_aggregates(db, weekly_period=week)
+
+        self.assertEqual(db.deleted, [aggregate])
+        self.assertEqual((department.people_count, department.pulse_counts), (0, {}))
+
+
+class TestMonthlyPersonAggregates(unittest.IsolatedAsyncioTestCase):
+    async def test_a_month_without_rollups_is_computed_from_its_weeks(self) -> None:
+        department_id = uuid.uuid4()
+        user_id = uuid.uuid4()
+        first = _week(department_id, date(2026, 2, 2), date(2026, 2, 6))
+        second = _week(department_id, date(2026, 2, 9), date(2026, 2, 13))
+        db = _Db(None, [first, second], [_result(second, user_id, "++"), _result(first, user_id, "+")])
+
+        (aggregate,) = await monthly_person_aggregates(db, department_id=department_id, month_start=date(2026, 2, 1))
+
+        self.assertEqual(aggregate.user_id, user_id)
+        self.assertEqual(aggregate.trend, ["+", "++"])
+        self.assertEqual(db.added, [])
+
+    async def test_stored_rollups_are_served_once_the_month_is_built(self) -> None:
+        department_id = uuid.uuid4()
+        stored = RealizationMonthlyPersonAggregate(
+            department_id=department_id, month_start=date(2026, 2, 1), user_id=uuid.uuid4()
+        )
+        db = _Db(uuid.uuid4(), [stored])
+
+        self.assertEqual(
+            await monthly_person_aggregates(db, department_id=department_id, month_start=date(2026, 2, 1)),
+            [stored],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,125 @@
+from __future__ import annotations
+
+import asyncio
+import importlib.util
+import json
+import unittest
+import uuid
+from datetime import datetime, timezone
+from types import SimpleNamespace
+from unittest.mock import patch
+
+from app.config import settings
+from app.integrations import redis as redis_integration
+from app.models.enums import NotificationType
+from app.models.notification import Notification
+from app.services.notifications import CHANNEL, NotificationDispatcher
+
+
+@unittest.skipUnless(importlib.util.find_spec("fakeredis"), "fakeredis is not installed")
+class RedisIntegrationTests(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self) -> None:
+        patcher = patch.multiple(settings, REDIS_ENABLED=True, REDIS_URL="fakeredis://")
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        redis_integration._fake_server = None
+        await redis_integration.init_redis()
+
+    async def asyncTearDown(self) -> None:
+        await redis_integration.close_redis()
+
+    async def test_one_client_is_shared_within_the_loop(self) -> None:
+        self.assertIs(redis_integration.get_redis(), redis_integration.get_redis())
+        self.assertEqual(await redis_integration.redis_health(), "ok")
+
+    async def test_other_loops_get_their_own_client_closed_with_the_loop(self) -> None:
+        app_client = redis_integration.get_redis()
+        closed = []
+
+        async def in_task():
+            client = redis_integration.get_redis()
+            await client.set("celery", "1")
+            original = client.aclose
+
+            async def aclose():
+                closed.append(client)
+                await original()
+
+            client.aclose = aclose
+            return client, redis_integration.get_redis()
+
+        first, again = await asyncio.to_thread(asyncio.run, in_task())
+        second, _ = await asyncio.to_thread(asyncio.run, in_task())
+
+        self.assertIs(first, again)
+        self.assertIsNot(first, app_client)
+        self.assertIsNot(first, second)
+        self.assertEqual(closed, [first, second])
+        self.assertIs(redis_integration.get_redis(), app_client)
+        self.assertEqual(await app_client.get("celery"), "1")
+
+    async def test_rate_limit_counts_within_the_window(self) -> None:
+        results = [
+            await redis_integration.rate_limit("login:elsa", limit=2, window_seconds=60)
+            for _ in range(3)
+        ]
+
+        self.assertEqual([result.allowed for result in results], [True, True, False])
+        self.assertEqual(results[-1].remaining, 0)
+        self.assertGreater(results[-1].reset_ms, 0)
+
+    async def test_distributed_lock_is_exclusive_until_released(self) -> None:
+        async with redis_integration.distributed_lock("weekly-audit") as first:
+            async with redis_integration.distributed_lock("weekly-audit") as second:
+                self.assertTrue(first)
+                self.assertFalse(second)
+        async with redis_integration.distributed_lock("weekly-audit") as again:
+            self.assertTrue(again)
+
+    async def test_dispatcher_publishes_through_the_shared_pool(self) -> None:
+        pubsub = redis_integration.get_redis().pubsub()
+        await pubsub.subscribe(CHANNEL)
+        await pubsub.get_message(timeout=1)  # subscribe confirmation
+        user_id = uuid.uuid4()
+        dispatcher = NotificationDispatcher(debounce_seconds=0)
+        for title in ("Assigned", "Reassigned"):
+            dispatcher.enqueue(
+                user_id,
+                Notification(
+                    id=uuid.uuid4(),
+                    user_id=user_id,
+                    type=NotificationType.assignment,
+                    title=title,
+                    data={"task_id": "t-1"},
+                    created_at=datetime(2026, 3, 2, 8, 0, tzinfo=timezone.utc),
+                ),
+            )
+        await dispatcher.dispatch()
+
+        message = await pubsub.get_message(ignore_subscribe_messages=True, timeout=1)
+        self.assertIsNone(await pubsub.get_message(ignore_subscribe_messages=True, timeout=0.1))
+        await pubsub.aclose()
+
+        payload = json.loads(message["data"])
+        self.assertEqual(payload["user_id"], str(user_id))
+        self.assertEqual(payload["notification"]["title"], "Reassigned")
+
+
+class RedisHealthTests(unittest.IsolatedAsyncioTestCase):
+    async def test_health_reports_disabled_redis_without_connecting(self) -> None:
+        with patch.object(settings, "REDIS_ENABLED", False):
+            self.assertEqual(await redis_integration.redis_health(), "disabled")
+
+    async def test_health_reports_unreachable_redis(self) -> None:
+        async def refused():
+            raise ConnectionError("refused")
+
+        with (
+            patch.object(settings, "REDIS_ENABLED", True),
+            patch.object(redis_integration, "get_redis", return_value=SimpleNamespace(ping=refused)),
+        ):
+            self.assertEqual(await redis_integration.redis_health(timeout=0.1), "unavailable")
+
+
+if __name__ == "__main__":
+    unittest.main()
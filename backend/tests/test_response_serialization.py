@@ -0,0 +1,143 @@
+import json
+import unittest
+import uuid
+from datetime import date, datetime, timezone
+
+import httpx
+from fastapi import APIRouter, FastAPI, Response
+from fastapi.responses import ORJSONResponse
+from fastapi.routing import APIRoute
+
+from app.api.routers import common_view, planners, system_tasks, tasks
+from app.api.serialization import PreEncodedRoute, encode_response, pre_encoded, response_adapter
+from app.models.enums import ProjectPhaseStatus, TaskPriority, TaskStatus
+from app.schemas.planner import (
+    WeeklyTableDay,
+    WeeklyTableDepartment,
+    WeeklyTableProjectEntry,
+    WeeklyTableProjectTaskEntry,
+    WeeklyTableResponse,
+    WeeklyTableUserDay,
+)
+from app.schemas.task import TaskAssigneeOut, TaskOut
+
+
+NOW = datetime(2026, 3, 2, 8, 30, tzinfo=timezone.utc)
+
+
+def _task(index: int) -> TaskOut:
+    user_id = uuid.uuid4()
+    return TaskOut(
+        id=uuid.uuid4(),
+        title=f"Task {index} – ë",
+        description="Përshkrim" if index % 2 else None,
+        assignees=[TaskAssigneeOut(id=user_id, email="elsa@example.com", full_name="Elsa", username="elsa")],
+        status=TaskStatus.IN_PROGRESS,
+        priority=TaskPriority.HIGH,
+        phase=ProjectPhaseStatus.PRODUCT,
+        progress_percentage=40,
+        due_date=NOW,
+        is_deadline_important=False,
+        is_bllok=False,
+        is_1h_report=False,
+        is_r1=True,
+        is_personal=False,
+        is_active=True,
+        alignment_user_ids=[user_id],
+        created_at=NOW,
+        updated_at=NOW,
+    )
+
+
+def _weekly_table() -> WeeklyTableResponse:
+    project = WeeklyTableProjectEntry(
+        project_id=uuid.uuid4(),
+        project_title="VS Amazon",
+        tasks=[WeeklyTableProjectTaskEntry(task_id=uuid.uuid4(), task_title="Kontroll", status=TaskStatus.DONE)],
+    )
+    user_day = WeeklyTableUserDay(user_id=uuid.uuid4(), user_name="Elsa", am_projects=[project])
+    return WeeklyTableResponse(
+        week_start=date(2026, 3, 2),
+        week_end=date(2026, 3, 6),
+        departments=[
+            WeeklyTableDepartment(
+                department_id=uuid.uuid4(),
+                department_name="Development",
+                days=[WeeklyTableDay(date=date(2026, 3, 2), users=[user_day])],
+            )
+        ],
+    )
+
+
+def _route(router: APIRouter, endpoint) -> APIRoute:
+    return next(route for route in router.routes if isinstance(route, APIRoute) and route.endpoint is endpoint)
+
+
+class TestPreEncodedResponses(unittest.IsolatedAsyncioTestCase):
+    async def _get(self, app: FastAPI, path: str) -> httpx.Response:
+        async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+            return await client.get(path)
+
+    def _app(self, items: list[TaskOut]) -> FastAPI:
+        router = APIRouter(route_class=PreEncodedRoute)
+
+        @router.get("/fast", response_model=list[TaskOut])
+        @pre_encoded
+        async def fast(response: Response) -> list[TaskOut]:
+            response.headers["ETag"] = '"abc"'
+            return items
+
+        @router.get("/validated", response_model=list[TaskOut])
+        async def validated() -> list[TaskOut]:
+            return items
+
+        @router.get("/mixed", response_model=list[TaskOut])
+        @pre_encoded
+        async def mixed() -> list:
+            return [items[0].model_dump(), *items[1:]]
+
+        app = FastAPI(default_response_class=ORJSONResponse)
+        app.include_router(router)
+        return app
+
+    async def test_pre_encoded_body_matches_the_validated_response(self) -> None:
+        app = self._app([_task(index) for index in range(3)])
+
+        fast = await self._get(app, "/fast")
+        validated = await self._get(app, "/validated")
+        mixed = await self._get(app, "/mixed")
+
+        self.assertEqual(fast.status_code, 200)
+        self.assertEqual(fast.headers["content-type"], "application/json")
+        self.assertEqual(fast.headers["etag"], '"abc"')
+        self.assertEqual(fast.json(), validated.json())
+        self.assertEqual(mixed.json(), validated.json())
+
+    def test_marker_leaves_direct_calls_returning_models(self) -> None:
+        self.assertTrue(getattr(tasks.list_tasks, "__pre_encoded__", False))
+        self.assertEqual(tasks.list_tasks.__name__, "list_tasks")
+
+    def test_large_list_endpoints_use_the_pre_encoded_route(self) -> None:
+        for router, endpoint in (
+            (tasks.router, tasks.list_tasks),
+            (planners.router, planners.weekly_table_planner),
+            (common_view.router, common_view.get_common_view),
+            (system_tasks.router, system_tasks.list_system_tasks),
+        ):
+            route = _route(router, endpoint)
+            self.assertIsInstance(route, PreEncodedRoute)
+            self.assertIsNot(route.dependant.call, endpoint, endpoint.__name__)
+
+    def test_encoded_payloads_satisfy_their_response_schemas(self) -> None:
+        for response_model, content in (
+            (list[TaskOut], [_task(index) for index in range(5)]),
+            (WeeklyTableResponse, _weekly_table()),
+        ):
+            adapter = response_adapter(response_model)
+            encoded = encode_response(adapter, content)
+            self.assertEqual(adapter.validate_json(encoded), content)
+            self.assertEqual(json.loads(encoded), adapter.dump_python(content, mode="json", by_alias=True))
+
+
+if __name__ == "__main__":
+    unittest.main()
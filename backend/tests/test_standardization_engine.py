@@ -0,0 +1,113 @@
+import asyncio
+import io
+import signal
+import time
+import unittest
+from unittest.mock import patch
+
+from openpyxl import Workbook, load_workbook
+
+from app.config import settings
+from app.services import excel_standardizer, standardization_engine
+from app.services.excel_standardizer import ExcelStandardizationError
+
+
+def _source() -> bytes:
+    workbook = Workbook()
+    worksheet = workbook.active
+    worksheet.title = "Sheet1"
+    worksheet.append(["Name", "Amount", None])
+    worksheet.append(["Primex", "1,370 EUR", "Shënim"])
+    output = io.BytesIO()
+    workbook.save(output)
+    return output.getvalue()
+
+
+def _sleep_ignoring_alarm(seconds: float) -> None:
+    # Stands in for a job stuck in C code, where the worker's alarm cannot reach it.
+    signal.pthread_sigmask(signal.SIG_BLOCK, {signal.SIGALRM})
+    time.sleep(seconds)
+
+
+class TestStandardizationEngine(unittest.IsolatedAsyncioTestCase):
+    def setUp(self) -> None:
+        standardization_engine._analysis_cache.clear()
+        self.addCleanup(standardization_engine._analysis_cache.clear)
+
+    async def test_generation_reuses_the_cached_analysis_and_parses_once(self) -> None:
+        content = _source()
+        with (
+            patch.multiple(settings, STANDARDIZER_WORKERS=0, REDIS_ENABLED=False),
+            patch.object(excel_standardizer, "_load_workbook", wraps=excel_standardizer._load_workbook) as loads,
+        ):
+            analysis = await standardization_engine.analyze_excel(content, "stock.xlsx")
+            again = await standardization_engine.analyze_excel(content, "stock.xlsx")
+            self.assertEqual(loads.call_count, 1)
+            workbook_bytes, _, report = await standardization_engine.generate_excel(
+                content,
+                "stock.xlsx",
+                initials="AN",
+                missing_headers={"Sheet1": {"C": "Shënim"}},
+            )
+
+        self.assertEqual(again, analysis)
+        self.assertEqual(loads.call_count, 2)
+        self.assertEqual(load_workbook(io.BytesIO(workbook_bytes)).sheetnames, ["STOCK"])
+        self.assertTrue(report["sheets"])
+
+    async def test_a_different_file_is_not_served_from_the_cache(self) -> None:
+        with patch.multiple(settings, STANDARDIZER_WORKERS=0, REDIS_ENABLED=False):
+            first = await standardization_engine.analyze_excel(_source(), "stock.xlsx")
+            renamed = await standardization_engine.analyze_excel(_source(), "sales_report.xlsx")
+
+        self.assertNotEqual(first.suggested_description, renamed.suggested_description)
+
+    async def test_jobs_past_the_timeout_are_stopped_in_the_worker(self) -> None:
+        with patch.multiple(settings, STANDARDIZER_WORKERS=1, STANDARDIZER_TIMEOUT_SECONDS=0.5):
+            self.addCleanup(standardization_engine.shutdown_standardizer_pool)
+            started = time.monotonic()
+            with self.assertRaises(ExcelStandardizationError) as raised:
+                await standardization_engine._run(time.sleep, 30, error_type=ExcelStandardizationError)
+            analysis = await standardization_engine._run(
+                excel_standardizer.analyze_workbook, _source(), "stock.xlsx", error_type=ExcelStandardizationError
+            )
+
+        self.assertEqual(str(raised.exception), standardization_engine.TIMEOUT_MESSAGE)
+        self.assertLess(time.monotonic() - started, 30)
+        self.assertEqual(analysis.sheets[0].name, "Sheet1")
+
+    async def test_time_spent_waiting_in_the_pool_queue_does_not_count(self) -> None:
+        with (
+            patch.multiple(settings, STANDARDIZER_WORKERS=1, STANDARDIZER_TIMEOUT_SECONDS=1),
+            patch.object(standardization_engine, "_TIMEOUT_GRACE_SECONDS", 0.5),
+        ):
+            self.addCleanup(standardization_engine.shutdown_standardizer_pool)
+            # Warm the worker up so process start-up is not charged to the first job.
+            await standardization_engine._run(time.sleep, 0, error_type=ExcelStandardizationError)
+            results = await asyncio.gather(
+                *(standardization_engine._run(time.sleep, 0.4, error_type=ExcelStandardizationError) for _ in range(5))
+            )
+
+        self.assertEqual(results, [None] * 5)
+
+    async def test_a_stuck_job_stops_its_worker_and_queued_jobs_are_retried(self) -> None:
+        with (
+            patch.multiple(settings, STANDARDIZER_WORKERS=1, STANDARDIZER_TIMEOUT_SECONDS=0.5),
+            patch.object(standardization_engine, "_TIMEOUT_GRACE_SECONDS", 0.5),
+        ):
+            self.addCleanup(standardization_engine.shutdown_standardizer_pool)
+            stuck, other = await asyncio.gather(
+                standardization_engine._run(_sleep_ignoring_alarm, 30, error_type=ExcelStandardizationError),
+                standardization_engine._run(
+                    excel_standardizer.analyze_workbook, _source(), "stock.xlsx", error_type=ExcelStandardizationError
+                ),
+                return_exceptions=True,
+            )
+
+        self.assertIsInstance(stuck, ExcelStandardizationError)
+        self.assertEqual(str(stuck), standardization_engine.TIMEOUT_MESSAGE)
+        self.assertEqual(other.sheets[0].name, "Sheet1")
+
+
+if __name__ == "__main__":
+    unittest.main()
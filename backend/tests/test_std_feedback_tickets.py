@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import os
+import tempfile
 import unittest
 import uuid
 from datetime import date, datetime, timezone
@@ -15,9 +16,11 @@ import httpx
 from fastapi import HTTPException
 from openpyxl import load_workbook
 
+from app.api.routers import external_tickets
 from app.api.routers.external_tickets import (
     _external_tickets_workbook,
     _search_condition,
+    download_external_ticket_file,
     external_ticket_task_options,
     sync_external_tickets_now,
 )
@@ -31,6 +34,7 @@ from app.services.std_feedback_task_creation import (
     task_type_fields,
     user_initials,
 )
+from app.services.std_attachment_cache import StdAttachmentCache, etag_matches
 from app.services.std_feedback_tickets import (
     StdFeedbackClient,
     _cursor_from_page,
@@ -469,5 +473,155 @@ class TestStdFeedbackWorkflow(unittest.IsolatedAsyncioTestCase):
         self.assertNotIn("STD_PRIMEFLOW_API_TOKEN", sources)
 
 
+async def _chunks(*parts: bytes):
+    for part in parts:
+        yield part
+
+
+class _ClosingTransport(httpx.MockTransport):
+    closed = False
+
+    async def aclose(self) -> None:
+        self.closed = True
+
+
+class TestStdAttachmentCache(unittest.IsolatedAsyncioTestCase):
+    def setUp(self) -> None:
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.cache = StdAttachmentCache(Path(directory.name), max_bytes=10)
+
+    async def test_tee_caches_complete_bodies_by_content(self) -> None:
+        streamed = [chunk async for chunk in self.cache.tee("t1", "f1", _chunks(b"ab", b"cd"), media_type="image/png")]
+        await self.cache.store("t2", "f9", _chunks(b"abcd"), media_type="image/png")
+
+        first = self.cache.get("t1", "f1")
+        self.assertEqual(streamed, [b"ab", b"cd"])
+        self.assertEqual(first.path.read_bytes(), b"abcd")
+        self.assertEqual(first.path, self.cache.get("t2", "f9").path)
+        self.assertEqual(first.media_type, "image/png")
+        self.assertTrue(etag_matches(f"W/{first.etag}, \"other\"", first.etag))
+        self.assertFalse(etag_matches('"other"', first.etag))
+
+    async def test_aborted_and_oversized_downloads_are_not_cached(self) -> None:
+        stream = self.cache.tee("t1", "f1", _chunks(b"ab", b"cd"), media_type="text/plain")
+        await stream.__anext__()
+        await stream.aclose()
+        oversized = [chunk async for chunk in self.cache.tee("t1", "f2", _chunks(b"x" * 11), media_type="text/plain")]
+
+        self.assertEqual(oversized, [b"x" * 11])
+        self.assertIsNone(self.cache.get("t1", "f1"))
+        self.assertIsNone(self.cache.get("t1", "f2"))
+        self.assertEqual(list((self.cache.root / "blobs").glob(".download-*")), [])
+
+    async def test_least_recently_used_blobs_are_evicted_past_the_bound(self) -> None:
+        await self.cache.store("t1", "old", _chunks(b"1" * 4), media_type="text/plain")
+        await self.cache.store("t1", "used", _chunks(b"2" * 4), media_type="text/plain")
+        old_blob = self.cache.get("t1", "old").path
+        os.utime(old_blob, (1, 1))
+        self.cache.get("t1", "used")
+        await self.cache.store("t1", "new", _chunks(b"3" * 4), media_type="text/plain")
+
+        self.assertIsNone(self.cache.get("t1", "old"))
+        self.assertIsNotNone(self.cache.get("t1", "used"))
+        self.assertIsNotNone(self.cache.get("t1", "new"))
+
+
+class TestExternalTicketFileDownload(unittest.IsolatedAsyncioTestCase):
+    def setUp(self) -> None:
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.cache = StdAttachmentCache(Path(directory.name), max_bytes=1024)
+        self.ticket = SimpleNamespace(
+            id=uuid.uuid4(), external_id="std-1", raw={"files": [{"id": "f1", "filename": "proof.png"}]}
+        )
+        self.upstream_calls = 0
+        self.upstream_body = None
+        self.transports = []
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            self.upstream_calls += 1
+            self.assertEqual(request.url.path, "/api/feedback-tickets/std-1/files/f1")
+            return httpx.Response(
+                200, content=self.upstream_body or b"png-bytes", headers={"content-type": "image/png"}
+            )
+
+        def client():
+            transport = _ClosingTransport(handler)
+            self.transports.append(transport)
+            return StdFeedbackClient(
+                token="server-secret", base_url="https://std.example.test/api", transport=transport
+            )
+
+        patchers = [
+            patch.object(external_tickets, "get_std_attachment_cache", return_value=self.cache),
+            patch.object(external_tickets, "_std_token", return_value="server-secret"),
+            patch.object(external_tickets, "StdFeedbackClient", side_effect=client),
+        ]
+        for patcher in patchers:
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    async def _download(self, if_none_match: str | None = None):
+        headers = [(b"if-none-match", if_none_match.encode())] if if_none_match else []
+        request = SimpleNamespace(headers=httpx.Headers(headers))
+        return await download_external_ticket_file(
+            ticket_id=self.ticket.id,
+            file_id="f1",
+            request=request,
+            db=_FakeDb(select_batches=[[self.ticket]]),
+            _user=SimpleNamespace(id=uuid.uuid4()),
+        )
+
+    async def test_first_download_streams_and_later_ones_are_served_from_cache(self) -> None:
+        streamed = await self._download()
+        body = b"".join([chunk async for chunk in streamed.body_iterator])
+
+        cached = await self._download()
+        cached_body = b"".join([chunk async for chunk in cached.body_iterator])
+        not_modified = await self._download(if_none_match=cached.headers["etag"])
+
+        self.assertEqual(body, b"png-bytes")
+        self.assertTrue(self.transports[0].closed)
+        self.assertNotIn("etag", streamed.headers)
+        self.assertEqual(cached_body, b"png-bytes")
+        self.assertEqual(cached.headers["content-length"], "9")
+        self.assertEqual(cached.media_type, "image/png")
+        self.assertIn('filename="proof.png"', cached.headers["content-disposition"])
+        self.assertEqual(not_modified.status_code, 304)
+        self.assertEqual(self.upstream_calls, 1)
+
+    async def test_upstream_is_closed_when_its_stream_fails(self) -> None:
+        async def broken():
+            yield b"png"
+            raise httpx.ReadError("connection reset")
+
+        self.upstream_body = broken()
+        streamed = await self._download()
+
+        with self.assertRaises(httpx.ReadError):
+            async for _chunk in streamed.body_iterator:
+                pass
+
+        self.assertTrue(self.transports[0].closed)
+        self.assertIsNone(self.cache.get("std-1", "f1"))
+
+    async def test_a_body_evicted_after_the_lookup_is_fetched_again(self) -> None:
+        await self.cache.store("std-1", "f1", _chunks(b"png-bytes"), media_type="image/png")
+        evict_after_lookup = self.cache.get
+
+        def get(external_id, file_id):
+            cached = evict_after_lookup(external_id, file_id)
+            cached.path.unlink()
+            return cached
+
+        with patch.object(self.cache, "get", side_effect=get):
+            response = await self._download()
+            body = b"".join([chunk async for chunk in response.body_iterator])
+
+        self.assertEqual(body, b"png-bytes")
+        self.assertNotIn("etag", response.headers)
+        self.assertEqual(self.upstream_calls, 1)
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,121 @@
+import unittest
+import uuid
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+
+from fastapi import HTTPException
+from fastapi.routing import APIRoute
+
+from app.api.routers import tasks as tasks_router
+from app.models.enums import UserRole
+from app.schemas.task import TaskBulkUpdate
+
+
+class _Result:
+    def __init__(self, value) -> None:
+        self.value = value
+
+    def scalars(self):
+        return self
+
+    def all(self):
+        return self.value
+
+
+class _Savepoint:
+    def __init__(self, db) -> None:
+        self.db = db
+
+    async def __aenter__(self):
+        self.db.events.append("savepoint")
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        self.db.events.append("rollback" if exc_type else "release")
+        return False
+
+
+class _Db:
+    def __init__(self, *responses) -> None:
+        self.responses = list(responses)
+        self.events: list[str] = []
+
+    async def execute(self, statement):
+        self.events.append("execute")
+        return _Result(self.responses.pop(0) if self.responses else [])
+
+    def begin_nested(self):
+        return _Savepoint(self)
+
+    async def commit(self) -> None:
+        self.events.append("commit")
+
+
+class TestBulkTaskUpdate(unittest.IsolatedAsyncioTestCase):
+    def test_bulk_route_is_matched_before_the_task_id_route(self) -> None:
+        paths = [
+            route.path
+            for route in tasks_router.router.routes
+            if isinstance(route, APIRoute) and "PATCH" in route.methods
+        ]
+        self.assertLess(paths.index("/bulk"), paths.index("/{task_id}"))
+
+    async def test_items_apply_in_savepoints_and_commit_once(self) -> None:
+        user = SimpleNamespace(id=uuid.uuid4(), role=UserRole.STAFF, department_id=None)
+        ok_task = SimpleNamespace(id=uuid.uuid4(), assigned_to=user.id)
+        forbidden_task = SimpleNamespace(id=uuid.uuid4(), assigned_to=None)
+        missing_id = uuid.uuid4()
+        # tasks, caller assignments, reloaded updated tasks, alignment users
+        db = _Db([ok_task, forbidden_task], [], [ok_task], [])
+        notification = SimpleNamespace(user_id=uuid.uuid4())
+
+        async def apply(db_, task, patch_, user_, *, is_assigned_to_task):
+            if task is forbidden_task:
+                raise HTTPException(status_code=403, detail="Forbidden")
+            self.assertTrue(is_assigned_to_task)
+            return [notification], None
+
+        async def publish(notifications):
+            db.events.append("publish")
+
+        payload = TaskBulkUpdate.model_validate(
+            {
+                "items": [
+                    {"task_id": str(ok_task.id), "patch": {"status": "DONE"}},
+                    {"task_id": str(forbidden_task.id), "patch": {"status": "DONE"}},
+                    {"task_id": str(missing_id), "patch": {"title": "Renamed"}},
+                ]
+            }
+        )
+        with (
+            patch.object(tasks_router, "_apply_task_update", new=apply),
+            patch.object(tasks_router, "sa_inspect", return_value=SimpleNamespace(expired_attributes=set())),
+            patch.object(tasks_router, "publish_notifications", new=publish),
+            patch.object(tasks_router, "_assignees_for_tasks", new=AsyncMock(return_value={})),
+            patch.object(tasks_router, "_uses_fast_task_group", return_value=False),
+            patch.object(tasks_router, "_task_to_out", side_effect=lambda task, *a, **kw: SimpleNamespace(id=task.id)),
+        ):
+            response = await tasks_router.bulk_update_tasks(payload=payload, db=db, user=user)
+
+        self.assertEqual(
+            [(r.task_id, r.ok, r.status_code) for r in response.results],
+            [(ok_task.id, True, 200), (forbidden_task.id, False, 403), (missing_id, False, 404)],
+        )
+        self.assertEqual(response.results[0].task.id, ok_task.id)
+        self.assertEqual(db.events.count("commit"), 1)
+        self.assertEqual(db.events.count("savepoint"), 2)
+        self.assertIn("rollback", db.events)
+        self.assertLess(db.events.index("commit"), db.events.index("publish"))
+
+    async def test_duplicate_task_ids_are_rejected(self) -> None:
+        task_id = str(uuid.uuid4())
+        payload = TaskBulkUpdate.model_validate(
+            {"items": [{"task_id": task_id, "patch": {}}, {"task_id": task_id, "patch": {}}]}
+        )
+        with self.assertRaises(HTTPException) as ctx:
+            await tasks_router.bulk_update_tasks(payload=payload, db=_Db(), user=SimpleNamespace(id=uuid.uuid4()))
+        self.assertEqual(ctx.exception.status_code, 400)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,83 @@
+import unittest
+import uuid
+
+from sqlalchemy import select
+from sqlalchemy.dialects import postgresql
+
+from app.models.task import Task
+from app.services.task_read_model import (
+    EVIDENCE_TASK_PROJECTION,
+    EXPORT_TASK_PROJECTION,
+    TaskProjection,
+    defer_task_text,
+)
+
+
+class _Result:
+    def __init__(self, rows):
+        self._rows = rows
+
+    def all(self):
+        return self._rows
+
+
+class _Session:
+    def __init__(self, rows):
+        self.rows = rows
+        self.executed = []
+
+    async def execute(self, statement):
+        self.executed.append(statement)
+        return _Result(self.rows)
+
+
+def _sql(statement) -> str:
+    return str(statement.compile(dialect=postgresql.dialect()))
+
+
+class TestTaskReadModel(unittest.IsolatedAsyncioTestCase):
+    def test_projection_selects_only_requested_columns(self):
+        sql = _sql(TaskProjection("title", "due_date").select())
+
+        self.assertIn("tasks.id", sql)
+        self.assertIn("tasks.title", sql)
+        self.assertIn("tasks.due_date", sql)
+        self.assertNotIn("tasks.description", sql)
+        self.assertNotIn("tasks.internal_notes", sql)
+
+    def test_unknown_columns_are_rejected(self):
+        with self.assertRaises(ValueError):
+            TaskProjection("title", "planned_for")
+
+    def test_hot_path_projections_skip_internal_notes(self):
+        self.assertNotIn("internal_notes", EXPORT_TASK_PROJECTION.fields)
+        self.assertNotIn("description", EVIDENCE_TASK_PROJECTION.fields)
+        self.assertNotIn("internal_notes", EVIDENCE_TASK_PROJECTION.fields)
+
+    async def test_fetch_returns_named_tuples_that_reject_unselected_columns(self):
+        task_id = uuid.uuid4()
+        projection = TaskProjection("title", "status")
+        db = _Session([(task_id, "Plan", "TODO")])
+
+        rows = await projection.fetch(db, projection.select())
+
+        self.assertEqual(len(db.executed), 1)
+        self.assertEqual(rows[0].id, task_id)
+        self.assertEqual(rows[0].title, "Plan")
+        with self.assertRaises(AttributeError):
+            rows[0].assigned_to
+        self.assertFalse(hasattr(rows[0], "__dict__"))
+
+    def test_deferred_text_options_drop_text_columns_from_entity_load(self):
+        sql = _sql(select(Task).options(*defer_task_text()))
+        description_only = _sql(select(Task).options(*defer_task_text("description")))
+
+        self.assertIn("tasks.title", sql)
+        self.assertNotIn("tasks.description", sql)
+        self.assertNotIn("tasks.internal_notes", sql)
+        self.assertIn("tasks.internal_notes", description_only)
+        self.assertNotIn("tasks.description", description_only)
+
+
+if __name__ == "__main__":
+    unittest.main()
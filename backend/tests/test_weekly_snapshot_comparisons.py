@@ -0,0 +1,171 @@
+import json
+import unittest
+import uuid
+from datetime import date
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+
+from sqlalchemy.dialects import postgresql
+
+from app.api.routers import planners
+from app.services.weekly_snapshot_comparisons import COMPARE_BUCKETS, comparison_cache_key, live_week_revision
+
+
+def _task(match_key: str, *, day: date, status: str = "TODO", completed: bool = False, assignee=None) -> dict:
+    assignee = assignee or {"assignee_id": uuid.uuid4(), "assignee_name": "Elsa"}
+    return {
+        "match_key": match_key,
+        "task_id": None,
+        "title": match_key,
+        "source_type": "project",
+        "status": status,
+        "daily_status": None,
+        "is_completed": completed,
+        "tags": ["R1"],
+        "assignees": [assignee],
+        "occurrences": [{"day": day, "time_slot": "AM", **assignee}],
+    }
+
+
+class TestWeeklySnapshotComparisonCache(unittest.IsolatedAsyncioTestCase):
+    def setUp(self) -> None:
+        self.week_end = date(2026, 2, 6)
+        self.planned = {
+            "a": _task("a", day=date(2026, 2, 2)),
+            "b": _task("b", day=date(2026, 2, 5)),
+            "c": _task("c", day=date(2026, 2, 3)),
+        }
+        self.actual = {
+            "a": _task("a", day=date(2026, 2, 2), status="DONE", completed=True),
+            "b": _task("b", day=date(2026, 2, 5), status="IN_PROGRESS"),
+            "d": _task("d", day=date(2026, 2, 4)),
+        }
+        self.baseline = SimpleNamespace(id=uuid.uuid4())
+        self.compare = SimpleNamespace(id=uuid.uuid4())
+
+    def test_cached_result_round_trips_through_json(self) -> None:
+        buckets = planners._classify_to_compare_out(
+            planned_tasks=self.planned,
+            actual_tasks=self.actual,
+            week_end=self.week_end,
+            as_of_date=date(2026, 2, 7),
+        )
+        stored = json.loads(json.dumps(planners._comparison_result(buckets, total_planned=3)))
+
+        self.assertEqual(planners._buckets_from_comparison(stored), buckets)
+        self.assertEqual(
+            {name: [task.match_key for task in buckets[name]] for name in COMPARE_BUCKETS},
+            {
+                "completed": ["a"],
+                "in_progress": [],
+                "pending": [],
+                "late": ["b"],
+                "additional": ["d"],
+                "removed_or_canceled": ["c"],
+            },
+        )
+
+    async def test_snapshot_pair_is_classified_once_and_then_served_from_cache(self) -> None:
+        stored: dict = {}
+
+        async def load(db, **key):
+            entry = stored.get((key["baseline_snapshot_id"], key["compare_snapshot_id"]))
+            return entry["result"] if entry and entry["cache_key"] == key["cache_key"] else None
+
+        async def store(**entry):
+            stored[(entry["baseline_snapshot_id"], entry["compare_snapshot_id"])] = entry
+
+        tasks_by_key = AsyncMock(return_value=[self.planned, self.actual])
+        with (
+            patch.object(planners, "load_comparison", load),
+            patch.object(planners, "store_comparison", store),
+            patch.object(planners, "_snapshot_tasks_by_key", tasks_by_key),
+        ):
+            first, first_total = await planners._snapshot_comparison(
+                None, self.baseline, self.compare, week_end=self.week_end
+            )
+            second, second_total = await planners._snapshot_comparison(
+                None, self.baseline, self.compare, week_end=self.week_end
+            )
+
+        tasks_by_key.assert_awaited_once()
+        self.assertEqual((first, first_total), (second, second_total))
+        self.assertEqual(first_total, 3)
+        self.assertEqual(
+            stored[(self.baseline.id, self.compare.id)]["cache_key"],
+            comparison_cache_key(self.week_end, date(2026, 2, 7)),
+        )
+
+    async def test_live_comparison_rebuilds_only_when_week_revision_changes(self) -> None:
+        stored: dict = {}
+
+        async def load(db, **key):
+            entry = stored.get((key["baseline_snapshot_id"], key["compare_snapshot_id"]))
+            return json.loads(json.dumps(entry["result"])) if entry and entry["cache_key"] == key["cache_key"] else None
+
+        async def store(**entry):
+            stored[(entry["baseline_snapshot_id"], entry["compare_snapshot_id"])] = entry
+
+        user_id, department_id = uuid.uuid4(), uuid.uuid4()
+        department_payload = {"days": [{"date": "2026-02-02", "users": [{"user_id": str(user_id), "user_name": "Elsa"}]}]}
+        table = SimpleNamespace(departments=[department_payload])
+        revisions = iter(["r1", "r1", "r2"])
+        planner = AsyncMock(return_value=table)
+
+        async def revision(db, **_):
+            return next(revisions)
+
+        with (
+            patch.object(planners, "load_comparison", load),
+            patch.object(planners, "store_comparison", store),
+            patch.object(planners, "live_week_revision", revision),
+            patch.object(planners, "_snapshot_tasks_by_key", AsyncMock(return_value=[self.planned])),
+            patch.object(planners, "weekly_table_planner", planner),
+            patch.object(planners, "_load_task_priority_map", AsyncMock(return_value={})),
+            patch.object(planners, "_today_app_date", return_value=date(2026, 2, 4)),
+        ):
+            results = [
+                await planners._live_comparison(
+                    None,
+                    SimpleNamespace(id=user_id),
+                    self.baseline,
+                    department_id=department_id,
+                    week_start=date(2026, 2, 2),
+                    week_end=self.week_end,
+                )
+                for _ in range(3)
+            ]
+
+        self.assertEqual(planner.await_count, 2)
+        self.assertEqual(results[0], results[1])
+        self.assertEqual(results[1][2], [(user_id, "Elsa")])
+        self.assertEqual(len(results[0][0]["removed_or_canceled"]), 3)
+
+    async def test_live_revision_is_scoped_to_the_department_and_week(self) -> None:
+        statements = []
+
+        class _Db:
+            async def execute(self, statement):
+                statements.append(statement)
+                return SimpleNamespace(one=lambda: ("digest",) * len(statement.selected_columns))
+
+        department_id = uuid.uuid4()
+        revision = await live_week_revision(
+            _Db(), department_id=department_id, week_start=date(2026, 2, 2), week_end=self.week_end
+        )
+        compiled = statements[0].compile(dialect=postgresql.dialect())
+        sql = str(compiled)
+
+        self.assertEqual(len(statements), 1)
+        self.assertEqual(revision, comparison_cache_key(*("digest",) * 11))
+        self.assertNotIn("count(", sql)
+        self.assertNotIn("max(", sql)
+        for source in ("system_task_templates.updated_at", "weekly_plans.updated_at", "project_members.user_id"):
+            self.assertIn(source, sql)
+        self.assertIn("users.department_id = ", sql)
+        self.assertIn("BETWEEN", sql)
+        self.assertIn(department_id, compiled.params.values())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,123 @@
+import unittest
+import uuid
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+
+from fastapi.encoders import jsonable_encoder
+
+from app.api.routers import exports
+from app.api.routers.planners import _flatten_weekly_department_tasks, _snapshot_tasks_by_key
+from app.services.realization_evidence import _snapshot_task_map, _snapshot_tasks
+from app.services.weekly_snapshot_tasks import snapshot_task_rows, task_items_from_rows
+
+
+def _department_payload(user_a: uuid.UUID, user_b: uuid.UUID, task_id: uuid.UUID) -> dict:
+    def user_day(user_id, name, am_tasks, pm_system):
+        return {
+            "user_id": str(user_id),
+            "user_name": name,
+            "am_projects": [{"project_id": None, "project_title": "Launch", "tasks": am_tasks}],
+            "pm_projects": [],
+            "am_system_tasks": [],
+            "pm_system_tasks": pm_system,
+            "am_fast_tasks": [],
+            "pm_fast_tasks": [],
+        }
+
+    shared = {"task_id": str(task_id), "task_title": "Prepare deck", "status": "IN_PROGRESS", "is_r1": True}
+    return {
+        "days": [
+            {
+                "date": "2026-02-02",
+                "users": [
+                    user_day(user_a, "Elsa", [shared], [{"task_title": "Inbox", "status": "TODO"}]),
+                    user_day(user_b, "Ardit", [shared], []),
+                ],
+            },
+            {"date": "2026-02-03", "users": [user_day(user_a, "Elsa", [dict(shared, status="DONE")], [])]},
+        ]
+    }
+
+
+class _RowsOnlySession:
+    """Answers the task-table query and fails if the payload is requested."""
+
+    def __init__(self, rows):
+        self.rows = rows
+        self.statements = []
+
+    async def execute(self, statement):
+        self.statements.append(str(statement))
+        if "weekly_planner_snapshots.payload" in str(statement):
+            raise AssertionError("payload should not be loaded")
+        return SimpleNamespace(all=lambda: self.rows)
+
+
+class TestWeeklySnapshotTaskRows(unittest.IsolatedAsyncioTestCase):
+    def setUp(self) -> None:
+        self.user_a, self.user_b, self.task_id = uuid.uuid4(), uuid.uuid4(), uuid.uuid4()
+        self.snapshot_id = uuid.uuid4()
+        self.flattened = _flatten_weekly_department_tasks(
+            _department_payload(self.user_a, self.user_b, self.task_id)
+        )
+        self.stored_items = jsonable_encoder(self.flattened)
+
+    def test_rows_round_trip_to_flattened_items(self) -> None:
+        rows = snapshot_task_rows(self.snapshot_id, self.stored_items)
+
+        self.assertEqual(len(rows), 4)
+        self.assertEqual({row.match_key for row in rows}, {task["match_key"] for task in self.flattened})
+        self.assertEqual(task_items_from_rows(rows), [dict(task, due_date=None) for task in self.flattened])
+
+    def test_assignees_without_slots_and_empty_items_keep_a_row(self) -> None:
+        rows = snapshot_task_rows(
+            self.snapshot_id,
+            [
+                {
+                    "task_id": str(self.task_id),
+                    "title": "Weekly obligation",
+                    "assignees": [{"assignee_id": str(self.user_a), "assignee_name": "Elsa"}],
+                    "occurrences": [{"day": "2026-07-27", "time_slot": "AM"}],
+                },
+                {"fallback_key": "x", "title": "Orphan"},
+            ],
+        )
+
+        self.assertEqual([(row.user_id, row.day is None) for row in rows], [(None, False), (self.user_a, True), (None, True)])
+        self.assertEqual(rows[2].match_key, "fallback:x")
+        restored = task_items_from_rows(rows)
+        self.assertEqual(restored[0]["assignees"], [{"assignee_id": self.user_a, "assignee_name": "Elsa"}])
+        self.assertEqual(len(restored[0]["occurrences"]), 1)
+        self.assertEqual((restored[1]["assignees"], restored[1]["occurrences"]), ([], []))
+
+    def test_evidence_view_matches_payload_view(self) -> None:
+        snapshot = SimpleNamespace(payload={"task_items": self.stored_items})
+        from_rows = _snapshot_task_map(task_items_from_rows(snapshot_task_rows(self.snapshot_id, self.stored_items)))
+
+        self.assertEqual(from_rows, _snapshot_tasks(snapshot))
+
+    async def test_compare_reads_rows_without_loading_payload(self) -> None:
+        db = _RowsOnlySession(snapshot_task_rows(self.snapshot_id, self.stored_items))
+
+        (tasks_by_key,) = await _snapshot_tasks_by_key(db, SimpleNamespace(id=self.snapshot_id))
+
+        self.assertEqual(len(db.statements), 1)
+        self.assertEqual(tasks_by_key[f"id:{self.task_id}"]["is_completed"], True)
+        self.assertEqual(len(tasks_by_key[f"id:{self.task_id}"]["occurrences"]), 3)
+
+
+class TestExportAssigneeColumns(unittest.IsolatedAsyncioTestCase):
+    async def test_columns_come_from_the_roster_of_the_first_snapshot_with_users(self) -> None:
+        empty, planned, final = (SimpleNamespace(id=uuid.uuid4()) for _ in range(3))
+        user_a, user_b = uuid.uuid4(), uuid.uuid4()
+        roster = AsyncMock(return_value={empty.id: {}, planned.id: {user_b: "Zana", user_a: "arta "}, final.id: {}})
+
+        with patch.object(exports, "load_snapshot_roster", roster):
+            columns = await exports._snapshot_assignee_columns(None, None, empty, planned, final)
+
+        self.assertEqual(columns, [(user_a, "arta"), (user_b, "Zana")])
+        roster.assert_awaited_once_with(None, [empty.id, planned.id, final.id])
+
+
+if __name__ == "__main__":
+    unittest.main()